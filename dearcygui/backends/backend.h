@@ -1,5 +1,7 @@
 #include <atomic>
 #include <mutex>
+#include <condition_variable>
+#include <thread>
 #include <vector>
 #include <string>
 #include <SDL3/SDL.h>
@@ -60,6 +62,32 @@ public:
                                int rowStride, int colStride, int chanStride) = 0;
     virtual void wakeRendering(uint64_t delay_ns, bool full_refresh) = 0;
 
+    /**
+     * OS handle (file descriptor) that event loops can poll to know
+     * when processEvents has something to process.
+     * It becomes readable on wakeRendering calls, at the end of each
+     * frame presentation by the presentation thread, and, if
+     * includes_input is set to true, when new input is available.
+     * Delayed wakes are signalled when requested, and their target
+     * time is found in nextWakeTime after processEvents.
+     * @param includes_input Set to whether the input is signalled
+     * @return The file descriptor, or -1 if not supported
+     */
+    virtual int getWaitHandle(bool* includes_input) = 0;
+    /**
+     * Make the wait handle readable. Can be called from any thread.
+     */
+    virtual void signalWaitHandle() = 0;
+    /**
+     * Reset the wait handle. The pending events remain to be processed.
+     */
+    virtual void clearWaitHandle() = 0;
+    /**
+     * Whether a frame can be queued to the presentation thread without
+     * waiting for the presentation of the previous frame (vsync).
+     */
+    virtual bool canQueuePresentFrame() = 0;
+
     /**
      * Set a hit test surface for custom window border behavior
      * @param surface Pointer to uint8_t hit test data (0=normal, 1=top, 2=left, 4=bottom, 8=right, 15=drag)
@@ -119,7 +147,7 @@ public:
      * @param height Texture height in pixels
      * @param num_chans Number of color channels (1-4)
      * @param dynamic Whether texture will be frequently updated
-     * @param type Pixel data type (1=byte, other=float)
+     * @param type Pixel data type (0=float32, 1=uint8, 2=uint16, 3=float16)
      * @param filtering_mode Texture filtering (0=linear, 1=nearest, 2=font, 3=antialias)
      * @param repeat_mode Texture repeat mode flag (0=clamp, 1=repeat on x, 2=repeat on y, 3=repeat on both)
      * @return void* Cast of GLuint texture ID, or nullptr on failure
@@ -173,6 +201,63 @@ public:
                                      unsigned num_chans, unsigned type, void* data, 
                                      unsigned src_stride) = 0;
 
+    /**
+     * Update a sub-rectangle of a texture, leaving the rest untouched.
+     * The upload context must be current before calling this function.
+     * The data is uploaded directly from client memory at the
+     * given offset, after waiting for pending reads of the texture.
+     * @param texture void* Cast of GLuint texture ID
+     * @param x Horizontal offset of the region in the texture
+     * @param y Vertical offset of the region in the texture
+     * @param width Width of the region
+     * @param height Height of the region
+     * @param num_chans Must match texture channels
+     * @param type Must match texture type
+     * @param data Pointer to the region pixel data
+     * @param src_stride Bytes per row in source data
+     * @return bool Success or failure
+     * @throws std::runtime_error If the region is invalid or the update fails
+     */
+    virtual bool updateTextureRegion(void* texture, unsigned x, unsigned y,
+                                     unsigned width, unsigned height,
+                                     unsigned num_chans, unsigned type, void* data,
+                                     unsigned src_stride) = 0;
+
+    /**
+     * Convert a YUV frame into a RGBA uint8 texture.
+     * The upload context must be current before calling this function.
+     * Only the YUV planes are transferred (1.5 bytes per pixel for
+     * NV12 and I420, 2 for YUYV), and the colorspace conversion
+     * is done on the GPU.
+     * @param texture void* Cast of GLuint texture ID (4 channels, uint8)
+     * @param width Frame width, must match the texture. Must be even.
+     * @param height Frame height, must match the texture.
+     *        Must be even for NV12 and I420.
+     * @param yuv_format 0=NV12, 1=I420, 2=YUYV
+     * @param data Pointer to the frame. For NV12 and I420, the chroma
+     *        planes follow the luma plane (with half its stride for I420).
+     * @param src_stride Bytes per row of the luma plane (of the frame for YUYV)
+     * @param colorspace 0=BT.601, 1=BT.709
+     * @param full_range Whether values span [0, 255] rather than video range
+     * @return bool Success or failure
+     * @throws std::runtime_error If the frame is invalid or the conversion fails
+     */
+    virtual bool updateTextureYUV(void* texture, unsigned width, unsigned height,
+                                  unsigned yuv_format, void* data, unsigned src_stride,
+                                  unsigned colorspace, bool full_range) = 0;
+
+    /**
+     * Mark a texture as containing a signed distance field.
+     * Draw commands sampling the texture are then rendered with
+     * a shader that thresholds the alpha channel at 0.5, with
+     * antialiasing adapted to the on-screen scale, such that
+     * the content remains sharp at any zoom level.
+     * @param texture void* Cast of GLuint texture ID
+     * @param pixel_range Distance in texels between the alpha
+     *        values 0 and 1 of the field. 0 disables the SDF mode.
+     */
+    virtual void setTextureSDF(void* texture, float pixel_range) = 0;
+
     /**
      * Download texture content to CPU memory.
      * @throws std::runtime_error If texture download fails
@@ -190,6 +275,23 @@ public:
     virtual bool backBufferToTexture(void* texture, unsigned width, unsigned height,
                                      unsigned num_chans, unsigned type) = 0;
 
+    /**
+     * Rasterize an ImDrawList into a texture.
+     * The texture is bound to a framebuffer object, cleared
+     * to transparent, and the draw list is rendered into it
+     * with the origin (0, 0) at the top left of the texture.
+     * Rows are stored bottom to top, as for backBufferToTexture.
+     * Must be called from the rendering thread, with the
+     * imgui context held.
+     * @param texture void* Cast of GLuint texture ID (RGBA)
+     * @param width Texture width
+     * @param height Texture height
+     * @param draw_list ImDrawList* to render
+     * @return bool Success or failure
+     */
+    virtual bool renderDrawListToTexture(void* texture, unsigned width, unsigned height,
+                                         void* draw_list) = 0;
+
 	// Window state
     float dpiScale = 1.;
     bool isFullScreen = false;
@@ -210,9 +312,13 @@ public:
     float clearColor[4] = { 0., 0., 0., 1. };
     bool hasModesChanged = false;
     bool hasVSync = true; // TODO: maybe change that
+    bool threadedPresentation = false; // submit and swap from a presentation thread
     bool shouldSkipPresenting = false;
     std::atomic<bool> activityDetected{true};
     std::atomic<bool> needsRefresh{true};
+    // Earliest target time (steady clock ns) of the delayed
+    // wakes not yet due, UINT64_MAX if none.
+    std::atomic<uint64_t> nextWakeTime{UINT64_MAX};
 
     // Window properties
     std::string windowTitle = "DearCyGui Window";
@@ -267,6 +373,10 @@ public:
     virtual void addWindowIcon(void* data, int width, int height, 
                                int rowStride, int colStride, int chanStride) override;
     virtual void wakeRendering(uint64_t delay_ns, bool full_refresh) override;
+    virtual int getWaitHandle(bool* includes_input) override;
+    virtual void signalWaitHandle() override;
+    virtual void clearWaitHandle() override;
+    virtual bool canQueuePresentFrame() override;
     virtual void setHitTestSurface(const uint8_t* surface, int width, int height) override;
     virtual void makeUploadContextCurrent() override;
     virtual void releaseUploadContext() override;
@@ -285,6 +395,14 @@ public:
     virtual bool updateStaticTexture(void* texture, unsigned width, unsigned height,
                                      unsigned num_chans, unsigned type, void* data, 
                                      unsigned src_stride) override;
+    virtual bool updateTextureRegion(void* texture, unsigned x, unsigned y,
+                                     unsigned width, unsigned height,
+                                     unsigned num_chans, unsigned type, void* data,
+                                     unsigned src_stride) override;
+    virtual bool updateTextureYUV(void* texture, unsigned width, unsigned height,
+                                  unsigned yuv_format, void* data, unsigned src_stride,
+                                  unsigned colorspace, bool full_range) override;
+    virtual void setTextureSDF(void* texture, float pixel_range) override;
 
     static SDLViewport* create(render_fun render,
                                on_resize_fun on_resize,
@@ -295,7 +413,10 @@ public:
                                on_wake_fun on_wake,
                                void* callback_data);
 
-    void prepareTexturesForRender(const std::unordered_set<GLuint>& tex_ids);
+    // sdf_ranges, if provided, receives the SDF range (in UV units)
+    // of the textures marked with setTextureSDF
+    void prepareTexturesForRender(const std::unordered_set<GLuint>& tex_ids,
+                                  std::unordered_map<GLuint, ImVec2>* sdf_ranges = nullptr);
     void finishTextureRender(const std::unordered_set<GLuint>& tex_ids);
 
     virtual bool downloadTexture(void* texture,
@@ -311,6 +432,9 @@ public:
     virtual bool backBufferToTexture(void* texture, unsigned width, unsigned height,
                                      unsigned num_chans, unsigned type) override;
 
+    virtual bool renderDrawListToTexture(void* texture, unsigned width, unsigned height,
+                                         void* draw_list) override;
+
     void *getSDLWindowHandle() { return (void*)windowHandle; }
 
 private:
@@ -327,6 +451,17 @@ private:
     // Icon handling
     SDL_Surface* iconSurface = nullptr;
 
+    // Wait handle. On Linux waitHandle is an epoll descriptor
+    // watching wakeEventFd and the display connection. On other
+    // POSIX systems it is the read end of a pipe (without input).
+    int waitHandle = -1;
+    int wakeEventFd = -1; // eventfd, or write end of the pipe
+    bool waitHandleHasInput = false;
+    SDL_SharedObject* displayLibrary = nullptr;
+    void initWaitHandle();
+    void closeWaitHandle();
+    int getDisplayConnectionFd();
+
     // Hit test surface data
     std::recursive_mutex hitMutex; 
     std::vector<uint8_t> hitTestSurface;
@@ -363,6 +498,7 @@ private:
         FenceSync* read_fence = nullptr;   // Shared fence after reads
         bool has_external_writers = false; // Track if external contexts are writing
         bool has_external_readers = false; // Track if external contexts are reading
+        float sdf_range = 0.f; // Texels between SDF values 0 and 1 (0 if not a SDF)
     };
 
     // Texture management 
@@ -378,7 +514,58 @@ private:
                              unsigned type, unsigned filter_mode, bool dynamic);
     size_t getTextureSize(unsigned width, unsigned height, unsigned num_chans, unsigned type);
 
+    // YUV conversion. The objects are only used with the
+    // upload context (framebuffers and vertex arrays are not
+    // shared between contexts).
+    GLuint yuvProgram = 0;
+    GLuint yuvVertexArray = 0;
+    GLuint yuvFramebuffer = 0;
+    GLuint yuvPlanes[3] = {0, 0, 0};
+    unsigned yuvPlaneWidth[3] = {0, 0, 0};
+    unsigned yuvPlaneHeight[3] = {0, 0, 0};
+    GLenum yuvPlaneFormat[3] = {0, 0, 0};
+    GLint yuvFormatLocation = -1;
+    GLint yuvMatrixLocation = -1;
+    GLint yuvOffsetLocation = -1;
+
+    bool initYUVConversion();
+    void uploadYUVPlane(int index, unsigned width, unsigned height,
+                        GLenum internal_format, GLenum format, unsigned pixel_size,
+                        const unsigned char* data, unsigned stride);
+    void cleanupYUVConversion();
+
     void preparePresentFrame();
+
+    // Threaded presentation.
+    // The main thread copies the draw data of each frame into one
+    // of two buffers, and the presentation thread, which owns
+    // the GL context while it renders, submits it and swaps.
+    struct PresentFrame {
+        ImVector<ImDrawList*> cmdLists; // copies, reused between frames
+        int numLists = 0;
+        ImVec2 displayPos;
+        ImVec2 displaySize;
+        ImVec2 framebufferScale;
+        int frameWidth = 0;
+        int frameHeight = 0;
+        float clearColor[4] = { 0., 0., 0., 1. };
+        bool vsync = true;
+        void* backendData = nullptr;
+    };
+    PresentFrame presentFrames[2];
+    int presentFillIndex = 0; // next buffer filled by the main thread
+    int presentPendingIndex = -1; // buffer waiting for the presentation thread
+    int presentingIndex = -1; // buffer being presented
+    bool presentThreadStop = false;
+    std::thread presentThread;
+    std::mutex presentMutex;
+    std::condition_variable presentCV;
+
+    void queuePresentFrame(ImDrawData* draw_data);
+    void presentationLoop();
+    void renderPresentFrame(PresentFrame& frame);
+    void waitPresentationIdle();
+    void stopPresentationThread();
     bool updateTexture(void* texture, unsigned width, unsigned height,
                       unsigned num_chans, unsigned type, void* data, 
                       unsigned src_stride, bool dynamic);
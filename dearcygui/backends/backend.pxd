@@ -26,6 +26,10 @@ cdef extern from "backend.h" nogil:
         void toggleFullScreen()
         void addWindowIcon(void*, int, int, int, int, int) except +
         void wakeRendering(uint64_t, bint)
+        int getWaitHandle(bint*)
+        void signalWaitHandle()
+        void clearWaitHandle()
+        bint canQueuePresentFrame()
         void setHitTestSurface(uint8_t*, int, int) except +
         void makeUploadContextCurrent()
         void releaseUploadContext()
@@ -36,11 +40,17 @@ cdef extern from "backend.h" nogil:
         void freeTexture(void*)
         bint updateDynamicTexture(void*, unsigned, unsigned, unsigned, unsigned, void*, unsigned) except +
         bint updateStaticTexture(void*, unsigned, unsigned, unsigned, unsigned, void*, unsigned) except +
+        bint updateTextureRegion(void*, unsigned, unsigned, unsigned, unsigned,
+                                 unsigned, unsigned, void*, unsigned) except +
+        bint updateTextureYUV(void*, unsigned, unsigned, unsigned,
+                              void*, unsigned, unsigned, bint) except +
+        void setTextureSDF(void*, float) except +
 
         bint downloadTexture(void*, int, int,
                              unsigned, unsigned, unsigned, unsigned,
                              void*, unsigned) except +
         bint backBufferToTexture(void*, unsigned, unsigned, unsigned, unsigned) except +
+        bint renderDrawListToTexture(void*, unsigned, unsigned, void*) except +
 
         # Texture sync methods
         void beginExternalWrite(unsigned int)
@@ -66,9 +76,11 @@ cdef extern from "backend.h" nogil:
         # Rendering properties
         float[4] clearColor
         bint hasVSync
+        bint threadedPresentation
         bint shouldSkipPresenting
         atomic[bint] activityDetected
         atomic[bint] needsRefresh
+        atomic[uint64_t] nextWakeTime
 
         # Window properties
         string iconSmall
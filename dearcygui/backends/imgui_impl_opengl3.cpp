@@ -221,6 +221,7 @@
 #define GL_CALL(_CALL)      _CALL   // Call without error check
 #endif
 
+#include <unordered_map>
 #include <unordered_set>
 
 // OpenGL Data
@@ -239,6 +240,10 @@ struct ImGui_ImplOpenGL3_Data
     GLuint          AttribLocationVtxPos;    // Vertex attributes location
     GLuint          AttribLocationVtxUV;
     GLuint          AttribLocationVtxColor;
+    GLuint          SdfShaderHandle;         // Program for textures marked as signed distance fields
+    GLint           SdfAttribLocationTex;
+    GLint           SdfAttribLocationProjMtx;
+    GLint           SdfAttribLocationRange;
     unsigned int    VboHandle, ElementsHandle;
     GLsizeiptr      VertexBufferSize;
     GLsizeiptr      IndexBufferSize;
@@ -251,11 +256,26 @@ struct ImGui_ImplOpenGL3_Data
 
 // Backend data stored in io.BackendRendererUserData to allow support for multiple Dear ImGui contexts
 // It is STRONGLY preferred that you use docking branch with multi-viewports (== single Dear ImGui context + multiple windows) instead of multiple Dear ImGui contexts.
+// Set on a presentation thread, which renders without the imgui context.
+static thread_local ImGui_ImplOpenGL3_Data* ThreadBackendData = nullptr;
+
 static ImGui_ImplOpenGL3_Data* ImGui_ImplOpenGL3_GetBackendData()
 {
+    if (ThreadBackendData != nullptr)
+        return ThreadBackendData;
     return ImGui::GetCurrentContext() ? (ImGui_ImplOpenGL3_Data*)ImGui::GetIO().BackendRendererUserData : nullptr;
 }
 
+void* ImGui_ImplOpenGL3_GetBackendDataHandle()
+{
+    return (void*)ImGui_ImplOpenGL3_GetBackendData();
+}
+
+void ImGui_ImplOpenGL3_SetThreadBackendData(void* backend_data)
+{
+    ThreadBackendData = (ImGui_ImplOpenGL3_Data*)backend_data;
+}
+
 // OpenGL vertex attribute state (for ES 1.0 and ES 2.0 only)
 #ifndef IMGUI_IMPL_OPENGL_USE_VERTEX_ARRAY
 struct ImGui_ImplOpenGL3_VtxAttribState
@@ -471,6 +491,12 @@ static void ImGui_ImplOpenGL3_SetupRenderState(ImDrawData* draw_data, int fb_wid
         { 0.0f,         0.0f,        -1.0f,   0.0f },
         { (R+L)/(L-R),  (T+B)/(B-T),  0.0f,   1.0f },
     };
+    if (bd->SdfShaderHandle)
+    {
+        glUseProgram(bd->SdfShaderHandle);
+        glUniform1i(bd->SdfAttribLocationTex, 0);
+        glUniformMatrix4fv(bd->SdfAttribLocationProjMtx, 1, GL_FALSE, &ortho_projection[0][0]);
+    }
     glUseProgram(bd->ShaderHandle);
     glUniform1i(bd->AttribLocationTex, 0);
     glUniformMatrix4fv(bd->AttribLocationProjMtx, 1, GL_FALSE, &ortho_projection[0][0]);
@@ -561,8 +587,11 @@ void ImGui_ImplOpenGL3_RenderDrawData(SDLViewport* platform, ImDrawData* draw_da
         }
     }
 
-    // Set up sync fences for all textures we'll use
-    platform->prepareTexturesForRender(used_textures);
+    // Set up sync fences for all textures we'll use,
+    // and retrieve which ones need the SDF program
+    std::unordered_map<GLuint, ImVec2> sdf_ranges;
+    platform->prepareTexturesForRender(used_textures, bd->SdfShaderHandle ? &sdf_ranges : nullptr);
+    bool sdf_program_bound = false;
 
     // Setup desired GL state
     // Recreate the VAO every time (this is to easily allow multiple GL contexts to be rendered to. VAO are not shared among GL contexts)
@@ -621,7 +650,10 @@ void ImGui_ImplOpenGL3_RenderDrawData(SDLViewport* platform, ImDrawData* draw_da
                 // User callback, registered via ImDrawList::AddCallback()
                 // (ImDrawCallback_ResetRenderState is a special callback value used by the user to request the renderer to reset render state.)
                 if (pcmd->UserCallback == ImDrawCallback_ResetRenderState)
+                {
                     ImGui_ImplOpenGL3_SetupRenderState(draw_data, fb_width, fb_height, vertex_array_object);
+                    sdf_program_bound = false;
+                }
                 else
                     pcmd->UserCallback(draw_list, pcmd);
             }
@@ -636,8 +668,29 @@ void ImGui_ImplOpenGL3_RenderDrawData(SDLViewport* platform, ImDrawData* draw_da
                 // Apply scissor/clipping rectangle (Y is inverted in OpenGL)
                 GL_CALL(glScissor((int)clip_min.x, (int)((float)fb_height - clip_max.y), (int)(clip_max.x - clip_min.x), (int)(clip_max.y - clip_min.y)));
 
+                // Select the program matching the texture
+                GLuint tex_id = (GLuint)(intptr_t)pcmd->GetTexID();
+                if (!sdf_ranges.empty())
+                {
+                    auto sdf_it = sdf_ranges.find(tex_id);
+                    if (sdf_it != sdf_ranges.end())
+                    {
+                        if (!sdf_program_bound)
+                        {
+                            glUseProgram(bd->SdfShaderHandle);
+                            sdf_program_bound = true;
+                        }
+                        glUniform2f(bd->SdfAttribLocationRange, sdf_it->second.x, sdf_it->second.y);
+                    }
+                    else if (sdf_program_bound)
+                    {
+                        glUseProgram(bd->ShaderHandle);
+                        sdf_program_bound = false;
+                    }
+                }
+
                 // Bind texture, Draw
-                GL_CALL(glBindTexture(GL_TEXTURE_2D,  (GLuint)(intptr_t)pcmd->GetTexID()));
+                GL_CALL(glBindTexture(GL_TEXTURE_2D, tex_id));
 #ifdef IMGUI_IMPL_OPENGL_MAY_HAVE_VTX_OFFSET
                 if (bd->GlVersion >= 320)
                     GL_CALL(glDrawElementsBaseVertex(GL_TRIANGLES, (GLsizei)pcmd->ElemCount, sizeof(ImDrawIdx) == 2 ? GL_UNSIGNED_SHORT : GL_UNSIGNED_INT, (void*)(intptr_t)(pcmd->IdxOffset * sizeof(ImDrawIdx)), (GLint)pcmd->VtxOffset));
@@ -901,28 +954,102 @@ bool    ImGui_ImplOpenGL3_CreateDeviceObjects()
         "    Out_Color = Frag_Color * texture(Texture, Frag_UV.st);\n"
         "}\n";
 
+    // Signed distance field variants: the alpha channel holds the
+    // distance to the edge, 0.5 being on the edge. SdfRange is the
+    // distance range covered by alpha 0 to 1, in UV units, which is
+    // converted to screen pixels to antialias over about one pixel
+    // whatever the zoom level.
+    const GLchar* sdf_fragment_shader_glsl_120 =
+        "#ifdef GL_ES\n"
+        "#extension GL_OES_standard_derivatives : enable\n"
+        "    precision mediump float;\n"
+        "#endif\n"
+        "uniform sampler2D Texture;\n"
+        "uniform vec2 SdfRange;\n"
+        "varying vec2 Frag_UV;\n"
+        "varying vec4 Frag_Color;\n"
+        "void main()\n"
+        "{\n"
+        "    float dist = texture2D(Texture, Frag_UV.st).a;\n"
+        "    vec2 screen_per_uv = 1.0 / max(fwidth(Frag_UV.st), vec2(1e-6));\n"
+        "    float px_range = max(0.5 * dot(SdfRange, screen_per_uv), 1.0);\n"
+        "    float alpha = clamp(px_range * (dist - 0.5) + 0.5, 0.0, 1.0);\n"
+        "    gl_FragColor = vec4(Frag_Color.rgb, Frag_Color.a * alpha);\n"
+        "}\n";
+
+    const GLchar* sdf_fragment_shader_glsl_130 =
+        "uniform sampler2D Texture;\n"
+        "uniform vec2 SdfRange;\n"
+        "in vec2 Frag_UV;\n"
+        "in vec4 Frag_Color;\n"
+        "out vec4 Out_Color;\n"
+        "void main()\n"
+        "{\n"
+        "    float dist = texture(Texture, Frag_UV.st).a;\n"
+        "    vec2 screen_per_uv = 1.0 / max(fwidth(Frag_UV.st), vec2(1e-6));\n"
+        "    float px_range = max(0.5 * dot(SdfRange, screen_per_uv), 1.0);\n"
+        "    float alpha = clamp(px_range * (dist - 0.5) + 0.5, 0.0, 1.0);\n"
+        "    Out_Color = vec4(Frag_Color.rgb, Frag_Color.a * alpha);\n"
+        "}\n";
+
+    const GLchar* sdf_fragment_shader_glsl_300_es =
+        "precision mediump float;\n"
+        "uniform sampler2D Texture;\n"
+        "uniform vec2 SdfRange;\n"
+        "in vec2 Frag_UV;\n"
+        "in vec4 Frag_Color;\n"
+        "layout (location = 0) out vec4 Out_Color;\n"
+        "void main()\n"
+        "{\n"
+        "    float dist = texture(Texture, Frag_UV.st).a;\n"
+        "    vec2 screen_per_uv = 1.0 / max(fwidth(Frag_UV.st), vec2(1e-6));\n"
+        "    float px_range = max(0.5 * dot(SdfRange, screen_per_uv), 1.0);\n"
+        "    float alpha = clamp(px_range * (dist - 0.5) + 0.5, 0.0, 1.0);\n"
+        "    Out_Color = vec4(Frag_Color.rgb, Frag_Color.a * alpha);\n"
+        "}\n";
+
+    const GLchar* sdf_fragment_shader_glsl_410_core =
+        "in vec2 Frag_UV;\n"
+        "in vec4 Frag_Color;\n"
+        "uniform sampler2D Texture;\n"
+        "uniform vec2 SdfRange;\n"
+        "layout (location = 0) out vec4 Out_Color;\n"
+        "void main()\n"
+        "{\n"
+        "    float dist = texture(Texture, Frag_UV.st).a;\n"
+        "    vec2 screen_per_uv = 1.0 / max(fwidth(Frag_UV.st), vec2(1e-6));\n"
+        "    float px_range = max(0.5 * dot(SdfRange, screen_per_uv), 1.0);\n"
+        "    float alpha = clamp(px_range * (dist - 0.5) + 0.5, 0.0, 1.0);\n"
+        "    Out_Color = vec4(Frag_Color.rgb, Frag_Color.a * alpha);\n"
+        "}\n";
+
     // Select shaders matching our GLSL versions
     const GLchar* vertex_shader = nullptr;
     const GLchar* fragment_shader = nullptr;
+    const GLchar* sdf_fragment_shader = nullptr;
     if (glsl_version < 130)
     {
         vertex_shader = vertex_shader_glsl_120;
         fragment_shader = fragment_shader_glsl_120;
+        sdf_fragment_shader = sdf_fragment_shader_glsl_120;
     }
     else if (glsl_version >= 410)
     {
         vertex_shader = vertex_shader_glsl_410_core;
         fragment_shader = fragment_shader_glsl_410_core;
+        sdf_fragment_shader = sdf_fragment_shader_glsl_410_core;
     }
     else if (glsl_version == 300)
     {
         vertex_shader = vertex_shader_glsl_300_es;
         fragment_shader = fragment_shader_glsl_300_es;
+        sdf_fragment_shader = sdf_fragment_shader_glsl_300_es;
     }
     else
     {
         vertex_shader = vertex_shader_glsl_130;
         fragment_shader = fragment_shader_glsl_130;
+        sdf_fragment_shader = sdf_fragment_shader_glsl_130;
     }
 
     // Create shaders
@@ -949,7 +1076,6 @@ bool    ImGui_ImplOpenGL3_CreateDeviceObjects()
 
     glDetachShader(bd->ShaderHandle, vert_handle);
     glDetachShader(bd->ShaderHandle, frag_handle);
-    glDeleteShader(vert_handle);
     glDeleteShader(frag_handle);
 
     bd->AttribLocationTex = glGetUniformLocation(bd->ShaderHandle, "Texture");
@@ -958,6 +1084,43 @@ bool    ImGui_ImplOpenGL3_CreateDeviceObjects()
     bd->AttribLocationVtxUV = (GLuint)glGetAttribLocation(bd->ShaderHandle, "UV");
     bd->AttribLocationVtxColor = (GLuint)glGetAttribLocation(bd->ShaderHandle, "Color");
 
+    // SDF program. It shares the vertex shader and the attribute
+    // locations, such that the vertex setup is valid for both programs.
+    // Failing to build it is not fatal: SDF textures are then drawn
+    // with the default program.
+    const GLchar* sdf_fragment_shader_with_version[2] = { bd->GlslVersionString, sdf_fragment_shader };
+    GLuint sdf_frag_handle;
+    GL_CALL(sdf_frag_handle = glCreateShader(GL_FRAGMENT_SHADER));
+    glShaderSource(sdf_frag_handle, 2, sdf_fragment_shader_with_version, nullptr);
+    glCompileShader(sdf_frag_handle);
+    bool sdf_valid = CheckShader(sdf_frag_handle, "sdf fragment shader");
+
+    bd->SdfShaderHandle = glCreateProgram();
+    glAttachShader(bd->SdfShaderHandle, vert_handle);
+    glAttachShader(bd->SdfShaderHandle, sdf_frag_handle);
+    glBindAttribLocation(bd->SdfShaderHandle, bd->AttribLocationVtxPos, "Position");
+    glBindAttribLocation(bd->SdfShaderHandle, bd->AttribLocationVtxUV, "UV");
+    glBindAttribLocation(bd->SdfShaderHandle, bd->AttribLocationVtxColor, "Color");
+    glLinkProgram(bd->SdfShaderHandle);
+    sdf_valid = CheckProgram(bd->SdfShaderHandle, "sdf shader program") && sdf_valid;
+
+    glDetachShader(bd->SdfShaderHandle, vert_handle);
+    glDetachShader(bd->SdfShaderHandle, sdf_frag_handle);
+    glDeleteShader(vert_handle);
+    glDeleteShader(sdf_frag_handle);
+
+    if (sdf_valid)
+    {
+        bd->SdfAttribLocationTex = glGetUniformLocation(bd->SdfShaderHandle, "Texture");
+        bd->SdfAttribLocationProjMtx = glGetUniformLocation(bd->SdfShaderHandle, "ProjMtx");
+        bd->SdfAttribLocationRange = glGetUniformLocation(bd->SdfShaderHandle, "SdfRange");
+    }
+    else
+    {
+        glDeleteProgram(bd->SdfShaderHandle);
+        bd->SdfShaderHandle = 0;
+    }
+
     // Create buffers
     glGenBuffers(1, &bd->VboHandle);
     glGenBuffers(1, &bd->ElementsHandle);
@@ -983,6 +1146,7 @@ void    ImGui_ImplOpenGL3_DestroyDeviceObjects()
     if (bd->VboHandle)      { glDeleteBuffers(1, &bd->VboHandle); bd->VboHandle = 0; }
     if (bd->ElementsHandle) { glDeleteBuffers(1, &bd->ElementsHandle); bd->ElementsHandle = 0; }
     if (bd->ShaderHandle)   { glDeleteProgram(bd->ShaderHandle); bd->ShaderHandle = 0; }
+    if (bd->SdfShaderHandle) { glDeleteProgram(bd->SdfShaderHandle); bd->SdfShaderHandle = 0; }
     ImGui_ImplOpenGL3_DestroyFontsTexture();
 }
 
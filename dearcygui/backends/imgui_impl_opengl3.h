@@ -37,6 +37,11 @@ IMGUI_IMPL_API bool     Needs_ImGui_ImplOpenGL3_NewFrame();
 IMGUI_IMPL_API void     ImGui_ImplOpenGL3_NewFrame();
 IMGUI_IMPL_API void     ImGui_ImplOpenGL3_RenderDrawData(SDLViewport* platform, ImDrawData* draw_data);
 
+// Rendering from a thread that doesn't hold the imgui context (threaded presentation):
+// retrieve the backend data with the context current, then set it on the rendering thread.
+IMGUI_IMPL_API void*    ImGui_ImplOpenGL3_GetBackendDataHandle();
+IMGUI_IMPL_API void     ImGui_ImplOpenGL3_SetThreadBackendData(void* backend_data);
+
 // (Optional) Called by Init/NewFrame/Shutdown
 IMGUI_IMPL_API bool     ImGui_ImplOpenGL3_CreateFontsTexture();
 IMGUI_IMPL_API void     ImGui_ImplOpenGL3_DestroyFontsTexture();
@@ -20,6 +20,15 @@
 #include <mutex>
 #include <chrono>
 
+#if defined(__linux__)
+#include <sys/epoll.h>
+#include <sys/eventfd.h>
+#endif
+#if !defined(_WIN32)
+#include <fcntl.h>
+#include <unistd.h>
+#endif
+
 SDL_ThreadID SDLViewport::sdlMainThreadId = 0;
 std::atomic<bool> SDLViewport::sdlInitialized{false};
 std::mutex SDLViewport::sdlInitMutex;
@@ -57,6 +66,12 @@ bool platformViewport::fastActivityCheck() {
 void SDLViewport::preparePresentFrame() {
     // Rendering
     ImGui::Render();
+    if (threadedPresentation) {
+        queuePresentFrame(ImGui::GetDrawData());
+        return;
+    }
+    // Frames already queued must be presented first
+    waitPresentationIdle();
     renderContextLock.lock();
     SDL_GL_MakeCurrent(windowHandle, glContext);
 
@@ -81,6 +96,138 @@ void SDLViewport::preparePresentFrame() {
     renderContextLock.unlock();
 }
 
+template <typename T>
+static void CopyImVector(ImVector<T>& dst, const ImVector<T>& src) {
+    // Unlike operator=, keeps the allocation of dst
+    dst.resize(src.Size);
+    if (src.Size > 0)
+        memcpy((void*)dst.Data, (const void*)src.Data, (size_t)src.Size * sizeof(T));
+}
+
+void SDLViewport::queuePresentFrame(ImDrawData* draw_data) {
+    std::unique_lock<std::mutex> lock(presentMutex);
+    if (!presentThread.joinable()) {
+        presentThreadStop = false;
+        presentThread = std::thread(&SDLViewport::presentationLoop, this);
+    }
+    // Wait the buffer is neither queued nor being presented.
+    // This blocks only when the main thread is more than
+    // one frame ahead of the presentation.
+    presentCV.wait(lock, [this] {
+        return presentPendingIndex < 0 && presentingIndex != presentFillIndex;
+    });
+    lock.unlock();
+
+    PresentFrame& frame = presentFrames[presentFillIndex];
+    frame.numLists = 0;
+    for (int n = 0; n < draw_data->CmdListsCount; n++) {
+        ImDrawList* src = draw_data->CmdLists[n];
+        if (frame.cmdLists.Size <= n)
+            frame.cmdLists.push_back(IM_NEW(ImDrawList)(nullptr));
+        ImDrawList* dst = frame.cmdLists[n];
+        CopyImVector(dst->CmdBuffer, src->CmdBuffer);
+        CopyImVector(dst->IdxBuffer, src->IdxBuffer);
+        CopyImVector(dst->VtxBuffer, src->VtxBuffer);
+        dst->Flags = src->Flags;
+        frame.numLists++;
+    }
+    frame.displayPos = draw_data->DisplayPos;
+    frame.displaySize = draw_data->DisplaySize;
+    frame.framebufferScale = draw_data->FramebufferScale;
+    frame.frameWidth = frameWidth;
+    frame.frameHeight = frameHeight;
+    for (int i = 0; i < 4; i++)
+        frame.clearColor[i] = clearColor[i];
+    frame.vsync = hasVSync;
+    frame.backendData = ImGui_ImplOpenGL3_GetBackendDataHandle();
+
+    lock.lock();
+    presentPendingIndex = presentFillIndex;
+    presentFillIndex = 1 - presentFillIndex;
+    lock.unlock();
+    presentCV.notify_all();
+}
+
+void SDLViewport::presentationLoop() {
+    std::unique_lock<std::mutex> lock(presentMutex);
+    while (true) {
+        presentCV.wait(lock, [this] {
+            return presentPendingIndex >= 0 || presentThreadStop;
+        });
+        // Queued frames are presented before stopping
+        if (presentPendingIndex < 0)
+            break;
+        int index = presentPendingIndex;
+        presentPendingIndex = -1;
+        presentingIndex = index;
+        lock.unlock();
+        presentCV.notify_all();
+        renderPresentFrame(presentFrames[index]);
+        lock.lock();
+        presentingIndex = -1;
+        presentCV.notify_all();
+        // Event loops may wait for the next frame to be accepted
+        signalWaitHandle();
+    }
+}
+
+void SDLViewport::renderPresentFrame(PresentFrame& frame) {
+    ImDrawData draw_data;
+    draw_data.Valid = true;
+    draw_data.DisplayPos = frame.displayPos;
+    draw_data.DisplaySize = frame.displaySize;
+    draw_data.FramebufferScale = frame.framebufferScale;
+    for (int n = 0; n < frame.numLists; n++)
+        draw_data.AddDrawList(frame.cmdLists[n]);
+
+    renderContextLock.lock();
+    SDL_GL_MakeCurrent(windowHandle, glContext);
+
+    int current_interval, desired_interval;
+    SDL_GL_GetSwapInterval(&current_interval);
+    desired_interval = frame.vsync ? 1 : 0;
+    if (desired_interval != current_interval)
+        SDL_GL_SetSwapInterval(desired_interval);
+    glDrawBuffer(GL_BACK);
+    glViewport(0, 0, frame.frameWidth, frame.frameHeight);
+    glClearColor(frame.clearColor[0], frame.clearColor[1], frame.clearColor[2], frame.clearColor[3]);
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
+    {
+        std::lock_guard<std::recursive_mutex> lock(textureMutex);
+        ImGui_ImplOpenGL3_SetThreadBackendData(frame.backendData);
+        ImGui_ImplOpenGL3_RenderDrawData(this, &draw_data);
+        ImGui_ImplOpenGL3_SetThreadBackendData(nullptr);
+        currentFrame++;
+    }
+    cleanupTextures();
+    SDL_GL_SwapWindow(windowHandle);
+    SDL_GL_MakeCurrent(windowHandle, NULL);
+    renderContextLock.unlock();
+}
+
+void SDLViewport::waitPresentationIdle() {
+    std::unique_lock<std::mutex> lock(presentMutex);
+    presentCV.wait(lock, [this] {
+        return presentPendingIndex < 0 && presentingIndex < 0;
+    });
+}
+
+void SDLViewport::stopPresentationThread() {
+    {
+        std::lock_guard<std::mutex> lock(presentMutex);
+        presentThreadStop = true;
+    }
+    presentCV.notify_all();
+    if (presentThread.joinable())
+        presentThread.join();
+    for (int i = 0; i < 2; i++) {
+        for (ImDrawList* draw_list : presentFrames[i].cmdLists)
+            IM_DELETE(draw_list);
+        presentFrames[i].cmdLists.clear();
+        presentFrames[i].numLists = 0;
+    }
+}
+
 SDL_HitTestResult SDLViewport::HitTestCallback(SDL_Window* win, const SDL_Point* area, void* data) {
     SDLViewport* viewport = static_cast<SDLViewport*>(data);
     return viewport->ProcessHitTest(area);
@@ -278,6 +425,58 @@ void SDLViewport::setHitTestSurface(const uint8_t* surface, int width, int heigh
 }
 
 
+// Texture element types: 0 = float32, 1 = uint8, 2 = uint16, 3 = float16
+static unsigned textureTypeSize(unsigned type) {
+    switch (type) {
+    case 1:
+        return 1;
+    case 2:
+    case 3:
+        return 2;
+    default:
+        return 4;
+    }
+}
+
+static GLenum textureGLType(unsigned type) {
+    switch (type) {
+    case 1:
+        return GL_UNSIGNED_BYTE;
+    case 2:
+        return GL_UNSIGNED_SHORT;
+    case 3:
+        return GL_HALF_FLOAT;
+    default:
+        return GL_FLOAT;
+    }
+}
+
+static GLenum textureGLFormat(unsigned num_chans) {
+    switch (num_chans) {
+    case 4:
+        return GL_RGBA;
+    case 3:
+        return GL_RGB;
+    case 2:
+        return GL_RG;
+    case 1:
+    default:
+        return GL_RED;
+    }
+}
+
+static GLenum textureGLInternalFormat(unsigned num_chans, unsigned type) {
+    static const GLenum formats[4][4] = {
+        {GL_R32F, GL_RG32F, GL_RGB32F, GL_RGBA32F},
+        {GL_R8, GL_RG8, GL_RGB8, GL_RGBA8},
+        {GL_R16, GL_RG16, GL_RGB16, GL_RGBA16},
+        {GL_R16F, GL_RG16F, GL_RGB16F, GL_RGBA16F}
+    };
+    if (num_chans < 1 || num_chans > 4)
+        num_chans = 1;
+    return formats[type < 4 ? type : 0][num_chans - 1];
+}
+
 GLuint SDLViewport::findTextureInCache(unsigned width, unsigned height, unsigned num_chans,
                                       unsigned type, unsigned filter_mode, bool dynamic) {
     std::lock_guard<std::recursive_mutex> lock(textureMutex);
@@ -322,6 +521,7 @@ GLuint SDLViewport::findTextureInCache(unsigned width, unsigned height, unsigned
         auto& info = textureInfoMap[best_tex_id];
         deletedTexturesMemory -= getTextureSize(info.width, info.height, info.num_chans, info.type);
         info.deletion_frame = -1; // Mark as active
+        info.sdf_range = 0.f;
         return best_tex_id;
     }
 
@@ -345,33 +545,9 @@ void* SDLViewport::allocateTexture(unsigned width, unsigned height, unsigned num
     // But if we were to change this,
     // here is commented out code to do it.
     //makeUploadContextCurrent();
-    unsigned gl_format = GL_RGBA;
-    unsigned gl_internal_format = GL_RGBA8;
-    unsigned gl_type = GL_FLOAT;
-
-    switch (num_chans) {
-    case 4:
-        gl_format = GL_RGBA;
-        gl_internal_format = type == 1 ? GL_RGBA8 : GL_RGBA32F;
-        break;
-    case 3:
-        gl_format = GL_RGB; 
-        gl_internal_format = type == 1 ? GL_RGB8 : GL_RGB32F;
-        break;
-    case 2:
-        gl_format = GL_RG;
-        gl_internal_format = type == 1 ? GL_RG8 : GL_RG32F;
-        break;
-    case 1:
-    default:
-        gl_format = GL_RED;
-        gl_internal_format = type == 1 ? GL_R8 : GL_R32F;
-        break;
-    }
-
-    if (type == 1) {
-        gl_type = GL_UNSIGNED_BYTE;
-    }
+    unsigned gl_format = textureGLFormat(num_chans);
+    unsigned gl_internal_format = textureGLInternalFormat(num_chans, type);
+    unsigned gl_type = textureGLType(type);
 
     glGenTextures(1, &image_texture);
     if (glGetError() != GL_NO_ERROR) {
@@ -497,6 +673,18 @@ void SDLViewport::freeTexture(void* texture) {
     }
 }
 
+void SDLViewport::setTextureSDF(void* texture, float pixel_range) {
+    GLuint tex_id = (GLuint)(size_t)texture;
+    if (pixel_range < 0.f)
+        throw std::runtime_error("Invalid SDF range");
+
+    std::lock_guard<std::recursive_mutex> lock(textureMutex);
+    auto it = textureInfoMap.find(tex_id);
+    if (it == textureInfoMap.end() || it->second.deletion_frame >= 0)
+        throw std::runtime_error("Invalid texture");
+    it->second.sdf_range = pixel_range;
+}
+
 bool SDLViewport::updateTexture(void* texture, unsigned width, unsigned height,
                               unsigned num_chans, unsigned type, void* data,
                               unsigned src_stride, bool dynamic) {
@@ -525,34 +713,12 @@ bool SDLViewport::updateTexture(void* texture, unsigned width, unsigned height,
         throw std::runtime_error("Texture parameters mismatch in update");
     }
 
-    unsigned gl_format = GL_RGBA;
-    unsigned gl_type = GL_FLOAT;
-    unsigned type_size = 4;
+    unsigned gl_format = textureGLFormat(num_chans);
+    unsigned gl_type = textureGLType(type);
+    unsigned type_size = textureTypeSize(type);
     GLuint pboid = 0;
     GLubyte* ptr;
 
-    switch (num_chans)
-    {
-    case 4:
-        gl_format = GL_RGBA;
-        break;
-    case 3:
-        gl_format = GL_RGB;
-        break;
-    case 2:
-        gl_format = GL_RG;
-        break;
-    case 1:
-    default:
-        gl_format = GL_RED;
-        break;
-    }
-
-    if (type == 1) {
-        gl_type = GL_UNSIGNED_BYTE;
-        type_size = 1;
-    }
-
     if(info.pbo == 0) {
         glGenBuffers(1, &pboid);
         if (glGetError() != GL_NO_ERROR)
@@ -654,6 +820,329 @@ bool SDLViewport::updateStaticTexture(void* texture, unsigned width, unsigned he
     return updateTexture(texture, width, height, num_chans, type, data, src_stride, false);
 }
 
+bool SDLViewport::updateTextureRegion(void* texture, unsigned x, unsigned y,
+                                      unsigned width, unsigned height,
+                                      unsigned num_chans, unsigned type, void* data,
+                                      unsigned src_stride) {
+    auto texture_id = (GLuint)(size_t)texture;
+    unsigned gl_format = textureGLFormat(num_chans);
+    unsigned gl_type = textureGLType(type);
+    unsigned pixel_size = num_chans * textureTypeSize(type);
+
+    std::lock_guard<std::recursive_mutex> lock(textureMutex);
+    auto it = textureInfoMap.find(texture_id);
+    if (it == textureInfoMap.end() || it->second.deletion_frame >= 0) {
+        throw std::runtime_error("Invalid or deleted texture handle");
+    }
+    TextureInfo& info = it->second;
+    if (info.num_chans != num_chans || info.type != type) {
+        throw std::runtime_error("Texture parameters mismatch in region update");
+    }
+    if (width == 0 || height == 0)
+        return true;
+    if (x > info.width || y > info.height ||
+        width > info.width - x || height > info.height - y) {
+        throw std::runtime_error("Region exceeds the texture bounds");
+    }
+
+    // Only the region is transferred: no staging through the
+    // full-size PBO, which would require copying the whole texture.
+    waitTextureWritable(info);
+
+    glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0);
+    glBindTexture(GL_TEXTURE_2D, texture_id);
+    if (src_stride % pixel_size == 0) {
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, src_stride / pixel_size);
+        glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, width, height, gl_format, gl_type, data);
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, 0);
+    } else {
+        for (unsigned row = 0; row < height; row++) {
+            glTexSubImage2D(GL_TEXTURE_2D, 0, x, y + row, width, 1, gl_format, gl_type,
+                            ((unsigned char*)data) + (size_t)row * src_stride);
+        }
+    }
+
+    if (info.filter_mode == 3) {
+        glGenerateMipmap(GL_TEXTURE_2D);
+    }
+
+    markTextureWritten(info);
+
+    if (info.last_use_frame >= currentFrame-1)
+        needsRefresh.store(true);
+
+    glBindTexture(GL_TEXTURE_2D, 0);
+    GLenum error = glGetError();
+    if (error != GL_NO_ERROR) {
+        std::string error_msg = "Failed to update texture region (error code: " +
+                               std::to_string(error) + ")";
+        throw std::runtime_error(error_msg);
+    }
+    glFlush();
+    return true;
+}
+
+static const char* yuv_vertex_shader = R"(#version 150
+void main() {
+    // Triangle covering the whole viewport
+    vec2 pos = vec2(float((gl_VertexID << 1) & 2), float(gl_VertexID & 2));
+    gl_Position = vec4(pos * 2.0 - 1.0, 0.0, 1.0);
+}
+)";
+
+static const char* yuv_fragment_shader = R"(#version 150
+uniform sampler2D PlaneY;
+uniform sampler2D PlaneU;
+uniform sampler2D PlaneV;
+uniform int Format; // 0 = NV12, 1 = I420, 2 = YUYV
+uniform mat3 YUVToRGB;
+uniform vec3 Offset;
+out vec4 Out_Color;
+void main() {
+    // Row 0 of the frame is stored at texel row 0
+    ivec2 p = ivec2(gl_FragCoord.xy);
+    vec3 yuv;
+    if (Format == 2) {
+        // Y0 U Y1 V macropixels
+        vec4 t = texelFetch(PlaneY, ivec2(p.x >> 1, p.y), 0);
+        yuv = vec3((p.x & 1) == 0 ? t.r : t.b, t.g, t.a);
+    } else if (Format == 0) {
+        yuv = vec3(texelFetch(PlaneY, p, 0).r, texelFetch(PlaneU, p >> 1, 0).rg);
+    } else {
+        yuv = vec3(texelFetch(PlaneY, p, 0).r,
+                   texelFetch(PlaneU, p >> 1, 0).r,
+                   texelFetch(PlaneV, p >> 1, 0).r);
+    }
+    Out_Color = vec4(clamp(YUVToRGB * (yuv - Offset), 0.0, 1.0), 1.0);
+}
+)";
+
+static GLuint compileYUVShader(GLenum type, const char* source) {
+    GLuint shader = glCreateShader(type);
+    glShaderSource(shader, 1, &source, nullptr);
+    glCompileShader(shader);
+    GLint status = 0;
+    glGetShaderiv(shader, GL_COMPILE_STATUS, &status);
+    if (status != GL_TRUE) {
+        glDeleteShader(shader);
+        return 0;
+    }
+    return shader;
+}
+
+bool SDLViewport::initYUVConversion() {
+    if (yuvProgram != 0)
+        return true;
+
+    GLuint vertex_shader = compileYUVShader(GL_VERTEX_SHADER, yuv_vertex_shader);
+    GLuint fragment_shader = compileYUVShader(GL_FRAGMENT_SHADER, yuv_fragment_shader);
+    if (vertex_shader == 0 || fragment_shader == 0) {
+        if (vertex_shader != 0)
+            glDeleteShader(vertex_shader);
+        if (fragment_shader != 0)
+            glDeleteShader(fragment_shader);
+        return false;
+    }
+    GLuint program = glCreateProgram();
+    glAttachShader(program, vertex_shader);
+    glAttachShader(program, fragment_shader);
+    glBindFragDataLocation(program, 0, "Out_Color");
+    glLinkProgram(program);
+    glDetachShader(program, vertex_shader);
+    glDetachShader(program, fragment_shader);
+    glDeleteShader(vertex_shader);
+    glDeleteShader(fragment_shader);
+    GLint status = 0;
+    glGetProgramiv(program, GL_LINK_STATUS, &status);
+    if (status != GL_TRUE) {
+        glDeleteProgram(program);
+        return false;
+    }
+
+    yuvFormatLocation = glGetUniformLocation(program, "Format");
+    yuvMatrixLocation = glGetUniformLocation(program, "YUVToRGB");
+    yuvOffsetLocation = glGetUniformLocation(program, "Offset");
+    glUseProgram(program);
+    glUniform1i(glGetUniformLocation(program, "PlaneY"), 0);
+    glUniform1i(glGetUniformLocation(program, "PlaneU"), 1);
+    glUniform1i(glGetUniformLocation(program, "PlaneV"), 2);
+    glUseProgram(0);
+
+    glGenVertexArrays(1, &yuvVertexArray);
+    glGenFramebuffers(1, &yuvFramebuffer);
+    glGenTextures(3, yuvPlanes);
+    for (int i = 0; i < 3; i++) {
+        glBindTexture(GL_TEXTURE_2D, yuvPlanes[i]);
+        // Planes are read with texelFetch, but must be complete
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE);
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE);
+        yuvPlaneWidth[i] = 0;
+        yuvPlaneHeight[i] = 0;
+        yuvPlaneFormat[i] = 0;
+    }
+    glBindTexture(GL_TEXTURE_2D, 0);
+    yuvProgram = program;
+    return true;
+}
+
+void SDLViewport::cleanupYUVConversion() {
+    if (yuvProgram == 0)
+        return;
+    glDeleteProgram(yuvProgram);
+    glDeleteVertexArrays(1, &yuvVertexArray);
+    glDeleteFramebuffers(1, &yuvFramebuffer);
+    glDeleteTextures(3, yuvPlanes);
+    yuvProgram = 0;
+    yuvVertexArray = 0;
+    yuvFramebuffer = 0;
+    for (int i = 0; i < 3; i++)
+        yuvPlanes[i] = 0;
+}
+
+void SDLViewport::uploadYUVPlane(int index, unsigned width, unsigned height,
+                                 GLenum internal_format, GLenum format, unsigned pixel_size,
+                                 const unsigned char* data, unsigned stride) {
+    glBindTexture(GL_TEXTURE_2D, yuvPlanes[index]);
+    if (yuvPlaneWidth[index] != width || yuvPlaneHeight[index] != height ||
+        yuvPlaneFormat[index] != internal_format) {
+        glTexImage2D(GL_TEXTURE_2D, 0, internal_format, width, height, 0,
+                     format, GL_UNSIGNED_BYTE, NULL);
+        yuvPlaneWidth[index] = width;
+        yuvPlaneHeight[index] = height;
+        yuvPlaneFormat[index] = internal_format;
+    }
+    if (stride % pixel_size == 0) {
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, stride / pixel_size);
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, width, height, format, GL_UNSIGNED_BYTE, data);
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, 0);
+    } else {
+        for (unsigned row = 0; row < height; row++) {
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, row, width, 1, format, GL_UNSIGNED_BYTE,
+                            data + (size_t)row * stride);
+        }
+    }
+    glBindTexture(GL_TEXTURE_2D, 0);
+}
+
+bool SDLViewport::updateTextureYUV(void* texture, unsigned width, unsigned height,
+                                   unsigned yuv_format, void* data, unsigned src_stride,
+                                   unsigned colorspace, bool full_range) {
+    auto texture_id = (GLuint)(size_t)texture;
+    if (yuv_format > 2) {
+        throw std::runtime_error("Unknown YUV format");
+    }
+    if ((width & 1) != 0 || (yuv_format != 2 && (height & 1) != 0)) {
+        throw std::runtime_error("YUV frame dimensions must be even");
+    }
+    if (yuv_format == 1 && (src_stride & 1) != 0) {
+        throw std::runtime_error("I420 frame stride must be even");
+    }
+
+    std::lock_guard<std::recursive_mutex> lock(textureMutex);
+    auto it = textureInfoMap.find(texture_id);
+    if (it == textureInfoMap.end() || it->second.deletion_frame >= 0) {
+        throw std::runtime_error("Invalid or deleted texture handle");
+    }
+    TextureInfo& info = it->second;
+    if (info.width != width || info.height != height ||
+        info.num_chans != 4 || info.type != 1) {
+        throw std::runtime_error("YUV frames must target a RGBA uint8 texture of the same size");
+    }
+    if (!initYUVConversion()) {
+        throw std::runtime_error("Failed to build the YUV conversion shader");
+    }
+
+    // Upload the planes
+    const unsigned char* src = (const unsigned char*)data;
+    glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0);
+    switch (yuv_format) {
+    case 0: // NV12: Y plane, then interleaved UV at half resolution
+        uploadYUVPlane(0, width, height, GL_R8, GL_RED, 1, src, src_stride);
+        uploadYUVPlane(1, width / 2, height / 2, GL_RG8, GL_RG, 2,
+                       src + (size_t)src_stride * height, src_stride);
+        break;
+    case 1: // I420: Y plane, then U and V planes at half resolution
+        uploadYUVPlane(0, width, height, GL_R8, GL_RED, 1, src, src_stride);
+        src += (size_t)src_stride * height;
+        uploadYUVPlane(1, width / 2, height / 2, GL_R8, GL_RED, 1, src, src_stride / 2);
+        src += (size_t)(src_stride / 2) * (height / 2);
+        uploadYUVPlane(2, width / 2, height / 2, GL_R8, GL_RED, 1, src, src_stride / 2);
+        break;
+    case 2: // YUYV: one Y0 U Y1 V texel for two pixels
+    default:
+        uploadYUVPlane(0, width / 2, height, GL_RGBA8, GL_RGBA, 4, src, src_stride);
+        break;
+    }
+
+    // Conversion matrix (column major) from the luma coefficients
+    float kr = colorspace == 1 ? 0.2126f : 0.299f;
+    float kb = colorspace == 1 ? 0.0722f : 0.114f;
+    float kg = 1.f - kr - kb;
+    float scale_y = full_range ? 1.f : 255.f / 219.f;
+    float scale_c = full_range ? 1.f : 255.f / 224.f;
+    float r_v = 2.f * (1.f - kr);
+    float b_u = 2.f * (1.f - kb);
+    GLfloat matrix[9] = {
+        scale_y, scale_y, scale_y,
+        0.f, -b_u * kb / kg * scale_c, b_u * scale_c,
+        r_v * scale_c, -r_v * kr / kg * scale_c, 0.f
+    };
+    GLfloat offset[3] = { full_range ? 0.f : 16.f / 255.f, 128.f / 255.f, 128.f / 255.f };
+
+    waitTextureWritable(info);
+
+    glBindFramebuffer(GL_FRAMEBUFFER, yuvFramebuffer);
+    glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture_id, 0);
+    bool success = glCheckFramebufferStatus(GL_FRAMEBUFFER) == GL_FRAMEBUFFER_COMPLETE;
+    if (success) {
+        glDisable(GL_BLEND);
+        glDisable(GL_SCISSOR_TEST);
+        glDisable(GL_DEPTH_TEST);
+        glDisable(GL_CULL_FACE);
+        glViewport(0, 0, width, height);
+        glUseProgram(yuvProgram);
+        glUniform1i(yuvFormatLocation, (GLint)yuv_format);
+        glUniformMatrix3fv(yuvMatrixLocation, 1, GL_FALSE, matrix);
+        glUniform3fv(yuvOffsetLocation, 1, offset);
+        for (int i = 0; i < 3; i++) {
+            glActiveTexture(GL_TEXTURE0 + i);
+            glBindTexture(GL_TEXTURE_2D, yuvPlanes[i]);
+        }
+        glBindVertexArray(yuvVertexArray);
+        glDrawArrays(GL_TRIANGLES, 0, 3);
+        glBindVertexArray(0);
+        for (int i = 2; i >= 0; i--) {
+            glActiveTexture(GL_TEXTURE0 + i);
+            glBindTexture(GL_TEXTURE_2D, 0);
+        }
+        glUseProgram(0);
+    }
+    glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, 0, 0);
+    glBindFramebuffer(GL_FRAMEBUFFER, 0);
+
+    if (success && info.filter_mode == 3) {
+        glBindTexture(GL_TEXTURE_2D, texture_id);
+        glGenerateMipmap(GL_TEXTURE_2D);
+        glBindTexture(GL_TEXTURE_2D, 0);
+    }
+
+    markTextureWritten(info);
+
+    if (info.last_use_frame >= currentFrame-1)
+        needsRefresh.store(true);
+
+    GLenum error = glGetError();
+    if (!success || error != GL_NO_ERROR) {
+        std::string error_msg = "Failed to convert YUV frame (error code: " +
+                               std::to_string(error) + ")";
+        throw std::runtime_error(error_msg);
+    }
+    glFlush();
+    return true;
+}
+
 SDLViewport* SDLViewport::create(render_fun render,
                                  on_resize_fun on_resize,
                                  on_close_fun on_close,
@@ -757,7 +1246,9 @@ SDLViewport* SDLViewport::create(render_fun render,
 // Implementation of SDLViewport methods
 void SDLViewport::cleanup() {
     if (!checkPrimaryThread()) return;
-    
+
+    stopPresentationThread();
+    closeWaitHandle();
     std::lock_guard<std::recursive_mutex> lock(textureMutex);
     // Clean up all GL resources properly before destroying contexts
     if (uploadWindowHandle != nullptr && uploadGLContext != nullptr) {
@@ -782,6 +1273,7 @@ void SDLViewport::cleanup() {
         }
         textureInfoMap.clear();
         deletedTexturesMemory = 0;
+        cleanupYUVConversion();
         SDL_GL_MakeCurrent(uploadWindowHandle, nullptr);
         uploadContextLock.unlock();
     }
@@ -980,6 +1472,8 @@ bool SDLViewport::initialize() {
     SDL_GL_MakeCurrent(windowHandle, NULL);
     renderContextLock.unlock();
 
+    initWaitHandle();
+
     return true;
 }
 
@@ -1333,6 +1827,10 @@ bool SDLViewport::processEvents(int timeout_ms) {
         time_requested_rendering = UINT64_MAX;
     }
 
+    // Concurrent delayed wakes lower the value and signal the wait
+    // handle, such that event loops process their events again.
+    nextWakeTime.store(std::min(time_requested_refresh, time_requested_rendering));
+
     // schedule again untreated refresh or rendering requests
 
     if (time_requested_refresh != UINT64_MAX) {
@@ -1432,6 +1930,13 @@ bool SDLViewport::renderFrame(bool can_skip_presenting) {
 }
 
 void SDLViewport::present() {
+    if (threadedPresentation) {
+        // Submission and swap are done by the presentation thread
+        dpiScale = SDL_GetWindowDisplayScale(windowHandle);
+        if (dpiScale == 0.f)
+            dpiScale = 1.0f;
+        return;
+    }
     renderContextLock.lock();
     SDL_GL_MakeCurrent(windowHandle, glContext);
     SDL_GL_SwapWindow(windowHandle);
@@ -1454,6 +1959,126 @@ void SDLViewport::wakeRendering(uint64_t delay_ns, bool full_refresh) {
     user_event.user.data1 = NULL;
     user_event.user.data2 = NULL;
     SDL_PushEvent(&user_event);
+    if (delay_ns > 0) {
+        uint64_t target = user_event.user.timestamp;
+        uint64_t current = nextWakeTime.load();
+        while (target < current && !nextWakeTime.compare_exchange_weak(current, target)) {}
+    }
+    signalWaitHandle();
+}
+
+int SDLViewport::getDisplayConnectionFd() {
+    // The connection to the display server is owned by SDL.
+    // Its descriptor is retrieved from the libraries SDL loaded,
+    // to not depend on their headers.
+    SDL_PropertiesID props = SDL_GetWindowProperties(windowHandle);
+    void* display = SDL_GetPointerProperty(props, SDL_PROP_WINDOW_X11_DISPLAY_POINTER, NULL);
+    const char* library = "libX11.so.6";
+    const char* function = "XConnectionNumber";
+    if (display == NULL) {
+        display = SDL_GetPointerProperty(props, SDL_PROP_WINDOW_WAYLAND_DISPLAY_POINTER, NULL);
+        library = "libwayland-client.so.0";
+        function = "wl_display_get_fd";
+    }
+    if (display == NULL)
+        return -1;
+    displayLibrary = SDL_LoadObject(library);
+    if (displayLibrary == nullptr) {
+        SDL_ClearError();
+        return -1;
+    }
+    typedef int (*get_fd_fun)(void*);
+    get_fd_fun get_fd = (get_fd_fun)SDL_LoadFunction(displayLibrary, function);
+    if (get_fd == nullptr) {
+        SDL_ClearError();
+        return -1;
+    }
+    return get_fd(display);
+}
+
+void SDLViewport::initWaitHandle() {
+#if defined(__linux__)
+    wakeEventFd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    waitHandle = epoll_create1(EPOLL_CLOEXEC);
+    if (wakeEventFd < 0 || waitHandle < 0) {
+        closeWaitHandle();
+        return;
+    }
+    struct epoll_event watch = {};
+    watch.events = EPOLLIN;
+    watch.data.fd = wakeEventFd;
+    if (epoll_ctl(waitHandle, EPOLL_CTL_ADD, wakeEventFd, &watch) != 0) {
+        closeWaitHandle();
+        return;
+    }
+    int display_fd = getDisplayConnectionFd();
+    if (display_fd >= 0) {
+        watch.data.fd = display_fd;
+        waitHandleHasInput = epoll_ctl(waitHandle, EPOLL_CTL_ADD, display_fd, &watch) == 0;
+    }
+#elif !defined(_WIN32)
+    int fds[2];
+    if (pipe(fds) != 0)
+        return;
+    for (int i = 0; i < 2; i++) {
+        fcntl(fds[i], F_SETFL, fcntl(fds[i], F_GETFL) | O_NONBLOCK);
+        fcntl(fds[i], F_SETFD, FD_CLOEXEC);
+    }
+    waitHandle = fds[0];
+    wakeEventFd = fds[1];
+#endif
+}
+
+void SDLViewport::closeWaitHandle() {
+#if !defined(_WIN32)
+    if (waitHandle >= 0)
+        close(waitHandle);
+    if (wakeEventFd >= 0)
+        close(wakeEventFd);
+#endif
+    waitHandle = -1;
+    wakeEventFd = -1;
+    waitHandleHasInput = false;
+    if (displayLibrary != nullptr) {
+        SDL_UnloadObject(displayLibrary);
+        displayLibrary = nullptr;
+    }
+}
+
+int SDLViewport::getWaitHandle(bool* includes_input) {
+    *includes_input = waitHandleHasInput;
+    return waitHandle;
+}
+
+void SDLViewport::signalWaitHandle() {
+#if defined(__linux__)
+    uint64_t value = 1;
+    if (wakeEventFd >= 0)
+        (void)!write(wakeEventFd, &value, sizeof(value));
+#elif !defined(_WIN32)
+    char value = 0;
+    if (wakeEventFd >= 0)
+        (void)!write(wakeEventFd, &value, 1);
+#endif
+}
+
+void SDLViewport::clearWaitHandle() {
+#if defined(__linux__)
+    uint64_t value;
+    if (wakeEventFd >= 0)
+        (void)!read(wakeEventFd, &value, sizeof(value));
+#elif !defined(_WIN32)
+    char buffer[64];
+    if (waitHandle >= 0)
+        while (read(waitHandle, buffer, sizeof(buffer)) > 0) {}
+#endif
+}
+
+bool SDLViewport::canQueuePresentFrame() {
+    if (!threadedPresentation && !presentThread.joinable())
+        return true;
+    std::lock_guard<std::mutex> lock(presentMutex);
+    return presentPendingIndex < 0 && presentingIndex != presentFillIndex;
 }
 
 void SDLViewport::makeUploadContextCurrent() {
@@ -1549,7 +2174,7 @@ GLContext* SDLViewport::createSharedContext(int major, int minor) {
 }
 
 size_t SDLViewport::getTextureSize(unsigned width, unsigned height, unsigned num_chans, unsigned type) {
-    return width * height * num_chans * (type == 1 ? 1 : 4);
+    return width * height * num_chans * textureTypeSize(type);
 }
 
 void SDLViewport::cleanupTextures() {
@@ -1621,7 +2246,8 @@ void SDLViewport::markTextureWritten(TextureInfo& info) {;
         info.write_fence->sync = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
 }
 
-void SDLViewport::prepareTexturesForRender(const std::unordered_set<GLuint>& tex_ids) {
+void SDLViewport::prepareTexturesForRender(const std::unordered_set<GLuint>& tex_ids,
+                                           std::unordered_map<GLuint, ImVec2>* sdf_ranges) {
     // Called before ImGui rendering to ensure all textures are ready
     // The mutex protection is essential as uploads might be happening
     // from another thread
@@ -1633,6 +2259,10 @@ void SDLViewport::prepareTexturesForRender(const std::unordered_set<GLuint>& tex
             // Wait for any pending writes before rendering
             waitTextureReadable(it->second);
             it->second.last_use_frame = currentFrame;
+            if (sdf_ranges != nullptr && it->second.sdf_range > 0.f) {
+                (*sdf_ranges)[tex_id] = ImVec2(it->second.sdf_range / (float)it->second.width,
+                                               it->second.sdf_range / (float)it->second.height);
+            }
         }
     }
 }
@@ -1777,6 +2407,52 @@ bool SDLViewport::backBufferToTexture(void* texture, unsigned width, unsigned he
     return success;
 }
 
+bool SDLViewport::renderDrawListToTexture(void* texture, unsigned width, unsigned height,
+                                          void* draw_list)
+{
+    GLuint tex_id = (GLuint)(size_t)texture;
+    ImDrawList* cmd_list = (ImDrawList*)draw_list;
+    if (!tex_id || cmd_list == nullptr || width == 0 || height == 0)
+        return false;
+
+    renderContextLock.lock();
+    SDL_GL_MakeCurrent(windowHandle, glContext);
+
+    GLuint fbo = 0;
+    glGenFramebuffers(1, &fbo);
+    glBindFramebuffer(GL_FRAMEBUFFER, fbo);
+    glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, tex_id, 0);
+
+    bool success = false;
+    if (glCheckFramebufferStatus(GL_FRAMEBUFFER) == GL_FRAMEBUFFER_COMPLETE)
+    {
+        // Same projection as the main draw data, but
+        // covering only the texture area.
+        ImDrawData draw_data;
+        draw_data.Valid = true;
+        draw_data.DisplayPos = ImVec2(0.f, 0.f);
+        draw_data.DisplaySize = ImVec2((float)width, (float)height);
+        draw_data.FramebufferScale = ImVec2(1.f, 1.f);
+        draw_data.AddDrawList(cmd_list);
+
+        glDisable(GL_SCISSOR_TEST);
+        glViewport(0, 0, width, height);
+        glClearColor(0.f, 0.f, 0.f, 0.f);
+        glClear(GL_COLOR_BUFFER_BIT);
+        {
+            std::lock_guard<std::recursive_mutex> lock(textureMutex);
+            ImGui_ImplOpenGL3_RenderDrawData(this, &draw_data);
+        }
+        success = true;
+    }
+
+    glBindFramebuffer(GL_FRAMEBUFFER, 0);
+    glDeleteFramebuffers(1, &fbo);
+    SDL_GL_MakeCurrent(windowHandle, NULL);
+    renderContextLock.unlock();
+    return success;
+}
+
 bool SDLViewport::downloadTexture(void* texture,
                                   int x,
                                   int y,
@@ -1793,7 +2469,7 @@ bool SDLViewport::downloadTexture(void* texture,
     }
 
     // Prevent writing outside bounds
-    if (dst_stride < sub_width * num_chans * ((type == 1) ? 1 : 4)) {
+    if (dst_stride < sub_width * num_chans * textureTypeSize(type)) {
         throw std::runtime_error("Destination stride is too small for texture download");
     }
 
@@ -1811,14 +2487,8 @@ bool SDLViewport::downloadTexture(void* texture,
     glBindTexture(GL_TEXTURE_2D, tex_id);
 
     // Determine format and type
-    GLenum gl_format = GL_RED;
-    switch (num_chans) {
-        case 2: gl_format = GL_RG; break;
-        case 3: gl_format = GL_RGB; break;
-        case 4: gl_format = GL_RGBA; break;
-    }
-
-    GLenum gl_type = (type == 1) ? GL_UNSIGNED_BYTE : GL_FLOAT;
+    GLenum gl_format = textureGLFormat(num_chans);
+    GLenum gl_type = textureGLType(type);
 
     GLuint fbo = 0;
     glGenFramebuffers(1, &fbo);
@@ -1850,7 +2520,7 @@ bool SDLViewport::downloadTexture(void* texture,
             // Copy rows from mapped buffer to dst
             for (unsigned row = 0; row < sub_height; row++)
             {
-                memcpy((unsigned char*)dst + row * dst_stride, (unsigned char*)mapped + row * dst_stride, sub_width * num_chans * ((type == 1) ? 1 : 4));
+                memcpy((unsigned char*)dst + row * dst_stride, (unsigned char*)mapped + row * dst_stride, sub_width * num_chans * textureTypeSize(type));
             }
             glUnmapBuffer(GL_PIXEL_PACK_BUFFER);
         } else {
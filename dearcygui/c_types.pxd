@@ -509,6 +509,62 @@ cdef extern from * nogil:
         bint try_lock()
         void unlock()
 
+"""
+Sequence lock used to publish read-mostly data.
+
+A single writer (which must be serialized by other means,
+typically the item mutex) publishes a copy of the data
+with store(). Readers retrieve a consistent copy with load()
+without taking any lock, and thus never block, nor get
+blocked by, the writer. load() fails if the data could not
+be read consistently after a few attempts (writer active),
+or if nothing was published yet.
+"""
+cdef extern from * nogil:
+    """
+    #include <atomic>
+    #include <cstring>
+
+    struct DCGSeqLock {
+    private:
+        alignas(8) std::atomic<uint64_t> seq_{0};
+
+    public:
+        DCGSeqLock() noexcept = default;
+
+        void store(void *dst, const void *src, size_t size) noexcept {
+            uint64_t seq = seq_.load(std::memory_order_relaxed);
+            seq_.store(seq + 1, std::memory_order_relaxed);
+            std::atomic_thread_fence(std::memory_order_release);
+            std::memcpy(dst, src, size);
+            seq_.store(seq + 2, std::memory_order_release);
+        }
+
+        bool load(void *dst, const void *src, size_t size, int max_attempts) const noexcept {
+            for (int i = 0; i < max_attempts; i++) {
+                uint64_t seq = seq_.load(std::memory_order_acquire);
+                if (seq == 0)
+                    return false; // never published
+                if (seq & 1)
+                    continue; // write in progress
+                std::memcpy(dst, src, size);
+                std::atomic_thread_fence(std::memory_order_acquire);
+                if (seq_.load(std::memory_order_relaxed) == seq)
+                    return true;
+            }
+            return false;
+        }
+
+        ~DCGSeqLock() = default;
+        DCGSeqLock(const DCGSeqLock&) = delete;
+        DCGSeqLock& operator=(const DCGSeqLock&) = delete;
+    };
+    """
+    cppclass DCGSeqLock:
+        DCGSeqLock()
+        void store(void*, const void*, size_t)
+        bint load(void*, const void*, size_t, int)
+
 # generated with pxdgen /usr/include/c++/11/mutex -x c++
 
 cdef extern from "<mutex>" namespace "std" nogil:
@@ -1,10 +1,10 @@
-from libc.stdint cimport uint32_t, int32_t, int64_t
+from libc.stdint cimport uint8_t, uint32_t, int32_t, int64_t, uint64_t
 from libcpp cimport bool
 from libcpp.atomic cimport atomic
 
 from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
 
-from .c_types cimport DCGMutex, DCGVector, DCGString, ValueOrItem,\
+from .c_types cimport DCGMutex, DCGSeqLock, DCGVector, DCGString, ValueOrItem,\
     unique_lock, defer_lock_t
 from .types cimport Vec2
 
@@ -102,6 +102,9 @@ cdef class Context:
     cdef object _queue
     ### private variables ###
     cdef bint _running
+    cdef object _teardown_queue # single worker executor for deferred deletions
+    cdef atomic[uint64_t] _content_generation # bumped by any change that may affect rendering
+    cdef atomic[uint64_t] _shared_generation # bumped by changes not tied to a subtree of the viewport (shared values, textures, themes, ...)
     cdef object __weakref__
     ### public methods ###
     # Queue operations assume the viewport mutex is held
@@ -188,6 +191,11 @@ cdef class baseItem:
     cdef int32_t _external_lock
     cdef object __weakref__
     cdef object _user_data
+    cdef dict _keyed_children # key -> child, managed by reconcile()
+    cdef uint64_t _dirty_generation # last content generation at which this item or a descendant changed
+    cdef int64_t _layout_frame # last frame count at which the item was done rendering
+    cdef int64_t _early_read_frame # last frame count a sizing read the states before the item was done rendering
+    cdef Vec2[4] _early_read_geometry # position and sizes seen by the first of these reads
     ### public methods ###
     cdef void lock_parent_and_item_mutex(self, unique_lock[DCGMutex]&, unique_lock[DCGMutex]&)
     cdef void lock_and_previous_siblings(self) noexcept nogil
@@ -195,7 +203,8 @@ cdef class baseItem:
     cpdef void attach_to_parent(self, target_parent)
     cpdef void attach_before(self, target_before)
     cpdef void detach_item(self)
-    cpdef void delete_item(self)
+    cpdef void delete_item(self, bint deferred=*)
+    cdef void mark_dirty(self) noexcept
     cdef void set_previous_states(self) noexcept nogil
     cdef void run_handlers(self) noexcept nogil
     cdef void set_hidden_and_propagate_to_siblings_with_handlers(self) noexcept nogil
@@ -215,6 +224,8 @@ cdef class baseItem:
     cdef bint _check_traversed(self)
     cdef void _detach_item_and_lock(self, unique_lock[DCGMutex]&)
     cdef void _delete_and_siblings(self) noexcept
+    cdef void _teardown_subtree(self) noexcept
+    cdef void _relink_children(self, list, int32_t)
 
 
 # The capabilities are set during item creation
@@ -287,6 +298,7 @@ cdef class ItemStateView:
     # Factory method to create a view for a specific item
     @staticmethod
     cdef ItemStateView create(baseItem item)
+    cdef int _read_state(self, itemState &) except -1
 
 
 cdef class ItemStateCopy:
@@ -300,6 +312,12 @@ cdef class ItemStateCopy:
 
 cdef void update_current_mouse_states(itemState&) noexcept nogil
 
+
+cdef class FramePolicy:
+    cdef double _max_fps # 0 = no limit
+    cdef double _idle_fps # 0 = no periodic refresh
+    cdef int32_t _latency # 0 = low, 1 = balanced, 2 = power
+
 """
 Viewport mutexes
 ================
@@ -340,6 +358,28 @@ release the global imgui context mutex, and lock_im_context to lock it back.
 One instance is if making call to unknown user call which might change the imgui context.
 """
 
+cdef class TextLayoutCache:
+    """
+    LRU cache of the size and line breaks of texts, for a given
+    font, font size and wrap width. One instance per context,
+    only used during rendering (viewport mutex held).
+    """
+    cdef void* _cache # DCGTextLayoutCache*
+    # Text size with the current font and font size (as imgui.CalcTextSize)
+    cdef Vec2 calc_text_size(self, const char* text, const char* text_end, float wrap_width) noexcept nogil
+    # Same as imgui.TextUnformatted
+    cdef void text_unformatted(self, const char* text, const char* text_end) noexcept nogil
+    # Same as ImDrawList::AddText. font can be NULL and size 0 for the current font and size.
+    cdef void add_text(self, void* drawlist, void* font, float size, float x, float y,
+                       uint32_t color, const char* text, const char* text_end) noexcept nogil
+
+# Must be called when the glyphs of an existing font are modified
+cdef void invalidate_text_layouts() noexcept nogil
+cdef void register_dynamic_font(void*, object)
+
+# Must be called by sizings when they read the states of source to compute a size of target
+cdef void record_sizing_read(baseItem source, baseItem target) noexcept nogil
+
 cdef class Viewport(baseItem):
     ### Public read-only variables
     cdef int64_t frame_count # frame count
@@ -358,6 +398,8 @@ cdef class Viewport(baseItem):
     ### Public read-write variables ###
     cdef bint wait_for_input
     cdef bint always_submit_to_gpu
+    cdef bint skip_idle_frames
+    cdef FramePolicy frame_policy
     # Temporary info to be accessed during rendering
     # Shouldn't be accessed outside draw()
     cdef float global_scale # Current scale factor to apply to all rendering
@@ -378,6 +420,7 @@ cdef class Viewport(baseItem):
     cdef DCGVector[float] temp_normals # Temporary storage for normals data
     cdef DCGVector[uint32_t] temp_colors # Temporary storage for color data
     cdef DCGVector[uint32_t] temp_indices # Temporary storage for indices data
+    cdef TextLayoutCache text_layouts # Cached text measurements and line breaks
     # Storage of current drag-drop item if any
     cdef baseItem drag_drop
     # OS drop
@@ -392,6 +435,7 @@ cdef class Viewport(baseItem):
     cdef atomic[int64_t] _platform_external_count
     cdef bint _initialized # False initially, then True. Doesn't need mutex
     cdef bint _retrieve_framebuffer
+    cdef bint _threaded_presentation
     cdef object _frame_buffer
     cdef Callback _resize_callback
     cdef Callback _close_callback
@@ -401,17 +445,33 @@ cdef class Viewport(baseItem):
     cdef int32_t _cursor # imgui.ImGuiMouseCursor
     cdef float _scale
     cdef double _target_refresh_time
+    cdef uint64_t _last_traversed_generation
+    cdef int64_t _refresh_requests # incremented by ask_refresh_after_* and force_present
+    cdef int64_t _idle_frames_skipped
+    cdef int64_t _missed_deadlines
+    cdef int64_t _convergence_redraws
+    cdef DCGVector[int64_t] _sizing_reads # (reader uuid, source uuid, early) of the sizing reads of the frame
+    cdef DCGVector[int64_t] _sizing_changes # uuids of the items that changed after an early sizing read
+    cdef set _reported_sizing_cycles
+    cdef int64_t _frame_interval_ns # 1/max_fps of the frame policy, 0 if unlimited
+    cdef atomic[int64_t] _pending_wake # monotonic ns of the scheduled coalesced wake, 0 if none
+    cdef atomic[int64_t] _wake_requests
+    cdef atomic[int64_t] _wakes_sent
+    cdef int64_t _pacing_target # monotonic ns before which the next frame should not start
+    cdef bint _last_frame_presented
+    cdef bint _nonblocking_frame # render_frame_async already awaited the waits of render_frame
     cdef bint _kill_signal
     cdef object _kill_exc
     cdef void* _imgui_context # imgui.ImGuiContext
     cdef void* _implot_context # implot.ImPlotContext
     ### public methods ###
-    cpdef void delete_item(self)
+    cpdef void delete_item(self, bint deferred=*)
     cdef void coordinate_to_screen(self, float *dst_p, const double[2] src_p) noexcept nogil
     cdef void screen_to_coordinate(self, double *dst_p, const float[2] src_p) noexcept nogil
     cdef void ask_refresh_after_target(self, double monotonic) noexcept nogil # might refresh before, in which case you should call again
     cdef void ask_refresh_after_delta(self, double delta_monotonic) noexcept nogil # might refresh before, in which case you should call again
     cdef void force_present(self) noexcept nogil
+    cdef bint request_redraw(self, double max_latency) noexcept nogil
     cdef Vec2 get_size(self) noexcept nogil
     cdef void *get_platform_window(self) noexcept nogil
     cdef void *get_platform(self) noexcept nogil # must be followed by release_platform
@@ -424,6 +484,8 @@ cdef class Viewport(baseItem):
     cdef void __on_close(self)
     cdef void __on_drop(self, int32_t, const char*)
     cdef void __render(self) noexcept nogil
+    cdef void _report_sizing_cycles(self) noexcept
+    cdef double _async_wait_delay(self) except -2.
 
 
 cdef class Callback:
@@ -660,6 +722,9 @@ cdef class uiItem(baseItem):
     ### Set by subclass (but has default value) ###
     cdef bint can_be_disabled
     cdef SharedValue _value
+    cdef DCGMutex _value_mutex # protects the _value reference. Never held during rendering
+    cdef DCGSeqLock _state_seqlock
+    cdef itemState _published_state # copy of state at the end of the last rendering
     ### Protected variables. Managed by uiItem by should be read by subclasses to alter rendering ###
     cdef DCGString _imgui_label # The hidden unique imgui label for this item
     cdef str _user_label # Label assigned by the user
@@ -675,6 +740,8 @@ cdef class uiItem(baseItem):
     cdef float _scaling_factor
 
     cdef void _clear_additional_references_on_delete(self) noexcept
+    cdef void _set_shared_value(self, SharedValue)
+    cdef void publish_state(self) noexcept nogil
     cdef void update_current_state(self) noexcept nogil
     cdef void update_current_state_subset(self) noexcept nogil
     cdef Vec2 get_requested_size(self) noexcept nogil
@@ -708,6 +775,40 @@ cdef class SharedValue:
 Complex UI elements
 """
 
+cdef struct DrawListCacheSegment:
+    float[4] clip_rect
+    uint64_t texture_id
+    uint32_t vtx_start
+    uint32_t vtx_count
+    uint32_t idx_start
+    uint32_t idx_count
+
+cdef class DrawListCache:
+    """
+    Retained copy of the draw commands generated by the children
+    of an item, to be copied back while nothing changed.
+    Only used during rendering, under the owner mutex.
+    """
+    cdef bint _valid
+    cdef bint _window_content
+    cdef bint _redraw_needed_before
+    cdef uint64_t _generation
+    cdef uint64_t _shared_generation
+    cdef int64_t _refresh_requests
+    cdef int32_t _num_windows
+    cdef uint32_t _idx_start
+    cdef double[16] _key
+    cdef float[6] _content_state
+    cdef DCGVector[uint8_t] _style # ImGui and ImPlot styles, and current font
+    cdef DCGVector[DrawListCacheSegment] _segments
+    cdef DCGVector[uint32_t] _vertices # raw ImDrawVert data
+    cdef DCGVector[uint32_t] _indices
+    cdef bint try_replay(self, baseItem owner, void* drawlist, bint window_content) noexcept nogil
+    cdef void capture(self, baseItem owner, void* drawlist) noexcept nogil
+    cdef void _replay(self, void* drawlist) noexcept nogil
+    cdef bint _same_style(self) noexcept nogil
+    cdef void _save_style(self) noexcept nogil
+
 cdef class TimeWatcher(uiItem):
     pass
 
@@ -747,6 +848,7 @@ cdef class Window(uiItem):
     cdef ValueOrItem _backup_requested_y
     cdef ValueOrItem _backup_requested_width
     cdef ValueOrItem _backup_requested_height
+    cdef DrawListCache _drawlist_cache
     cdef void draw(self) noexcept nogil
 
 """
@@ -800,3 +902,22 @@ cdef class baseTheme(baseItem):
     cdef void push(self) noexcept nogil
     cdef void pop(self) noexcept nogil
 
+
+"""
+Item recycling
+"""
+
+cdef class ItemPool:
+    cdef DCGMutex mutex
+    cdef Context _context
+    cdef object _item_type
+    cdef int32_t _size
+    cdef list _free # released items, ready for reuse
+    cdef set _pooled # uuids of the items in _free (or being released)
+    cdef dict _defaults # attribute values of a fresh item
+    cdef tuple _always_reset # attributes restored on every release
+    cdef dict _acquired_keys # uuid -> attributes set by acquire
+    cdef int64_t _hits
+    cdef int64_t _misses
+    cdef int64_t _dropped
+    cdef void _track_keys(self, baseItem, dict)
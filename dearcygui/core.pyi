@@ -137,6 +137,146 @@ def __exit__(self, exc_type, exc_value, traceback): # -> Literal[False]:
     Array: TypeAlias = memoryview | bytearray | bytes | Sequence[Any] | "np.ndarray[Any, Any]"
 
 
+class ItemPool:
+    """
+    Recycling pool for items of a given type.
+
+    UIs that destroy and recreate many items per frame
+    (live tables, order books, logs) spend a significant
+    time allocating items (object, mutex, states, uuid).
+    ItemPool keeps released items detached outside the
+    rendering tree, and hands them back on acquire,
+    instead of creating new ones.
+
+    Released items are detached from their parent, their
+    children are detached, and the attributes that were
+    set through acquire (as well as the handlers, callbacks
+    and user_data) are restored to the values of a freshly
+    created item. Attributes set directly on the item
+    after acquire are not tracked and must be listed in
+    reset_attributes if they should be restored on release.
+
+    Recycled items keep their uuid, and thus their internal
+    ImGui identifier.
+
+    Example::
+
+        pool = dcg.ItemPool(C, dcg.Text, size=5000)
+        with window:
+            text = pool.acquire(value="42.0")
+        ...
+        pool.release(text)
+
+    Parameters:
+    context : Context
+        Context in which the items are created.
+    item_type : type
+        Class of the pooled items (subclass of baseItem).
+    size : int
+        Maximum number of released items kept for reuse.
+        Items released beyond this size are deleted.
+    reset_attributes : list[str], optional
+        Attributes always restored on release.
+    """
+    def __init__(self, context: Context, item_type, size: int = 1024, reset_attributes: list[str] | None = None) -> None:
+        ...
+
+    @property
+    def item_type(self) -> type[baseItem]:
+        """
+        Readonly attribute: class of the pooled items
+        """
+        ...
+
+    @property
+    def size(self) -> int:
+        """
+        Maximum number of released items kept for reuse
+        """
+        ...
+
+    @size.setter
+    def size(self, value: int) -> None:
+        ...
+
+    @property
+    def num_free(self) -> int:
+        """
+        Readonly attribute: number of items ready for reuse
+        """
+        ...
+
+    @property
+    def hits(self) -> int:
+        """
+        Readonly attribute: number of acquire calls served
+        by a recycled item
+        """
+        ...
+
+    @property
+    def misses(self) -> int:
+        """
+        Readonly attribute: number of acquire calls that
+        had to create a new item
+        """
+        ...
+
+    @property
+    def dropped(self) -> int:
+        """
+        Readonly attribute: number of released items that
+        were deleted because the pool was full
+        """
+        ...
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Readonly attribute: fraction of acquire calls served
+        by a recycled item (0 if acquire was never called)
+        """
+        ...
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hits, misses and dropped counters
+        """
+        ...
+
+    def fill(self, count: int) -> None:
+        """
+        Pre-allocate items until count items are ready
+        for reuse (bounded by size).
+        """
+        ...
+
+    def acquire(self, **kwargs) -> baseItem:
+        """
+        Retrieve an item from the pool, or create one if
+        the pool is empty.
+
+        The keyword arguments are handled as for item creation,
+        including parent, before and attach. In particular the
+        item is attached to the current parent of the 'with'
+        statement if none is specified.
+        """
+        ...
+
+    def release(self, item: baseItem) -> None:
+        """
+        Give back an item to the pool.
+
+        The item is detached, its children are detached and
+        its configuration is reset. If the pool is full, the
+        item is deleted instead. The item must not be used
+        after this call.
+
+        Raises ValueError if the item was already released.
+        """
+        ...
+
+
 """
 This type stub file was generated by cyright.
 """
@@ -1737,6 +1877,140 @@ def frame_count(self) -> float:
         """
         ...
 
+    @property
+    def lock_contentions(self) -> int:
+        """
+        Number of times a Python thread had to wait for an item
+        mutex held by another thread (process-wide, cumulative).
+
+        Comparing the value between two frames indicates how
+        much user threads contend with rendering.
+        """
+        ...
+
+    @property
+    def state_snapshot_reads(self) -> int:
+        """
+        Number of item state reads served from the state
+        published at the end of the last item rendering,
+        instead of waiting for the item mutex (process-wide,
+        cumulative).
+        """
+        ...
+
+    @property
+    def idle_frames_skipped(self) -> int:
+        """
+        Number of render_frame calls which skipped the
+        traversal of the item tree because nothing changed
+        since the previous traversal (cumulative).
+
+        See Viewport.skip_idle_frames.
+        """
+        ...
+
+    @property
+    def missed_deadlines(self) -> int:
+        """
+        Number of presented frames which completed after
+        the deadline set by the max_fps of the frame policy,
+        while they had started before it (cumulative).
+
+        See Viewport.frame_policy.
+        """
+        ...
+
+    @property
+    def wake_requests(self) -> int:
+        """
+        Number of redraw requests received through
+        Viewport.wake() and item.invalidate() (cumulative).
+        """
+        ...
+
+    @property
+    def wakes(self) -> int:
+        """
+        Number of wakes actually sent to the viewport (cumulative).
+
+        item.invalidate() requests are coalesced, thus comparing
+        with wake_requests and frame_count shows how many
+        redundant wakes and frames were avoided.
+        """
+        ...
+
+    @property
+    def convergence_redraws(self) -> int:
+        """
+        Number of frames which had to be rendered again,
+        without being presented, because a value read
+        during the frame changed later in the same frame
+        (cumulative).
+
+        This happens mainly when a size or position refers
+        to an item rendered after the item using it.
+        """
+        ...
+
+
+class FramePolicy:
+    """
+    Frame pacing policy of the viewport.
+
+    Controls how fast render_frame can run, and how much
+    it waits when nothing changes on screen.
+
+    Args:
+        max_fps: Maximum frame rate. render_frame sleeps to not
+            exceed it, whether the frame is presented or not.
+            0 (the default) means no limit other than vsync.
+        idle_fps: Rate at which a frame is presented when
+            nothing happens. Before the policy, this rate was
+            hardcoded to a refresh every 5 s (0.2). 0 disables
+            the periodic refresh.
+        latency: One of:
+            - "low": The max_fps sleep (and the throttling of
+                frames that are not presented, as for "balanced")
+                is done at the start of the next render_frame,
+                right before processing the events, such that
+                inputs are the most recent.
+            - "balanced" (default): With vsync or max_fps, frames
+                that are not presented are throttled to 200 fps.
+                The max_fps sleep is done at the end of render_frame.
+            - "power": Same as "balanced", but when the previous
+                frame was not presented and no item changed since,
+                render_frame waits for input events as if
+                wait_for_input was set. The wait ends on input,
+                on Viewport.wake(), on an item requesting a refresh
+                (for example a timed animation), or after 1/idle_fps.
+                Note items modified from another thread while
+                render_frame waits require a call to Viewport.wake()
+                to be displayed before 1/idle_fps.
+
+    The policy is immutable. Assign a new one to the viewport to
+    change it.
+
+    Example:
+        viewport.frame_policy = dcg.FramePolicy(max_fps=60, idle_fps=2, latency="power")
+    """
+    def __init__(self, max_fps: float = 0., idle_fps: float = 0.2, latency: Literal["low", "balanced", "power"] = "balanced") -> None:
+        ...
+
+    @property
+    def max_fps(self) -> float:
+        """Maximum frame rate (0 = no limit)"""
+        ...
+
+    @property
+    def idle_fps(self) -> float:
+        """Rate of presented frames when nothing happens (0 = none)"""
+        ...
+
+    @property
+    def latency(self) -> Literal["low", "balanced", "power"]:
+        """Latency mode: 'low', 'balanced' or 'power'"""
+        ...
+
 from types import NotImplementedType
 NumStrT = int | float | str
 
@@ -2818,6 +3092,24 @@ def __reduce__(self): # -> tuple[Type[Self@ViewportWidth], tuple[()], dict[str,
     
 
 
+class CompiledSize(baseSizing):
+    """
+    Sizing expression compiled into a flat program.
+
+    Strings assigned to sizes are converted to this class.
+    Expressions of the same string share their program.
+    """
+    def __repr__(self) -> str: # -> str:
+        ...
+    
+    def __str__(self) -> str:
+        ...
+    
+    def __reduce__(self): # -> tuple[Callable[[str], baseSizing], tuple[str]]:
+        ...
+    
+
+
 def parse_size(size_str: str) -> baseSizing:
     """
     Parse a sizing string into sizing objects
@@ -3672,6 +3964,27 @@ def merge_glyph_sets(cls, glyphs: list['GlyphSet']) -> 'GlyphSet':
         """
         ...
 
+    def save(self, path: str) -> None:
+        """
+        Write the GlyphSet to a file, in a format
+        that can be memory mapped by GlyphSet.load.
+
+        Images shared by several characters (see remap)
+        are stored only once.
+        """
+        ...
+
+    @classmethod
+    def load(cls, path: str) -> 'GlyphSet':
+        """
+        Read a GlyphSet written by GlyphSet.save.
+
+        The file is memory mapped: the glyph images
+        are views into the mapping, and are only
+        read from disk when accessed.
+        """
+        ...
+
 class FontRenderer:
     """
     A class that manages font loading,
@@ -3751,11 +4064,15 @@ def render_glyph_set(self,
             target_size: if set, scale the characters to match the
                 font 'size' by scaling the pixel size at the 'nominal'
                 value (default size of the font).
-            hinter: "font", "none", "light", "strong" or "monochrome".
+            hinter: "font", "none", "light", "strong", "monochrome" or "sdf".
                 The hinter is the rendering algorithm that
                 impacts a lot the aspect of the characters,
                 especially at low scales, to make them
                 more readable.
+                "sdf" renders signed distance fields, to be
+                loaded with FontTexture.add_custom_font(..., sdf=True).
+                Such fonts remain sharp at any scale. Color is
+                not supported.
             restrict_to: set of ints that contains the unicode characters
                 that should be loaded. If None, load all the characters
                 available.
@@ -4191,7 +4508,7 @@ def copy(self, target_context = None):
         ...
 
 
-    def delete_item(self):
+    def delete_item(self, deferred = False):
         """
         Deletes the item and all its children.
 
@@ -4204,6 +4521,17 @@ def delete_item(self):
         items. As a result, items with no more references
         will be freed immediately.
 
+        Parameters:
+        deferred : bool, optional
+            If True, only the detachment of the item from its
+            parent is done by the call, which takes constant time.
+            The item stops being rendered right away, while the
+            teardown of its subtree (and the deallocation of the
+            items without references) is performed incrementally
+            by a background worker of the context.
+            The item must not be reused after this call.
+            Defaults to False.
+
         """
         ...
 
@@ -4221,6 +4549,29 @@ def detach_item(self):
         ...
 
 
+    def invalidate(self, max_latency = 0.0) -> bool:
+        """
+        Mark the item as modified and request a redraw.
+
+        Meant for threads updating items in the background,
+        instead of calling Viewport.wake() after each update.
+        Requests are coalesced: the viewport is woken at most
+        once per batch of changes, and not more than once per
+        frame interval of the frame policy (max_fps).
+
+        Args:
+            max_latency: Delay in seconds within which the redraw
+                should occur. Larger values enable to batch more
+                changes into the same frame.
+
+        Returns:
+            True if a wake was sent to the viewport, False if the
+            request was merged into an already scheduled one.
+
+        """
+        ...
+
+
     def lock_mutex(self, wait = False):
         """
         Lock the internal item mutex.
@@ -4266,6 +4617,45 @@ def lock_mutex(self, wait = False):
         ...
 
 
+    def reconcile(self, keys, factory, updater = None) -> list:
+        """
+        Incrementally update the children of the item from a list of keys.
+
+        This is the keyed alternative to rebuilding the children list
+        every time the data changes. Children created by previous calls
+        to reconcile are remembered by key:
+            - Keys seen for the first time get a new child,
+              created by calling factory(key).
+            - Keys already present reuse their child, and
+              updater(key, child) is called if provided.
+            - Children whose keys are absent are deleted.
+        The reconciled children are then reordered to follow the order
+        of keys, moving only the children that are out of place. The
+        item mutex is held during the whole relinking, while the mutex
+        of each moved or inserted child is only held for its own move.
+
+        Children that were not created by reconcile are left in place,
+        before the reconciled children. All the reconciled children
+        must be of the same category (for example all widgets, or all
+        drawings).
+
+        Parameters:
+        keys : iterable
+            Hashable keys, in the target rendering order.
+        factory : callable
+            factory(key) -> item. Called for new keys. The returned
+            item is attached to this item by reconcile.
+        updater : callable, optional
+            updater(key, item). Called for reused children.
+
+        Returns:
+        list
+            The reconciled children, in the order of keys.
+
+        """
+        ...
+
+
     def unlock_mutex(self):
         """
         Unlock a previously held mutex on this object by this thread.
@@ -7640,11 +8030,18 @@ def __getitem__(self, key: int) -> 'Font':
     def __len__(self) -> int:
         """The number of fonts in the texture"""
         ...
-    def add_custom_font(self, glyph_set):
+    def add_custom_font(self, glyph_set, sdf = False):
         """
         See fonts.py for a detailed explanation of
         the input arguments.
 
+        sdf: Set if the glyphs are signed distance fields,
+            as rendered with hinter="sdf". The texture is then
+            drawn with a shader that keeps the outlines sharp
+            at any scale, thus a single font can be used for all
+            sizes and zoom levels (with font.scale set to
+            target_size / glyph_set.height).
+
         Currently add_custom_font calls build()
         and thus prevents adding new fonts, but
         this might not be true in the future, thus
@@ -7654,6 +8051,35 @@ def add_custom_font(self, glyph_set):
         ...
 
 
+    def add_dynamic_font(self, path, size = 13.0, hinter = "light", allow_color = False, atlas_size = 1024, preload = None):
+        """
+        Add a font whose glyphs are rendered on demand.
+
+        Instead of rendering all the characters of the font
+        in advance, which for large character sets (CJK, emojis)
+        takes a long time and a huge texture, the texture reserves
+        a grid of cells, filled as characters are displayed by
+        text items, or requested with Font.request_glyphs.
+        When the grid is full, the least recently requested
+        glyphs are replaced, thus atlas_size must be large enough
+        to hold the characters displayed at the same time.
+
+        The texture is built by this call, and cannot receive
+        other fonts.
+
+        path: path to the font file (ttf, otf, etc).
+        size: Target pixel size at which the font will be rendered.
+        hinter: see FontRenderer.render_glyph_set.
+        allow_color: Whether colored glyphs (emojis) are supported.
+            Uses a four times larger texture.
+        atlas_size: width and height of the texture.
+        preload: characters to render immediately. Defaults
+            to printable ASCII.
+
+        """
+        ...
+
+
     def add_font_file(self, path, size = 13.0, index_in_file = 0, density_scale = 1.0, align_to_pixel = False):
         """
         Prepare the target font file to be added to the FontTexture,
@@ -10010,7 +10436,7 @@ class Texture(baseItem):
     and can be read from or written to.
 
     """
-    def __init__(self, context : Context, content: Array | None = None, *, antialiased : bool = False, attach : Any = ..., before : Any = ..., children : list[Never] = [], hint_dynamic : bool = False, nearest_neighbor_upsampling : int = 0, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, user_data : Any = ..., wrap_x : bool = False, wrap_y : bool = False):
+    def __init__(self, context : Context, content: Array | None = None, *, antialiased : bool = False, attach : Any = ..., before : Any = ..., children : list[Never] = [], evictable : bool = False, hint_dynamic : bool = False, nearest_neighbor_upsampling : int = 0, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, reload_callback : Any = ..., user_data : Any = ..., wrap_x : bool = False, wrap_y : bool = False):
         """
         Parameters
         ----------
@@ -10018,11 +10444,13 @@ def __init__(self, context : Context, content: Array | None = None, *, antialias
         - attach: Whether to attach the item to a parent. Default is None (auto)
         - before: Attach the item just before the target item. Default is None (disabled)
         - children: List of all the children of the item, from first rendered, to last rendered.
+        - evictable: Whether the texture can be evicted to respect the
         - hint_dynamic: Hint that the texture will be updated frequently.
         - nearest_neighbor_upsampling: Whether to use nearest neighbor interpolation when upscaling.
         - next_sibling: Child of the parent rendered just after this item.
         - parent: Parent of the item in the rendering tree.
         - previous_sibling: Child of the parent rendered just before this item.
+        - reload_callback: Callback called when the texture is drawn while its
         - user_data: User data of any type.
         - wrap_x: Whether to repeat the texture on x.
         - wrap_y: Whether to repeat the texture on y.
@@ -10030,7 +10458,7 @@ def __init__(self, context : Context, content: Array | None = None, *, antialias
         ...
 
 
-    def allocate(self, width, height, num_chans, uint8 = False, float32 = False, no_realloc = True):
+    def allocate(self, width, height, num_chans, uint8 = False, float32 = False, uint16 = False, float16 = False, no_realloc = True):
         """
         Allocate the buffer backing for the texture.
 
@@ -10045,15 +10473,18 @@ def allocate(self, width, height, num_chans, uint8 = False, float32 = False, no_
         - num_chans: Number of channels (1, 2, 3, or 4)
         - uint8: Whether the texture format is unsigned bytes (default: False)
         - float32: Whether the texture format is float32 (default: False)
+        - uint16: Whether the texture format is unsigned 16-bit
+            integers, normalized to [0, 1] when sampled (default: False)
+        - float16: Whether the texture format is half floats (default: False)
         - no_realloc: Whether to prevent future reallocations (default: True)
 
-        Either uint8 or float32 must be set to True.
+        One of uint8, float32, uint16 or float16 must be set to True.
 
         """
         ...
 
 
-    def configure(self, *, antialiased : bool = False, children : list[Never] = [], hint_dynamic : bool = False, nearest_neighbor_upsampling : int = 0, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, user_data : Any = ..., wrap_x : bool = False, wrap_y : bool = False) -> None:
+    def configure(self, *, antialiased : bool = False, children : list[Never] = [], evictable : bool = False, hint_dynamic : bool = False, nearest_neighbor_upsampling : int = 0, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, reload_callback : Any = ..., user_data : Any = ..., wrap_x : bool = False, wrap_y : bool = False) -> None:
         """
         Shortcut to set multiple attributes at once.
 
@@ -10061,11 +10492,13 @@ def configure(self, *, antialiased : bool = False, children : list[Never] = [],
         ----------
         - antialiased: Whether this texture uses mipmapping with anisotropic filtering for antialiasing.
         - children: List of all the children of the item, from first rendered, to last rendered.
+        - evictable: Whether the texture can be evicted to respect the
         - hint_dynamic: Hint that the texture will be updated frequently.
         - nearest_neighbor_upsampling: Whether to use nearest neighbor interpolation when upscaling.
         - next_sibling: Child of the parent rendered just after this item.
         - parent: Parent of the item in the rendering tree.
         - previous_sibling: Child of the parent rendered just before this item.
+        - reload_callback: Callback called when the texture is drawn while its
         - user_data: User data of any type.
         - wrap_x: Whether to repeat the texture on x.
         - wrap_y: Whether to repeat the texture on y.
@@ -10154,8 +10587,8 @@ def set_value(self, src):
         content, the previous allocation will be reused if compatible.
 
         Supported formats:
-        - Data type: uint8 (0-255) or float32 (0.0-1.0)
-          (other types will be converted to float32)
+        - Data type: uint8 (0-255), uint16 (0-65535), float16 or
+          float32 (0.0-1.0) (other types will be converted to float32)
         - Channels: 1 (R), 2 (RG), 3 (RGB), or 4 (RGBA)
 
         Note that for single-channel textures, R is duplicated to G and B
@@ -10165,6 +10598,93 @@ def set_value(self, src):
         ...
 
 
+    def set_value_async(self, src):
+        """
+        Set the texture data from an array, in a background worker.
+
+        Accepts the same inputs as set_value, but returns right
+        away with a concurrent.futures.Future, which completes
+        once the data is uploaded (or holds the upload exception).
+
+        Uploads follow latest-wins semantics: if new data is set
+        while a previous one is still waiting for the worker, the
+        previous one is dropped and its Future is cancelled. Thus
+        frames produced faster than they can be uploaded (video)
+        do not queue up, and at most one upload per texture is
+        waiting.
+
+        The source data must not be modified until the Future
+        completes or is cancelled.
+
+        """
+        ...
+
+
+    def set_value_yuv(self, src, format, colorspace = "bt601", full_range = False):
+        """
+        Set the texture data from a YUV frame.
+
+        The frame is uploaded as is and converted to RGBA on the
+        GPU. This avoids a colorspace conversion pass on the CPU,
+        and transfers 1.5 (NV12, I420) or 2 (YUYV) bytes per pixel
+        rather than 4. These are the formats of most cameras and
+        video decoders.
+
+        Parameters:
+        - src: uint8 array holding the frame:
+            - "nv12": shape (height * 3 // 2, width). The luma plane,
+              followed by the interleaved UV plane at half resolution.
+            - "i420": shape (height * 3 // 2, width). The luma plane,
+              followed by the U plane, then the V plane, both at
+              half resolution.
+            - "yuyv": shape (height, width * 2) or (height, width, 2).
+              Y0 U Y1 V for each pair of pixels.
+        - format: "nv12", "i420" or "yuyv"
+        - colorspace: "bt601" (SD content, default) or "bt709" (HD content)
+        - full_range: Whether the values span [0, 255] rather
+          than the video range ([16, 235] for luma). Default False.
+
+        The width (and the height for nv12 and i420) must be even.
+        The texture holds 4 channels uint8 data of the frame size.
+
+        """
+        ...
+
+
+    def update_region(self, x, y, src):
+        """
+        Update a sub-rectangle of the texture.
+
+        src is an array of shape (height, width) or
+        (height, width, num_chans), which is written with its
+        top-left corner at pixel (x, y). The rest of the texture
+        is left untouched, and only the region is transferred,
+        which is much cheaper than set_value when a small part
+        of a large texture changes (tiles, incremental plots, etc).
+
+        The texture must already have content or have been
+        allocated, and src must match its number of channels and
+        its data type (uint8 or float32). The region must fit
+        inside the texture.
+
+        """
+        ...
+
+
+    def update_regions(self, regions):
+        """
+        Update several sub-rectangles of the texture.
+
+        regions is an iterable of (x, y, src) tuples, with the
+        same meaning as for update_region. All the regions are
+        uploaded in a single upload session, which is cheaper than
+        calling update_region for each of them. Regions are
+        written in order, thus where they overlap the latest wins.
+
+        """
+        ...
+
+
     @property
     def antialiased(self) -> bool:
         """
@@ -10187,6 +10707,38 @@ def antialiased(self, value : bool):
         ...
 
 
+    @property
+    def evictable(self) -> bool:
+        """
+        Whether the texture can be evicted to respect the
+        texture budget of the context.
+
+        When the textures of the context exceed the budget
+        (see Viewport.texture_budget), the least recently drawn
+        evictable textures are released. When an evicted texture
+        is drawn again, it is skipped and reload_callback is
+        called, which should set the content back (set_value or
+        set_value_async). Useful for large image galleries.
+
+        """
+        ...
+
+
+    @evictable.setter
+    def evictable(self, value : bool):
+        ...
+
+
+    @property
+    def evicted(self) -> bool:
+        """
+        (Read-only) Whether the texture content was evicted, and
+        has not been set again since.
+
+        """
+        ...
+
+
     @property
     def height(self) -> int:
         """
@@ -10243,6 +10795,25 @@ def num_chans(self) -> int:
         ...
 
 
+    @property
+    def reload_callback(self):
+        """
+        Callback called when the texture is drawn while its
+        content was evicted (see evictable).
+
+        It receives the texture as sender and target, and is
+        expected to set the texture content back. It is called
+        once per eviction.
+
+        """
+        ...
+
+
+    @reload_callback.setter
+    def reload_callback(self, value):
+        ...
+
+
     @property
     def texture_id(self) -> int:
         """
@@ -10312,7 +10883,7 @@ class Viewport(baseItem):
     It is decorated by the operating system and can be minimized/maximized/made fullscreen.
 
     """
-    def __init__(self, context : Context, *, always_on_top : bool = False, always_submit_to_gpu : bool = False, attach : Any = ..., before : Any = ..., children : Sequence['Window' | 'WindowLayout' | 'ViewportDrawList' | 'MenuBar'] = [], clear_color : tuple = (0.0, 0.0, 0.0, 1.0), close_callback : Any = ..., cursor : MouseCursor = MouseCursor.ARROW, decorated : bool = True, disable_close : bool = False, font : 'baseFont' | None = None, fullscreen : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 800, hit_test_surface : Any = ..., icon : Any = ..., keyboard_navigation : bool = False, max_height : int = 10000, max_width : int = 10000, maximized : bool = False, min_height : int = 250, min_width : int = 250, minimized : bool = False, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, pixel_height : int = 800, pixel_width : int = 1280, previous_sibling : 'baseItem' | None = None, resizable : bool = True, resize_callback : Any = ..., retrieve_framebuffer : bool = False, scale : float = 1.0, theme : Any = ..., title : str = "DearCyGui Window", transparent : bool = False, user_data : Any = ..., visible : bool = True, vsync : bool = True, wait_for_input : bool = False, width : float | str | 'baseSizing' = 1280, x_pos : int = 100, y_pos : int = 100):
+    def __init__(self, context : Context, *, always_on_top : bool = False, always_submit_to_gpu : bool = False, attach : Any = ..., before : Any = ..., children : Sequence['Window' | 'WindowLayout' | 'ViewportDrawList' | 'MenuBar'] = [], clear_color : tuple = (0.0, 0.0, 0.0, 1.0), close_callback : Any = ..., cursor : MouseCursor = MouseCursor.ARROW, decorated : bool = True, disable_close : bool = False, font : 'baseFont' | None = None, frame_policy : FramePolicy = FramePolicy(max_fps=0.0, idle_fps=0.2, latency='balanced'), fullscreen : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 800, hit_test_surface : Any = ..., icon : Any = ..., keyboard_navigation : bool = False, max_height : int = 10000, max_width : int = 10000, maximized : bool = False, min_height : int = 250, min_width : int = 250, minimized : bool = False, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, pixel_height : int = 800, pixel_width : int = 1280, previous_sibling : 'baseItem' | None = None, resizable : bool = True, resize_callback : Any = ..., retrieve_framebuffer : bool = False, scale : float = 1.0, skip_idle_frames : bool = False, text_layout_cache_size : int = 65536, texture_budget : int = 0, theme : Any = ..., threaded_presentation : bool = False, title : str = "DearCyGui Window", transparent : bool = False, user_data : Any = ..., visible : bool = True, vsync : bool = True, wait_for_input : bool = False, width : float | str | 'baseSizing' = 1280, x_pos : int = 100, y_pos : int = 100):
         """
         Parameters
         ----------
@@ -10327,6 +10898,7 @@ def __init__(self, context : Context, *, always_on_top : bool = False, always_su
         - decorated: Whether the viewport window shows OS-provided decorations.
         - disable_close: Whether window close operations are blocked.
         - font: Global font applied to all text within the viewport.
+        - frame_policy: Frame pacing policy (FramePolicy) used by render_frame.
         - fullscreen: Whether the viewport is currently in fullscreen mode.
         - handlers: Event handlers attached to the viewport.
         - height: DPI invariant height of the viewport window.
@@ -10348,7 +10920,11 @@ def __init__(self, context : Context, *, always_on_top : bool = False, always_su
         - resize_callback: Callback to be issued when the viewport is resized.
         - retrieve_framebuffer: Whether to activate the framebuffer retrieval.
         - scale: Multiplicative scale applied on top of the system DPI scaling.
+        - skip_idle_frames: Whether render_frame may skip traversing the item tree
+        - text_layout_cache_size: Maximum number of text layouts retained between frames.
+        - texture_budget: GPU memory budget, in bytes, for the textures of the context.
         - theme: Global theme applied to all elements within the viewport.
+        - threaded_presentation: Whether GPU submission and buffer swap run on a presentation thread.
         - title: Text displayed in the viewport window's title bar.
         - transparent: Whether the window is created with a back buffer allowing for transparent windows
         - user_data: User data of any type.
@@ -10362,7 +10938,7 @@ def __init__(self, context : Context, *, always_on_top : bool = False, always_su
         ...
 
 
-    def configure(self, *, always_on_top : bool = False, always_submit_to_gpu : bool = False, children : Sequence['Window' | 'WindowLayout' | 'ViewportDrawList' | 'MenuBar'] = [], clear_color : tuple = (0.0, 0.0, 0.0, 1.0), close_callback : Any = ..., cursor : MouseCursor = MouseCursor.ARROW, decorated : bool = True, disable_close : bool = False, font : 'baseFont' | None = None, fullscreen : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 800, hit_test_surface : Any = ..., icon : Any = ..., keyboard_navigation : bool = False, max_height : int = 10000, max_width : int = 10000, maximized : bool = False, min_height : int = 250, min_width : int = 250, minimized : bool = False, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, pixel_height : int = 800, pixel_width : int = 1280, previous_sibling : 'baseItem' | None = None, resizable : bool = True, resize_callback : Any = ..., retrieve_framebuffer : bool = False, scale : float = 1.0, theme : Any = ..., title : str = "DearCyGui Window", transparent : bool = False, user_data : Any = ..., visible : bool = True, vsync : bool = True, wait_for_input : bool = False, width : float | str | 'baseSizing' = 1280, x_pos : int = 100, y_pos : int = 100) -> None:
+    def configure(self, *, always_on_top : bool = False, always_submit_to_gpu : bool = False, children : Sequence['Window' | 'WindowLayout' | 'ViewportDrawList' | 'MenuBar'] = [], clear_color : tuple = (0.0, 0.0, 0.0, 1.0), close_callback : Any = ..., cursor : MouseCursor = MouseCursor.ARROW, decorated : bool = True, disable_close : bool = False, font : 'baseFont' | None = None, frame_policy : FramePolicy = FramePolicy(max_fps=0.0, idle_fps=0.2, latency='balanced'), fullscreen : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 800, hit_test_surface : Any = ..., icon : Any = ..., keyboard_navigation : bool = False, max_height : int = 10000, max_width : int = 10000, maximized : bool = False, min_height : int = 250, min_width : int = 250, minimized : bool = False, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, pixel_height : int = 800, pixel_width : int = 1280, previous_sibling : 'baseItem' | None = None, resizable : bool = True, resize_callback : Any = ..., retrieve_framebuffer : bool = False, scale : float = 1.0, skip_idle_frames : bool = False, text_layout_cache_size : int = 65536, texture_budget : int = 0, theme : Any = ..., threaded_presentation : bool = False, title : str = "DearCyGui Window", transparent : bool = False, user_data : Any = ..., visible : bool = True, vsync : bool = True, wait_for_input : bool = False, width : float | str | 'baseSizing' = 1280, x_pos : int = 100, y_pos : int = 100) -> None:
         """
         Shortcut to set multiple attributes at once.
 
@@ -10377,6 +10953,7 @@ def configure(self, *, always_on_top : bool = False, always_submit_to_gpu : bool
         - decorated: Whether the viewport window shows OS-provided decorations.
         - disable_close: Whether window close operations are blocked.
         - font: Global font applied to all text within the viewport.
+        - frame_policy: Frame pacing policy (FramePolicy) used by render_frame.
         - fullscreen: Whether the viewport is currently in fullscreen mode.
         - handlers: Event handlers attached to the viewport.
         - height: DPI invariant height of the viewport window.
@@ -10398,7 +10975,11 @@ def configure(self, *, always_on_top : bool = False, always_submit_to_gpu : bool
         - resize_callback: Callback to be issued when the viewport is resized.
         - retrieve_framebuffer: Whether to activate the framebuffer retrieval.
         - scale: Multiplicative scale applied on top of the system DPI scaling.
+        - skip_idle_frames: Whether render_frame may skip traversing the item tree
+        - text_layout_cache_size: Maximum number of text layouts retained between frames.
+        - texture_budget: GPU memory budget, in bytes, for the textures of the context.
         - theme: Global theme applied to all elements within the viewport.
+        - threaded_presentation: Whether GPU submission and buffer swap run on a presentation thread.
         - title: Text displayed in the viewport window's title bar.
         - transparent: Whether the window is created with a back buffer allowing for transparent windows
         - user_data: User data of any type.
@@ -10416,7 +10997,7 @@ def copy(self, target_context = None) -> None:
         ...
 
 
-    def delete_item(self):
+    def delete_item(self, deferred = False):
         ...
 
 
@@ -10442,7 +11023,7 @@ def destroy(self) -> None:
         ...
 
 
-    def initialize(self, *, always_on_top : bool = False, always_submit_to_gpu : bool = False, children : Sequence['Window' | 'WindowLayout' | 'ViewportDrawList' | 'MenuBar'] = [], clear_color : tuple = (0.0, 0.0, 0.0, 1.0), close_callback : Any = ..., cursor : MouseCursor = MouseCursor.ARROW, decorated : bool = True, disable_close : bool = False, font : 'baseFont' | None = None, fullscreen : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 800, hit_test_surface : Any = ..., icon : Any = ..., keyboard_navigation : bool = False, max_height : int = 10000, max_width : int = 10000, maximized : bool = False, min_height : int = 250, min_width : int = 250, minimized : bool = False, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, pixel_height : int = 800, pixel_width : int = 1280, previous_sibling : 'baseItem' | None = None, resizable : bool = True, resize_callback : Any = ..., retrieve_framebuffer : bool = False, scale : float = 1.0, theme : Any = ..., title : str = "DearCyGui Window", transparent : bool = False, user_data : Any = ..., visible : bool = True, vsync : bool = True, wait_for_input : bool = False, width : float | str | 'baseSizing' = 1280, x_pos : int = 100, y_pos : int = 100) -> None:
+    def initialize(self, *, always_on_top : bool = False, always_submit_to_gpu : bool = False, children : Sequence['Window' | 'WindowLayout' | 'ViewportDrawList' | 'MenuBar'] = [], clear_color : tuple = (0.0, 0.0, 0.0, 1.0), close_callback : Any = ..., cursor : MouseCursor = MouseCursor.ARROW, decorated : bool = True, disable_close : bool = False, font : 'baseFont' | None = None, frame_policy : FramePolicy = FramePolicy(max_fps=0.0, idle_fps=0.2, latency='balanced'), fullscreen : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 800, hit_test_surface : Any = ..., icon : Any = ..., keyboard_navigation : bool = False, max_height : int = 10000, max_width : int = 10000, maximized : bool = False, min_height : int = 250, min_width : int = 250, minimized : bool = False, next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, pixel_height : int = 800, pixel_width : int = 1280, previous_sibling : 'baseItem' | None = None, resizable : bool = True, resize_callback : Any = ..., retrieve_framebuffer : bool = False, scale : float = 1.0, skip_idle_frames : bool = False, text_layout_cache_size : int = 65536, texture_budget : int = 0, theme : Any = ..., threaded_presentation : bool = False, title : str = "DearCyGui Window", transparent : bool = False, user_data : Any = ..., visible : bool = True, vsync : bool = True, wait_for_input : bool = False, width : float | str | 'baseSizing' = 1280, x_pos : int = 100, y_pos : int = 100) -> None:
         """
         Initialize the viewport for rendering and show it.
 
@@ -10469,6 +11050,7 @@ def initialize(self, *, always_on_top : bool = False, always_submit_to_gpu : boo
         - decorated: Whether the viewport window shows OS-provided decorations.
         - disable_close: Whether window close operations are blocked.
         - font: Global font applied to all text within the viewport.
+        - frame_policy: Frame pacing policy (FramePolicy) used by render_frame.
         - fullscreen: Whether the viewport is currently in fullscreen mode.
         - handlers: Event handlers attached to the viewport.
         - height: DPI invariant height of the viewport window.
@@ -10490,7 +11072,11 @@ def initialize(self, *, always_on_top : bool = False, always_submit_to_gpu : boo
         - resize_callback: Callback to be issued when the viewport is resized.
         - retrieve_framebuffer: Whether to activate the framebuffer retrieval.
         - scale: Multiplicative scale applied on top of the system DPI scaling.
+        - skip_idle_frames: Whether render_frame may skip traversing the item tree
+        - text_layout_cache_size: Maximum number of text layouts retained between frames.
+        - texture_budget: GPU memory budget, in bytes, for the textures of the context.
         - theme: Global theme applied to all elements within the viewport.
+        - threaded_presentation: Whether GPU submission and buffer swap run on a presentation thread.
         - title: Text displayed in the viewport window's title bar.
         - transparent: Whether the window is created with a back buffer allowing for transparent windows
         - user_data: User data of any type.
@@ -10509,7 +11095,8 @@ def render_frame(self) -> bool:
 Render one frame of the application.
 
         Rendering occurs in several sequential steps:
-        1. Mouse/Keyboard events are processed (wait_for_input applies here)
+        1. Mouse/Keyboard events are processed (wait_for_input and
+           the frame_policy apply here)
         2. The viewport and entire rendering tree are traversed to prepare
         rendering commands using ImGui and ImPlot
         3. Rendering commands are submitted to the GPU, if a change was detected
@@ -10526,6 +11113,55 @@ def render_frame(self) -> bool:
         ...
 
 
+    async def render_frame_async(self) -> bool:
+        """
+        Same as render_frame, but awaits instead of blocking.
+
+        Must be awaited from an asyncio event loop running in the
+        thread where the context was created.
+
+        The waits of render_frame yield to the event loop instead:
+            - The frame pacing of the frame_policy.
+            - When wait_for_input is set (or the frame policy is
+              "power" and nothing changed), the wait for an input,
+              a wake() or a timed refresh. The wait_handle is used
+              for that, thus the wait consumes no cpu.
+            - The wait for the previous frame presentation (vsync).
+              Frames are presented by the presentation thread, as
+              with threaded_presentation.
+
+        On platforms where the wait_handle does not signal new
+        input, the input is checked every few milliseconds.
+
+        Returns
+        -------
+        bool
+            True if the frame was presented to the screen, False otherwise
+
+        """
+        ...
+
+
+    def texture_stats(self):
+        """
+        Return the texture memory statistics of the context.
+
+        Returns a dict with:
+        - budget: the texture_budget, in bytes
+        - resident_bytes: memory of the allocated textures
+        - resident_count: number of allocated textures
+        - evictable_bytes: part of resident_bytes that can be evicted
+        - evictable_count: number of allocated evictable textures
+        - evicted_count: number of textures currently evicted
+        - evictions: total number of evictions
+        - reloads: total number of evicted textures set again
+
+        Sizes do not include mipmaps and backend caches.
+
+        """
+        ...
+
+
     def wait_events(self, timeout_ms = 0) -> bool:
         """
         Waits for an event that justifies running render_frame to occur.
@@ -10766,6 +11402,30 @@ def font(self, value : 'baseFont' | None):
         ...
 
 
+    @property
+    def frame_policy(self) -> FramePolicy:
+        """
+        Frame pacing policy (FramePolicy) used by render_frame.
+
+        Defines the maximum frame rate, the rate of refreshes
+        when nothing happens, and the latency/power trade-off.
+
+        The default, FramePolicy(max_fps=0, idle_fps=0.2,
+        latency="balanced"), reproduces the behaviour of previous
+        versions.
+
+        Example:
+            viewport.frame_policy = dcg.FramePolicy(max_fps=60, idle_fps=2, latency="power")
+
+        """
+        ...
+
+
+    @frame_policy.setter
+    def frame_policy(self, value : FramePolicy):
+        ...
+
+
     @property
     def framebuffer(self):
         """
@@ -11214,6 +11874,80 @@ def shown(self) -> bool:
         ...
 
 
+    @property
+    def skip_idle_frames(self) -> bool:
+        """
+        Whether render_frame may skip traversing the item tree
+        when nothing changed since the last traversal.
+
+        A frame is considered idle when no input event or wake()
+        was received, no timed refresh is due, no callback was queued
+        by the previous frame, and no item was modified (property
+        write, tree change, shared value or texture update).
+        Idle frames neither run handlers nor increment frame_count,
+        and the previous frame remains displayed.
+
+        Disabled by default. Only enable it if no code relies
+        on handlers being run, or frame_count being incremented,
+        on every render_frame call. Item changes that are not
+        made through the item properties (for instance from Cython
+        code accessing the item fields directly, or attributes of
+        Python subclasses) are not detected and must be followed
+        by a call to invalidate().
+
+        """
+        ...
+
+
+    @skip_idle_frames.setter
+    def skip_idle_frames(self, value : bool):
+        ...
+
+
+    @property
+    def text_layout_cache_size(self) -> int:
+        """
+        Maximum number of text layouts retained between frames.
+
+        The size and line breaks of the texts displayed by Text,
+        TextValue, table cells and DrawText are cached per font,
+        font size and wrap width, and unchanged texts are not
+        measured again. The least recently displayed texts are
+        evicted first. Set to 0 to disable the cache.
+
+        Defaults to 65536.
+
+        """
+        ...
+
+
+    @text_layout_cache_size.setter
+    def text_layout_cache_size(self, value : int):
+        ...
+
+
+    @property
+    def texture_budget(self) -> int:
+        """
+        GPU memory budget, in bytes, for the textures of the context.
+
+        When the textures exceed it, the least recently drawn
+        textures with evictable=True (and not drawn during the
+        last frame) are released until the memory is back under
+        90% of the budget. Evicted textures call their
+        reload_callback when drawn again.
+
+        0 (default) means no budget.
+
+        """
+        ...
+
+
+    @texture_budget.setter
+    def texture_budget(self, value : int):
+        ...
+
+
     @property
     def theme(self):
         """
@@ -11233,6 +11967,44 @@ def theme(self, value):
         ...
 
 
+    @property
+    def threaded_presentation(self) -> bool:
+        """
+        Whether GPU submission and buffer swap run on a presentation thread.
+
+        By default, render_frame processes the events, traverses the
+        item tree, then submits the frame to the GPU and swaps the
+        buffers, which blocks on vsync. These steps add up.
+
+        When enabled, the rendering commands of the frame are copied
+        (double buffered), and a dedicated thread submits them and
+        waits for the swap, while render_frame returns right away
+        to let the next frame be prepared. render_frame only blocks
+        when it gets more than one frame ahead of the presentation.
+        Heavy UIs can thus use nearly the whole frame interval
+        for the traversal.
+
+        Notes:
+        - Displayed frames have one more frame of latency
+            when the traversal is faster than the swap.
+        - delta_presenting in the metrics no longer includes
+            the GPU submission and the swap.
+        - Frames for which retrieve_framebuffer is set are
+            presented synchronously.
+        - Presenting from a secondary thread might not be supported
+            by all platforms and drivers (macOS in particular).
+
+        Disabled by default.
+
+        """
+        ...
+
+
+    @threaded_presentation.setter
+    def threaded_presentation(self, value : bool):
+        ...
+
+
     @property
     def title(self) -> str:
         """
@@ -11337,6 +12109,28 @@ def wait_for_input(self, value : bool):
         ...
 
 
+    @property
+    def wait_handle(self):
+        """
+        (Read-only) OS handle that event loops can poll to know when
+        the viewport has something to process.
+
+        This is a file descriptor which becomes readable on wake()
+        (and item.invalidate()) calls, when a frame presented by the
+        presentation thread completes, and on Linux (X11 and Wayland)
+        when new input is available. It is reset by render_frame_async,
+        and is only a hint: wait_events(0) tells whether rendering is
+        needed.
+
+        None if not supported by the platform (Windows), or if
+        the viewport is not initialized.
+
+        See render_frame_async for a rendering loop using it with asyncio.
+
+        """
+        ...
+
+
     @property
     def width(self) -> float | str | 'baseSizing':
         """
@@ -12337,7 +13131,7 @@ class ChildWindow(uiItem):
     structured layouts.
 
     """
-    def __init__(self, context : Context, *, always_auto_resize : bool = False, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, always_use_window_padding : bool = False, attach : Any = ..., auto_resize_x : bool = False, auto_resize_y : bool = False, before : 'uiItem' | None = None, border : bool = True, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], enabled : bool = True, flattened_navigation : bool = True, font : 'baseFont' | None = None, frame_style : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", menubar : bool = False, next_sibling : 'uiItem' | None = None, no_background : bool = False, no_inputs : bool = False, no_newline : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, resizable_x : bool = False, resizable_y : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
+    def __init__(self, context : Context, *, always_auto_resize : bool = False, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, always_use_window_padding : bool = False, attach : Any = ..., auto_resize_x : bool = False, auto_resize_y : bool = False, before : 'uiItem' | None = None, border : bool = True, cache_drawlist : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], enabled : bool = True, flattened_navigation : bool = True, font : 'baseFont' | None = None, frame_style : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", menubar : bool = False, next_sibling : 'uiItem' | None = None, no_background : bool = False, no_inputs : bool = False, no_newline : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, resizable_x : bool = False, resizable_y : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
         ----------
@@ -12350,6 +13144,7 @@ def __init__(self, context : Context, *, always_auto_resize : bool = False, alwa
         - auto_resize_y: Automatically adjust height based on content.
         - before: Attach the item just before the target item. Default is None (disabled)
         - border: Show an outer border and enable window padding.
+        - cache_drawlist: Retain the draw commands of the child window content between frames.
         - callback: Callback to invoke when the item's value changes
         - callbacks: List of callbacks to invoke when the item's value changes.
         - children: List of all the children of the item, from first rendered, to last rendered.
@@ -12385,7 +13180,7 @@ def __init__(self, context : Context, *, always_auto_resize : bool = False, alwa
         ...
 
 
-    def configure(self, *, always_auto_resize : bool = False, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, always_use_window_padding : bool = False, auto_resize_x : bool = False, auto_resize_y : bool = False, border : bool = True, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], enabled : bool = True, flattened_navigation : bool = True, font : 'baseFont' | None = None, frame_style : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", menubar : bool = False, next_sibling : 'uiItem' | None = None, no_background : bool = False, no_inputs : bool = False, no_newline : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, resizable_x : bool = False, resizable_y : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
+    def configure(self, *, always_auto_resize : bool = False, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, always_use_window_padding : bool = False, auto_resize_x : bool = False, auto_resize_y : bool = False, border : bool = True, cache_drawlist : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], enabled : bool = True, flattened_navigation : bool = True, font : 'baseFont' | None = None, frame_style : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", menubar : bool = False, next_sibling : 'uiItem' | None = None, no_background : bool = False, no_inputs : bool = False, no_newline : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, resizable_x : bool = False, resizable_y : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
         ----------
@@ -12396,6 +13191,7 @@ def configure(self, *, always_auto_resize : bool = False, always_show_horizontal
         - auto_resize_x: Automatically adjust width based on content.
         - auto_resize_y: Automatically adjust height based on content.
         - border: Show an outer border and enable window padding.
+        - cache_drawlist: Retain the draw commands of the child window content between frames.
         - callback: Callback to invoke when the item's value changes
         - callbacks: List of callbacks to invoke when the item's value changes.
         - children: List of all the children of the item, from first rendered, to last rendered.
@@ -12562,6 +13358,27 @@ def border(self, value : bool):
         ...
 
 
+    @property
+    def cache_drawlist(self) -> bool:
+        """
+        Retain the draw commands of the child window content between frames.
+
+        When enabled, the vertices generated by the children are kept, and
+        copied back instead of drawing the children again as long as no
+        child is modified, the child window is not moved, resized or
+        scrolled, and it doesn't receive inputs. While the cached content
+        is used, the states and handlers of the children are not updated.
+        Nested windows (child windows, popups, tooltips) disable the cache.
+
+        """
+        ...
+
+
+    @cache_drawlist.setter
+    def cache_drawlist(self, value : bool):
+        ...
+
+
     @property
     def children(self) -> list['uiItem' | 'MenuBar']:
         """
@@ -16783,13 +17600,14 @@ class DrawInWindow(uiItem):
     maintained and thus do not have a callback.
 
     """
-    def __init__(self, context : Context, *, attach : Any = ..., before : 'uiItem' | None = None, button : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['drawingItem'] = [], enabled : bool = True, font : 'baseFont' | None = None, frame : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, invert_y : bool = False, label : str = "", next_sibling : 'uiItem' | None = None, no_global_scaling : bool = False, no_newline : bool = False, orig_x : float = 0.0, orig_y : float = 0.0, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, relative : bool = False, scale_x : float = 1.0, scale_y : float = 1.0, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
+    def __init__(self, context : Context, *, attach : Any = ..., before : 'uiItem' | None = None, button : bool = False, cache_drawlist : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['drawingItem'] = [], enabled : bool = True, font : 'baseFont' | None = None, frame : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, invert_y : bool = False, label : str = "", next_sibling : 'uiItem' | None = None, no_global_scaling : bool = False, no_newline : bool = False, orig_x : float = 0.0, orig_y : float = 0.0, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, relative : bool = False, scale_x : float = 1.0, scale_y : float = 1.0, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
         ----------
         - attach: Whether to attach the item to a parent. Default is None (auto)
         - before: Attach the item just before the target item. Default is None (disabled)
         - button: Controls if the entire DrawInWindow area behaves like a single button.
+        - cache_drawlist: Retain the vertices of the drawing elements between frames.
         - callback: Callback to invoke when the item's value changes
         - callbacks: List of callbacks to invoke when the item's value changes.
         - children: List of all the children of the item, from first rendered, to last rendered.
@@ -16823,11 +17641,12 @@ def __init__(self, context : Context, *, attach : Any = ..., before : 'uiItem' |
         ...
 
 
-    def configure(self, *, button : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['drawingItem'] = [], enabled : bool = True, font : 'baseFont' | None = None, frame : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, invert_y : bool = False, label : str = "", next_sibling : 'uiItem' | None = None, no_global_scaling : bool = False, no_newline : bool = False, orig_x : float = 0.0, orig_y : float = 0.0, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, relative : bool = False, scale_x : float = 1.0, scale_y : float = 1.0, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
+    def configure(self, *, button : bool = False, cache_drawlist : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['drawingItem'] = [], enabled : bool = True, font : 'baseFont' | None = None, frame : bool = False, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], height : float | str | 'baseSizing' = 0.0, invert_y : bool = False, label : str = "", next_sibling : 'uiItem' | None = None, no_global_scaling : bool = False, no_newline : bool = False, orig_x : float = 0.0, orig_y : float = 0.0, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, relative : bool = False, scale_x : float = 1.0, scale_y : float = 1.0, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
         ----------
         - button: Controls if the entire DrawInWindow area behaves like a single button.
+        - cache_drawlist: Retain the vertices of the drawing elements between frames.
         - callback: Callback to invoke when the item's value changes
         - callbacks: List of callbacks to invoke when the item's value changes.
         - children: List of all the children of the item, from first rendered, to last rendered.
@@ -16879,6 +17698,27 @@ def button(self, value : bool):
         ...
 
 
+    @property
+    def cache_drawlist(self) -> bool:
+        """
+        Retain the vertices of the drawing elements between frames.
+
+        When enabled, the draw commands generated by the children are
+        kept and copied back as long as no child is modified and the
+        item position, size and transform are unchanged. This reduces
+        the cost of drawing many static elements. Mouse activity over
+        the parent window disables the cache for the frame, such that
+        interactive elements (DrawInvisibleButton) remain functional.
+
+        """
+        ...
+
+
+    @cache_drawlist.setter
+    def cache_drawlist(self, value : bool):
+        ...
+
+
     @property
     def children(self) -> list['drawingItem']:
         """
@@ -19431,6 +20271,216 @@ def size(self, value : float):
         ...
 
 
+class DrawingCache(drawingItem):
+    """
+    A DrawingList which caches the rendering of its children into a texture.
+
+    The children are rendered into an offscreen texture that
+    covers the region between pmin and pmax. On the next frames,
+    only a single textured quad is drawn, which is much cheaper
+    than submitting the children again when they are numerous
+    (maps, schematics, etc).
+
+    The texture is rendered again when:
+    - The item or any of its children is modified
+    - The coordinate to screen scaling changed by more than
+        zoom_threshold since the last rendering. Below this
+        threshold, the cached texture is stretched.
+    - The sign of the scaling changed (axis inverted)
+
+    Panning only translates the cached texture.
+
+    Limitations:
+    - Only the region between pmin and pmax is rendered.
+    - Children are expected to be passive drawing items. Items
+        that interact with the mouse do not receive events while
+        the cache is used.
+    - The coordinate transform is assumed to be affine in the
+        region (for example log-scale plot axes are not handled).
+    - If the region on screen (multiplied by supersampling) exceeds
+        max_texture_size, the children are drawn directly.
+
+    """
+    def __init__(self, context : Context, *, attach : Any = ..., before : 'drawingItem' | None = None, children : Sequence['drawingItem'] = [], max_texture_size : int = 4096, next_sibling : 'drawingItem' | None = None, parent : 'DrawInWindow' | 'DrawInPlot' | 'ViewportDrawList' | 'drawingItem' | None = None, pmax : Sequence[float] | tuple[float, float] | 'Coord' = (0.0, 0.0), pmin : Sequence[float] | tuple[float, float] | 'Coord' = (0.0, 0.0), previous_sibling : 'drawingItem' | None = None, show : bool = True, supersampling : float = 1.0, user_data : Any = ..., zoom_threshold : float = 1.5):
+        """
+        Parameters
+        ----------
+        - attach: Whether to attach the item to a parent. Default is None (auto)
+        - before: Attach the item just before the target item. Default is None (disabled)
+        - children: List of all the children of the item, from first rendered, to last rendered.
+        - max_texture_size: Maximum width and height of the cached texture.
+        - next_sibling: Child of the parent rendered just after this item.
+        - parent: Parent of the item in the rendering tree.
+        - pmax: (xmax, ymax) corner of the cached region, in coordinate space.
+        - pmin: (xmin, ymin) corner of the cached region, in coordinate space.
+        - previous_sibling: Child of the parent rendered just before this item.
+        - show: Should the object be drawn/shown ?
+        - supersampling: Resolution factor of the cached texture relative to the screen.
+        - user_data: User data of any type.
+        - zoom_threshold: Zoom factor above which the cached texture is rendered again.
+        """
+        ...
+
+
+    def configure(self, *, children : Sequence['drawingItem'] = [], max_texture_size : int = 4096, next_sibling : 'drawingItem' | None = None, parent : 'DrawInWindow' | 'DrawInPlot' | 'ViewportDrawList' | 'drawingItem' | None = None, pmax : Sequence[float] | tuple[float, float] | 'Coord' = (0.0, 0.0), pmin : Sequence[float] | tuple[float, float] | 'Coord' = (0.0, 0.0), previous_sibling : 'drawingItem' | None = None, show : bool = True, supersampling : float = 1.0, user_data : Any = ..., zoom_threshold : float = 1.5) -> None:
+        """
+        Shortcut to set multiple attributes at once.
+
+        Parameters
+        ----------
+        - children: List of all the children of the item, from first rendered, to last rendered.
+        - max_texture_size: Maximum width and height of the cached texture.
+        - next_sibling: Child of the parent rendered just after this item.
+        - parent: Parent of the item in the rendering tree.
+        - pmax: (xmax, ymax) corner of the cached region, in coordinate space.
+        - pmin: (xmin, ymin) corner of the cached region, in coordinate space.
+        - previous_sibling: Child of the parent rendered just before this item.
+        - show: Should the object be drawn/shown ?
+        - supersampling: Resolution factor of the cached texture relative to the screen.
+        - user_data: User data of any type.
+        - zoom_threshold: Zoom factor above which the cached texture is rendered again.
+        """
+        ...
+
+
+    @property
+    def children(self) -> list['drawingItem']:
+        """
+        List of all the children of the item, from first rendered, to last rendered.
+
+        When written to, an error is raised if the children already
+        have other parents. This error is meant to prevent programming
+        mistakes, as users might not realize the children were
+        unattached from their former parents.
+
+        """
+        ...
+
+
+    @children.setter
+    def children(self, value : Sequence['drawingItem']):
+        ...
+
+
+    @property
+    def max_texture_size(self) -> int:
+        """
+        Maximum width and height of the cached texture.
+
+        When the region to cache is larger on screen, the
+        children are drawn directly without caching.
+
+        Default is 4096.
+
+        """
+        ...
+
+
+    @max_texture_size.setter
+    def max_texture_size(self, value : int):
+        ...
+
+
+    @property
+    def pmax(self) -> 'Coord':
+        """
+        (xmax, ymax) corner of the cached region, in coordinate space.
+
+        Children outside the region between pmin and pmax
+        are not visible.
+
+        """
+        ...
+
+
+    @pmax.setter
+    def pmax(self, value : Sequence[float] | tuple[float, float] | 'Coord'):
+        ...
+
+
+    @property
+    def pmin(self) -> 'Coord':
+        """
+        (xmin, ymin) corner of the cached region, in coordinate space.
+
+        Children outside the region between pmin and pmax
+        are not visible.
+
+        """
+        ...
+
+
+    @pmin.setter
+    def pmin(self, value : Sequence[float] | tuple[float, float] | 'Coord'):
+        ...
+
+
+    @property
+    def render_count(self) -> int:
+        """
+        (Read-only) Readonly attribute: number of times the children were
+        rendered into the cached texture.
+
+        """
+        ...
+
+
+    @property
+    def supersampling(self) -> float:
+        """
+        Resolution factor of the cached texture relative to the screen.
+
+        A value of 2. renders the children at twice the screen
+        resolution, which improves quality when the texture is
+        stretched by zooming, at the cost of four times the memory.
+
+        Default is 1.
+
+        """
+        ...
+
+
+    @supersampling.setter
+    def supersampling(self, value : float):
+        ...
+
+
+    @property
+    def texture(self) -> 'Texture' | None:
+        """
+        (Read-only) Readonly attribute: the Texture holding the cached rendering.
+
+        None until the children are rendered the first time.
+        Note the rows are stored from bottom to top.
+
+        """
+        ...
+
+
+    @property
+    def zoom_threshold(self) -> float:
+        """
+        Zoom factor above which the cached texture is rendered again.
+
+        When the scaling from coordinate space to screen space
+        changes by a factor larger than zoom_threshold (zoom in)
+        or smaller than 1/zoom_threshold (zoom out), the
+        children are rendered again. Between the two, the cached
+        texture is stretched.
+
+        Setting 1. renders again on any zoom change.
+
+        Default is 1.5.
+
+        """
+        ...
+
+
+    @zoom_threshold.setter
+    def zoom_threshold(self, value : float):
+        ...
+
+
 class DrawingClip(drawingItem):
     """
     A DrawingList, but with clipping.
@@ -19936,8 +20986,9 @@ class Font(baseFont):
     A Font object encapsulates the rendering information for text in the UI.
     It contains the texture data, size information, and scaling behavior.
 
-    Fonts are typically created through FontTexture.add_font_file() or
-    FontTexture.add_custom_font() rather than directly instantiated.
+    Fonts are typically created through FontTexture.add_font_file(),
+    FontTexture.add_custom_font() or FontTexture.add_dynamic_font()
+    rather than directly instantiated.
 
     """
     def __init__(self, context : Context, *, attach : Any = ..., before : Any = ..., children : list[Never] = [], next_sibling : 'baseItem' | None = None, no_scaling : bool = False, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, scale : float = 1.0, size : Any = ..., user_data : Any = ...):
@@ -19976,6 +21027,43 @@ def configure(self, *, children : list[Never] = [], next_sibling : 'baseItem' |
         ...
 
 
+    def request_glyphs(self, text) -> int:
+        """
+        Indicate the characters of text are going to be displayed.
+
+        For fonts created with FontTexture.add_dynamic_font, the
+        characters not yet in the texture are rendered in the
+        background, and appear on the next frames (the fallback
+        glyph is displayed in the meantime). The characters
+        already in the texture are marked as recently used.
+
+        The characters of Text, TextValue, DrawText and table
+        cells are requested automatically when their layout is
+        computed (new value, font or wrap width). This method
+        is only needed for other texts, such as widget labels,
+        or to load glyphs in advance.
+
+        Does nothing for other fonts.
+
+        Returns:
+            The number of characters queued for rendering.
+
+        """
+        ...
+
+
+    @property
+    def loaded_glyphs(self) -> str:
+        """
+        (Read-only) Readonly attribute: characters currently in the texture
+        of a font created with FontTexture.add_dynamic_font.
+
+        Empty for other fonts.
+
+        """
+        ...
+
+
     @property
     def no_scaling(self) -> bool:
         """
@@ -22335,6 +23423,22 @@ def __init__(self, context : Context, *, attach : Any = ..., before : 'uiItem' |
         ...
 
 
+    def append(self, text):
+        """
+        Append markdown text at the end of the current value.
+
+        Equivalent to `value += text`, except only the end of
+        the document is parsed and laid out again. Use it to
+        stream text into the item.
+
+        The text is parsed in parts, split at blank lines that
+        start a new top-level block. Link reference definitions
+        only apply to the part that contains them.
+
+        """
+        ...
+
+
     def configure(self, *, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem'] = [], color_code : Color | None = None, color_code_bg : Color | None = None, color_emph : Color | None = None, color_headings : Sequence[Color] | None = [None, None, None, None, None, None], color_strikethrough : Color | None = None, color_strong : Color | None = None, color_underline : Color | None = None, enabled : bool = True, font : 'baseFont' | None = None, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], heading_scales : Sequence[float] = [2.0, 1.75, 1.5, 1.375, 1.25, 1.125], height : float | str | 'baseSizing' = 0.0, label : str = "", next_sibling : 'uiItem' | None = None, no_newline : bool = False, parent : 'uiItem' | 'plotElement' | None = None, previous_sibling : 'uiItem' | None = None, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., user_data : Any = ..., value : str = "", width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
@@ -22501,6 +23605,19 @@ def heading_scales(self, value : Sequence[float]):
         ...
 
 
+    @property
+    def processing(self) -> bool:
+        """
+        (Read-only) Whether parsing or layout is still in progress.
+
+        Long texts are parsed in a worker thread, and their
+        layout is spread on several frames. In the meantime,
+        the previous content or layout is displayed.
+
+        """
+        ...
+
+
     @property
     def value(self) -> str:
         """Get the markdown text content
@@ -28331,7 +29448,7 @@ class Window(uiItem):
     menu bars can be attached using menubar items.
 
     """
-    def __init__(self, context : Context, *, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, attach : Any = ..., autosize : bool = False, before : 'Window' | None = None, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], collapsed : bool = False, enabled : bool = True, font : 'baseFont' | None = None, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], has_close_button : bool = True, height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", max_size : Sequence[float] | tuple[float, float] | 'Coord' = (30000.0, 30000.0), menubar : bool = False, min_size : Sequence[float] | tuple[float, float] | 'Coord' = (100.0, 100.0), modal : bool = False, next_sibling : 'Window' | None = None, no_background : bool = False, no_bring_to_front_on_focus : bool = False, no_collapse : bool = False, no_focus_on_appearing : bool = False, no_keyboard_inputs : bool = False, no_mouse_inputs : bool = False, no_move : bool = False, no_newline : bool = False, no_open_over_existing_popup : bool = False, no_resize : bool = False, no_saved_settings : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, no_title_bar : bool = False, on_close : Any = ..., parent : 'Viewport' | 'WindowLayout' | None = None, popup : bool = False, previous_sibling : 'Window' | None = None, primary : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., unsaved_document : bool = False, user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
+    def __init__(self, context : Context, *, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, attach : Any = ..., autosize : bool = False, before : 'Window' | None = None, cache_drawlist : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], collapsed : bool = False, enabled : bool = True, font : 'baseFont' | None = None, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], has_close_button : bool = True, height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", max_size : Sequence[float] | tuple[float, float] | 'Coord' = (30000.0, 30000.0), menubar : bool = False, min_size : Sequence[float] | tuple[float, float] | 'Coord' = (100.0, 100.0), modal : bool = False, next_sibling : 'Window' | None = None, no_background : bool = False, no_bring_to_front_on_focus : bool = False, no_collapse : bool = False, no_focus_on_appearing : bool = False, no_keyboard_inputs : bool = False, no_mouse_inputs : bool = False, no_move : bool = False, no_newline : bool = False, no_open_over_existing_popup : bool = False, no_resize : bool = False, no_saved_settings : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, no_title_bar : bool = False, on_close : Any = ..., parent : 'Viewport' | 'WindowLayout' | None = None, popup : bool = False, previous_sibling : 'Window' | None = None, primary : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., unsaved_document : bool = False, user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
         ----------
@@ -28340,6 +29457,7 @@ def __init__(self, context : Context, *, always_show_horizontal_scrollvar : bool
         - attach: Whether to attach the item to a parent. Default is None (auto)
         - autosize: Makes the window automatically resize to fit its contents.
         - before: Attach the item just before the target item. Default is None (disabled)
+        - cache_drawlist: Retain the draw commands of the window content between frames.
         - callback: Callback to invoke when the item's value changes
         - callbacks: List of callbacks to invoke when the item's value changes.
         - children: List of all the children of the item, from first rendered, to last rendered.
@@ -28389,13 +29507,14 @@ def __init__(self, context : Context, *, always_show_horizontal_scrollvar : bool
         ...
 
 
-    def configure(self, *, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, autosize : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], collapsed : bool = False, enabled : bool = True, font : 'baseFont' | None = None, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], has_close_button : bool = True, height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", max_size : Sequence[float] | tuple[float, float] | 'Coord' = (30000.0, 30000.0), menubar : bool = False, min_size : Sequence[float] | tuple[float, float] | 'Coord' = (100.0, 100.0), modal : bool = False, next_sibling : 'Window' | None = None, no_background : bool = False, no_bring_to_front_on_focus : bool = False, no_collapse : bool = False, no_focus_on_appearing : bool = False, no_keyboard_inputs : bool = False, no_mouse_inputs : bool = False, no_move : bool = False, no_newline : bool = False, no_open_over_existing_popup : bool = False, no_resize : bool = False, no_saved_settings : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, no_title_bar : bool = False, on_close : Any = ..., parent : 'Viewport' | 'WindowLayout' | None = None, popup : bool = False, previous_sibling : 'Window' | None = None, primary : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., unsaved_document : bool = False, user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
+    def configure(self, *, always_show_horizontal_scrollvar : bool = False, always_show_vertical_scrollvar : bool = False, autosize : bool = False, cache_drawlist : bool = False, callback : DCGCallable | None = None, callbacks : Sequence[DCGCallable] = [], children : Sequence['uiItem' | 'MenuBar'] = [], collapsed : bool = False, enabled : bool = True, font : 'baseFont' | None = None, handlers : Sequence['baseHandler'] | 'baseHandler' | None = [], has_close_button : bool = True, height : float | str | 'baseSizing' = 0.0, horizontal_scrollbar : bool = False, label : str = "", max_size : Sequence[float] | tuple[float, float] | 'Coord' = (30000.0, 30000.0), menubar : bool = False, min_size : Sequence[float] | tuple[float, float] | 'Coord' = (100.0, 100.0), modal : bool = False, next_sibling : 'Window' | None = None, no_background : bool = False, no_bring_to_front_on_focus : bool = False, no_collapse : bool = False, no_focus_on_appearing : bool = False, no_keyboard_inputs : bool = False, no_mouse_inputs : bool = False, no_move : bool = False, no_newline : bool = False, no_open_over_existing_popup : bool = False, no_resize : bool = False, no_saved_settings : bool = False, no_scroll_with_mouse : bool = False, no_scrollbar : bool = False, no_title_bar : bool = False, on_close : Any = ..., parent : 'Viewport' | 'WindowLayout' | None = None, popup : bool = False, previous_sibling : 'Window' | None = None, primary : bool = False, scaling_factor : float = 1.0, shareable_value : SharedValue = ..., show : bool = True, theme : Any = ..., unsaved_document : bool = False, user_data : Any = ..., value : Any = ..., width : float | str | 'baseSizing' = 0.0, x : float | str | 'baseSizing' = 0.0, y : float | str | 'baseSizing' = 0.0):
         """
         Parameters
         ----------
         - always_show_horizontal_scrollvar: Always displays the horizontal scrollbar even when content fits.
         - always_show_vertical_scrollvar: Always displays the vertical scrollbar even when content fits.
         - autosize: Makes the window automatically resize to fit its contents.
+        - cache_drawlist: Retain the draw commands of the window content between frames.
         - callback: Callback to invoke when the item's value changes
         - callbacks: List of callbacks to invoke when the item's value changes.
         - children: List of all the children of the item, from first rendered, to last rendered.
@@ -28499,6 +29618,32 @@ def autosize(self, value : bool):
         ...
 
 
+    @property
+    def cache_drawlist(self) -> bool:
+        """
+        Retain the draw commands of the window content between frames.
+
+        When enabled, the vertices generated by the children of the window
+        are kept, and copied back instead of drawing the children again as
+        long as no child is modified, the window is not moved, resized or
+        scrolled, and it doesn't receive mouse or keyboard inputs.
+
+        This is meant for mostly static windows with a lot of content
+        (text, drawings). While the cached content is used, the children
+        are not drawn, and thus their states and handlers are not updated.
+        Children which create their own windows (child windows, popups,
+        tooltips) or require to be drawn at specific times disable the
+        cache for the frame.
+
+        """
+        ...
+
+
+    @cache_drawlist.setter
+    def cache_drawlist(self, value : bool):
+        ...
+
+
     @property
     def children(self) -> list['uiItem' | 'MenuBar']:
         """
@@ -29257,11 +30402,15 @@ class AutoFont(FontMultiScales):
         Function to create fonts. Takes size as first argument and optional kwargs.
         The output should be a GlyphSet.
         If None, uses make_extended_latin_font.
+    sdf : bool = False
+        Render a single signed distance field font (font_creator
+        receives hinter="sdf"), which remains sharp at all scales,
+        instead of creating a new font for each new global scale.
     **kwargs :
         Additional arguments passed to font_creator
 
     """
-    def __init__(self, context : Context, base_size: float = 17.0, font_creator: Callable[Concatenate[float, ...], 'GlyphSet'] | None = None, *, attach : Any = ..., before : Any = ..., callbacks : Sequence[DCGCallable] = ..., children : list[Never] = [], fonts : Sequence['Font'] = ..., next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, user_data : Any = ...):
+    def __init__(self, context : Context, base_size: float = 17.0, font_creator: Callable[Concatenate[float, ...], 'GlyphSet'] | None = None, sdf: bool = False, *, attach : Any = ..., before : Any = ..., callbacks : Sequence[DCGCallable] = ..., children : list[Never] = [], fonts : Sequence['Font'] = ..., next_sibling : 'baseItem' | None = None, parent : 'baseItem' | None = None, previous_sibling : 'baseItem' | None = None, user_data : Any = ...):
         """
         Parameters
         ----------
@@ -34616,6 +35765,17 @@ def color_as_ints(val: Color) -> tuple[int, int, int, int]:
     ...
 
 
+def get_glyph_cache() -> tuple[str | None, int]:
+    """
+    Returns the (directory, max_size) of the
+    on-disk cache of rendered glyphs.
+
+    See set_glyph_cache.
+    
+    """
+    ...
+
+
 def get_system_fonts() -> list[str]:
     """
     Returns a list of available fonts
@@ -34734,3 +35894,25 @@ def resolve_theme(item: baseItem, target_class: type, name: str) -> object:
     """
     ...
 
+
+def set_glyph_cache(directory: str | None, max_size: int = 67108864) -> None:
+    """
+    Configure the on-disk cache of rendered glyphs.
+
+    make_extended_latin_font (used by AutoFont) stores the
+    glyphs it renders in this directory, and reuses them
+    on the next runs instead of rendering them again.
+
+    By default the cache is in the user cache directory,
+    or in the directory set by the DEARCYGUI_GLYPH_CACHE
+    environment variable (an empty value disables the cache).
+
+    Inputs:
+    -------
+    directory: cache directory. None disables the cache.
+    max_size: maximum size in bytes of the cache. When exceeded,
+        the least recently used entries are removed.
+    
+    """
+    ...
+
@@ -15,12 +15,13 @@
 #cython: freethreading_compatible=True
 #distutils: language=c++
 
-from libc.stdint cimport uint8_t, uint32_t, int32_t, int64_t, uint64_t
-from libc.string cimport memset, memcpy
+from libc.stdint cimport uint8_t, uint32_t, int32_t, int64_t, uint64_t, uintptr_t
+from libc.string cimport memset, memcpy, memcmp
 from libcpp cimport bool
 from libcpp.cmath cimport floor, ceil, round as cround, fmin, fmax
 from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
+from libcpp.vector cimport vector
 
 cimport cython
 from cpython.object cimport PyObject
@@ -37,7 +38,7 @@ from .font cimport AutoFont
 from .imgui_types cimport parse_color, ImVec2Vec2, Vec2ImVec2, unparse_color,\
     check_Axis, make_Axis
 from .sizing cimport resolve_size, set_size, RefX0, RefY0, RefWidth, RefHeight
-from .texture cimport Texture
+from .texture cimport Texture, TextureManager, get_texture_manager
 from .types cimport Vec2, child_type,\
     Coord, parse_texture, Display,\
     get_children_types, get_item_type, is_Key, make_Key,\
@@ -257,6 +258,13 @@ cdef class SharedGLContext:
         shared_context.gl_context = gl_context
         return shared_context
 
+# Process-wide counters reported in ViewportMetrics.
+# Number of times a thread holding the gil had to wait for a mutex
+cdef atomic[int64_t] _lock_contentions
+# Number of item state reads served by the published states
+# rather than waiting for the item mutex
+cdef atomic[int64_t] _snapshot_reads
+
 # We use unique_lock rather than lock_guard as
 # the latter doesn't support nullary constructor
 # which causes trouble to cython
@@ -271,6 +279,7 @@ cdef void lock_gil_friendly_block(unique_lock[DCGMutex] &m) noexcept:
     # holding the lock to run and release it.
     # Block until we get the lock
     cdef bint locked = False
+    _lock_contentions.fetch_add(1)
     while not(locked):
         with nogil:
             # Block until the mutex is released
@@ -430,8 +439,19 @@ cdef class Context:
         """
         self.next_uuid.store(21)
         self._running = True
+        # Threads are only started on the first submission
+        self._teardown_queue = _ThreadPoolExecutor(max_workers=1,
+                                                   thread_name_prefix="dcg_teardown")
         self.viewport = Viewport(self)
 
+    def __dealloc__(self):
+        # Pending teardowns keep references to their items,
+        # and thus to the context. The queue is idle at this point.
+        # wait=False as the last reference might be released
+        # by the teardown worker itself.
+        if self._teardown_queue is not None:
+            self._teardown_queue.shutdown(wait=False)
+
     def __reduce__(self):
         """
         Pickle support.
@@ -521,6 +541,9 @@ cdef class Context:
         """
         if callback is None:
             return
+        # Callbacks may update items in reaction: the next
+        # frame cannot be skipped.
+        self._content_generation.fetch_add(1)
         # we release the context because we cannot guarantee
         # this external code doesn't change the context.
         unlock_im_context() 
@@ -547,6 +570,7 @@ cdef class Context:
         """
         if callback is None:
             return
+        self._content_generation.fetch_add(1)
         unlock_im_context()
         with gil:
             try:
@@ -571,6 +595,7 @@ cdef class Context:
         """
         if callback is None:
             return
+        self._content_generation.fetch_add(1)
         unlock_im_context()
         with gil:
             try:
@@ -594,6 +619,7 @@ cdef class Context:
         cdef unique_lock[DCGMutex] m
         if callback is None:
             return
+        self._content_generation.fetch_add(1)
         unlock_im_context()
         try:
             self._queue.submit(callback, sender, target, data)
@@ -1064,6 +1090,13 @@ cdef class Context:
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.viewport.mutex)
         self._running = value
+        cdef platformViewport *platform
+        if not(value) and self.viewport._initialized:
+            # Let event loops waiting on the wait_handle stop
+            platform = <platformViewport*>self.viewport.get_platform()
+            if platform != NULL:
+                platform.signalWaitHandle()
+                self.viewport.release_platform()
 
     @property
     def clipboard(self):
@@ -1091,6 +1124,52 @@ cdef class Context:
 
 
 
+cdef inline void read_sizing_geometry(Vec2 *geometry, itemStateValues &state) noexcept nogil:
+    geometry[0] = state.pos_to_viewport
+    geometry[1] = state.rect_size
+    geometry[2] = state.content_region_size
+    geometry[3] = state.content_pos
+
+cdef void record_sizing_read(baseItem source, baseItem target) noexcept nogil:
+    """
+    Record that a sizing of target read the states of source.
+
+    If source is not done rendering for this frame, the value read
+    is the one of the previous frame (or partially updated). The
+    geometry of source is then saved, to check at the end of its
+    rendering whether the value read was final.
+    """
+    cdef int64_t frame = target.context.viewport.frame_count
+    cdef bint early = source._layout_frame != frame
+    target.context.viewport._sizing_reads.push_back(target.uuid)
+    target.context.viewport._sizing_reads.push_back(source.uuid)
+    target.context.viewport._sizing_reads.push_back(early)
+    if early and source._early_read_frame != frame and source.p_state != NULL:
+        source._early_read_frame = frame
+        read_sizing_geometry(source._early_read_geometry, source.p_state.cur)
+
+cdef void check_early_sizing_reads(baseItem item) noexcept nogil:
+    """
+    Called when item is done rendering. Requests another
+    rendering pass if a sizing read its position or size
+    earlier in the frame, and the value has changed since.
+    """
+    cdef int64_t frame = item.context.viewport.frame_count
+    cdef Vec2[4] geometry
+    cdef int32_t i
+    if item._layout_frame == frame:
+        return
+    item._layout_frame = frame
+    if item._early_read_frame != frame:
+        return
+    read_sizing_geometry(geometry, item.p_state.cur)
+    for i in range(4):
+        if geometry[i].x != item._early_read_geometry[i].x or \
+           geometry[i].y != item._early_read_geometry[i].y:
+            item.context.viewport.redraw_needed = True
+            item.context.viewport._sizing_changes.push_back(item.uuid)
+            return
+
 cdef class baseItem:
     """
     Base class for all items (except shared values).
@@ -1199,6 +1278,8 @@ cdef class baseItem:
         self.context = context
         self._external_lock = False
         self.uuid = self.context.next_uuid.fetch_add(1)
+        self._layout_frame = -1
+        self._early_read_frame = -1
         self.can_have_widget_child = False
         self.can_have_drawing_child = False
         self.can_have_sibling = False
@@ -1211,6 +1292,54 @@ cdef class baseItem:
         for (key, value) in (<dict>kwargs).items():
             setattr(self, key, value)
 
+    cdef void mark_dirty(self) noexcept:
+        """
+        Record that the item content has changed.
+
+        Bumps the context content generation and stamps it on
+        the item and all its ancestors, such that a parent can
+        tell whether anything in its subtree changed since a
+        given generation. Changes to items outside the rendering
+        tree bump the shared generation instead.
+
+        Parent links are read without their mutex. In the worst
+        case a concurrent detach leads to stamping the previous
+        parent chain, which only causes a spurious refresh.
+        """
+        cdef uint64_t generation = self.context._content_generation.fetch_add(1) + 1
+        cdef baseItem item = self
+        cdef baseItem root = self
+        while item is not None:
+            item._dirty_generation = generation
+            root = item
+            item = item.parent
+        if root is not self.context.viewport:
+            # Not in the rendering tree (themes, fonts, textures,
+            # items being built): the users of the item are unknown.
+            self.context._shared_generation.fetch_add(1)
+
+    def invalidate(self, double max_latency=0.) -> bool:
+        """
+        Mark the item as modified and request a redraw.
+
+        Meant for threads updating items in the background,
+        instead of calling Viewport.wake() after each update.
+        Requests are coalesced: the viewport is woken at most
+        once per batch of changes, and not more than once per
+        frame interval of the frame policy (max_fps).
+
+        Args:
+            max_latency: Delay in seconds within which the redraw
+                should occur. Larger values enable to batch more
+                changes into the same frame.
+
+        Returns:
+            True if a wake was sent to the viewport, False if the
+            request was merged into an already scheduled one.
+        """
+        self.mark_dirty()
+        return self.context.viewport.request_redraw(max_latency)
+
     def __reduce__(self) -> tuple:
         """
         Pickle support.
@@ -1597,6 +1726,186 @@ cdef class baseItem:
             (<baseItem>child).detach_item()
             child = self.last_menubar_child
 
+    def reconcile(self, keys, factory, updater=None) -> list:
+        """
+        Incrementally update the children of the item from a list of keys.
+
+        This is the keyed alternative to rebuilding the children list
+        every time the data changes. Children created by previous calls
+        to reconcile are remembered by key:
+            - Keys seen for the first time get a new child,
+              created by calling factory(key).
+            - Keys already present reuse their child, and
+              updater(key, child) is called if provided.
+            - Children whose keys are absent are deleted.
+        The reconciled children are then reordered to follow the order
+        of keys, moving only the children that are out of place. The
+        item mutex is held during the whole relinking, while the mutex
+        of each moved or inserted child is only held for its own move.
+
+        Children that were not created by reconcile are left in place,
+        before the reconciled children. All the reconciled children
+        must be of the same category (for example all widgets, or all
+        drawings).
+
+        Parameters:
+        keys : iterable
+            Hashable keys, in the target rendering order.
+        factory : callable
+            factory(key) -> item. Called for new keys. The returned
+            item is attached to this item by reconcile.
+        updater : callable, optional
+            updater(key, item). Called for reused children.
+
+        Returns:
+        list
+            The reconciled children, in the order of keys.
+        """
+        cdef dict previous = self._keyed_children
+        if previous is None:
+            previous = {}
+        cdef dict current = {}
+        cdef list ordered = []
+        cdef list created = []
+        cdef baseItem child
+        cdef int32_t category = -1
+        for key in keys:
+            if key in current:
+                raise ValueError(f"Duplicated key {key}")
+            child = previous.get(key, None)
+            # The child might have been moved elsewhere since
+            if child is not None and child.parent is not self:
+                child = None
+            if child is None:
+                new_item = factory(key)
+                if not(isinstance(new_item, baseItem)):
+                    raise TypeError(f"factory returned {new_item}, which is not an item")
+                child = <baseItem>new_item
+                if child.context is not self.context:
+                    raise ValueError(f"{child} was not created in the same context")
+                if child.parent is not None:
+                    # For instance attached by the 'with' statement
+                    child.detach_item()
+                created.append(child)
+            elif updater is not None:
+                updater(key, child)
+            if category == -1:
+                category = child.element_child_category
+            elif child.element_child_category != category:
+                raise TypeError("All reconciled children must be of the same category")
+            current[key] = child
+            ordered.append(child)
+
+        if len(ordered) > 0:
+            if not(_can_have_child_category(self, category)):
+                raise TypeError("Instance of type {} cannot be attached to {}".format(type(ordered[0]), type(self)))
+            if len(ordered) > 1 and not((<baseItem>ordered[0]).can_have_sibling):
+                raise ValueError("Instance of type {} cannot have a sibling".format(type(ordered[0])))
+
+        # Delete the children of the keys that disappeared
+        for key, old_child in previous.items():
+            if key in current:
+                continue
+            if (<baseItem>old_child).parent is self:
+                (<baseItem>old_child).delete_item()
+
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if len(ordered) > 0:
+            self._relink_children(ordered, category)
+        self._keyed_children = current
+        m.unlock()
+        self.mark_dirty()
+
+        if len(created) > 0 and not(self._check_traversed()):
+            for child in created:
+                child._set_hidden_and_propagate_to_children_no_handlers()
+        return ordered
+
+    cdef void _relink_children(self, list ordered, int32_t category):
+        """
+        Reorder the children of a category such that the items
+        of ordered are last, in the given order. Items of ordered
+        that are not attached are inserted.
+
+        Only the items that are not part of the longest already
+        sorted subsequence are moved. Assumes the item mutex is held.
+        """
+        cdef unique_lock[DCGMutex] m
+        cdef unique_lock[DCGMutex] m2
+        cdef unique_lock[DCGMutex] m3
+        cdef baseItem item, prev, next
+        cdef set ordered_uuids = set([(<baseItem>item).uuid for item in ordered])
+
+        # Current children, in rendering order
+        cdef list chain = []
+        item = _get_last_child(self, category)
+        while item is not None:
+            chain.append(item)
+            item = item.prev_sibling
+        chain.reverse()
+
+        # Target order: children not managed by the caller, then ordered
+        cdef list target = []
+        cdef dict position = {}
+        cdef int32_t i
+        for i in range(len(chain)):
+            item = <baseItem>chain[i]
+            position[item.uuid] = i
+            if item.uuid not in ordered_uuids:
+                target.append(item)
+        target.extend(ordered)
+
+        cdef list stable = _increasing_subsequence_mask(
+            [position.get((<baseItem>item).uuid, -1) for item in target])
+
+        # Going backward, move each item that is out of place
+        # right before its successor in the target order.
+        # The successor is either stable or was already moved.
+        for i in range(len(target) - 1, -1, -1):
+            if stable[i]:
+                continue
+            item = <baseItem>target[i]
+            lock_gil_friendly(m, item.mutex)
+            if item.parent is self:
+                # Unlink
+                prev = item.prev_sibling
+                next = item.next_sibling
+                if prev is not None:
+                    lock_gil_friendly(m2, prev.mutex)
+                    prev.next_sibling = next
+                    m2.unlock()
+                if next is not None:
+                    lock_gil_friendly(m2, next.mutex)
+                    next.prev_sibling = prev
+                    m2.unlock()
+                else:
+                    _set_last_child(self, category, prev)
+            if i == len(target) - 1:
+                # Insert at the end
+                prev = _get_last_child(self, category)
+                if prev is not None:
+                    lock_gil_friendly(m2, prev.mutex)
+                    prev.next_sibling = item
+                    m2.unlock()
+                item.prev_sibling = prev
+                item.next_sibling = None
+                _set_last_child(self, category, item)
+            else:
+                next = <baseItem>target[i+1]
+                lock_gil_friendly(m2, next.mutex)
+                prev = next.prev_sibling
+                if prev is not None:
+                    lock_gil_friendly(m3, prev.mutex)
+                    prev.next_sibling = item
+                    m3.unlock()
+                next.prev_sibling = item
+                m2.unlock()
+                item.prev_sibling = prev
+                item.next_sibling = next
+            item.parent = self
+            m.unlock()
+
     @property
     def children_types(self):
         """
@@ -1968,6 +2277,7 @@ cdef class baseItem:
         assert(attached) # because we checked before compatibility
         if not(self.parent._check_traversed()): # TODO: could be optimized. Also not totally correct (attaching to a menu for instance)
             self._set_hidden_and_propagate_to_children_no_handlers()
+        self.mark_dirty()
 
     cpdef void attach_before(self, target):
         """
@@ -2031,6 +2341,7 @@ cdef class baseItem:
         target_before.prev_sibling = self
         if not(self.parent._check_traversed()):
             self._set_hidden_and_propagate_to_children_no_handlers()
+        self.mark_dirty()
 
     cdef void _detach_item_and_lock(self, unique_lock[DCGMutex]& m):
         # NOTE: the mutex is not locked if we raise an exception.
@@ -2079,6 +2390,7 @@ cdef class baseItem:
                     self.parent.last_widgets_child = self.prev_sibling
                 elif self.parent.last_window_child is self:
                     self.parent.last_window_child = self.prev_sibling
+        self.parent.mark_dirty()
         # Free references
         self.parent = None
         self.prev_sibling = None
@@ -2100,7 +2412,7 @@ cdef class baseItem:
         # when we want to detect loss of hover, render, etc
         self._set_hidden_and_propagate_to_children_no_handlers()
 
-    cpdef void delete_item(self):
+    cpdef void delete_item(self, bint deferred=False):
         """
         Deletes the item and all its children.
 
@@ -2112,6 +2424,17 @@ cdef class baseItem:
         and all elements in its subtree, as well as bound
         items. As a result, items with no more references
         will be freed immediately.
+
+        Parameters:
+        deferred : bool, optional
+            If True, only the detachment of the item from its
+            parent is done by the call, which takes constant time.
+            The item stops being rendered right away, while the
+            teardown of its subtree (and the deallocation of the
+            items without references) is performed incrementally
+            by a background worker of the context.
+            The item must not be reused after this call.
+            Defaults to False.
         """
         cdef unique_lock[DCGMutex] sibling_m
 
@@ -2120,6 +2443,11 @@ cdef class baseItem:
         # retaining the lock enables to ensure the item is
         # still detached
 
+        if deferred:
+            m.unlock()
+            self.context._teardown_queue.submit(_run_deferred_teardown, self)
+            return
+
         # delete all children recursively
         if self.last_drawings_child is not None:
             (<baseItem>self.last_drawings_child)._delete_and_siblings()
@@ -2152,6 +2480,7 @@ cdef class baseItem:
         self.last_viewport_drawlist_child = None
         self.last_widgets_child = None
         self.last_window_child = None
+        self._keyed_children = None
         # Note we don't free self.context, nor
         # destroy anything else: the item might
         # still be referenced for instance in handlers,
@@ -2225,6 +2554,7 @@ cdef class baseItem:
             current.last_viewport_drawlist_child = None
             current.last_widgets_child = None
             current.last_window_child = None
+            current._keyed_children = None
 
             # Release additional references
             if current._clear_additional_references_on_delete != baseItem._clear_additional_references_on_delete:
@@ -2234,6 +2564,70 @@ cdef class baseItem:
             m.unlock()
             current = prev
 
+    @cython.final
+    cdef void _teardown_subtree(self) noexcept:
+        """
+        Iterative teardown of a detached subtree, used by
+        delete_item(deferred=True).
+
+        Runs on the teardown worker of the context. Contrary to
+        _delete_and_siblings, the parent lock is not kept during
+        the whole traversal: each item only holds the lock of
+        the item being cleared, and the worker yields regularly
+        so that the rendering thread and user threads are not
+        starved. Items are freed as soon as the worker drops its
+        last reference to them.
+        """
+        cdef unique_lock[DCGMutex] m
+        cdef list pending = [self]
+        cdef baseItem current
+        cdef int32_t num_processed = 0
+
+        while len(pending) > 0:
+            current = <baseItem>pending.pop()
+            lock_gil_friendly(m, current.mutex)
+
+            # Children are pushed before their links are broken.
+            # The parent lock being held, the children lists
+            # cannot change.
+            _append_children_chain(pending, current.last_drawings_child)
+            _append_children_chain(pending, current.last_handler_child)
+            _append_children_chain(pending, current.last_menubar_child)
+            _append_children_chain(pending, current.last_plot_element_child)
+            _append_children_chain(pending, current.last_tab_child)
+            _append_children_chain(pending, current.last_tag_child)
+            _append_children_chain(pending, current.last_theme_child)
+            _append_children_chain(pending, current.last_viewport_drawlist_child)
+            _append_children_chain(pending, current.last_widgets_child)
+            _append_children_chain(pending, current.last_window_child)
+
+            # Break all owning references
+            current.parent = None
+            current.prev_sibling = None
+            current.next_sibling = None
+            current.last_drawings_child = None
+            current.last_handler_child = None
+            current.last_menubar_child = None
+            current.last_plot_element_child = None
+            current.last_tab_child = None
+            current.last_tag_child = None
+            current.last_theme_child = None
+            current.last_viewport_drawlist_child = None
+            current.last_widgets_child = None
+            current.last_window_child = None
+            current._keyed_children = None
+
+            if current._clear_additional_references_on_delete != baseItem._clear_additional_references_on_delete:
+                current._clear_additional_references_on_delete()
+            m.unlock()
+
+            # Dropping our reference frees the item here,
+            # on the worker, if nothing else references it.
+            current = None
+            num_processed += 1
+            if num_processed % 256 == 0:
+                sched_yield()
+
     """
     *** Old version that was recursive but suffered from call stack overflow issues
     cdef void _delete_and_siblings(self):
@@ -2291,6 +2685,9 @@ cdef class baseItem:
     @cython.final
     cdef void run_handlers(self) noexcept nogil:
         cdef int32_t i
+        # Called when the item is done rendering for the frame
+        if self.p_state != NULL:
+            check_early_sizing_reads(self)
         if not(self._handlers.empty()):
             for i in range(<int>self._handlers.size()):
                 (<baseHandler>(self._handlers[i])).run_handler(self)
@@ -2684,6 +3081,129 @@ cdef class baseItem:
         """
         return _WrapThisAndParentsMutex.from_item(self)
 
+cdef bint _can_have_child_category(baseItem parent, int32_t category) noexcept:
+    if category == child_type.cat_drawing:
+        return parent.can_have_drawing_child
+    elif category == child_type.cat_handler:
+        return parent.can_have_handler_child
+    elif category == child_type.cat_menubar:
+        return parent.can_have_menubar_child
+    elif category == child_type.cat_plot_element:
+        return parent.can_have_plot_element_child
+    elif category == child_type.cat_tab:
+        return parent.can_have_tab_child
+    elif category == child_type.cat_tag:
+        return parent.can_have_tag_child
+    elif category == child_type.cat_theme:
+        return parent.can_have_theme_child
+    elif category == child_type.cat_viewport_drawlist:
+        return parent.can_have_viewport_drawlist_child
+    elif category == child_type.cat_widget:
+        return parent.can_have_widget_child
+    elif category == child_type.cat_window:
+        return parent.can_have_window_child
+    return False
+
+cdef baseItem _get_last_child(baseItem parent, int32_t category):
+    if category == child_type.cat_drawing:
+        return parent.last_drawings_child
+    elif category == child_type.cat_handler:
+        return parent.last_handler_child
+    elif category == child_type.cat_menubar:
+        return parent.last_menubar_child
+    elif category == child_type.cat_plot_element:
+        return parent.last_plot_element_child
+    elif category == child_type.cat_tab:
+        return parent.last_tab_child
+    elif category == child_type.cat_tag:
+        return parent.last_tag_child
+    elif category == child_type.cat_theme:
+        return parent.last_theme_child
+    elif category == child_type.cat_viewport_drawlist:
+        return parent.last_viewport_drawlist_child
+    elif category == child_type.cat_widget:
+        return parent.last_widgets_child
+    elif category == child_type.cat_window:
+        return parent.last_window_child
+    return None
+
+cdef void _set_last_child(baseItem parent, int32_t category, baseItem child):
+    # Assumes the child category was checked
+    if category == child_type.cat_drawing:
+        parent.last_drawings_child = <drawingItem>child
+    elif category == child_type.cat_handler:
+        parent.last_handler_child = <baseHandler>child
+    elif category == child_type.cat_menubar:
+        parent.last_menubar_child = <uiItem>child
+    elif category == child_type.cat_plot_element:
+        parent.last_plot_element_child = <plotElement>child
+    elif category == child_type.cat_tab:
+        parent.last_tab_child = <uiItem>child
+    elif category == child_type.cat_tag:
+        parent.last_tag_child = <AxisTag>child
+    elif category == child_type.cat_theme:
+        parent.last_theme_child = <baseTheme>child
+    elif category == child_type.cat_viewport_drawlist:
+        parent.last_viewport_drawlist_child = <drawingItem>child
+    elif category == child_type.cat_widget:
+        parent.last_widgets_child = <uiItem>child
+    elif category == child_type.cat_window:
+        parent.last_window_child = <Window>child
+
+cdef list _increasing_subsequence_mask(list positions):
+    """
+    Returns for each element whether it belongs to a longest
+    strictly increasing subsequence of positions. Negative
+    positions are never part of it. O(n log(n)).
+    """
+    cdef int32_t n = len(positions)
+    cdef list mask = [False] * n
+    cdef list tails = [] # index of the smallest tail of each subsequence length
+    cdef list tail_values = []
+    cdef list predecessor = [-1] * n
+    cdef int32_t i, lo, hi, mid, k
+    for i in range(n):
+        value = positions[i]
+        if value < 0:
+            continue
+        lo = 0
+        hi = len(tail_values)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tail_values[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo > 0:
+            predecessor[i] = tails[lo-1]
+        if lo == len(tail_values):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[lo] = i
+            tail_values[lo] = value
+    if len(tails) == 0:
+        return mask
+    k = tails[len(tails)-1]
+    while k >= 0:
+        mask[k] = True
+        k = predecessor[k]
+    return mask
+
+cdef inline void _append_children_chain(list pending, baseItem last_child):
+    """
+    Appends a child list (given by its last element) to pending
+    """
+    while last_child is not None:
+        pending.append(last_child)
+        last_child = last_child.prev_sibling
+
+def _run_deferred_teardown(baseItem item):
+    """
+    Entry point of the teardown worker for delete_item(deferred=True)
+    """
+    item._teardown_subtree()
+
 cdef class _WrapMutex:
     cdef baseItem _target
     def __init__(self, *args, **kwargs):
@@ -2821,6 +3341,13 @@ cdef class ViewportMetrics:
     cdef int64_t rendered_windows
     cdef int64_t active_windows
     cdef int64_t frame_count
+    cdef int64_t lock_contentions
+    cdef int64_t state_snapshot_reads
+    cdef int64_t idle_frames_skipped
+    cdef int64_t missed_deadlines
+    cdef int64_t wake_requests
+    cdef int64_t wakes
+    cdef int64_t convergence_redraws
     
     def __cinit__(self, 
                   int64_t last_time_before_event_handling,
@@ -2835,7 +3362,14 @@ cdef class ViewportMetrics:
                   int64_t rendered_indices,
                   int64_t rendered_windows,
                   int64_t active_windows,
-                  int64_t frame_count):
+                  int64_t frame_count,
+                  int64_t lock_contentions=0,
+                  int64_t state_snapshot_reads=0,
+                  int64_t idle_frames_skipped=0,
+                  int64_t missed_deadlines=0,
+                  int64_t wake_requests=0,
+                  int64_t wakes=0,
+                  int64_t convergence_redraws=0):
         self.last_time_before_event_handling = last_time_before_event_handling
         self.last_time_before_rendering = last_time_before_rendering
         self.last_time_after_rendering = last_time_after_rendering
@@ -2849,6 +3383,13 @@ cdef class ViewportMetrics:
         self.rendered_windows = rendered_windows
         self.active_windows = active_windows
         self.frame_count = frame_count
+        self.lock_contentions = lock_contentions
+        self.state_snapshot_reads = state_snapshot_reads
+        self.idle_frames_skipped = idle_frames_skipped
+        self.missed_deadlines = missed_deadlines
+        self.wake_requests = wake_requests
+        self.wakes = wakes
+        self.convergence_redraws = convergence_redraws
         
     @property
     def last_time_before_event_handling(self) -> float:
@@ -3009,6 +3550,167 @@ cdef class ViewportMetrics:
         """
         return self.frame_count
 
+    @property
+    def lock_contentions(self) -> int:
+        """
+        Number of times a Python thread had to wait for an item
+        mutex held by another thread (process-wide, cumulative).
+
+        Comparing the value between two frames indicates how
+        much user threads contend with rendering.
+        """
+        return self.lock_contentions
+
+    @property
+    def state_snapshot_reads(self) -> int:
+        """
+        Number of item state reads served from the state
+        published at the end of the last item rendering,
+        instead of waiting for the item mutex (process-wide,
+        cumulative).
+        """
+        return self.state_snapshot_reads
+
+    @property
+    def idle_frames_skipped(self) -> int:
+        """
+        Number of render_frame calls which skipped the
+        traversal of the item tree because nothing changed
+        since the previous traversal (cumulative).
+
+        See Viewport.skip_idle_frames.
+        """
+        return self.idle_frames_skipped
+
+    @property
+    def missed_deadlines(self) -> int:
+        """
+        Number of presented frames which completed after
+        the deadline set by the max_fps of the frame policy,
+        while they had started before it (cumulative).
+
+        See Viewport.frame_policy.
+        """
+        return self.missed_deadlines
+
+    @property
+    def wake_requests(self) -> int:
+        """
+        Number of redraw requests received through
+        Viewport.wake() and item.invalidate() (cumulative).
+        """
+        return self.wake_requests
+
+    @property
+    def wakes(self) -> int:
+        """
+        Number of wakes actually sent to the viewport (cumulative).
+
+        item.invalidate() requests are coalesced, thus comparing
+        with wake_requests and frame_count shows how many
+        redundant wakes and frames were avoided.
+        """
+        return self.wakes
+
+    @property
+    def convergence_redraws(self) -> int:
+        """
+        Number of frames which had to be rendered again,
+        without being presented, because a value read
+        during the frame changed later in the same frame
+        (cumulative).
+
+        This happens mainly when a size or position refers
+        to an item rendered after the item using it.
+        """
+        return self.convergence_redraws
+
+
+cdef class FramePolicy:
+    """
+    Frame pacing policy of the viewport.
+
+    Controls how fast render_frame can run, and how much
+    it waits when nothing changes on screen.
+
+    Args:
+        max_fps: Maximum frame rate. render_frame sleeps to not
+            exceed it, whether the frame is presented or not.
+            0 (the default) means no limit other than vsync.
+        idle_fps: Rate at which a frame is presented when
+            nothing happens. Before the policy, this rate was
+            hardcoded to a refresh every 5 s (0.2). 0 disables
+            the periodic refresh.
+        latency: One of:
+            - "low": The max_fps sleep (and the throttling of
+                frames that are not presented, as for "balanced")
+                is done at the start of the next render_frame,
+                right before processing the events, such that
+                inputs are the most recent.
+            - "balanced" (default): With vsync or max_fps, frames
+                that are not presented are throttled to 200 fps.
+                The max_fps sleep is done at the end of render_frame.
+            - "power": Same as "balanced", but when the previous
+                frame was not presented and no item changed since,
+                render_frame waits for input events as if
+                wait_for_input was set. The wait ends on input,
+                on Viewport.wake(), on an item requesting a refresh
+                (for example a timed animation), or after 1/idle_fps.
+                Note items modified from another thread while
+                render_frame waits require a call to Viewport.wake()
+                to be displayed before 1/idle_fps.
+
+    The policy is immutable. Assign a new one to the viewport to
+    change it.
+
+    Example:
+        viewport.frame_policy = dcg.FramePolicy(max_fps=60, idle_fps=2, latency="power")
+    """
+    def __cinit__(self, double max_fps=0., double idle_fps=0.2, str latency="balanced"):
+        if max_fps < 0.:
+            raise ValueError("max_fps must be positive or zero")
+        if idle_fps < 0.:
+            raise ValueError("idle_fps must be positive or zero")
+        if latency == "low":
+            self._latency = 0
+        elif latency == "balanced":
+            self._latency = 1
+        elif latency == "power":
+            self._latency = 2
+        else:
+            raise ValueError(f"Invalid latency mode: {latency}. Expected 'low', 'balanced' or 'power'")
+        self._max_fps = max_fps
+        self._idle_fps = idle_fps
+
+    @property
+    def max_fps(self) -> float:
+        """Maximum frame rate (0 = no limit)"""
+        return self._max_fps
+
+    @property
+    def idle_fps(self) -> float:
+        """Rate of presented frames when nothing happens (0 = none)"""
+        return self._idle_fps
+
+    @property
+    def latency(self) -> str:
+        """Latency mode: 'low', 'balanced' or 'power'"""
+        return ("low", "balanced", "power")[self._latency]
+
+    def __repr__(self):
+        return f"FramePolicy(max_fps={self._max_fps}, idle_fps={self._idle_fps}, latency={self.latency!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, FramePolicy):
+            return NotImplemented
+        cdef FramePolicy policy = <FramePolicy>other
+        return self._max_fps == policy._max_fps and \
+            self._idle_fps == policy._idle_fps and \
+            self._latency == policy._latency
+
+    def __hash__(self):
+        return hash((self._max_fps, self._idle_fps, self._latency))
+
 def _wake_viewport_on_exit(viewport_ref: _weak_ref):
     """
     Wake and help clean the viewport if it is still alive (atexit)
@@ -3060,6 +3762,18 @@ cdef class Viewport(baseItem):
         self.frame_count = 0
         self.wait_for_input = False
         self.always_submit_to_gpu = False
+        self.skip_idle_frames = False
+        self.frame_policy = FramePolicy()
+        self.text_layouts = TextLayoutCache()
+        self._missed_deadlines = 0
+        self._convergence_redraws = 0
+        self._reported_sizing_cycles = set()
+        self._frame_interval_ns = 0
+        self._pending_wake.store(0)
+        self._wake_requests.store(0)
+        self._wakes_sent.store(0)
+        self._pacing_target = 0
+        self._last_frame_presented = True
         self._target_refresh_time = 0.
         self.state.cur.traversed = True
         self.state.cur.rendered = True # For compatibility with RenderHandlers
@@ -3135,8 +3849,8 @@ cdef class Viewport(baseItem):
             imgui.DestroyContext(<imgui.ImGuiContext*>self._imgui_context)
             self._imgui_context = NULL
 
-    cpdef void delete_item(self):
-        baseItem.delete_item(self)
+    cpdef void delete_item(self, bint deferred=False):
+        baseItem.delete_item(self, deferred)
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
         self._font = None
@@ -3260,6 +3974,7 @@ cdef class Viewport(baseItem):
     def clear_color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         cdef uint32_t color = parse_color(value)
         if color & 0xFF000000 != 0xFF000000:
@@ -3293,6 +4008,7 @@ cdef class Viewport(baseItem):
     def icon(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         
         if value is None:
             return
@@ -3421,6 +4137,7 @@ cdef class Viewport(baseItem):
     def hit_test_surface(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
 
         if value is None:
@@ -3482,6 +4199,7 @@ cdef class Viewport(baseItem):
     def transparent(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if (<platformViewport*>self._platform).isTransparent == value:
             return
@@ -3509,6 +4227,7 @@ cdef class Viewport(baseItem):
     def x_pos(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value == (<platformViewport*>self._platform).positionX:
             return
@@ -3536,6 +4255,7 @@ cdef class Viewport(baseItem):
     def y_pos(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value == (<platformViewport*>self._platform).positionY:
             return
@@ -3685,6 +4405,7 @@ cdef class Viewport(baseItem):
     def width(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value <= 0:
             raise ValueError("Width must be a positive integer")
@@ -3712,6 +4433,7 @@ cdef class Viewport(baseItem):
     def height(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         cdef float dpi_scale = (<platformViewport*>self._platform).dpiScale
         if value <= 0:
@@ -3738,6 +4460,7 @@ cdef class Viewport(baseItem):
     def pixel_width(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         cdef float dpi_scale = (<platformViewport*>self._platform).dpiScale
         (<platformViewport*>self._platform).windowWidth = <int>(<float>value / dpi_scale)
@@ -3762,6 +4485,7 @@ cdef class Viewport(baseItem):
     def pixel_height(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         cdef float dpi_scale = (<platformViewport*>self._platform).dpiScale
         (<platformViewport*>self._platform).windowHeight = <int>(<float>value / dpi_scale)
@@ -3786,6 +4510,7 @@ cdef class Viewport(baseItem):
     def resizable(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         (<platformViewport*>self._platform).windowResizable = value
         (<platformViewport*>self._platform).windowPropertyChangeRequested = True
@@ -3809,9 +4534,51 @@ cdef class Viewport(baseItem):
     def vsync(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         (<platformViewport*>self._platform).hasVSync = value
 
+    @property
+    def threaded_presentation(self) -> bool:
+        """
+        Whether GPU submission and buffer swap run on a presentation thread.
+
+        By default, render_frame processes the events, traverses the
+        item tree, then submits the frame to the GPU and swaps the
+        buffers, which blocks on vsync. These steps add up.
+
+        When enabled, the rendering commands of the frame are copied
+        (double buffered), and a dedicated thread submits them and
+        waits for the swap, while render_frame returns right away
+        to let the next frame be prepared. render_frame only blocks
+        when it gets more than one frame ahead of the presentation.
+        Heavy UIs can thus use nearly the whole frame interval
+        for the traversal.
+
+        Notes:
+        - Displayed frames have one more frame of latency
+            when the traversal is faster than the swap.
+        - delta_presenting in the metrics no longer includes
+            the GPU submission and the swap.
+        - Frames for which retrieve_framebuffer is set are
+            presented synchronously.
+        - Presenting from a secondary thread might not be supported
+            by all platforms and drivers (macOS in particular).
+
+        Disabled by default.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        return self._threaded_presentation
+
+    @threaded_presentation.setter
+    def threaded_presentation(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        self._threaded_presentation = value
+
     @property
     def dpi(self) -> float:
         """
@@ -3846,6 +4613,7 @@ cdef class Viewport(baseItem):
     def scale(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         self._scale = value
 
@@ -3868,6 +4636,7 @@ cdef class Viewport(baseItem):
     def min_width(self, uint32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value <= 0:
             raise ValueError("Minimum width must be a positive integer")
@@ -3893,6 +4662,7 @@ cdef class Viewport(baseItem):
     def max_width(self, uint32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value <= 0:
             raise ValueError("Maximum width must be a positive integer")
@@ -3918,6 +4688,7 @@ cdef class Viewport(baseItem):
     def min_height(self, uint32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value <= 0:
             raise ValueError("Minimum height must be a positive integer")
@@ -3943,6 +4714,7 @@ cdef class Viewport(baseItem):
     def max_height(self, uint32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value <= 0:
             raise ValueError("Maximum height must be a positive integer")
@@ -3984,6 +4756,7 @@ cdef class Viewport(baseItem):
         cdef unique_lock[DCGMutex] m
         cdef unique_lock[DCGMutex] m2
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         ulock_im_context_gil(m2, self)
         if value:
@@ -4010,6 +4783,7 @@ cdef class Viewport(baseItem):
     def always_on_top(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         (<platformViewport*>self._platform).windowAlwaysOnTop = value
         (<platformViewport*>self._platform).windowPropertyChangeRequested = True
@@ -4033,6 +4807,7 @@ cdef class Viewport(baseItem):
     def decorated(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         (<platformViewport*>self._platform).windowDecorated = value
         (<platformViewport*>self._platform).windowPropertyChangeRequested = True
@@ -4096,6 +4871,7 @@ cdef class Viewport(baseItem):
     def cursor(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value is None or not(is_MouseCursor(value)):
             raise TypeError("Cursor must be a MouseCursor type")
@@ -4124,6 +4900,7 @@ cdef class Viewport(baseItem):
     def font(self, baseFont value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         self._font = value
 
@@ -4146,6 +4923,7 @@ cdef class Viewport(baseItem):
     def theme(self, baseTheme value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         self._theme = value
 
@@ -4168,6 +4946,7 @@ cdef class Viewport(baseItem):
     def title(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         cdef string title = value.encode("utf-8")
         (<platformViewport*>self._platform).windowTitle = title
@@ -4196,6 +4975,7 @@ cdef class Viewport(baseItem):
     def disable_close(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         self._disable_close = value
 
@@ -4218,6 +4998,7 @@ cdef class Viewport(baseItem):
     def fullscreen(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value and not((<platformViewport*>self._platform).isFullScreen):
             (<platformViewport*>self._platform).shouldFullscreen = True
@@ -4243,6 +5024,7 @@ cdef class Viewport(baseItem):
     def minimized(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value and not((<platformViewport*>self._platform).isMinimized):
             (<platformViewport*>self._platform).shouldMinimize = True
@@ -4270,6 +5052,7 @@ cdef class Viewport(baseItem):
     def maximized(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value and not((<platformViewport*>self._platform).isMaximized):
             (<platformViewport*>self._platform).shouldMaximize = True
@@ -4295,6 +5078,7 @@ cdef class Viewport(baseItem):
     def visible(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         if value and not((<platformViewport*>self._platform).isVisible):
             (<platformViewport*>self._platform).shouldHide = False
@@ -4359,9 +5143,100 @@ cdef class Viewport(baseItem):
     def always_submit_to_gpu(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         self.always_submit_to_gpu = value
 
+    @property
+    def skip_idle_frames(self):
+        """
+        Whether render_frame may skip traversing the item tree
+        when nothing changed since the last traversal.
+
+        A frame is considered idle when no input event or wake()
+        was received, no timed refresh is due, no callback was queued
+        by the previous frame, and no item was modified (property
+        write, tree change, shared value or texture update).
+        Idle frames neither run handlers nor increment frame_count,
+        and the previous frame remains displayed.
+
+        Disabled by default. Only enable it if no code relies
+        on handlers being run, or frame_count being incremented,
+        on every render_frame call. Item changes that are not
+        made through the item properties (for instance from Cython
+        code accessing the item fields directly, or attributes of
+        Python subclasses) are not detected and must be followed
+        by a call to invalidate().
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        return self.skip_idle_frames
+
+    @skip_idle_frames.setter
+    def skip_idle_frames(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        self.skip_idle_frames = value
+
+    @property
+    def text_layout_cache_size(self):
+        """
+        Maximum number of text layouts retained between frames.
+
+        The size and line breaks of the texts displayed by Text,
+        TextValue, table cells and DrawText are cached per font,
+        font size and wrap width, and unchanged texts are not
+        measured again. The least recently displayed texts are
+        evicted first. Set to 0 to disable the cache.
+
+        Defaults to 65536.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return (<DCGTextLayoutCache*>self.text_layouts._cache).get_capacity()
+
+    @text_layout_cache_size.setter
+    def text_layout_cache_size(self, int64_t value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if value < 0:
+            raise ValueError("text_layout_cache_size must be non-negative")
+        (<DCGTextLayoutCache*>self.text_layouts._cache).set_capacity(<size_t>value)
+
+    @property
+    def frame_policy(self):
+        """
+        Frame pacing policy (FramePolicy) used by render_frame.
+
+        Defines the maximum frame rate, the rate of refreshes
+        when nothing happens, and the latency/power trade-off.
+
+        The default, FramePolicy(max_fps=0, idle_fps=0.2,
+        latency="balanced"), reproduces the behaviour of previous
+        versions.
+
+        Example:
+            viewport.frame_policy = dcg.FramePolicy(max_fps=60, idle_fps=2, latency="power")
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        return self.frame_policy
+
+    @frame_policy.setter
+    def frame_policy(self, FramePolicy value not None):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        self.frame_policy = value
+        self._frame_interval_ns = <int64_t>(1e9 / value._max_fps) if value._max_fps > 0. else 0
+        # Apply the new idle refresh rate right away
+        if value._idle_fps > 0.:
+            self._target_refresh_time = min(self._target_refresh_time,
+                                            (<double>ctime.monotonic_ns()) * 1e-9 + 1. / value._idle_fps)
+
     @property
     def shown(self) -> bool:
         """
@@ -4452,9 +5327,96 @@ cdef class Viewport(baseItem):
             imgui.GetIO().MetricsRenderIndices,
             imgui.GetIO().MetricsRenderWindows,
             imgui.GetIO().MetricsActiveWindows,
-            self.frame_count-1
+            self.frame_count-1,
+            _lock_contentions.load(),
+            _snapshot_reads.load(),
+            self._idle_frames_skipped,
+            self._missed_deadlines,
+            self._wake_requests.load(),
+            self._wakes_sent.load(),
+            self._convergence_redraws
         )
 
+    @property
+    def texture_budget(self):
+        """
+        GPU memory budget, in bytes, for the textures of the context.
+
+        When the textures exceed it, the least recently drawn
+        textures with evictable=True (and not drawn during the
+        last frame) are released until the memory is back under
+        90% of the budget. Evicted textures call their
+        reload_callback when drawn again.
+
+        0 (default) means no budget.
+        """
+        cdef TextureManager manager = get_texture_manager(self.context)
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, manager.mutex)
+        return manager._budget
+
+    @texture_budget.setter
+    def texture_budget(self, int64_t value):
+        if value < 0:
+            raise ValueError("texture_budget must be positive or 0")
+        cdef TextureManager manager = get_texture_manager(self.context)
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, manager.mutex)
+        manager._budget = value
+        m.unlock()
+        manager.enforce_budget(None)
+
+    def texture_stats(self):
+        """
+        Return the texture memory statistics of the context.
+
+        Returns a dict with:
+        - budget: the texture_budget, in bytes
+        - resident_bytes: memory of the allocated textures
+        - resident_count: number of allocated textures
+        - evictable_bytes: part of resident_bytes that can be evicted
+        - evictable_count: number of allocated evictable textures
+        - evicted_count: number of textures currently evicted
+        - evictions: total number of evictions
+        - reloads: total number of evicted textures set again
+
+        Sizes do not include mipmaps and backend caches.
+        """
+        cdef TextureManager manager = get_texture_manager(self.context)
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, manager.mutex)
+        cdef list textures = list(manager._evictable)
+        cdef int64_t budget = manager._budget
+        cdef int64_t resident_bytes = manager._resident_bytes
+        cdef int64_t resident_count = manager._resident_count
+        cdef int64_t evictions = manager._evictions
+        cdef int64_t reloads = manager._reloads
+        m.unlock()
+        # The texture fields are protected by the texture mutex,
+        # which must not be taken while holding the manager mutex.
+        cdef int64_t evictable_bytes = 0
+        cdef int64_t evictable_count = 0
+        cdef int64_t evicted_count = 0
+        cdef Texture texture
+        for texture in textures:
+            lock_gil_friendly(m, texture.mutex)
+            if texture._evicted:
+                evicted_count += 1
+            elif texture.allocated_texture != NULL:
+                evictable_bytes += texture._resident_size
+                evictable_count += 1
+            m.unlock()
+        return {
+            "budget": budget,
+            "resident_bytes": resident_bytes,
+            "resident_count": resident_count,
+            "evictable_bytes": evictable_bytes,
+            "evictable_count": evictable_count,
+            "evicted_count": evicted_count,
+            "evictions": evictions,
+            "reloads": reloads
+        }
+
     @property
     def retrieve_framebuffer(self):
         """
@@ -4472,6 +5434,7 @@ cdef class Viewport(baseItem):
     def retrieve_framebuffer(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.__check_alive()
         self._retrieve_framebuffer = value
 
@@ -4564,6 +5527,8 @@ cdef class Viewport(baseItem):
         if self._theme is not None: # maybe apply in render_frame instead ?
             self._theme.push()
         self.redraw_needed = False
+        self._sizing_reads.clear()
+        self._sizing_changes.clear()
         cdef int32_t i
         for i in range(5):
             self.context.prev_last_id_button_catch[i] = \
@@ -4615,6 +5580,7 @@ cdef class Viewport(baseItem):
         self.run_handlers()
         self.last_t_after_rendering = ctime.monotonic_ns()
         if self.redraw_needed:
+            self._convergence_redraws += 1
             (<platformViewport*>self._platform).needsRefresh.store(True)
             (<platformViewport*>self._platform).shouldSkipPresenting = True
             # Skip presenting frames if we can afford
@@ -4626,6 +5592,9 @@ cdef class Viewport(baseItem):
                 # 10 ms elapsed, redraw even if might not be perfect
                 self.skipped_last_frame = False
                 (<platformViewport*>self._platform).shouldSkipPresenting = False
+                if not(self._sizing_changes.empty()):
+                    with gil:
+                        self._report_sizing_cycles()
         else:
             if self.skipped_last_frame:
                 # probably not needed
@@ -4633,6 +5602,45 @@ cdef class Viewport(baseItem):
             self.skipped_last_frame = False
         return
 
+    cdef void _report_sizing_cycles(self) noexcept:
+        """
+        Warn about the cycles in the sizing dependencies
+        that prevented the sizes from converging.
+
+        The graph is the one of the sizing reads of the
+        last frame, from the reading item to the item read.
+        Each cycle is reported once.
+        """
+        cdef dict graph = {}
+        cdef size_t i
+        for i in range(0, self._sizing_reads.size(), 3):
+            graph.setdefault(self._sizing_reads[i], set()).add(self._sizing_reads[i+1])
+        cdef list path
+        cdef list stack
+        cdef set visited
+        cdef frozenset cycle
+        for i in range(self._sizing_changes.size()):
+            start = self._sizing_changes[i]
+            # Depth first search of a path back to start
+            visited = set()
+            stack = [(start, [start])]
+            while stack:
+                (node, path) = stack.pop()
+                for dep in graph.get(node, ()):
+                    if dep == start:
+                        cycle = frozenset(path)
+                        if cycle not in self._reported_sizing_cycles:
+                            self._reported_sizing_cycles.add(cycle)
+                            _warn("Sizes did not converge due to the cycle of "
+                                  "references between the items of uuids " +
+                                  " -> ".join(str(uuid) for uuid in path + [start]),
+                                  RuntimeWarning)
+                        stack = []
+                        break
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, path + [dep]))
+
     cdef void coordinate_to_screen(self, float *dst_p, const double[2] src_p) noexcept nogil:
         """
         Used during rendering as helper to convert drawing coordinates to pixel coordinates
@@ -4679,6 +5687,35 @@ cdef class Viewport(baseItem):
             dst_p[0] = <double>(src_p[0] - self.shifts[0]) / <double>self.scales[0]
             dst_p[1] = <double>(src_p[1] - self.shifts[1]) / <double>self.scales[1]
 
+    @property
+    def wait_handle(self):
+        """
+        OS handle that event loops can poll to know when
+        the viewport has something to process.
+
+        This is a file descriptor which becomes readable on wake()
+        (and item.invalidate()) calls, when a frame presented by the
+        presentation thread completes, and on Linux (X11 and Wayland)
+        when new input is available. It is reset by render_frame_async,
+        and is only a hint: wait_events(0) tells whether rendering is
+        needed.
+
+        None if not supported by the platform (Windows), or if
+        the viewport is not initialized.
+
+        See render_frame_async for a rendering loop using it with asyncio.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        if not(self._initialized):
+            return None
+        cdef bint includes_input
+        cdef int fd = (<platformViewport*>self._platform).getWaitHandle(&includes_input)
+        if fd < 0:
+            return None
+        return fd
+
     def wait_events(self, int32_t timeout_ms=0) -> bool:
         """
         Waits for an event that justifies running render_frame to occur.
@@ -4748,7 +5785,8 @@ cdef class Viewport(baseItem):
         """Render one frame of the application.
 
         Rendering occurs in several sequential steps:
-        1. Mouse/Keyboard events are processed (wait_for_input applies here)
+        1. Mouse/Keyboard events are processed (wait_for_input and
+           the frame_policy apply here)
         2. The viewport and entire rendering tree are traversed to prepare
         rendering commands using ImGui and ImPlot
         3. Rendering commands are submitted to the GPU, if a change was detected
@@ -4771,10 +5809,29 @@ cdef class Viewport(baseItem):
             raise RuntimeError("render_frame must be called from the thread where the context was created")
         cdef double current_time_s, target_timeout_ms
         cdef bint should_present
+        cdef bint is_idle
+        cdef bint wait_idle
+        cdef FramePolicy policy = self.frame_policy
+        cdef int64_t current_time = ctime.monotonic_ns()
+        cdef int64_t interval_ns, pacing_target
+        cdef uint64_t generation
         cdef float gs
         cdef imgui.ImGuiStyle *style
         cdef implot.ImPlotStyle *style_p
         cdef Texture framebuffer
+        if policy._latency == 0 and current_time < self._pacing_target and \
+           not(self._nonblocking_frame):
+            # Low latency: the max_fps sleep occurs before
+            # processing events rather than after presenting.
+            m.unlock()
+            _python_sleep(<double>(self._pacing_target - current_time) * 1e-9)
+            lock_gil_friendly(m, self.mutex)
+        # Power saving: block on events when the previous frame
+        # had nothing to present and nothing changed since.
+        wait_idle = policy._latency == 2 and \
+            not(self._last_frame_presented) and \
+            not(self.skipped_last_frame) and \
+            self.context._content_generation.load() == self._last_traversed_generation
         with nogil:
             lock_im_context(self)
             # Configuring imgui's style. Uses imgui variables and viewport variables
@@ -4841,7 +5898,7 @@ cdef class Viewport(baseItem):
             current_time_s = self.last_t_before_event_handling * 1e-9
             target_timeout_ms = (self._target_refresh_time - current_time_s) * 1000.
             target_timeout_ms = max(0., ceil(target_timeout_ms))
-            if not self.wait_for_input:
+            if not(self.wait_for_input or wait_idle) or self._nonblocking_frame:
                 target_timeout_ms = 0.
             # Use manual locks for processEvents (it may release them)
             self.mutex.lock()
@@ -4867,16 +5924,41 @@ cdef class Viewport(baseItem):
                 # If we are past the target time, we should present
                 # to avoid blocking the viewport.
                 (<platformViewport*>self._platform).needsRefresh.store(True)
-                self._target_refresh_time = current_time_s + 5. # maximum time before next frame
+                # maximum time before next frame. When idle_fps is 0,
+                # one day is far enough and fits the event timeout.
+                self._target_refresh_time = current_time_s + \
+                    (1. / policy._idle_fps if policy._idle_fps > 0. else 86400.)
+            should_present = False
+            # The changes requested so far will be rendered
+            self._pending_wake.store(0)
+            # When no input, timed event, or item change occured
+            # since the last traversal, rendering would produce
+            # the same frame, which is already displayed.
+            generation = self.context._content_generation.load()
+            is_idle = self.skip_idle_frames and \
+                not(self.always_submit_to_gpu) and \
+                not(self.skipped_last_frame) and \
+                generation == self._last_traversed_generation and \
+                not((<platformViewport*>self._platform).activityDetected.load()) and \
+                not((<platformViewport*>self._platform).needsRefresh.load())
+            if is_idle:
+                self._idle_frames_skipped += 1
+                self.last_t_before_rendering = ctime.monotonic_ns()
+                self.last_t_after_rendering = self.last_t_before_rendering
             else:
-                should_present = False
-            # we do not use a unique lock to enable children to unlock
-            lock_im_context(self)
-            try:
-                should_present = \
-                    (<platformViewport*>self._platform).renderFrame(not(self.always_submit_to_gpu))
-            finally:
-                unlock_im_context()
+                self._last_traversed_generation = generation
+                # we do not use a unique lock to enable children to unlock
+                # The back buffer can only be retrieved
+                # when presenting from this thread.
+                (<platformViewport*>self._platform).threadedPresentation = \
+                    (self._threaded_presentation or self._nonblocking_frame) and \
+                    not(self._retrieve_framebuffer)
+                lock_im_context(self)
+                try:
+                    should_present = \
+                        (<platformViewport*>self._platform).renderFrame(not(self.always_submit_to_gpu))
+                finally:
+                    unlock_im_context()
             #self.last_t_after_rendering = ctime.monotonic_ns()
             # Present doesn't use imgui but can take time (vsync)
             if should_present:
@@ -4904,20 +5986,41 @@ cdef class Viewport(baseItem):
                 # Note: doesn't need the imgui context
                 (<platformViewport*>self._platform).present()
                 m.lock()
-        cdef long long current_time = ctime.monotonic_ns()
-        if not(should_present) and (<platformViewport*>self._platform).hasVSync\
-           and (current_time - self.last_t_after_swapping) < 5000000: # 5 ms
-            # cap 'cpu' framerate when not presenting
+        if DCGDynamicGlyphsPending():
+            # Render the missing glyphs of dynamic fonts
             m.unlock()
-            _python_sleep(0.005 - <double>(current_time - self.last_t_after_swapping) * 1e-9)
-            current_time = ctime.monotonic_ns()
+            request_dynamic_glyphs()
             lock_gil_friendly(m, self.mutex)
+        current_time = ctime.monotonic_ns()
+        # Frame pacing
+        interval_ns = 0
+        if policy._max_fps > 0.:
+            interval_ns = <int64_t>(1e9 / policy._max_fps)
+        pacing_target = self.last_t_after_swapping + interval_ns
+        if should_present and interval_ns > 0 and \
+           self.last_t_before_rendering < pacing_target and \
+           pacing_target < current_time:
+            self._missed_deadlines += 1
+        if not(should_present) and \
+           ((<platformViewport*>self._platform).hasVSync or interval_ns > 0):
+            # cap 'cpu' framerate when not presenting
+            pacing_target = self.last_t_after_swapping + max(interval_ns, 5000000) # 5 ms
+        if current_time < pacing_target:
+            if policy._latency == 0 or self._nonblocking_frame:
+                self._pacing_target = pacing_target
+            else:
+                m.unlock()
+                _python_sleep(<double>(pacing_target - current_time) * 1e-9)
+                current_time = ctime.monotonic_ns()
+                lock_gil_friendly(m, self.mutex)
+        self._last_frame_presented = should_present
         self.delta_frame = current_time - self.last_t_after_swapping
         self.last_t_after_swapping = current_time
         self.delta_swapping = current_time - self.last_t_after_rendering
         self.delta_rendering = self.last_t_after_rendering - self.last_t_before_rendering
         self.delta_event_handling = self.last_t_before_rendering - self.last_t_before_event_handling
-        self.frame_count += 1
+        if not(is_idle):
+            self.frame_count += 1
         if self._kill_signal:
             self._kill_signal = False
             if self._kill_exc is not None:
@@ -4927,15 +6030,123 @@ cdef class Viewport(baseItem):
             raise KeyboardInterrupt("Viewport killed by user")
         return should_present
 
-    def wake(self, double delay=0., bint full_refresh=True):
+    async def render_frame_async(self) -> bool:
         """
-        Wake the viewport to force a redraw.
+        Same as render_frame, but awaits instead of blocking.
 
-        In case rendering is waiting for an input (wait_for_input),
-        generate a fake input to force rendering.
+        Must be awaited from an asyncio event loop running in the
+        thread where the context was created.
 
-        Use-cases are:
-            - You have updated the content of several items, and you
+        The waits of render_frame yield to the event loop instead:
+            - The frame pacing of the frame_policy.
+            - When wait_for_input is set (or the frame policy is
+              "power" and nothing changed), the wait for an input,
+              a wake() or a timed refresh. The wait_handle is used
+              for that, thus the wait consumes no cpu.
+            - The wait for the previous frame presentation (vsync).
+              Frames are presented by the presentation thread, as
+              with threaded_presentation.
+
+        On platforms where the wait_handle does not signal new
+        input, the input is checked every few milliseconds.
+
+        Returns
+        -------
+        bool
+            True if the frame was presented to the screen, False otherwise
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        cdef double delay
+        cdef int fd
+        cdef bint includes_input
+        while True:
+            delay = self._async_wait_delay()
+            if delay == 0.:
+                break
+            fd = -1
+            if self._initialized:
+                fd = (<platformViewport*>self._platform).getWaitHandle(&includes_input)
+            if fd < 0:
+                await asyncio.sleep(delay if delay > 0. else 0.001)
+                continue
+            ready = loop.create_future()
+            def set_ready():
+                if not ready.done():
+                    ready.set_result(None)
+            timer = loop.call_later(delay, set_ready) if delay > 0. else None
+            try:
+                loop.add_reader(fd, set_ready)
+            except NotImplementedError:
+                # Event loops without add_reader (Windows proactor)
+                await asyncio.sleep(delay if delay > 0. else 0.001)
+                continue
+            try:
+                await ready
+            finally:
+                loop.remove_reader(fd)
+                if timer is not None:
+                    timer.cancel()
+        self._nonblocking_frame = True
+        try:
+            return self.render_frame()
+        finally:
+            self._nonblocking_frame = False
+
+    cdef double _async_wait_delay(self) except -2.:
+        """
+        Time in seconds render_frame_async must wait before
+        render_frame can run without blocking: 0 if it can run
+        right away, else the maximum time to wait for the wait
+        handle (-1 for no maximum).
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.__check_alive()
+        self.__check_initialized()
+        if not self.context._running:
+            return 0.
+        cdef platformViewport *platform = <platformViewport*>self._platform
+        # Signals after this point are seen by the next wait
+        platform.clearWaitHandle()
+        cdef FramePolicy policy = self.frame_policy
+        cdef bint wait_idle = policy._latency == 2 and \
+            not(self._last_frame_presented) and \
+            not(self.skipped_last_frame) and \
+            self.context._content_generation.load() == self._last_traversed_generation
+        m.unlock()
+        # Pump the events, which also consumes the input
+        # signalled by the wait handle.
+        cdef bint has_events = self.wait_events(0)
+        lock_gil_friendly(m, self.mutex)
+        cdef int64_t now = ctime.monotonic_ns()
+        if now < self._pacing_target:
+            return <double>(self._pacing_target - now) * 1e-9
+        if not(platform.canQueuePresentFrame()):
+            # The previous frame is being presented
+            return -1.
+        if has_events or not(self.wait_for_input or wait_idle):
+            return 0.
+        # Wait until an event, the next timed refresh, or a delayed wake
+        cdef double delay = self._target_refresh_time - (<double>now) * 1e-9
+        cdef uint64_t next_wake = platform.nextWakeTime.load()
+        if next_wake != <uint64_t>(-1):
+            delay = min(delay, (<double>next_wake - <double>now) * 1e-9)
+        cdef bint includes_input
+        platform.getWaitHandle(&includes_input)
+        if not(includes_input):
+            delay = min(delay, 0.005)
+        return max(delay, 1e-4)
+
+    def wake(self, double delay=0., bint full_refresh=True):
+        """
+        Wake the viewport to force a redraw.
+
+        In case rendering is waiting for an input (wait_for_input),
+        generate a fake input to force rendering.
+
+        Use-cases are:
+            - You have updated the content of several items, and you
                request an immediate refresh.
             - You have updated the content of several items, and while
                you don't need an immediate refresh, you want refresh
@@ -4961,6 +6172,39 @@ cdef class Viewport(baseItem):
         cdef uint64_t delay_ns = <uint64_t>fmax(0, delay * 1e9)
         platform.wakeRendering(delay_ns, full_refresh) # doesn't need any mutex
         self.release_platform()
+        self._wake_requests.fetch_add(1)
+        self._wakes_sent.fetch_add(1)
+
+    cdef bint request_redraw(self, double max_latency) noexcept nogil:
+        """
+        Coalescing version of wake(). Returns whether a wake was sent.
+
+        Does not need the viewport mutex. The wake target is
+        now + max_latency, but not earlier than one frame interval
+        after the last frame. If a wake is already scheduled before
+        the target, it will render the change and no wake is sent.
+        The scheduled wake is cleared when a frame starts rendering.
+        """
+        if not self._initialized:
+            return False
+        self._wake_requests.fetch_add(1)
+        cdef int64_t now = ctime.monotonic_ns()
+        cdef int64_t target = now + <int64_t>(fmax(0., max_latency) * 1e9)
+        # Reads without the mutex. A stale value only shifts the target
+        target = max(target, self.last_t_after_swapping + self._frame_interval_ns)
+        cdef int64_t pending = self._pending_wake.load()
+        cdef platformViewport *platform
+        while pending == 0 or pending > target:
+            if not(self._pending_wake.compare_exchange_weak(pending, target)):
+                continue # pending was updated
+            platform = <platformViewport*>self.get_platform()
+            if platform == NULL:
+                return False
+            platform.wakeRendering(<uint64_t>max(target - now, 0), True)
+            self.release_platform()
+            self._wakes_sent.fetch_add(1)
+            return True
+        return False
 
     cdef void ask_refresh_after_target(self, double monotonic) noexcept nogil:
         """
@@ -4971,6 +6215,7 @@ cdef class Viewport(baseItem):
         """
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
         self._target_refresh_time = min(self._target_refresh_time, monotonic)
+        self._refresh_requests += 1
 
     cdef void ask_refresh_after_delta(self, double delta_monotonic) noexcept nogil:
         """
@@ -4982,6 +6227,7 @@ cdef class Viewport(baseItem):
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
         cdef double monotonic = ctime.monotonic_ns() * 1e-9
         self._target_refresh_time = min(self._target_refresh_time, monotonic + delta_monotonic)
+        self._refresh_requests += 1
 
     cdef void force_present(self) noexcept nogil:
         """
@@ -4994,6 +6240,7 @@ cdef class Viewport(baseItem):
         """
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
         (<platformViewport*>self._platform).needsRefresh.store(True)
+        self._refresh_requests += 1
 
     cdef Vec2 get_size(self) noexcept nogil:
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
@@ -5150,6 +6397,316 @@ cdef class PlaceHolderParent(baseItem):
         self.can_have_window_child = True
 
 
+"""
+Item recycling
+"""
+
+cdef class ItemPool:
+    """
+    Recycling pool for items of a given type.
+
+    UIs that destroy and recreate many items per frame
+    (live tables, order books, logs) spend a significant
+    time allocating items (object, mutex, states, uuid).
+    ItemPool keeps released items detached outside the
+    rendering tree, and hands them back on acquire,
+    instead of creating new ones.
+
+    Released items are detached from their parent, their
+    children are detached, and the attributes that were
+    set through acquire (as well as the handlers, callbacks
+    and user_data) are restored to the values of a freshly
+    created item. Attributes set directly on the item
+    after acquire are not tracked and must be listed in
+    reset_attributes if they should be restored on release.
+
+    Recycled items keep their uuid, and thus their internal
+    ImGui identifier.
+
+    Example::
+
+        pool = dcg.ItemPool(C, dcg.Text, size=5000)
+        with window:
+            text = pool.acquire(value="42.0")
+        ...
+        pool.release(text)
+
+    Parameters:
+    context : Context
+        Context in which the items are created.
+    item_type : type
+        Class of the pooled items (subclass of baseItem).
+    size : int
+        Maximum number of released items kept for reuse.
+        Items released beyond this size are deleted.
+    reset_attributes : list[str], optional
+        Attributes always restored on release.
+    """
+    def __init__(self, Context context not None, item_type, int32_t size=1024, reset_attributes=None):
+        if not(isinstance(item_type, type)) or not(issubclass(item_type, baseItem)):
+            raise TypeError("item_type must be a subclass of baseItem")
+        if size < 0:
+            raise ValueError("size must be positive")
+        self._context = context
+        self._item_type = item_type
+        self._size = size
+        self._free = []
+        self._pooled = set()
+        self._acquired_keys = {}
+        # Capture the default configuration of the type
+        cdef baseItem template = item_type(context, attach=False)
+        self._defaults = template.__getstate__()
+        self._defaults.pop("children", None)
+        template.delete_item()
+        # Not all items have handlers or callbacks (drawing items)
+        always_reset = [key for key in ("handlers", "callbacks", "user_data")
+                        if key in self._defaults]
+        if reset_attributes is not None:
+            for key in reset_attributes:
+                if key not in self._defaults:
+                    raise AttributeError(f"{item_type} has no configurable attribute {key}")
+            always_reset += list(reset_attributes)
+        self._always_reset = tuple(dict.fromkeys(always_reset))
+
+    @property
+    def item_type(self):
+        """
+        Readonly attribute: class of the pooled items
+        """
+        return self._item_type
+
+    @property
+    def size(self) -> int:
+        """
+        Maximum number of released items kept for reuse
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._size
+
+    @size.setter
+    def size(self, int32_t value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if value < 0:
+            raise ValueError("size must be positive")
+        self._size = value
+        cdef list excess = self._free[self._size:]
+        del self._free[self._size:]
+        self._dropped += len(excess)
+        for item in excess:
+            self._pooled.discard((<baseItem>item).uuid)
+        m.unlock()
+        for item in excess:
+            (<baseItem>item).delete_item()
+
+    @property
+    def num_free(self) -> int:
+        """
+        Readonly attribute: number of items ready for reuse
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return len(self._free)
+
+    @property
+    def hits(self) -> int:
+        """
+        Readonly attribute: number of acquire calls served
+        by a recycled item
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Readonly attribute: number of acquire calls that
+        had to create a new item
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._misses
+
+    @property
+    def dropped(self) -> int:
+        """
+        Readonly attribute: number of released items that
+        were deleted because the pool was full
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._dropped
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Readonly attribute: fraction of acquire calls served
+        by a recycled item (0 if acquire was never called)
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if self._hits + self._misses == 0:
+            return 0.
+        return <double>self._hits / <double>(self._hits + self._misses)
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hits, misses and dropped counters
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self._hits = 0
+        self._misses = 0
+        self._dropped = 0
+
+    def fill(self, int32_t count) -> None:
+        """
+        Pre-allocate items until count items are ready
+        for reuse (bounded by size).
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        count = min(count, self._size)
+        cdef baseItem item
+        while len(self._free) < count:
+            item = self._item_type(self._context, attach=False)
+            self._pooled.add(item.uuid)
+            self._free.append(item)
+
+    def acquire(self, **kwargs):
+        """
+        Retrieve an item from the pool, or create one if
+        the pool is empty.
+
+        The keyword arguments are handled as for item creation,
+        including parent, before and attach. In particular the
+        item is attached to the current parent of the 'with'
+        statement if none is specified.
+        """
+        cdef unique_lock[DCGMutex] m
+        cdef baseItem item = None
+        lock_gil_friendly(m, self.mutex)
+        if len(self._free) > 0:
+            item = <baseItem>self._free.pop()
+            self._pooled.discard(item.uuid)
+            self._hits += 1
+        else:
+            self._misses += 1
+        m.unlock()
+
+        if item is None:
+            item = self._item_type(self._context, **kwargs)
+            self._track_keys(item, kwargs)
+            return item
+
+        # Same attachment rules as baseItem.__init__
+        attach = kwargs.pop("attach", None)
+        before = kwargs.pop("before", None)
+        parent = kwargs.pop("parent", None)
+        cdef bint ignore_if_fail = attach is None
+        if attach is None and item.element_child_category == -1:
+            attach = False
+        if attach is None or attach:
+            if before is not None:
+                item.attach_before(before)
+            else:
+                if parent is None:
+                    parent = self._context.fetch_parent_queue_back()
+                    if parent is None and \
+                       (not(ignore_if_fail) or \
+                        item.element_child_category == child_type.cat_window or \
+                        item.element_child_category == child_type.cat_menubar or \
+                        item.element_child_category == child_type.cat_viewport_drawlist):
+                        parent = self._context.viewport
+                else:
+                    ignore_if_fail = False
+                if parent is not None:
+                    try:
+                        item.attach_to_parent(parent)
+                    except (ValueError, TypeError) as e:
+                        if not(ignore_if_fail):
+                            raise e
+        for (key, value) in (<dict>kwargs).items():
+            setattr(item, key, value)
+        self._track_keys(item, kwargs)
+        return item
+
+    def release(self, baseItem item not None) -> None:
+        """
+        Give back an item to the pool.
+
+        The item is detached, its children are detached and
+        its configuration is reset. If the pool is full, the
+        item is deleted instead. The item must not be used
+        after this call.
+
+        Raises ValueError if the item was already released.
+        """
+        if type(item) is not self._item_type:
+            raise TypeError(f"{item} is not of type {self._item_type}")
+        if item.context is not self._context:
+            raise ValueError(f"{item} does not belong to the pool context")
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if item.uuid in self._pooled:
+            raise ValueError(f"{item} was already released to the pool")
+        keys = self._acquired_keys.pop(item.uuid, ())
+        if len(self._free) >= self._size:
+            self._dropped += 1
+            m.unlock()
+            item.delete_item()
+            return
+        # Reserved right away to catch concurrent releases
+        self._pooled.add(item.uuid)
+        m.unlock()
+
+        item.detach_item()
+        if item.last_drawings_child is not None or \
+           item.last_handler_child is not None or \
+           item.last_menubar_child is not None or \
+           item.last_plot_element_child is not None or \
+           item.last_tab_child is not None or \
+           item.last_tag_child is not None or \
+           item.last_theme_child is not None or \
+           item.last_viewport_drawlist_child is not None or \
+           item.last_widgets_child is not None or \
+           item.last_window_child is not None:
+            item.children = []
+        for key in keys:
+            if key in self._always_reset:
+                continue
+            setattr(item, key, self._defaults[key])
+        for key in self._always_reset:
+            setattr(item, key, self._defaults[key])
+
+        # The next owner must not see the states of the previous one
+        cdef unique_lock[DCGMutex] item_m
+        lock_gil_friendly(item_m, item.mutex)
+        if item.p_state != NULL:
+            memset(<void*>&item.p_state.cur, 0, sizeof(item.p_state.cur))
+            memset(<void*>&item.p_state.prev, 0, sizeof(item.p_state.prev))
+            if isinstance(item, uiItem):
+                (<uiItem>item).publish_state()
+        item_m.unlock()
+
+        lock_gil_friendly(m, self.mutex)
+        self._free.append(item)
+
+    cdef void _track_keys(self, baseItem item, dict kwargs):
+        """
+        Record the attributes to restore when item is released
+        """
+        cdef unique_lock[DCGMutex] m
+        keys = tuple(key for key in kwargs
+                     if key in self._defaults and key not in self._always_reset)
+        if len(keys) == 0:
+            return
+        lock_gil_friendly(m, self.mutex)
+        self._acquired_keys[item.uuid] = keys
+
+
 """
 States used by many items
 """
@@ -5192,6 +6749,31 @@ cdef class ItemStateView:
         view._item = item
         return view
 
+    cdef int _read_state(self, itemState &state) except -1:
+        """
+        Retrieve a consistent copy of the item states.
+
+        If the item mutex is held by another thread (typically
+        during rendering of the item), the states published by the
+        item at the end of its last rendering are used instead of
+        waiting. Items which do not publish their states fall back
+        to waiting for the mutex.
+        """
+        cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self._item.mutex, defer_lock_t())
+        if not(m.try_lock()):
+            if isinstance(self._item, uiItem) and \
+               (<uiItem>self._item)._state_seqlock.load(<void*>&state,
+                                                        <const void*>&(<uiItem>self._item)._published_state,
+                                                        sizeof(itemState),
+                                                        8):
+                _snapshot_reads.fetch_add(1)
+                return 0
+            lock_gil_friendly_block(m)
+        if self._item.p_state is NULL:
+            raise ValueError("Item state is not available")
+        memcpy(<void*>&state, <const void*>self._item.p_state, sizeof(itemState))
+        return 0
+
     def __dir__(self):
         default_dir = dir(type(self))
         if hasattr(self, '__dict__'): # Can happen with python subclassing
@@ -5214,13 +6796,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_active):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_active):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.active
+        return state.cur.active
     
     @property
     def activated(self):
@@ -5233,13 +6813,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_active):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_active):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.active and not(self._item.p_state.prev.active)
+        return state.cur.active and not(state.prev.active)
     
     @property
     def clicked(self):
@@ -5252,13 +6830,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_clicked):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_clicked):
             raise AttributeError("Field undefined for this item type")
-        return tuple(self._item.p_state.cur.clicked)
+        return tuple(state.cur.clicked)
     
     @property
     def double_clicked(self):
@@ -5271,13 +6847,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_clicked):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_clicked):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.double_clicked
+        return state.cur.double_clicked
     
     @property
     def deactivated(self):
@@ -5290,13 +6864,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_active):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_active):
             raise AttributeError("Field undefined for this item type")
-        return not(self._item.p_state.cur.active) and self._item.p_state.prev.active
+        return not(state.cur.active) and state.prev.active
     
     @property
     def deactivated_after_edited(self):
@@ -5309,13 +6881,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_deactivated_after_edited):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_deactivated_after_edited):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.deactivated_after_edited
+        return state.cur.deactivated_after_edited
     
     @property
     def edited(self):
@@ -5328,13 +6898,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_edited):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_edited):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.edited
+        return state.cur.edited
     
     @property
     def focused(self):
@@ -5347,13 +6915,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_focused):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_focused):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.focused
+        return state.cur.focused
     
     @property
     def hovered(self):
@@ -5366,13 +6932,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_hovered):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_hovered):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.hovered
+        return state.cur.hovered
     
     @property
     def resized(self):
@@ -5385,14 +6949,12 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_rect_size):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_rect_size):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.rect_size.x != self._item.p_state.prev.rect_size.x or \
-               self._item.p_state.cur.rect_size.y != self._item.p_state.prev.rect_size.y
+        return state.cur.rect_size.x != state.prev.rect_size.x or \
+               state.cur.rect_size.y != state.prev.rect_size.y
     
     @property
     def toggled(self):
@@ -5405,13 +6967,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.can_be_toggled):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.can_be_toggled):
             raise AttributeError("Field undefined for this item type")
-        return self._item.p_state.cur.open and not(self._item.p_state.prev.open)
+        return state.cur.open and not(state.prev.open)
     
     @property
     def visible(self):
@@ -5424,11 +6984,9 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        return self._item.p_state.cur.rendered
+        cdef itemState state
+        self._read_state(state)
+        return state.cur.rendered
     
     # Position and size properties
     
@@ -5447,13 +7005,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_rect_size):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_rect_size):
             raise AttributeError("Field undefined for this item type")
-        return Coord.build_v(self._item.p_state.cur.rect_size)
+        return Coord.build_v(state.cur.rect_size)
     
     @property
     def pos_to_viewport(self):
@@ -5462,13 +7018,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_position):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_position):
             raise AttributeError("Field undefined for this item type")
-        return Coord.build_v(self._item.p_state.cur.pos_to_viewport)
+        return Coord.build_v(state.cur.pos_to_viewport)
     
     @property
     def pos_to_window(self):
@@ -5477,13 +7031,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_position):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_position):
             raise AttributeError("Field undefined for this item type")
-        return Coord.build_v(self._item.p_state.cur.pos_to_window)
+        return Coord.build_v(state.cur.pos_to_window)
     
     @property
     def pos_to_parent(self):
@@ -5492,13 +7044,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_position):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_position):
             raise AttributeError("Field undefined for this item type")
-        return Coord.build_v(self._item.p_state.cur.pos_to_parent)
+        return Coord.build_v(state.cur.pos_to_parent)
     
     @property
     def content_region_avail(self):
@@ -5514,13 +7064,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_content_region):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_content_region):
             raise AttributeError("Field undefined for this item type")
-        return Coord.build_v(self._item.p_state.cur.content_region_size)
+        return Coord.build_v(state.cur.content_region_size)
 
     @property
     def content_pos(self):
@@ -5536,13 +7084,11 @@ cdef class ItemStateView:
         """
         if self._item is None:
             raise ValueError("Item has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self._item.mutex)
-        if self._item.p_state is NULL:
-            raise ValueError("Item state is not available")
-        if not(self._item.p_state.cap.has_content_region):
+        cdef itemState state
+        self._read_state(state)
+        if not(state.cap.has_content_region):
             raise AttributeError("Field undefined for type {}".format(type(self)))
-        return Coord.build_v(self._item.p_state.cur.content_pos)
+        return Coord.build_v(state.cur.content_pos)
 
     # Accessor
     @property
@@ -5590,18 +7136,12 @@ cdef class ItemStateCopy:
         cdef baseItem item = view._item
         if item is None:
             raise ValueError("Cannot create a state copy for an item that has been deleted or is invalid")
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, item.mutex)
         if item.p_state is NULL:
             raise AttributeError("Cannot create a state view for an item without state")
         cdef ItemStateCopy self = ItemStateCopy.__new__(ItemStateCopy)
         self._item = item
         # Create a copy of the state
-        memcpy(
-            <void*>&self._state,
-            <const void*>item.p_state,
-            sizeof(itemState)
-        )
+        view._read_state(self._state)
         return self
 
     def __dir__(self):
@@ -5938,6 +7478,7 @@ cdef class drawingItem(baseItem):
     def show(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(value) and self._show:
             self._set_hidden_and_propagate_to_children_no_handlers()
         self._show = value
@@ -6339,6 +7880,9 @@ cdef class SharedValue:
         self._last_frame_update = self.context.viewport.frame_count
         if changed:
             self._last_frame_change = self.context.viewport.frame_count
+            # The items sharing the value are unknown
+            self.context._content_generation.fetch_add(1)
+            self.context._shared_generation.fetch_add(1)
 
     cdef void inc_num_attached(self) noexcept nogil:
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
@@ -6732,6 +8276,7 @@ cdef class uiItem(baseItem):
     def enabled(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(self.can_be_disabled) and value != True:
             raise AttributeError(f"Objects of type {type(self)} cannot be disabled")
         self._enabled_update_requested = True
@@ -6754,6 +8299,7 @@ cdef class uiItem(baseItem):
     def font(self, baseFont value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._font = value
 
     @property
@@ -6773,6 +8319,7 @@ cdef class uiItem(baseItem):
     def label(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._user_label = ""
         else:
@@ -6793,14 +8340,24 @@ cdef class uiItem(baseItem):
         items it's whether selected, and so on. This property provides a
         unified interface for accessing an item's core data.
         """
+        # The value has its own mutex. Only the reference to
+        # it needs protection, and _value_mutex is never held
+        # during rendering. Thus reading does not wait for the
+        # item to be rendered.
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self.mutex)
-        return self._value.value
+        lock_gil_friendly(m, self._value_mutex)
+        cdef SharedValue value = self._value
+        m.unlock()
+        return value.value
 
     @value.setter
     def value(self, value):
+        # Writes wait for the rendering of the item to complete,
+        # such that they are not overwritten by the rendering
+        # thread, and are seen by the next frame as a whole.
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._value.value = value
 
     @property
@@ -6821,13 +8378,12 @@ cdef class uiItem(baseItem):
     def shareable_value(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self._value is value:
             return
         if type(self._value) is not type(value):
             raise ValueError(f"Expected a shareable value of type {type(self._value)}. Received {type(value)}")
-        self._value.dec_num_attached()
-        self._value = value
-        self._value.inc_num_attached()
+        self._set_shared_value(value)
 
     @property
     def show(self):
@@ -6847,6 +8403,7 @@ cdef class uiItem(baseItem):
     def show(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self._show == value:
             return
         if not(value) and self._show:
@@ -6923,6 +8480,7 @@ cdef class uiItem(baseItem):
     def theme(self, baseTheme value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._theme = value
 
     @property 
@@ -6943,6 +8501,7 @@ cdef class uiItem(baseItem):
     def scaling_factor(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scaling_factor = value
 
     ### Positioning and size requests
@@ -7121,6 +8680,7 @@ cdef class uiItem(baseItem):
     def y(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if isinstance(value, (int, float)) and float(value) < 0:
             raise ValueError("Negative y values are not supported. Use a string specification instead.")
         set_size(self.requested_y, value)
@@ -7129,6 +8689,7 @@ cdef class uiItem(baseItem):
     def x(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if isinstance(value, (int, float)) and float(value) < 0:
             raise ValueError("Negative x values are not supported. Use a string specification instead.")
         set_size(self.requested_x, value)
@@ -7137,18 +8698,21 @@ cdef class uiItem(baseItem):
     def height(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         set_size(self.requested_height, value)
 
     @width.setter
     def width(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         set_size(self.requested_width, value)
 
     @no_newline.setter
     def no_newline(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.no_newline = value
 
     @cython.final
@@ -7190,6 +8754,7 @@ cdef class uiItem(baseItem):
                 self.set_previous_states()
                 self._set_hidden_and_propagate_to_children_with_handlers()
                 self._show_update_requested = False
+                self.publish_state()
             return
 
         cdef float original_scale = self.context.viewport.global_scale
@@ -7287,7 +8852,30 @@ cdef class uiItem(baseItem):
             imgui.SameLine(0., -1.)
 
         self.run_handlers()
+        self.publish_state()
+
+
+    cdef void _set_shared_value(self, SharedValue value):
+        """
+        Replace the SharedValue of the item.
 
+        Must be called with the item mutex held.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self._value_mutex)
+        self._value.dec_num_attached()
+        self._value = value
+        self._value.inc_num_attached()
+
+    cdef void publish_state(self) noexcept nogil:
+        """
+        Make the current states available to readers that
+        cannot wait for the item mutex. Called at the end of
+        the item rendering, with the item mutex held.
+        """
+        self._state_seqlock.store(<void*>&self._published_state,
+                                  <const void*>&self.state,
+                                  sizeof(itemState))
 
     cdef bint draw_item(self) noexcept nogil:
         """
@@ -7367,6 +8955,681 @@ cdef class TimeWatcher(uiItem):
                          self.context.viewport.frame_count))
 
 
+cdef extern from * nogil:
+    """
+void GetCurrentWindowContentState(float* state)
+{
+    ImGuiWindow* window = ImGui::GetCurrentWindow();
+    state[0] = window->DC.CursorPos.x;
+    state[1] = window->DC.CursorPos.y;
+    state[2] = window->DC.CursorMaxPos.x;
+    state[3] = window->DC.CursorMaxPos.y;
+    state[4] = window->DC.IdealMaxPos.x;
+    state[5] = window->DC.IdealMaxPos.y;
+}
+
+void SetCurrentWindowContentState(const float* state)
+{
+    ImGuiWindow* window = ImGui::GetCurrentWindow();
+    window->DC.CursorPos = ImVec2(state[0], state[1]);
+    window->DC.CursorMaxPos = ImVec2(state[2], state[3]);
+    window->DC.IdealMaxPos = ImVec2(state[4], state[5]);
+}
+
+int GetActiveWindowsCount()
+{
+    return GImGui->WindowsActiveCount;
+}
+
+bool CurrentWindowInputMayChangeContent()
+{
+    ImGuiContext& g = *GImGui;
+    ImGuiWindow* root = ImGui::GetCurrentWindow()->RootWindow;
+    // An item of the window is being interacted with
+    if (g.ActiveId != 0 && g.ActiveIdWindow != NULL && g.ActiveIdWindow->RootWindow == root)
+        return true;
+    // Keyboard inputs go to the focused window
+    if (g.NavWindow != NULL && g.NavWindow->RootWindow == root) {
+        for (int i = 0; i < g.InputEventsTrail.Size; i++) {
+            ImGuiInputEventType type = g.InputEventsTrail[i].Type;
+            if (type == ImGuiInputEventType_Key || type == ImGuiInputEventType_Text)
+                return true;
+        }
+    }
+    if (g.HoveredWindow == NULL || g.HoveredWindow->RootWindow != root)
+        return false;
+    // Mouse over the window: hover effects, clicks and scrolling
+    if (g.HoveredId != 0 || g.HoveredIdPreviousFrame != 0)
+        return true;
+    if (g.IO.MouseDelta.x != 0.f || g.IO.MouseDelta.y != 0.f ||
+        g.IO.MouseWheel != 0.f || g.IO.MouseWheelH != 0.f)
+        return true;
+    for (int button = 0; button < IM_ARRAYSIZE(g.IO.MouseDown); button++) {
+        if (g.IO.MouseDown[button] || g.IO.MouseReleased[button])
+            return true;
+    }
+    return false;
+}
+    """
+    void GetCurrentWindowContentState(float* state) noexcept
+    void SetCurrentWindowContentState(const float* state) noexcept
+    int GetActiveWindowsCount() noexcept
+    bint CurrentWindowInputMayChangeContent() noexcept
+
+
+cdef class DrawListCache:
+    """
+    Retains the vertices and indices generated by the children
+    of an item (Window, ChildWindow, DrawInWindow), in order to
+    copy them back to the drawlist instead of drawing the children
+    when nothing changed.
+
+    The cached content is reused when:
+    - No item of the subtree was modified (dirty generation)
+    - No shared value, texture, theme or font was modified
+    - The style and font in use are unchanged
+    - The position, size, scroll and clipping region are unchanged
+    - No input may have affected the content of the window
+
+    Content that cannot be retained disables the cache for the frame:
+    nested windows (child windows, popups, tooltips), draw callbacks,
+    and items requesting a timed refresh or a new frame.
+    """
+    def __cinit__(self):
+        self._valid = False
+
+    cdef bint try_replay(self, baseItem owner, void* drawlist, bint window_content) noexcept nogil:
+        """
+        Copy back the cached draw commands into drawlist if the
+        cache is still valid, and return True. Else return False,
+        in which case the caller must draw the children, then call
+        capture().
+
+        window_content indicates drawlist is the drawlist of the
+        owner window, in which case the layout state of the window
+        is saved and restored as well.
+        """
+        cdef imgui.ImDrawList* dl = <imgui.ImDrawList*>drawlist
+        cdef double[16] key
+        cdef imgui.ImVec2 v = imgui.GetCursorScreenPos()
+        key[0] = v.x
+        key[1] = v.y
+        v = dl.GetClipRectMin()
+        key[2] = v.x
+        key[3] = v.y
+        v = dl.GetClipRectMax()
+        key[4] = v.x
+        key[5] = v.y
+        v = imgui.GetWindowSize()
+        key[6] = v.x
+        key[7] = v.y
+        key[8] = owner.context.viewport.parent_size.x
+        key[9] = owner.context.viewport.parent_size.y
+        key[10] = owner.context.viewport.global_scale
+        key[11] = owner.context.viewport.scales[0]
+        key[12] = owner.context.viewport.scales[1]
+        key[13] = owner.context.viewport.shifts[0]
+        key[14] = owner.context.viewport.shifts[1]
+        key[15] = owner.context.viewport.thickness_multiplier
+
+        if self._valid and \
+           self._window_content == window_content and \
+           owner._dirty_generation <= self._generation and \
+           owner.context._shared_generation.load() == self._shared_generation and \
+           memcmp(key, self._key, sizeof(key)) == 0 and \
+           self._same_style() and \
+           not(CurrentWindowInputMayChangeContent()):
+            self._replay(drawlist)
+            if window_content:
+                SetCurrentWindowContentState(self._content_state)
+            return True
+
+        # Prepare capture
+        self._valid = False
+        self._window_content = window_content
+        self._generation = owner.context._content_generation.load()
+        self._shared_generation = owner.context._shared_generation.load()
+        memcpy(self._key, key, sizeof(key))
+        self._save_style()
+        self._idx_start = <uint32_t>dl.IdxBuffer.Size
+        self._num_windows = GetActiveWindowsCount()
+        self._refresh_requests = owner.context.viewport._refresh_requests
+        self._redraw_needed_before = owner.context.viewport.redraw_needed
+        return False
+
+    cdef void capture(self, baseItem owner, void* drawlist) noexcept nogil:
+        """
+        Retain the draw commands appended to drawlist since
+        the last failed try_replay()
+        """
+        cdef imgui.ImDrawList* dl = <imgui.ImDrawList*>drawlist
+        self._segments.clear()
+        self._vertices.clear()
+        self._indices.clear()
+        # Content which depends on time or which
+        # is not in the drawlist cannot be retained
+        if owner.context.viewport._refresh_requests != self._refresh_requests or \
+           (owner.context.viewport.redraw_needed and not(self._redraw_needed_before)) or \
+           GetActiveWindowsCount() != self._num_windows:
+            return
+
+        cdef int32_t words_per_vertex = sizeof(imgui.ImDrawVert) // sizeof(uint32_t)
+        cdef DrawListCacheSegment segment
+        cdef imgui.ImDrawCmd* cmd
+        cdef uint32_t idx_begin, idx_end, vtx_min, vtx_max, vtx
+        cdef uint32_t k
+        cdef int32_t i
+        for i in range(dl.CmdBuffer.Size):
+            cmd = &dl.CmdBuffer.Data[i]
+            idx_begin = max(cmd.IdxOffset, self._idx_start)
+            idx_end = cmd.IdxOffset + cmd.ElemCount
+            if idx_end <= idx_begin:
+                continue
+            if cmd.UserCallback != NULL:
+                self._segments.clear()
+                self._vertices.clear()
+                self._indices.clear()
+                return
+            # Vertices referenced by the command
+            vtx_min = <uint32_t>(-1)
+            vtx_max = 0
+            for k in range(idx_begin, idx_end):
+                vtx = cmd.VtxOffset + dl.IdxBuffer.Data[k]
+                vtx_min = min(vtx_min, vtx)
+                vtx_max = max(vtx_max, vtx)
+            segment.clip_rect[0] = cmd.ClipRect.x
+            segment.clip_rect[1] = cmd.ClipRect.y
+            segment.clip_rect[2] = cmd.ClipRect.z
+            segment.clip_rect[3] = cmd.ClipRect.w
+            segment.texture_id = <uint64_t>cmd.TextureId
+            segment.vtx_start = <uint32_t>(self._vertices.size() // words_per_vertex)
+            segment.vtx_count = vtx_max - vtx_min + 1
+            segment.idx_start = <uint32_t>self._indices.size()
+            segment.idx_count = idx_end - idx_begin
+            self._vertices.resize(self._vertices.size() + segment.vtx_count * words_per_vertex)
+            memcpy(&self._vertices[segment.vtx_start * words_per_vertex],
+                   &dl.VtxBuffer.Data[vtx_min],
+                   segment.vtx_count * sizeof(imgui.ImDrawVert))
+            for k in range(idx_begin, idx_end):
+                self._indices.push_back(cmd.VtxOffset + dl.IdxBuffer.Data[k] - vtx_min)
+            self._segments.push_back(segment)
+
+        if self._window_content:
+            GetCurrentWindowContentState(self._content_state)
+        self._valid = True
+
+    cdef bint _same_style(self) noexcept nogil:
+        # Themes and fonts pushed by the parents
+        cdef size_t imgui_size = sizeof(imgui.ImGuiStyle)
+        cdef size_t implot_size = sizeof(implot.ImPlotStyle)
+        cdef imgui.ImFont* font = imgui.GetFont()
+        cdef float font_size = imgui.GetFontSize()
+        if self._style.size() != imgui_size + implot_size + sizeof(font) + sizeof(font_size):
+            return False
+        cdef uint8_t* data = self._style.data()
+        return memcmp(data, &imgui.GetStyle(), imgui_size) == 0 and \
+               memcmp(data + imgui_size, &implot.GetStyle(), implot_size) == 0 and \
+               memcmp(data + imgui_size + implot_size, &font, sizeof(font)) == 0 and \
+               memcmp(data + imgui_size + implot_size + sizeof(font), &font_size, sizeof(font_size)) == 0
+
+    cdef void _save_style(self) noexcept nogil:
+        cdef size_t imgui_size = sizeof(imgui.ImGuiStyle)
+        cdef size_t implot_size = sizeof(implot.ImPlotStyle)
+        cdef imgui.ImFont* font = imgui.GetFont()
+        cdef float font_size = imgui.GetFontSize()
+        self._style.resize(imgui_size + implot_size + sizeof(font) + sizeof(font_size))
+        cdef uint8_t* data = self._style.data()
+        memcpy(data, &imgui.GetStyle(), imgui_size)
+        memcpy(data + imgui_size, &implot.GetStyle(), implot_size)
+        memcpy(data + imgui_size + implot_size, &font, sizeof(font))
+        memcpy(data + imgui_size + implot_size + sizeof(font), &font_size, sizeof(font_size))
+
+    cdef void _replay(self, void* drawlist) noexcept nogil:
+        cdef imgui.ImDrawList* dl = <imgui.ImDrawList*>drawlist
+        cdef int32_t words_per_vertex = sizeof(imgui.ImDrawVert) // sizeof(uint32_t)
+        cdef DrawListCacheSegment *segment
+        cdef imgui.ImVec2 clip_min, clip_max
+        cdef uint32_t base, k
+        cdef int32_t i
+        for i in range(<int32_t>self._segments.size()):
+            segment = &self._segments[i]
+            clip_min = imgui.ImVec2(segment.clip_rect[0], segment.clip_rect[1])
+            clip_max = imgui.ImVec2(segment.clip_rect[2], segment.clip_rect[3])
+            dl.PushClipRect(clip_min, clip_max, False)
+            dl.PushTextureID(<imgui.ImTextureID>segment.texture_id)
+            dl.PrimReserve(segment.idx_count, segment.vtx_count)
+            base = dl._VtxCurrentIdx
+            memcpy(dl._VtxWritePtr,
+                   &self._vertices[segment.vtx_start * words_per_vertex],
+                   segment.vtx_count * sizeof(imgui.ImDrawVert))
+            for k in range(segment.idx_count):
+                dl._IdxWritePtr[k] = base + self._indices[segment.idx_start + k]
+            dl._VtxWritePtr += segment.vtx_count
+            dl._IdxWritePtr += segment.idx_count
+            dl._VtxCurrentIdx += segment.vtx_count
+            dl.PopTextureID()
+            dl.PopClipRect()
+
+
+cdef extern from * nogil:
+    """
+#include <atomic>
+#include <cfloat>
+#include <cstring>
+#include <iterator>
+#include <list>
+#include <mutex>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+// Bumped when the glyphs of a font are modified, which
+// invalidates the layouts of all the caches.
+static std::atomic<uint64_t> dcg_text_layout_generation(0);
+
+// Fonts whose glyphs are rendered on demand, with the
+// characters of the layouts computed since the last
+// call to DCGTakeDynamicGlyphs.
+static std::mutex dcg_dynamic_fonts_mutex;
+static std::unordered_map<ImFont*, std::unordered_set<uint32_t>> dcg_dynamic_fonts;
+static std::atomic<int> dcg_num_dynamic_fonts(0);
+static std::atomic<bool> dcg_dynamic_glyphs_pending(false);
+
+static void DCGRegisterDynamicFont(ImFont* font, bool registered)
+{
+    std::lock_guard<std::mutex> lock(dcg_dynamic_fonts_mutex);
+    if (registered)
+        dcg_dynamic_fonts[font];
+    else
+        dcg_dynamic_fonts.erase(font);
+    dcg_num_dynamic_fonts.store((int)dcg_dynamic_fonts.size());
+}
+
+static void DCGNoteDynamicGlyphs(ImFont* font, const char* text, const char* text_end)
+{
+    if (dcg_num_dynamic_fonts.load(std::memory_order_relaxed) == 0)
+        return;
+    std::lock_guard<std::mutex> lock(dcg_dynamic_fonts_mutex);
+    auto it = dcg_dynamic_fonts.find(font);
+    if (it == dcg_dynamic_fonts.end())
+        return;
+    const char* s = text;
+    while (s < text_end) {
+        unsigned int c = 0;
+        s += ImTextCharFromUtf8(&c, s, text_end);
+        if (c >= 32) // control characters are handled by ImGui
+            it->second.insert((uint32_t)c);
+    }
+    if (!it->second.empty())
+        dcg_dynamic_glyphs_pending.store(true, std::memory_order_relaxed);
+}
+
+static bool DCGDynamicGlyphsPending()
+{
+    return dcg_dynamic_glyphs_pending.load(std::memory_order_relaxed);
+}
+
+static bool DCGTakeDynamicGlyphs(std::vector<void*>& fonts,
+                                 std::vector<std::vector<uint32_t>>& codepoints)
+{
+    if (!dcg_dynamic_glyphs_pending.exchange(false))
+        return false;
+    std::lock_guard<std::mutex> lock(dcg_dynamic_fonts_mutex);
+    for (auto& entry : dcg_dynamic_fonts) {
+        if (entry.second.empty())
+            continue;
+        fonts.push_back((void*)entry.first);
+        codepoints.emplace_back(entry.second.begin(), entry.second.end());
+        entry.second.clear();
+    }
+    return !fonts.empty();
+}
+
+struct DCGTextLayout {
+    float width = 0.f;
+    float height = 0.f;
+    std::vector<uint32_t> lines; // begin and end offsets of each line
+};
+
+class DCGTextLayoutCache {
+public:
+    const DCGTextLayout* get(ImFont* font, float size, float wrap_width,
+                             const char* text, const char* text_end)
+    {
+        const uint64_t generation = dcg_text_layout_generation.load(std::memory_order_relaxed);
+        if (generation != font_generation) {
+            clear();
+            font_generation = generation;
+        }
+        if (wrap_width <= 0.f)
+            wrap_width = 0.f;
+        if (capacity == 0) {
+            compute(font, size, wrap_width, text, text_end, scratch);
+            return &scratch;
+        }
+        Key key;
+        key.font = font;
+        key.size = size;
+        key.wrap_width = wrap_width;
+        key.length = (size_t)(text_end - text);
+        key.hash = hash_text(text, text_end);
+        auto it = index.find(key);
+        if (it != index.end()) {
+            entries.splice(entries.begin(), entries, it->second);
+            return &it->second->second;
+        }
+        if (entries.size() >= capacity) {
+            // Recycle the least recently used entry
+            entries.splice(entries.begin(), entries, std::prev(entries.end()));
+            index.erase(entries.front().first);
+        } else {
+            entries.emplace_front();
+        }
+        entries.front().first = key;
+        compute(font, size, wrap_width, text, text_end, entries.front().second);
+        index[key] = entries.begin();
+        return &entries.front().second;
+    }
+
+    void clear()
+    {
+        index.clear();
+        entries.clear();
+    }
+
+    size_t get_capacity() const { return capacity; }
+
+    void set_capacity(size_t value)
+    {
+        capacity = value;
+        while (entries.size() > capacity) {
+            index.erase(entries.back().first);
+            entries.pop_back();
+        }
+    }
+
+    size_t size() const { return entries.size(); }
+
+private:
+    struct Key {
+        ImFont* font;
+        float size;
+        float wrap_width;
+        size_t length;
+        uint64_t hash;
+        bool operator==(const Key& other) const {
+            return font == other.font && size == other.size &&
+                   wrap_width == other.wrap_width &&
+                   length == other.length && hash == other.hash;
+        }
+    };
+    struct KeyHasher {
+        size_t operator()(const Key& key) const {
+            uint64_t h = key.hash;
+            h ^= (uint64_t)(uintptr_t)key.font * 0x9E3779B97F4A7C15ULL;
+            h ^= (uint64_t)std::hash<float>()(key.size) << 1;
+            h ^= (uint64_t)std::hash<float>()(key.wrap_width) << 2;
+            return (size_t)h;
+        }
+    };
+    typedef std::list<std::pair<Key, DCGTextLayout>> EntryList;
+
+    size_t capacity = 65536;
+    EntryList entries; // Most recently used first
+    std::unordered_map<Key, EntryList::iterator, KeyHasher> index;
+    DCGTextLayout scratch; // Used when the cache is disabled
+    uint64_t font_generation = 0;
+
+    static uint64_t hash_text(const char* text, const char* text_end)
+    {
+        // FNV-1a
+        uint64_t h = 14695981039346656037ULL;
+        for (const char* s = text; s < text_end; s++) {
+            h ^= (uint8_t)*s;
+            h *= 1099511628211ULL;
+        }
+        return h;
+    }
+
+    static void add_line(DCGTextLayout& layout, ImFont* font, float size,
+                         const char* text, const char* begin, const char* end)
+    {
+        ImVec2 line_size = font->CalcTextSizeA(size, FLT_MAX, -1.f, begin, end, NULL);
+        layout.width = ImMax(layout.width, line_size.x);
+        layout.lines.push_back((uint32_t)(begin - text));
+        layout.lines.push_back((uint32_t)(end - text));
+    }
+
+    // Same line breaks as ImFont::RenderText
+    static void compute(ImFont* font, float size, float wrap_width,
+                        const char* text, const char* text_end,
+                        DCGTextLayout& layout)
+    {
+        const float scale = size / font->FontSize;
+        DCGNoteDynamicGlyphs(font, text, text_end);
+        layout.width = 0.f;
+        layout.lines.clear();
+        const char* s = text;
+        while (s < text_end) {
+            const char* line_end = (const char*)memchr(s, '\\n', (size_t)(text_end - s));
+            if (line_end == NULL)
+                line_end = text_end;
+            if (wrap_width > 0.f && s < line_end) {
+                while (true) {
+                    const char* eol = font->CalcWordWrapPositionA(scale, s, line_end, wrap_width);
+                    if (eol <= s) // Display at least one character
+                        eol = s + ImTextCountUtf8BytesFromChar(s, line_end);
+                    add_line(layout, font, size, text, s, eol);
+                    s = eol;
+                    // Blanks at the wrapping point are skipped
+                    while (s < line_end && (*s == ' ' || *s == '\\t'))
+                        s++;
+                    if (s >= line_end)
+                        break;
+                }
+            } else {
+                add_line(layout, font, size, text, s, line_end);
+            }
+            s = line_end + 1;
+        }
+        // Same rounding as ImGui::CalcTextSize
+        layout.width = (float)(int)(layout.width + 0.99999f);
+        layout.height = size * (float)ImMax((int)(layout.lines.size() / 2), 1);
+    }
+};
+
+static void DCGRenderTextLayout(ImDrawList* draw_list, ImFont* font, float size,
+                                ImVec2 pos, ImU32 col, const char* text,
+                                const DCGTextLayout& layout)
+{
+    if ((col & IM_COL32_A_MASK) == 0 || size <= 0.f)
+        return;
+    const ImVec4& clip_rect = draw_list->_CmdHeader.ClipRect;
+    // Glyphs may slightly overhang the measured box
+    if (pos.x > clip_rect.z || pos.x + layout.width + size < clip_rect.x ||
+        pos.y > clip_rect.w || pos.y + layout.height + size < clip_rect.y)
+        return;
+    const int num_lines = (int)(layout.lines.size() / 2);
+    // Skip the lines above the clipping region
+    int i = 0;
+    if (pos.y + size < clip_rect.y)
+        i = (int)((clip_rect.y - pos.y) / size) - 1;
+    for (i = ImMax(i, 0); i < num_lines; i++) {
+        const float y = pos.y + (float)i * size;
+        if (y > clip_rect.w)
+            break;
+        const char* begin = text + layout.lines[2 * i];
+        const char* end = text + layout.lines[2 * i + 1];
+        if (begin == end)
+            continue;
+        draw_list->AddText(font, size, ImVec2(pos.x, y), col, begin, end);
+    }
+}
+
+// ImGui::TextEx with the text size and line breaks from the cache
+static void DCGTextUnformattedCached(DCGTextLayoutCache* cache,
+                                     const char* text, const char* text_end)
+{
+    ImGuiContext& g = *GImGui;
+    ImGuiWindow* window = g.CurrentWindow;
+    if (window->SkipItems)
+        return;
+    if (text_end == NULL)
+        text_end = text + strlen(text);
+
+    const ImVec2 text_pos(window->DC.CursorPos.x, window->DC.CursorPos.y + window->DC.CurrLineTextBaseOffset);
+    const float wrap_pos_x = window->DC.TextWrapPos;
+    const bool wrap_enabled = (wrap_pos_x >= 0.0f);
+    const float wrap_width = wrap_enabled ? ImGui::CalcWrapWidthForPos(window->DC.CursorPos, wrap_pos_x) : 0.0f;
+    const DCGTextLayout* layout = cache->get(g.Font, g.FontSize, wrap_width, text, text_end);
+
+    const ImVec2 text_size(layout->width, layout->height);
+    ImRect bb(text_pos, ImVec2(text_pos.x + text_size.x, text_pos.y + text_size.y));
+    ImGui::ItemSize(text_size, 0.0f);
+    if (!ImGui::ItemAdd(bb, 0))
+        return;
+    DCGRenderTextLayout(window->DrawList, g.Font, g.FontSize, bb.Min,
+                        ImGui::GetColorU32(ImGuiCol_Text), text, *layout);
+}
+
+static ImVec2 DCGCalcTextSizeCached(DCGTextLayoutCache* cache, const char* text,
+                                    const char* text_end, float wrap_width)
+{
+    ImGuiContext& g = *GImGui;
+    if (text_end == NULL)
+        text_end = text + strlen(text);
+    if (text == text_end)
+        return ImVec2(0.0f, g.FontSize);
+    const DCGTextLayout* layout = cache->get(g.Font, g.FontSize, wrap_width, text, text_end);
+    return ImVec2(layout->width, layout->height);
+}
+
+static void DCGAddTextCached(DCGTextLayoutCache* cache, ImDrawList* draw_list,
+                             ImFont* font, float size, ImVec2 pos, ImU32 col,
+                             const char* text, const char* text_end)
+{
+    ImGuiContext& g = *GImGui;
+    if (font == NULL)
+        font = g.Font;
+    if (size <= 0.0f)
+        size = g.FontSize;
+    if (text_end == NULL)
+        text_end = text + strlen(text);
+    if (text == text_end)
+        return;
+    const DCGTextLayout* layout = cache->get(font, size, 0.0f, text, text_end);
+    DCGRenderTextLayout(draw_list, font, size, pos, col, text, *layout);
+}
+
+static void DCGInvalidateTextLayouts()
+{
+    dcg_text_layout_generation.fetch_add(1, std::memory_order_relaxed);
+}
+    """
+    cppclass DCGTextLayoutCache:
+        size_t get_capacity()
+        void set_capacity(size_t)
+        size_t size()
+        void clear()
+    void DCGTextUnformattedCached(DCGTextLayoutCache*, const char*, const char*)
+    imgui.ImVec2 DCGCalcTextSizeCached(DCGTextLayoutCache*, const char*, const char*, float)
+    void DCGAddTextCached(DCGTextLayoutCache*, imgui.ImDrawList*, imgui.ImFont*, float,
+                          imgui.ImVec2, uint32_t, const char*, const char*)
+    void DCGInvalidateTextLayouts()
+    void DCGRegisterDynamicFont(imgui.ImFont*, bool)
+    bint DCGDynamicGlyphsPending()
+    bint DCGTakeDynamicGlyphs(vector[void*]&, vector[vector[uint32_t]]&)
+
+
+cdef void invalidate_text_layouts() noexcept nogil:
+    """
+    Invalidates the cached text layouts of all contexts.
+    Must be called when the glyphs of an existing font
+    are modified.
+    """
+    DCGInvalidateTextLayouts()
+
+
+# ImFont address -> weak reference to the dynamic Font
+cdef dict _dynamic_fonts = {}
+
+cdef void register_dynamic_font(void* font, object font_object):
+    """
+    Request the glyphs of the texts laid out with font
+    through font_object.request_glyphs, such that the
+    glyphs of dynamic fonts are loaded without explicit
+    requests. font_object=None unregisters the font.
+    """
+    if font_object is None:
+        _dynamic_fonts.pop(<uintptr_t>font, None)
+        DCGRegisterDynamicFont(<imgui.ImFont*>font, False)
+        return
+    _dynamic_fonts[<uintptr_t>font] = _weak_ref(font_object)
+    DCGRegisterDynamicFont(<imgui.ImFont*>font, True)
+
+cdef void request_dynamic_glyphs():
+    """
+    Forward the characters of the text layouts computed
+    with dynamic fonts to their Font. Called by the
+    viewport after rendering, without the viewport mutex.
+    """
+    cdef vector[void*] fonts
+    cdef vector[vector[uint32_t]] codepoints
+    if not(DCGTakeDynamicGlyphs(fonts, codepoints)):
+        return
+    cdef int32_t i
+    for i in range(<int32_t>fonts.size()):
+        ref = _dynamic_fonts.get(<uintptr_t>fonts[i], None)
+        font_object = None if ref is None else ref()
+        if font_object is None:
+            # The font was freed
+            _dynamic_fonts.pop(<uintptr_t>fonts[i], None)
+            DCGRegisterDynamicFont(<imgui.ImFont*>fonts[i], False)
+            continue
+        try:
+            font_object.request_glyphs("".join([chr(c) for c in codepoints[i]]))
+        except Exception as e:
+            print(f"Failed to request glyphs: {e}")
+
+
+cdef class TextLayoutCache:
+    """
+    Retains the measured size and line breaks of the texts
+    displayed by Text, TextValue, table cells and DrawText,
+    such that unchanged texts are not measured and wrapped
+    again every frame.
+
+    Entries are keyed on the font, the font size, the wrap
+    width and a hash of the text, and the least recently used
+    entries are evicted when the capacity is reached.
+    """
+    def __cinit__(self):
+        self._cache = <void*>(new DCGTextLayoutCache())
+
+    def __dealloc__(self):
+        cdef DCGTextLayoutCache* cache = <DCGTextLayoutCache*>self._cache
+        if cache != NULL:
+            del cache
+
+    cdef Vec2 calc_text_size(self, const char* text, const char* text_end, float wrap_width) noexcept nogil:
+        return ImVec2Vec2(DCGCalcTextSizeCached(<DCGTextLayoutCache*>self._cache,
+                                                text, text_end, wrap_width))
+
+    cdef void text_unformatted(self, const char* text, const char* text_end) noexcept nogil:
+        DCGTextUnformattedCached(<DCGTextLayoutCache*>self._cache, text, text_end)
+
+    cdef void add_text(self, void* drawlist, void* font, float size, float x, float y,
+                       uint32_t color, const char* text, const char* text_end) noexcept nogil:
+        DCGAddTextCached(<DCGTextLayoutCache*>self._cache,
+                         <imgui.ImDrawList*>drawlist,
+                         <imgui.ImFont*>font,
+                         size,
+                         imgui.ImVec2(x, y),
+                         color,
+                         text,
+                         text_end)
+
+
 cdef extern from * nogil:
     """
 bool GetNamedWindowPos(const char* name, ImVec2& pos)
@@ -7461,6 +9724,7 @@ cdef class Window(uiItem):
     def no_title_bar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoTitleBar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoTitleBar
@@ -7481,6 +9745,7 @@ cdef class Window(uiItem):
     def no_resize(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoResize
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoResize
@@ -7501,6 +9766,7 @@ cdef class Window(uiItem):
     def no_move(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoMove
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoMove
@@ -7522,6 +9788,7 @@ cdef class Window(uiItem):
     def no_scrollbar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoScrollbar
@@ -7542,6 +9809,7 @@ cdef class Window(uiItem):
     def no_scroll_with_mouse(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoScrollWithMouse
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoScrollWithMouse
@@ -7562,6 +9830,7 @@ cdef class Window(uiItem):
     def no_collapse(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoCollapse
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoCollapse
@@ -7583,6 +9852,7 @@ cdef class Window(uiItem):
     def autosize(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_AlwaysAutoResize
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_AlwaysAutoResize
@@ -7604,10 +9874,42 @@ cdef class Window(uiItem):
     def no_background(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoBackground
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoBackground
 
+    @property
+    def cache_drawlist(self):
+        """
+        Retain the draw commands of the window content between frames.
+
+        When enabled, the vertices generated by the children of the window
+        are kept, and copied back instead of drawing the children again as
+        long as no child is modified, the window is not moved, resized or
+        scrolled, and it doesn't receive mouse or keyboard inputs.
+
+        This is meant for mostly static windows with a lot of content
+        (text, drawings). While the cached content is used, the children
+        are not drawn, and thus their states and handlers are not updated.
+        Children which create their own windows (child windows, popups,
+        tooltips) or require to be drawn at specific times disable the
+        cache for the frame.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._drawlist_cache is not None
+
+    @cache_drawlist.setter
+    def cache_drawlist(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if not(value):
+            self._drawlist_cache = None
+        elif self._drawlist_cache is None:
+            self._drawlist_cache = DrawListCache()
+
     @property
     def no_saved_settings(self):
         """
@@ -7621,6 +9923,7 @@ cdef class Window(uiItem):
     def no_saved_settings(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoSavedSettings
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoSavedSettings
@@ -7644,6 +9947,7 @@ cdef class Window(uiItem):
     def no_mouse_inputs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoMouseInputs
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoMouseInputs
@@ -7665,6 +9969,7 @@ cdef class Window(uiItem):
     def no_keyboard_inputs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoNav
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoNav
@@ -7687,6 +9992,7 @@ cdef class Window(uiItem):
     def menubar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_MenuBar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_MenuBar
@@ -7708,6 +10014,7 @@ cdef class Window(uiItem):
     def horizontal_scrollbar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_HorizontalScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_HorizontalScrollbar
@@ -7729,6 +10036,7 @@ cdef class Window(uiItem):
     def no_focus_on_appearing(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoFocusOnAppearing
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoFocusOnAppearing
@@ -7750,6 +10058,7 @@ cdef class Window(uiItem):
     def no_bring_to_front_on_focus(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoBringToFrontOnFocus
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoBringToFrontOnFocus
@@ -7771,6 +10080,7 @@ cdef class Window(uiItem):
     def always_show_vertical_scrollvar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_AlwaysVerticalScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_AlwaysVerticalScrollbar
@@ -7792,6 +10102,7 @@ cdef class Window(uiItem):
     def always_show_horizontal_scrollvar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_AlwaysHorizontalScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_AlwaysHorizontalScrollbar
@@ -7813,6 +10124,7 @@ cdef class Window(uiItem):
     def unsaved_document(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_UnsavedDocument
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_UnsavedDocument
@@ -7834,6 +10146,7 @@ cdef class Window(uiItem):
     def disallow_docking(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoDocking
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoDocking
@@ -7856,6 +10169,7 @@ cdef class Window(uiItem):
     def no_open_over_existing_popup(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_open_over_existing_popup = value
 
     @property
@@ -7875,6 +10189,7 @@ cdef class Window(uiItem):
     def modal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._modal = value
 
     @property
@@ -7894,6 +10209,7 @@ cdef class Window(uiItem):
     def popup(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._popup = value
 
     @property
@@ -7913,6 +10229,7 @@ cdef class Window(uiItem):
     def has_close_button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._has_close_button = value
 
     @property
@@ -7933,6 +10250,7 @@ cdef class Window(uiItem):
     def collapsed(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.state.cur.open = not(value)
         self._collapse_update_requested = True
 
@@ -7983,6 +10301,7 @@ cdef class Window(uiItem):
 
         if self.parent is None:
             raise ValueError("Window must be attached before becoming primary")
+        self.mark_dirty()
         if self._main_window == value:
             return # Nothing to do
         self._main_window = value
@@ -8046,6 +10365,7 @@ cdef class Window(uiItem):
     def min_size(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._min_size.x = max(1, value[0])
         self._min_size.y = max(1, value[1])
 
@@ -8066,6 +10386,7 @@ cdef class Window(uiItem):
     def max_size(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._max_size.x = max(1, value[0])
         self._max_size.y = max(1, value[1])
 
@@ -8205,6 +10526,7 @@ cdef class Window(uiItem):
     def y(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if isinstance(value, (int, float)) and float(value) < 0:
             raise ValueError("Negative y values are not supported. Use a string specification instead.")
         set_size(self.requested_y, value)
@@ -8214,6 +10536,7 @@ cdef class Window(uiItem):
     def x(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if isinstance(value, (int, float)) and float(value) < 0:
             raise ValueError("Negative x values are not supported. Use a string specification instead.")
         set_size(self.requested_x, value)
@@ -8223,6 +10546,7 @@ cdef class Window(uiItem):
     def height(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         set_size(self.requested_height, value)
         self.height_update_requested = True
 
@@ -8230,6 +10554,7 @@ cdef class Window(uiItem):
     def width(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         set_size(self.requested_width, value)
         self.width_update_requested = True
 
@@ -8241,6 +10566,7 @@ cdef class Window(uiItem):
                 self.set_previous_states()
                 self._set_hidden_and_propagate_to_children_with_handlers()
                 self._show_update_requested = False
+                self.publish_state()
             return
 
         cdef float original_scale = self.context.viewport.global_scale
@@ -8482,7 +10808,11 @@ cdef class Window(uiItem):
             draw_menubar_children(self)
             # Q: should we shift content pos after the menubar ?
             # R: No, because this is already taken into account by the MenuBar flag.
-            draw_ui_children(self)
+            if self._drawlist_cache is None:
+                draw_ui_children(self)
+            elif not(self._drawlist_cache.try_replay(self, imgui.GetWindowDrawList(), True)):
+                draw_ui_children(self)
+                self._drawlist_cache.capture(self, imgui.GetWindowDrawList())
 
             self.context.viewport.parent_size = parent_size_backup
             self.context.viewport.parent_pos = parent_pos_backup
@@ -8552,6 +10882,7 @@ cdef class Window(uiItem):
         self._show_update_requested = False
 
         self.run_handlers()
+        self.publish_state()
         # The sizing of windows might not converge right away
         if self.state.cur.content_region_size.x != self.state.prev.content_region_size.x or \
            self.state.cur.content_region_size.y != self.state.prev.content_region_size.y:
@@ -8598,6 +10929,7 @@ cdef class plotElement(baseItem):
     def show(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(value) and self._show:
             self._set_hidden_and_propagate_to_children_no_handlers()
         self._show = value
@@ -8620,6 +10952,7 @@ cdef class plotElement(baseItem):
     def axes(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         cdef int32_t axis_x, axis_y
         axis_x = check_Axis(value[0])
         axis_y = check_Axis(value[1])
@@ -8643,6 +10976,7 @@ cdef class plotElement(baseItem):
     def label(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._user_label = ""
         else:
@@ -8670,6 +11004,7 @@ cdef class plotElement(baseItem):
     def theme(self, baseTheme value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._theme = value
 
     cdef void draw(self) noexcept nogil:
@@ -8735,6 +11070,7 @@ cdef class AxisTag(baseItem):
     def show(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.show = value
 
     @property
@@ -8760,6 +11096,7 @@ cdef class AxisTag(baseItem):
     def bg_color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.bg_color = parse_color(value)
 
     @property
@@ -8779,6 +11116,7 @@ cdef class AxisTag(baseItem):
     def coord(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.coord = value
 
     @property
@@ -8799,6 +11137,7 @@ cdef class AxisTag(baseItem):
     def text(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.text = string_from_str(value)
 
 
@@ -8858,6 +11197,7 @@ cdef class baseTheme(baseItem):
     def enabled(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._enabled = value
     # should be always defined by subclass
     cdef void push(self) noexcept nogil:
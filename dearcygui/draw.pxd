@@ -2,7 +2,7 @@ from .core cimport drawingItem, baseFont, SharedValue
 from .c_types cimport double2, float2, DCGVector, DCGString
 from .texture cimport Texture, Pattern
 
-from libc.stdint cimport uint32_t, int32_t
+from libc.stdint cimport uint32_t, int32_t, int64_t, uint64_t
 
 cdef class ViewportDrawList(drawingItem):
     cdef bint _front
@@ -27,6 +27,23 @@ cdef class DrawingScale(drawingItem):
     cdef bint _no_global_scale
     cdef void draw(self, void*) noexcept nogil
 
+cdef class DrawingCache(drawingItem):
+    cdef double[2] _pmin
+    cdef double[2] _pmax
+    cdef float _supersampling
+    cdef float _zoom_threshold
+    cdef int32_t _max_texture_size
+    cdef Texture _texture
+    cdef void* _offscreen_drawlist
+    cdef bint _valid
+    cdef uint64_t _generation
+    cdef uint64_t _shared_generation
+    cdef double[2] _cached_scales
+    cdef float _cached_thickness_multiplier
+    cdef int64_t _num_renders
+    cdef bint _render_to_texture(self, float[2], float[2]) noexcept nogil
+    cdef void draw(self, void*) noexcept nogil
+
 cdef class DrawSplitBatch(drawingItem):
     cdef void draw(self, void*) noexcept nogil
 
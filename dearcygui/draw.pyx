@@ -24,11 +24,12 @@ from .imgui_types cimport unparse_color, parse_color
 from .c_types cimport DCGMutex, DCGString, unique_lock, make_Vec2,\
     string_from_bytes, string_from_str, string_to_str, Vec4
 from .types cimport child_type, Coord, read_point, read_coord
+from .backends.backend cimport platformViewport
 
 from libcpp.algorithm cimport swap
-from libcpp.cmath cimport atan, atan2, sin, cos, sqrt, fabs, fmod, fmin, fmax
+from libcpp.cmath cimport atan, atan2, sin, cos, sqrt, fabs, fmod, fmin, fmax, ceil
 from libc.math cimport M_PI
-from libc.stdint cimport int32_t
+from libc.stdint cimport int32_t, uint64_t
 from libcpp cimport bool
 from libcpp.vector cimport vector
 
@@ -76,6 +77,7 @@ cdef class ViewportDrawList(drawingItem):
     def front(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._front = value
 
     cdef void draw(self, void* unused) noexcept nogil:
@@ -191,6 +193,7 @@ cdef class DrawingClip(drawingItem):
     def clip_rendering(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._update_clip_rect = value
 
     @property
@@ -208,6 +211,7 @@ cdef class DrawingClip(drawingItem):
     def pmin(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pmin, value)
 
     @property
@@ -225,6 +229,7 @@ cdef class DrawingClip(drawingItem):
     def pmax(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pmax, value)
 
     @property
@@ -244,6 +249,7 @@ cdef class DrawingClip(drawingItem):
     def scale_min(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scale_min = value
 
     @property
@@ -263,6 +269,7 @@ cdef class DrawingClip(drawingItem):
     def scale_max(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scale_max = value
 
     @property
@@ -283,6 +290,7 @@ cdef class DrawingClip(drawingItem):
     def no_global_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_global_scale = value
 
     cdef void draw(self,
@@ -376,6 +384,7 @@ cdef class DrawingScale(drawingItem):
     def scales(self, values):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         cdef int size = read_point[double](self._scales, values)
         if size == 1:
             self._scales[1] = self._scales[0]
@@ -397,6 +406,7 @@ cdef class DrawingScale(drawingItem):
     def origin(self, values):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[double](self._shifts, values)
 
     @property
@@ -418,6 +428,7 @@ cdef class DrawingScale(drawingItem):
     def no_parent_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_parent_scale = value
 
     @property
@@ -432,6 +443,7 @@ cdef class DrawingScale(drawingItem):
     def no_global_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_global_scale = value
 
     cdef void draw(self,
@@ -488,6 +500,350 @@ cdef class DrawingScale(drawingItem):
         self.context.viewport.thickness_multiplier = cur_thick_mul
 
 
+cdef extern from * nogil:
+    """
+    static void* CreateOffscreenDrawList()
+    {
+        return (void*)IM_NEW(ImDrawList)(ImGui::GetDrawListSharedData());
+    }
+
+    static void DeleteOffscreenDrawList(void* draw_list)
+    {
+        if (draw_list != NULL)
+            IM_DELETE((ImDrawList*)draw_list);
+    }
+
+    // Prepares the draw list to receive a new frame,
+    // with a (0, 0, width, height) clip rect.
+    static void BeginOffscreenDrawList(void* draw_list, float width, float height)
+    {
+        ImDrawList* dl = (ImDrawList*)draw_list;
+        dl->_ResetForNewFrame();
+        dl->PushTextureID(ImGui::GetFont()->ContainerAtlas->TexID);
+        dl->PushClipRect(ImVec2(0.f, 0.f), ImVec2(width, height), false);
+    }
+    """
+    void* CreateOffscreenDrawList()
+    void DeleteOffscreenDrawList(void*)
+    void BeginOffscreenDrawList(void*, float, float)
+
+cdef class DrawingCache(drawingItem):
+    """
+    A DrawingList which caches the rendering of its children into a texture.
+
+    The children are rendered into an offscreen texture that
+    covers the region between pmin and pmax. On the next frames,
+    only a single textured quad is drawn, which is much cheaper
+    than submitting the children again when they are numerous
+    (maps, schematics, etc).
+
+    The texture is rendered again when:
+    - The item or any of its children is modified
+    - The coordinate to screen scaling changed by more than
+        zoom_threshold since the last rendering. Below this
+        threshold, the cached texture is stretched.
+    - The sign of the scaling changed (axis inverted)
+
+    Panning only translates the cached texture.
+
+    Limitations:
+    - Only the region between pmin and pmax is rendered.
+    - Children are expected to be passive drawing items. Items
+        that interact with the mouse do not receive events while
+        the cache is used.
+    - The coordinate transform is assumed to be affine in the
+        region (for example log-scale plot axes are not handled).
+    - If the region on screen (multiplied by supersampling) exceeds
+        max_texture_size, the children are drawn directly.
+    """
+    def __cinit__(self):
+        self.can_have_drawing_child = True
+        self._pmin = [0., 0.]
+        self._pmax = [0., 0.]
+        self._supersampling = 1.
+        self._zoom_threshold = 1.5
+        self._max_texture_size = 4096
+        self._offscreen_drawlist = NULL
+        self._valid = False
+
+    def __dealloc__(self):
+        DeleteOffscreenDrawList(self._offscreen_drawlist)
+
+    @property
+    def pmin(self):
+        """
+        (xmin, ymin) corner of the cached region, in coordinate space.
+
+        Children outside the region between pmin and pmax
+        are not visible.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return Coord.build(self._pmin)
+    @pmin.setter
+    def pmin(self, value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        read_coord(self._pmin, value)
+
+    @property
+    def pmax(self):
+        """
+        (xmax, ymax) corner of the cached region, in coordinate space.
+
+        Children outside the region between pmin and pmax
+        are not visible.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return Coord.build(self._pmax)
+    @pmax.setter
+    def pmax(self, value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        read_coord(self._pmax, value)
+
+    @property
+    def supersampling(self):
+        """
+        Resolution factor of the cached texture relative to the screen.
+
+        A value of 2. renders the children at twice the screen
+        resolution, which improves quality when the texture is
+        stretched by zooming, at the cost of four times the memory.
+
+        Default is 1.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._supersampling
+    @supersampling.setter
+    def supersampling(self, float value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if value <= 0.:
+            raise ValueError("supersampling must be positive")
+        self._supersampling = value
+
+    @property
+    def zoom_threshold(self):
+        """
+        Zoom factor above which the cached texture is rendered again.
+
+        When the scaling from coordinate space to screen space
+        changes by a factor larger than zoom_threshold (zoom in)
+        or smaller than 1/zoom_threshold (zoom out), the
+        children are rendered again. Between the two, the cached
+        texture is stretched.
+
+        Setting 1. renders again on any zoom change.
+
+        Default is 1.5.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._zoom_threshold
+    @zoom_threshold.setter
+    def zoom_threshold(self, float value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if value < 1.:
+            raise ValueError("zoom_threshold must be at least 1")
+        self._zoom_threshold = value
+
+    @property
+    def max_texture_size(self):
+        """
+        Maximum width and height of the cached texture.
+
+        When the region to cache is larger on screen, the
+        children are drawn directly without caching.
+
+        Default is 4096.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._max_texture_size
+    @max_texture_size.setter
+    def max_texture_size(self, int32_t value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if value <= 0:
+            raise ValueError("max_texture_size must be positive")
+        self._max_texture_size = value
+
+    @property
+    def texture(self):
+        """
+        Readonly attribute: the Texture holding the cached rendering.
+
+        None until the children are rendered the first time.
+        Note the rows are stored from bottom to top.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._texture
+
+    @property
+    def render_count(self):
+        """
+        Readonly attribute: number of times the children were
+        rendered into the cached texture.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._num_renders
+
+    cdef bint _render_to_texture(self, float[2] c0, float[2] c1) noexcept nogil:
+        """
+        Renders the children into the texture, given the screen
+        positions of pmin (c0) and pmax (c1).
+        """
+        cdef float xmin = fmin(c0[0], c1[0])
+        cdef float ymin = fmin(c0[1], c1[1])
+        cdef float ss = self._supersampling
+        cdef int32_t width = <int32_t>ceil((fmax(c0[0], c1[0]) - xmin) * ss)
+        cdef int32_t height = <int32_t>ceil((fmax(c0[1], c1[1]) - ymin) * ss)
+        if width <= 0 or height <= 0 or \
+           width > self._max_texture_size or height > self._max_texture_size:
+            return False
+
+        if self._texture is None or self._texture.allocated_texture == NULL or \
+           self._texture.width != width or self._texture.height != height:
+            with gil:
+                try:
+                    self._texture = Texture(self.context)
+                    self._texture.allocate(width=width, height=height,
+                                           num_chans=4, uint8=True)
+                except Exception:
+                    self._texture = None
+                    return False
+
+        if self._offscreen_drawlist == NULL:
+            self._offscreen_drawlist = CreateOffscreenDrawList()
+
+        # save states
+        cdef double[2] cur_scales = self.context.viewport.scales
+        cdef double[2] cur_shifts = self.context.viewport.shifts
+        cdef bint cur_in_plot = self.context.viewport.in_plot
+        cdef float cur_size_mul = self.context.viewport.size_multiplier
+        cdef float cur_thick_mul = self.context.viewport.thickness_multiplier
+
+        # Affine transform that maps the region to the texture
+        cdef double sx = self._cached_scales[0]
+        cdef double sy = self._cached_scales[1]
+        self.context.viewport.in_plot = False
+        self.context.viewport.scales[0] = sx * ss
+        self.context.viewport.scales[1] = sy * ss
+        self.context.viewport.shifts[0] = (<double>c0[0] - sx * self._pmin[0] - xmin) * ss
+        self.context.viewport.shifts[1] = (<double>c0[1] - sy * self._pmin[1] - ymin) * ss
+        self.context.viewport.size_multiplier = cur_size_mul * ss
+        self.context.viewport.thickness_multiplier = cur_thick_mul * ss
+
+        BeginOffscreenDrawList(self._offscreen_drawlist, width, height)
+        draw_drawing_children(self, self._offscreen_drawlist)
+
+        # restore states
+        self.context.viewport.scales = cur_scales
+        self.context.viewport.shifts = cur_shifts
+        self.context.viewport.in_plot = cur_in_plot
+        self.context.viewport.size_multiplier = cur_size_mul
+        self.context.viewport.thickness_multiplier = cur_thick_mul
+
+        cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
+        if platform == NULL:
+            return False
+        cdef bint success
+        try:
+            success = platform.renderDrawListToTexture(self._texture.allocated_texture,
+                                                       width,
+                                                       height,
+                                                       self._offscreen_drawlist)
+        finally:
+            self.context.viewport.release_platform()
+        if success:
+            self._num_renders += 1
+        return success
+
+    cdef void draw(self,
+                   void* drawlist) noexcept nogil:
+        cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
+        if not(self._show):
+            return
+        if self.last_drawings_child is None:
+            return
+
+        cdef float[2] c0
+        cdef float[2] c1
+        self.context.viewport.coordinate_to_screen(c0, self._pmin)
+        self.context.viewport.coordinate_to_screen(c1, self._pmax)
+
+        cdef double dx = self._pmax[0] - self._pmin[0]
+        cdef double dy = self._pmax[1] - self._pmin[1]
+        if dx == 0. or dy == 0.:
+            # Empty region: nothing to cache
+            self._valid = False
+            draw_drawing_children(self, drawlist)
+            return
+
+        cdef double[2] scales
+        scales[0] = (<double>c1[0] - <double>c0[0]) / dx
+        scales[1] = (<double>c1[1] - <double>c0[1]) / dy
+
+        # Any change in the subtree stamps our generation.
+        # size_multiplier follows the zoom, and is thus
+        # handled by the scaling ratio.
+        cdef uint64_t generation = self._dirty_generation
+        cdef uint64_t shared_generation = self.context._shared_generation.load()
+        cdef bint needs_render = not(self._valid) or \
+            self._generation != generation or \
+            self._shared_generation != shared_generation or \
+            self._cached_thickness_multiplier != self.context.viewport.thickness_multiplier
+        cdef double ratio
+        cdef int32_t i
+        for i in range(2):
+            if needs_render:
+                break
+            ratio = scales[i] / self._cached_scales[i]
+            if ratio <= 0. or ratio > self._zoom_threshold or \
+               ratio * self._zoom_threshold < 1.:
+                needs_render = True
+
+        if needs_render:
+            self._cached_scales = scales
+            self._cached_thickness_multiplier = self.context.viewport.thickness_multiplier
+            self._valid = self._render_to_texture(c0, c1)
+            if not(self._valid):
+                draw_drawing_children(self, drawlist)
+                return
+            self._generation = generation
+            self._shared_generation = shared_generation
+
+        # Texture rows are stored bottom to top, and the corner
+        # mapped to pmin depends on the sign of the scaling.
+        cdef imgui.ImVec2 uv_pmin = imgui.ImVec2(
+            0. if self._cached_scales[0] > 0. else 1.,
+            1. if self._cached_scales[1] > 0. else 0.)
+        cdef imgui.ImVec2 uv_pmax = imgui.ImVec2(1. - uv_pmin.x, 1. - uv_pmin.y)
+        cdef unique_lock[DCGMutex] m2 = unique_lock[DCGMutex](self._texture.mutex)
+        if not(self._texture.c_mark_used()):
+            # Evicted: render again on the next frame
+            self._valid = False
+            m2.unlock()
+            draw_drawing_children(self, drawlist)
+            return
+        (<imgui.ImDrawList*>drawlist).AddImage(<imgui.ImTextureID>self._texture.allocated_texture,
+                                               imgui.ImVec2(c0[0], c0[1]),
+                                               imgui.ImVec2(c1[0], c1[1]),
+                                               uv_pmin,
+                                               uv_pmax)
+
+
 """
 Draw items
 """
@@ -531,6 +887,7 @@ cdef class DrawArc(drawingItem):
     def center(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._center, value)
         
     @property
@@ -550,6 +907,7 @@ cdef class DrawArc(drawingItem):
     def radius(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._radius, value)
 
     @property
@@ -575,6 +933,7 @@ cdef class DrawArc(drawingItem):
     def inner_radius(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._inner_radius, value)
 
     @property
@@ -594,6 +953,7 @@ cdef class DrawArc(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -611,6 +971,7 @@ cdef class DrawArc(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     @property
@@ -628,6 +989,7 @@ cdef class DrawArc(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -647,6 +1009,7 @@ cdef class DrawArc(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -664,6 +1027,7 @@ cdef class DrawArc(drawingItem):
     def start_angle(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._start_angle = value
 
     @property
@@ -681,6 +1045,7 @@ cdef class DrawArc(drawingItem):
     def end_angle(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._end_angle = value
 
     @property
@@ -698,6 +1063,7 @@ cdef class DrawArc(drawingItem):
     def rotation(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._rotation = value
 
     @property
@@ -716,6 +1082,7 @@ cdef class DrawArc(drawingItem):
     def segments(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._segments = max(0, value)
 
     cdef void draw(self, void* drawlist) noexcept nogil:
@@ -876,6 +1243,7 @@ cdef class DrawArrow(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._end, value)
         self.__compute_tip()
 
@@ -893,6 +1261,7 @@ cdef class DrawArrow(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._start, value)
         self.__compute_tip()
 
@@ -911,6 +1280,7 @@ cdef class DrawArrow(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -929,6 +1299,7 @@ cdef class DrawArrow(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -946,6 +1317,7 @@ cdef class DrawArrow(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
         self.__compute_tip()
 
@@ -964,6 +1336,7 @@ cdef class DrawArrow(drawingItem):
     def size(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._size = value
         self.__compute_tip()
 
@@ -1063,6 +1436,7 @@ cdef class DrawBezierCubic(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
 
     @property
@@ -1080,6 +1454,7 @@ cdef class DrawBezierCubic(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
 
     @property
@@ -1097,6 +1472,7 @@ cdef class DrawBezierCubic(drawingItem):
     def p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
 
     @property
@@ -1113,6 +1489,7 @@ cdef class DrawBezierCubic(drawingItem):
     def p4(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p4, value)
 
     @property
@@ -1130,6 +1507,7 @@ cdef class DrawBezierCubic(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -1149,6 +1527,7 @@ cdef class DrawBezierCubic(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -1166,6 +1545,7 @@ cdef class DrawBezierCubic(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     @property
@@ -1183,6 +1563,7 @@ cdef class DrawBezierCubic(drawingItem):
     def segments(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._segments = max(0, value)
 
     cdef void draw(self,
@@ -1238,6 +1619,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
 
     @property
@@ -1255,6 +1637,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
 
     @property
@@ -1271,6 +1654,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
 
     @property
@@ -1288,6 +1672,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -1307,6 +1692,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -1324,6 +1710,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     @property
@@ -1341,6 +1728,7 @@ cdef class DrawBezierQuadratic(drawingItem):
     def segments(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._segments = max(0, value)
 
     cdef void draw(self,
@@ -1398,6 +1786,7 @@ cdef class DrawCircle(drawingItem):
     def center(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._center, value)
 
     @property
@@ -1416,6 +1805,7 @@ cdef class DrawCircle(drawingItem):
     def radius(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._radius = value
 
     @property
@@ -1433,6 +1823,7 @@ cdef class DrawCircle(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -1452,6 +1843,7 @@ cdef class DrawCircle(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -1471,6 +1863,7 @@ cdef class DrawCircle(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -1489,6 +1882,7 @@ cdef class DrawCircle(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     @property
@@ -1506,6 +1900,7 @@ cdef class DrawCircle(drawingItem):
     def segments(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._segments = max(0, value)
 
     cdef void draw(self,
@@ -1567,6 +1962,7 @@ cdef class DrawEllipse(drawingItem):
     def pmin(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pmin, value)
 
     @property
@@ -1584,6 +1980,7 @@ cdef class DrawEllipse(drawingItem):
     def pmax(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pmax, value)
 
     @property
@@ -1601,6 +1998,7 @@ cdef class DrawEllipse(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -1620,6 +2018,7 @@ cdef class DrawEllipse(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -1639,6 +2038,7 @@ cdef class DrawEllipse(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -1656,6 +2056,7 @@ cdef class DrawEllipse(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     @property
@@ -1673,6 +2074,7 @@ cdef class DrawEllipse(drawingItem):
     def segments(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._segments = max(0, value)
 
     cdef void draw(self,
@@ -1743,6 +2145,7 @@ cdef class DrawImage(drawingItem):
     def texture(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(isinstance(value, Texture)) and value is not None:
             raise TypeError("texture must be a Texture")
         self._texture = value
@@ -1762,6 +2165,7 @@ cdef class DrawImage(drawingItem):
     def pmin(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
         self._p2[1] = self._p1[1]
         self._p4[0] = self._p1[0]
@@ -1782,6 +2186,7 @@ cdef class DrawImage(drawingItem):
     def pmax(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
         self._p2[0] = self._p3[0]
         self._p4[1] = self._p3[1]
@@ -1806,6 +2211,7 @@ cdef class DrawImage(drawingItem):
         """
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._center, value)
         self.update_extremities()
 
@@ -1825,6 +2231,7 @@ cdef class DrawImage(drawingItem):
     def height(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._height = value
         self.update_extremities()
 
@@ -1844,6 +2251,7 @@ cdef class DrawImage(drawingItem):
     def width(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._width = value
         self.update_extremities()
 
@@ -1863,6 +2271,7 @@ cdef class DrawImage(drawingItem):
     def direction(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._direction = value
         self.update_extremities()
 
@@ -1881,6 +2290,7 @@ cdef class DrawImage(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
         self.update_center()
 
@@ -1899,6 +2309,7 @@ cdef class DrawImage(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
         self.update_center()
 
@@ -1917,6 +2328,7 @@ cdef class DrawImage(drawingItem):
     def p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
         self.update_center()
 
@@ -1935,6 +2347,7 @@ cdef class DrawImage(drawingItem):
     def p4(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p4, value)
         self.update_center()
 
@@ -1954,6 +2367,7 @@ cdef class DrawImage(drawingItem):
     def uv_min(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[float](self._uv1, value)
         self._uv4[0] = self._uv1[0]
         self._uv2[1] = self._uv1[1]
@@ -1974,6 +2388,7 @@ cdef class DrawImage(drawingItem):
     def uv_max(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[float](self._uv3, value)
         self._uv2[0] = self._uv3[0]
         self._uv4[1] = self._uv3[1]
@@ -1994,6 +2409,7 @@ cdef class DrawImage(drawingItem):
     def uv1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[float](self._uv1, value)
 
     @property
@@ -2012,6 +2428,7 @@ cdef class DrawImage(drawingItem):
     def uv2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[float](self._uv2, value)
 
     @property
@@ -2030,6 +2447,7 @@ cdef class DrawImage(drawingItem):
     def uv3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[float](self._uv3, value)
 
     @property
@@ -2048,6 +2466,7 @@ cdef class DrawImage(drawingItem):
     def uv4(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[float](self._uv4, value)
 
     @property
@@ -2068,6 +2487,7 @@ cdef class DrawImage(drawingItem):
     def color_multiplier(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color_multiplier = parse_color(value)
 
     @property
@@ -2086,6 +2506,7 @@ cdef class DrawImage(drawingItem):
     def rounding(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._rounding = value
 
     cdef void update_extremities(self) noexcept nogil:
@@ -2144,7 +2565,7 @@ cdef class DrawImage(drawingItem):
         if self._texture is None:
             return
         cdef unique_lock[DCGMutex] m2 = unique_lock[DCGMutex](self._texture.mutex)
-        if self._texture.allocated_texture == NULL:
+        if not(self._texture.c_mark_used()):
             return
 
         cdef float[2] p1
@@ -2265,6 +2686,7 @@ cdef class DrawLine(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
         self.update_center()
 
@@ -2283,6 +2705,7 @@ cdef class DrawLine(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
         self.update_center()
 
@@ -2313,6 +2736,7 @@ cdef class DrawLine(drawingItem):
     def center(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._center, value)
         self.update_extremities()
 
@@ -2332,6 +2756,7 @@ cdef class DrawLine(drawingItem):
     def length(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._length = value
         self.update_extremities()
 
@@ -2350,6 +2775,7 @@ cdef class DrawLine(drawingItem):
     def direction(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._direction = value
         self.update_extremities()
 
@@ -2382,6 +2808,7 @@ cdef class DrawLine(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -2401,6 +2828,7 @@ cdef class DrawLine(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -2418,6 +2846,7 @@ cdef class DrawLine(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     cdef void draw(self,
@@ -2490,6 +2919,7 @@ cdef class DrawPolyline(drawingItem):
     def points(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         cdef double2 p
         cdef int32_t i
         self._points.clear()
@@ -2512,6 +2942,7 @@ cdef class DrawPolyline(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -2531,6 +2962,7 @@ cdef class DrawPolyline(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -2549,6 +2981,7 @@ cdef class DrawPolyline(drawingItem):
     def closed(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._closed = value
 
     @property
@@ -2567,6 +3000,7 @@ cdef class DrawPolyline(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     cdef void draw(self,
@@ -2627,6 +3061,7 @@ cdef class DrawPolygon(drawingItem):
     def points(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         cdef double2 p
         cdef int32_t i
         self._points.clear()
@@ -2650,6 +3085,7 @@ cdef class DrawPolygon(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -2669,6 +3105,7 @@ cdef class DrawPolygon(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -2688,6 +3125,7 @@ cdef class DrawPolygon(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -2706,6 +3144,7 @@ cdef class DrawPolygon(drawingItem):
     def hull(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._hull = value
 
     @property
@@ -2725,6 +3164,7 @@ cdef class DrawPolygon(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     # ImGui Polygon fill requires clockwise order and convex polygon.
@@ -2886,6 +3326,7 @@ cdef class DrawQuad(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
 
     @property
@@ -2902,6 +3343,7 @@ cdef class DrawQuad(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
 
     @property
@@ -2918,6 +3360,7 @@ cdef class DrawQuad(drawingItem):
     def p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
 
     @property
@@ -2934,6 +3377,7 @@ cdef class DrawQuad(drawingItem):
     def p4(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p4, value)
 
     @property
@@ -2951,6 +3395,7 @@ cdef class DrawQuad(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -2970,6 +3415,7 @@ cdef class DrawQuad(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -2989,6 +3435,7 @@ cdef class DrawQuad(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -3007,6 +3454,7 @@ cdef class DrawQuad(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     cdef void draw(self,
@@ -3073,6 +3521,7 @@ cdef class DrawRect(drawingItem):
     def pmin(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pmin, value)
 
     @property
@@ -3090,6 +3539,7 @@ cdef class DrawRect(drawingItem):
     def pmax(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pmax, value)
 
     @property
@@ -3107,6 +3557,7 @@ cdef class DrawRect(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -3126,6 +3577,7 @@ cdef class DrawRect(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -3146,6 +3598,7 @@ cdef class DrawRect(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
         self._color_upper_left = self._fill
         self._color_upper_right = self._fill
@@ -3171,6 +3624,7 @@ cdef class DrawRect(drawingItem):
     def fill_p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color_upper_left = parse_color(value)
         self._multicolor = True
 
@@ -3192,6 +3646,7 @@ cdef class DrawRect(drawingItem):
     def fill_p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color_upper_right = parse_color(value)
         self._multicolor = True
 
@@ -3213,6 +3668,7 @@ cdef class DrawRect(drawingItem):
     def fill_p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color_bottom_right = parse_color(value)
         self._multicolor = True
 
@@ -3234,6 +3690,7 @@ cdef class DrawRect(drawingItem):
     def fill_p4(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color_bottom_left = parse_color(value)
         self._multicolor = True
 
@@ -3252,6 +3709,7 @@ cdef class DrawRect(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     @property
@@ -3271,6 +3729,7 @@ cdef class DrawRect(drawingItem):
     def rounding(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._rounding = value
 
     cdef void draw(self,
@@ -3375,6 +3834,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def center(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._center, value)
         
     @property
@@ -3394,6 +3854,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def radius(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._radius = value
         
     @property
@@ -3411,6 +3872,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def direction(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._direction = value
         
     @property
@@ -3430,6 +3892,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def num_points(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._num_points = value
 
     @property
@@ -3447,6 +3910,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -3466,6 +3930,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
         
     @property
@@ -3485,6 +3950,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
         
     @property
@@ -3503,6 +3969,7 @@ cdef class DrawRegularPolygon(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     cdef void draw(self,
@@ -3559,6 +4026,7 @@ cdef class DrawStar(drawingItem):
     def center(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._center, value)
 
     @property
@@ -3578,6 +4046,7 @@ cdef class DrawStar(drawingItem):
     def radius(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._radius = value
 
     @property
@@ -3596,6 +4065,7 @@ cdef class DrawStar(drawingItem):
     def inner_radius(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._inner_radius = value
 
     @property
@@ -3614,6 +4084,7 @@ cdef class DrawStar(drawingItem):
     def direction(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._direction = value
 
     @property
@@ -3632,6 +4103,7 @@ cdef class DrawStar(drawingItem):
     def num_points(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._num_points = value
 
     @property
@@ -3649,6 +4121,7 @@ cdef class DrawStar(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -3668,6 +4141,7 @@ cdef class DrawStar(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -3687,6 +4161,7 @@ cdef class DrawStar(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -3704,6 +4179,7 @@ cdef class DrawStar(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     cdef void draw(self,
@@ -3758,6 +4234,7 @@ cdef class DrawText(drawingItem):
     def pos(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pos, value)
 
     @property
@@ -3778,6 +4255,7 @@ cdef class DrawText(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -3796,6 +4274,7 @@ cdef class DrawText(drawingItem):
     def font(self, baseFont value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._font = value
 
     @property
@@ -3813,6 +4292,7 @@ cdef class DrawText(drawingItem):
     def text(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._text = string_from_str(value)
 
     @property
@@ -3831,6 +4311,7 @@ cdef class DrawText(drawingItem):
     def size(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._size = value
 
     cdef void draw(self,
@@ -3847,10 +4328,11 @@ cdef class DrawText(drawingItem):
 
         if self._font is not None:
             self._font.push()
-        if size == 0:
-            (<imgui.ImDrawList*>drawlist).AddText(ip, <imgui.ImU32>self._color, self._text.c_str())
-        else:
-            (<imgui.ImDrawList*>drawlist).AddText(NULL, size, ip, <imgui.ImU32>self._color, self._text.c_str())
+        # size 0 selects the current font size
+        self.context.viewport.text_layouts.add_text(drawlist, NULL, size, ip.x, ip.y,
+                                                    self._color,
+                                                    self._text.c_str(),
+                                                    self._text.c_str() + self._text.size())
         if self._font is not None:
             self._font.pop()
 
@@ -3884,6 +4366,7 @@ cdef class DrawTriangle(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
 
     @property
@@ -3901,6 +4384,7 @@ cdef class DrawTriangle(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
 
     @property
@@ -3918,6 +4402,7 @@ cdef class DrawTriangle(drawingItem):
     def p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
 
     @property
@@ -3935,6 +4420,7 @@ cdef class DrawTriangle(drawingItem):
     def pattern(self, Pattern value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._pattern = value
 
     @property
@@ -3954,6 +4440,7 @@ cdef class DrawTriangle(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -3973,6 +4460,7 @@ cdef class DrawTriangle(drawingItem):
     def fill(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._fill = parse_color(value)
 
     @property
@@ -3991,6 +4479,7 @@ cdef class DrawTriangle(drawingItem):
     def thickness(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._thickness = value
 
     cdef void draw(self,
@@ -4048,6 +4537,7 @@ cdef class DrawTextQuad(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p1, value)
 
     @property
@@ -4065,6 +4555,7 @@ cdef class DrawTextQuad(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p2, value)
 
     @property
@@ -4082,6 +4573,7 @@ cdef class DrawTextQuad(drawingItem):
     def p3(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p3, value)
 
     @property
@@ -4099,6 +4591,7 @@ cdef class DrawTextQuad(drawingItem):
     def p4(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._p4, value)
 
     @property
@@ -4120,6 +4613,7 @@ cdef class DrawTextQuad(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -4139,6 +4633,7 @@ cdef class DrawTextQuad(drawingItem):
     def font(self, baseFont value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._font = value
 
     @property
@@ -4157,6 +4652,7 @@ cdef class DrawTextQuad(drawingItem):
     def text(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._text = string_from_str(value)
 
     @property
@@ -4179,6 +4675,7 @@ cdef class DrawTextQuad(drawingItem):
     def preserve_ratio(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._preserve_ratio = value
 
     cdef void draw(self,
@@ -4243,6 +4740,7 @@ cdef class DrawValue(drawingItem):
     def pos(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_coord(self._pos, value)
 
     @property
@@ -4263,6 +4761,7 @@ cdef class DrawValue(drawingItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -4281,6 +4780,7 @@ cdef class DrawValue(drawingItem):
     def font(self, baseFont value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._font = value
 
     @property
@@ -4299,6 +4799,7 @@ cdef class DrawValue(drawingItem):
     def size(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._size = value
 
     @property
@@ -4321,6 +4822,7 @@ cdef class DrawValue(drawingItem):
     def shareable_value(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self._value is value:
             return
         if not(isinstance(value, SharedBool) or
@@ -4362,6 +4864,7 @@ cdef class DrawValue(drawingItem):
     def print_format(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._print_format = string_from_str(value)
 
     cdef void draw(self,
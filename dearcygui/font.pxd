@@ -1,4 +1,4 @@
-from libc.stdint cimport int32_t
+from libc.stdint cimport int32_t, uint32_t
 from cpython.ref cimport PyObject
 from .c_types cimport DCGVector
 from .core cimport baseItem, baseFont
@@ -30,6 +30,7 @@ cdef class AutoFont(FontMultiScales):
     cdef str _bold_italic_path
     cdef dict _kwargs
     cdef float _base_size
+    cdef bint _sdf # single distance field font for all scales
     cdef object _font_creation_executor  # ThreadPoolExecutor
     cdef set _pending_fonts  # set of scales being created
     cdef set _failed_scales # set of secondary scales that are known to fail
@@ -47,6 +48,8 @@ cdef class FontTexture(baseItem):
     cdef bint _built
     cdef list _fonts_files # content of the font files
     cdef list _fonts
+    cdef object _dynamic # _DynamicGlyphAtlas, for add_dynamic_font
+    cdef void _mark_sdf(self, float pixel_range)
 
 cdef class GlyphSet:
     cdef readonly int32_t height
@@ -62,6 +65,12 @@ cdef class GlyphSet:
 
 cdef class FontRenderer:
     cdef object _face
+    cdef object _glyph_cache # OrderedDict (size, flags, char) -> glyph data
+    cdef object _get_cached_glyph(self,
+                                  uint32_t char_code,
+                                  int32_t load_flags,
+                                  bint render)
+    cdef void _store_cached_glyph(self, key, entry)
     cpdef GlyphSet render_glyph_set(self,
                                     target_pixel_height=?,
                                     target_size=?,
@@ -16,7 +16,7 @@
 #distutils: language=c++
 
 from libc.math cimport logf, ceil, INFINITY
-from libc.stdint cimport int32_t, uint32_t
+from libc.stdint cimport int32_t, int64_t, uint32_t
 from libcpp cimport bool
 from libcpp.deque cimport deque
 from libcpp.vector cimport vector
@@ -24,17 +24,19 @@ from libcpp.vector cimport vector
 cimport cython
 from cython.view cimport array as cython_array
 from cpython cimport PySequence_Check
+from cpython.bytes cimport PyBytes_FromStringAndSize
 from dearcygui.wrapper cimport imgui
 
 from .core cimport Context, baseFont, baseItem, Callback, \
-    lock_gil_friendly
+    lock_gil_friendly, invalidate_text_layouts, register_dynamic_font
 from .c_types cimport unique_lock, DCGMutex
 from .texture cimport Texture
+from .backends.backend cimport platformViewport
 from .types cimport parse_texture
 
 from weakref import WeakKeyDictionary as _WeakKeyDictionary, WeakValueDictionary as _WeakValueDictionary
 
-from atexit import register as _atexit_register
+from collections import OrderedDict as _OrderedDict
 from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 
 """
@@ -66,7 +68,16 @@ What is up to you to provide:
 - Passing correct spacing value to have characters properly aligned, etc
 """
 
-from os.path import dirname as _dirname, exists as _path_exists, join as _path_join
+from warnings import warn as _warn
+from os.path import dirname as _dirname, exists as _path_exists, join as _path_join, \
+    expanduser as _expanduser
+from os import close as _close, cpu_count as _cpu_count, environ as _environ, makedirs as _makedirs, remove as _remove, \
+    replace as _replace, scandir as _scandir, stat as _stat, utime as _utime
+from hashlib import sha256 as _sha256
+from mmap import mmap as _mmap, ACCESS_COPY as _ACCESS_COPY
+from struct import calcsize as _calcsize, pack as _pack, unpack_from as _unpack_from
+from sys import platform as _platform
+from tempfile import mkstemp as _mkstemp
 
 from .wrapper cimport freetype
 
@@ -84,6 +95,31 @@ def get_system_fonts() -> list[str]:
     return fonts_filename
 
 
+cdef object _font_creation_executor = None
+cdef object _glyph_rendering_executor = None
+
+cdef object _get_font_creation_executor():
+    """Executor used by AutoFont to create fonts"""
+    global _font_creation_executor
+    if _font_creation_executor is None:
+        _font_creation_executor = \
+            _ThreadPoolExecutor(max_workers=min(4, _cpu_count() or 1),
+                                thread_name_prefix="dcg_font_creation")
+    return _font_creation_executor
+
+cdef object _get_glyph_rendering_executor():
+    """
+    Executor used to render glyph sets in parallel.
+    Distinct from the font creation executor, which waits
+    for the glyph sets.
+    """
+    global _glyph_rendering_executor
+    if _glyph_rendering_executor is None:
+        _glyph_rendering_executor = \
+            _ThreadPoolExecutor(max_workers=min(8, _cpu_count() or 1),
+                                thread_name_prefix="dcg_glyph_rendering")
+    return _glyph_rendering_executor
+
 # Global font cache: context -> {font_key -> weak_font}
 _font_cache = _WeakKeyDictionary()
 
@@ -148,8 +184,9 @@ cdef class Font(baseFont):
     A Font object encapsulates the rendering information for text in the UI. 
     It contains the texture data, size information, and scaling behavior.
     
-    Fonts are typically created through FontTexture.add_font_file() or 
-    FontTexture.add_custom_font() rather than directly instantiated.
+    Fonts are typically created through FontTexture.add_font_file(),
+    FontTexture.add_custom_font() or FontTexture.add_dynamic_font()
+    rather than directly instantiated.
     """
     def __cinit__(self, context, *args, **kwargs):
         self.can_have_sibling = False
@@ -199,6 +236,7 @@ cdef class Font(baseFont):
     def scale(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value <= 0.:
             raise ValueError(f"Invalid scale {value}")
         self._scale = value
@@ -220,8 +258,48 @@ cdef class Font(baseFont):
     def no_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._dpi_scaling = not(value)
 
+    @property
+    def loaded_glyphs(self) -> str:
+        """
+        Readonly attribute: characters currently in the texture
+        of a font created with FontTexture.add_dynamic_font.
+
+        Empty for other fonts.
+        """
+        cdef FontTexture container = self._container
+        if container is None or container._dynamic is None:
+            return ""
+        return (<_DynamicGlyphAtlas>container._dynamic).loaded()
+
+    def request_glyphs(self, str text) -> int:
+        """
+        Indicate the characters of text are going to be displayed.
+
+        For fonts created with FontTexture.add_dynamic_font, the
+        characters not yet in the texture are rendered in the
+        background, and appear on the next frames (the fallback
+        glyph is displayed in the meantime). The characters
+        already in the texture are marked as recently used.
+
+        The characters of Text, TextValue, DrawText and table
+        cells are requested automatically when their layout is
+        computed (new value, font or wrap width). This method
+        is only needed for other texts, such as widget labels,
+        or to load glyphs in advance.
+
+        Does nothing for other fonts.
+
+        Returns:
+            The number of characters queued for rendering.
+        """
+        cdef FontTexture container = self._container
+        if container is None or container._dynamic is None:
+            return 0
+        return (<_DynamicGlyphAtlas>container._dynamic).request(container, text)
+
     cdef void push(self) noexcept nogil:
         if self._font == NULL:
             return
@@ -280,6 +358,7 @@ cdef class FontMultiScales(baseFont):
     def fonts(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._fonts.clear()
             self._fonts_backing = None
@@ -421,6 +500,9 @@ cdef class FontMultiScales(baseFont):
         self.mutex.unlock()
 
 
+# Minimum size at which AutoFont renders distance fields
+cdef int32_t _SDF_MIN_SIZE = 32
+
 cdef class AutoFont(FontMultiScales):
     """
     A self-managing font container that automatically creates and caches fonts at different scales.
@@ -437,19 +519,30 @@ cdef class AutoFont(FontMultiScales):
         Function to create fonts. Takes size as first argument and optional kwargs.
         The output should be a GlyphSet.
         If None, uses make_extended_latin_font.
+    sdf : bool = False
+        Render a single signed distance field font (font_creator
+        receives hinter="sdf"), which remains sharp at all scales,
+        instead of creating a new font for each new global scale.
     **kwargs : 
         Additional arguments passed to font_creator
     """
     def __init__(self, context, 
                  float base_size=17.0,
                  font_creator=None,
+                 bint sdf=False,
                  **kwargs):
         super().__init__(context)
                  
         self._base_size = base_size
+        self._sdf = sdf
+        if sdf:
+            kwargs = dict(kwargs)
+            kwargs["hinter"] = "sdf"
         self._kwargs = kwargs
         self._font_creator = font_creator if font_creator is not None else make_extended_latin_font
-        self._font_creation_executor = _ThreadPoolExecutor(max_workers=1)
+        # Shared between AutoFonts, such that several
+        # scales and fonts are created in parallel.
+        self._font_creation_executor = _get_font_creation_executor()
         self._pending_fonts = set()
         self._failed_scales = set()
         
@@ -467,22 +560,19 @@ cdef class AutoFont(FontMultiScales):
                 kwargs = dict(kwargs)
                 kwargs["base_size"] = base_size
                 kwargs["font_creator"] = font_creator
+                kwargs["sdf"] = sdf
                 _store_font_in_cache(self.context, "AutoFont", kwargs, self)
             except Exception as e:
                 pass
 
-    def __del__(self):
-        try:
-            if self._font_creation_executor is not None:
-                self._font_creation_executor.shutdown(wait=True)
-        except:
-            pass
-
     def _on_new_scale(self, sender, target, float scale) -> None:
         """Called when a new global scale is encountered"""
         # Only queue font creation if we don't have it pending already
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        if self._sdf:
+            # The distance field font is sharp at all scales
+            return
         if scale in self._pending_fonts:
             return
         if scale in self._failed_scales:
@@ -501,18 +591,21 @@ cdef class AutoFont(FontMultiScales):
         
         # Calculate scaled size
         cdef int32_t scaled_size = int(round(self._base_size * scale))
+        if self._sdf:
+            # Small distance fields lose the details of the outlines
+            scaled_size = max(scaled_size, _SDF_MIN_SIZE)
 
         try:
             # Create glyph set using the font creator
             glyph_set = self._font_creator(scaled_size, **self._kwargs)
 
             # Add to texture and build
-            texture.add_custom_font(glyph_set)
+            texture.add_custom_font(glyph_set, sdf=self._sdf)
             texture.build()
 
             # Get font and configure scale
             font = texture._fonts[0] 
-            font.scale = 1.0/scale
+            font.scale = self._base_size / scaled_size if self._sdf else 1.0/scale
 
             self._add_new_font_to_list(font)
         except Exception as e:
@@ -823,6 +916,10 @@ cdef extern from * nogil:
 
 
 
+# Distance (in pixels) covered by half the alpha range of
+# glyphs rendered with hinter="sdf" (FreeType's default spread)
+SDF_SPREAD = 8
+
 cdef class FontTexture(baseItem):
     """
     Packs one or several fonts into
@@ -863,8 +960,12 @@ cdef class FontTexture(baseItem):
         cdef imgui.ImFontAtlas *atlas = <imgui.ImFontAtlas*>self._atlas
         if atlas == NULL:
             return
+        if self._dynamic is not None and self._fonts:
+            register_dynamic_font((<Font>self._fonts[0])._font, None)
         atlas.Clear() # Unsure if needed
         del atlas
+        # The addresses of our fonts may be reused
+        invalidate_text_layouts()
 
     def add_font_file(self,
                       str path,
@@ -925,11 +1026,18 @@ cdef class FontTexture(baseItem):
         font_object._font = font
         self._fonts.append(font_object)
 
-    def add_custom_font(self, GlyphSet glyph_set):
+    def add_custom_font(self, GlyphSet glyph_set, bint sdf=False):
         """
         See fonts.py for a detailed explanation of
         the input arguments.
 
+        sdf: Set if the glyphs are signed distance fields,
+            as rendered with hinter="sdf". The texture is then
+            drawn with a shader that keeps the outlines sharp
+            at any scale, thus a single font can be used for all
+            sizes and zoom levels (with font.scale set to
+            target_size / glyph_set.height).
+
         Currently add_custom_font calls build()
         and thus prevents adding new fonts, but
         this might not be true in the future, thus
@@ -973,6 +1081,10 @@ cdef class FontTexture(baseItem):
         self._fonts.append(font_object)
 
         atlas.Flags |= imgui.ImFontAtlasFlags_NoMouseCursors # SDL supports all cursors
+        if sdf:
+            # Antialiased lines baked in the texture are coverage
+            # values, which the SDF shader would distort.
+            atlas.Flags |= imgui.ImFontAtlasFlags_NoBakedLines
 
         # build
         if not(atlas.Build()):
@@ -986,6 +1098,8 @@ cdef class FontTexture(baseItem):
                 if image.shape[2] != 4:
                     raise ValueError("Color data must be rgba (4 channels)")
                 use_color = True
+        if sdf and use_color:
+            raise ValueError("Signed distance field fonts cannot have color glyphs")
         if atlas.TexPixelsUseColors or use_color:
             atlas.GetTexDataAsRGBA32(&data, &width, &height, &bpp)
         else:
@@ -1018,11 +1132,146 @@ cdef class FontTexture(baseItem):
         assert(self._texture.allocated_texture != NULL)
         self._texture._readonly = True
         atlas.SetTexID(<imgui.ImTextureID>self._texture.allocated_texture)
+        if sdf:
+            self._mark_sdf(2 * SDF_SPREAD)
 
         # Release temporary CPU memory
         atlas.ClearInputData()
         self._built = True
 
+    cdef void _mark_sdf(self, float pixel_range):
+        """Indicate the backend our texture contains distance fields"""
+        cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
+        if platform == NULL:
+            raise RuntimeError("Cannot configure a texture after viewport destruction")
+        try:
+            platform.setTextureSDF(self._texture.allocated_texture, pixel_range)
+        finally:
+            self.context.viewport.release_platform()
+
+    def add_dynamic_font(self,
+                         str path,
+                         float size=13.,
+                         str hinter="light",
+                         bint allow_color=False,
+                         int32_t atlas_size=1024,
+                         preload=None):
+        """
+        Add a font whose glyphs are rendered on demand.
+
+        Instead of rendering all the characters of the font
+        in advance, which for large character sets (CJK, emojis)
+        takes a long time and a huge texture, the texture reserves
+        a grid of cells, filled as characters are displayed by
+        text items, or requested with Font.request_glyphs.
+        When the grid is full, the least recently requested
+        glyphs are replaced, thus atlas_size must be large enough
+        to hold the characters displayed at the same time.
+
+        The texture is built by this call, and cannot receive
+        other fonts.
+
+        path: path to the font file (ttf, otf, etc).
+        size: Target pixel size at which the font will be rendered.
+        hinter: see FontRenderer.render_glyph_set.
+        allow_color: Whether colored glyphs (emojis) are supported.
+            Uses a four times larger texture.
+        atlas_size: width and height of the texture.
+        preload: characters to render immediately. Defaults
+            to printable ASCII.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if self._built:
+            raise ValueError("Cannot add Font to built FontTexture")
+        if not(_path_exists(path)):
+            raise ValueError(f"File {path} does not exist")
+        if size <= 0.:
+            raise ValueError("Invalid font size")
+        if atlas_size < 64:
+            raise ValueError("atlas_size is too small")
+        if hinter == "sdf":
+            raise ValueError("Dynamic fonts do not support the sdf hinter")
+        if preload is None:
+            preload = "".join([chr(c) for c in range(32, 127)])
+
+        cdef _DynamicGlyphAtlas dynamic = \
+            _DynamicGlyphAtlas(FontRenderer(path), size, hinter, allow_color)
+        # Render the initial glyphs, which determine
+        # the line metrics and the size of the cells.
+        cdef GlyphSet initial = dynamic.render(set([ord(c) for c in preload]))
+        dynamic.setup_metrics(initial)
+
+        cdef imgui.ImFontAtlas *atlas = <imgui.ImFontAtlas*>self._atlas
+        cdef imgui.ImFontConfig config = imgui.ImFontConfig()
+        config.SizePixels = dynamic.height
+        config.FontDataOwnedByAtlas = False
+        config.OversampleH = 1
+        config.OversampleV = 1
+        config.GlyphRanges = minimal_font_range
+        cdef imgui.ImFont *font = atlas.AddFontDefault(&config)
+
+        # The placeholder glyph is displayed for missing characters
+        cdef object placeholder = dynamic.make_placeholder()
+        cdef int32_t cell = dynamic.cell
+        cdef int32_t placeholder_id = \
+            atlas.AddCustomRectFontGlyph(font,
+                                         _DYNAMIC_PLACEHOLDER,
+                                         cell, cell,
+                                         dynamic.placeholder_advance,
+                                         imgui.ImVec2(dynamic.placeholder_dx,
+                                                      dynamic.placeholder_dy))
+        # Area of the texture for the dynamic glyphs
+        cdef int32_t columns = (atlas_size - 2 * atlas.TexGlyphPadding) // cell
+        cdef int32_t rows = (atlas_size - 2 * cell - 128) // cell
+        if columns < 1 or rows < 1:
+            raise ValueError("atlas_size is too small for the font size")
+        cdef int32_t region_id = atlas.AddCustomRectRegular(columns * cell, rows * cell)
+
+        atlas.Flags |= imgui.ImFontAtlasFlags_NoMouseCursors # SDL supports all cursors
+        atlas.TexDesiredWidth = atlas_size
+        if not(atlas.Build()):
+            raise RuntimeError("Failed to build target texture data")
+
+        cdef unsigned char *data = NULL
+        cdef int width, height, bpp
+        if allow_color:
+            atlas.GetTexDataAsRGBA32(&data, &width, &height, &bpp)
+        else:
+            atlas.GetTexDataAsAlpha8(&data, &width, &height, &bpp)
+        cdef cython_array data_array = cython_array(shape=(height, width, bpp), itemsize=1, format='B', mode='c', allocate_buffer=False)
+        data_array.data = <char*>data
+        cdef unsigned char[:,:,:] array_view = data_array
+        cdef unsigned char[:,:,:] src_view = placeholder
+        cdef imgui.ImFontAtlasCustomRect *rect = atlas.GetCustomRectByIndex(placeholder_id)
+        array_view[rect.Y:rect.Y+cell, rect.X:rect.X+cell, :] = src_view[:,:,:]
+        rect = atlas.GetCustomRectByIndex(region_id)
+        dynamic.setup_cells(rect.X, rect.Y, columns, rows, width, height, bpp)
+
+        if allow_color:
+            self._texture._filtering_mode = 0 # rgba bilinear
+        else:
+            self._texture._filtering_mode = 2 # 111A bilinear
+        self._texture.set_value(data_array.get_memview())
+        assert(self._texture.allocated_texture != NULL)
+        self._texture._readonly = True
+        atlas.SetTexID(<imgui.ImTextureID>self._texture.allocated_texture)
+        # The input data (font configuration) is kept,
+        # as ImGui accesses it when updating the glyphs.
+
+        cdef Font font_object = Font(self.context)
+        font_object._container = self
+        font_object._font = font
+        self._fonts.append(font_object)
+        self._dynamic = dynamic
+        self._built = True
+        m.unlock()
+        # Texts laid out with the font request their glyphs
+        register_dynamic_font(<void*>font, font_object)
+
+        dynamic.insert(self, initial, set())
+        return font_object
+
     @property
     def built(self):
         cdef unique_lock[DCGMutex] m
@@ -1098,6 +1347,278 @@ cdef class FontTexture(baseItem):
         atlas.ClearInputData()
         self._built = True
 
+# Codepoint of the glyph displayed for characters
+# not yet rendered by dynamic fonts (replacement character)
+cdef int32_t _DYNAMIC_PLACEHOLDER = 0xFFFD
+
+cdef object _dynamic_glyphs_executor = None
+
+cdef object _get_dynamic_glyphs_executor():
+    global _dynamic_glyphs_executor
+    if _dynamic_glyphs_executor is None:
+        _dynamic_glyphs_executor = _ThreadPoolExecutor(max_workers=2,
+                                                       thread_name_prefix="dcg_glyphs")
+    return _dynamic_glyphs_executor
+
+def _load_dynamic_glyphs(_DynamicGlyphAtlas dynamic, FontTexture texture):
+    dynamic.load_pending(texture)
+
+cdef class _DynamicGlyphAtlas:
+    """
+    Glyph cells of a FontTexture created with add_dynamic_font.
+
+    The glyphs are rendered in cells of fixed size,
+    which enables to replace any glyph by any other.
+    """
+    cdef DCGMutex mutex
+    cdef FontRenderer renderer
+    cdef float size
+    cdef str hinter
+    cdef bint allow_color
+    # Line metrics
+    cdef int32_t height
+    cdef int32_t origin_y
+    cdef int32_t cell
+    cdef float placeholder_dx
+    cdef float placeholder_dy
+    cdef float placeholder_advance
+    # Area of the cells in the texture
+    cdef int32_t x0
+    cdef int32_t y0
+    cdef int32_t columns
+    cdef int32_t tex_width
+    cdef int32_t tex_height
+    cdef int32_t num_chans
+    cdef list free_cells
+    cdef object cells # OrderedDict codepoint -> cell index, least recently used first
+    cdef set pending # codepoints to render
+    cdef set unavailable # codepoints the font cannot render
+    cdef bint loading
+
+    def __init__(self, FontRenderer renderer, float size, str hinter, bint allow_color):
+        self.renderer = renderer
+        self.size = size
+        self.hinter = hinter
+        self.allow_color = allow_color
+        self.free_cells = []
+        self.cells = _OrderedDict()
+        self.pending = set()
+        self.unavailable = set()
+        self.loading = False
+
+    cdef GlyphSet render(self, set codepoints):
+        return self.renderer.render_glyph_set(target_size=self.size,
+                                              hinter=self.hinter,
+                                              restrict_to=codepoints,
+                                              allow_color=self.allow_color)
+
+    cdef void setup_metrics(self, GlyphSet reference):
+        """Set the line metrics and cell size"""
+        cdef int32_t max_dim = 0
+        if len(reference.images) > 0:
+            self.height = reference.height
+            self.origin_y = reference.origin_y
+            for image in reference.images.values():
+                max_dim = max(max_dim, image.shape[0], image.shape[1])
+        else:
+            self.height = <int32_t>ceil(self.size)
+            self.origin_y = <int32_t>(0.8 * self.height)
+        # Room for glyphs larger than the reference ones,
+        # plus one pixel of padding for bilinear filtering.
+        self.cell = max(max_dim, <int32_t>ceil(1.25 * self.height)) + 1
+        self.placeholder_advance = max(3, <int32_t>(0.5 * self.size)) + 2
+        self.placeholder_dx = 1
+        self.placeholder_dy = max(0, self.origin_y - max(3, <int32_t>(0.7 * self.size)))
+
+    cdef object make_placeholder(self):
+        """Image of the placeholder glyph: a hollow box"""
+        cdef int32_t chans = 4 if self.allow_color else 1
+        cdef cython_array image = cython_array(shape=(self.cell, self.cell, chans), itemsize=1, format='B', mode='c', allocate_buffer=True)
+        cdef unsigned char[:,:,::1] view = image
+        view[:,:,:] = 0
+        cdef int32_t w = min(<int32_t>self.placeholder_advance - 2, self.cell - 1)
+        cdef int32_t h = min(self.origin_y - <int32_t>self.placeholder_dy, self.cell - 1)
+        cdef int32_t i, j, c
+        for i in range(h):
+            for j in range(w):
+                if i == 0 or j == 0 or i == h - 1 or j == w - 1:
+                    for c in range(chans):
+                        view[i, j, c] = 255
+        return image
+
+    cdef void setup_cells(self, int32_t x0, int32_t y0,
+                          int32_t columns, int32_t rows,
+                          int32_t tex_width, int32_t tex_height,
+                          int32_t num_chans):
+        self.x0 = x0
+        self.y0 = y0
+        self.columns = columns
+        self.tex_width = tex_width
+        self.tex_height = tex_height
+        self.num_chans = num_chans
+        # pop() takes the first cells first
+        self.free_cells = list(reversed(range(columns * rows)))
+
+    cdef object make_cell(self, image):
+        """Content of a cell containing the glyph image"""
+        cdef int32_t chans = self.num_chans
+        cdef cython_array result = cython_array(shape=(self.cell, self.cell, chans), itemsize=1, format='B', mode='c', allocate_buffer=True)
+        cdef unsigned char[:,:,::1] dst = result
+        cdef const unsigned char[:,:,:] src = image
+        dst[:,:,:] = 0
+        cdef int32_t src_chans = src.shape[2]
+        cdef int32_t i, j
+        for i in range(min(<int32_t>src.shape[0], self.cell - 1)):
+            for j in range(min(<int32_t>src.shape[1], self.cell - 1)):
+                if src_chans == chans:
+                    dst[i, j, :] = src[i, j, :]
+                elif chans == 1:
+                    # color glyph in an alpha texture
+                    dst[i, j, 0] = src[i, j, src_chans - 1]
+                else:
+                    # alpha glyph in a color texture
+                    dst[i, j, 0] = 255
+                    dst[i, j, 1] = 255
+                    dst[i, j, 2] = 255
+                    dst[i, j, 3] = src[i, j, 0]
+        return result
+
+    cdef str loaded(self):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return "".join([chr(c) for c in sorted(self.cells)])
+
+    cdef int32_t request(self, FontTexture texture, str text):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        cdef int32_t num_new = 0
+        cdef int32_t codepoint
+        for character in set(text):
+            codepoint = ord(character)
+            if codepoint < 32:
+                # control characters (\t, \n) are handled by ImGui
+                continue
+            if codepoint in self.cells:
+                self.cells.move_to_end(codepoint)
+            elif codepoint not in self.unavailable and \
+                 codepoint not in self.pending:
+                self.pending.add(codepoint)
+                num_new += 1
+        if len(self.pending) > 0 and not(self.loading):
+            self.loading = True
+            _get_dynamic_glyphs_executor().submit(_load_dynamic_glyphs, self, texture)
+        return num_new
+
+    cdef void load_pending(self, FontTexture texture):
+        """Render the pending glyphs, until there are none left"""
+        cdef unique_lock[DCGMutex] m
+        cdef set batch
+        cdef GlyphSet glyph_set
+        while True:
+            lock_gil_friendly(m, self.mutex)
+            batch = self.pending
+            self.pending = set()
+            if len(batch) == 0:
+                self.loading = False
+                return
+            m.unlock()
+            try:
+                glyph_set = self.render(batch)
+            except Exception as e:
+                lock_gil_friendly(m, self.mutex)
+                self.unavailable.update(batch)
+                m.unlock()
+                _warn(f"Failed to render glyphs: {e}")
+                continue
+            lock_gil_friendly(m, self.mutex)
+            self.unavailable.update(batch.difference(glyph_set.images.keys()))
+            m.unlock()
+            self.insert(texture, glyph_set, batch)
+            texture.invalidate()
+
+    cdef void insert(self, FontTexture texture, GlyphSet glyph_set, set protected):
+        """
+        Place the glyphs of glyph_set in free cells, replacing
+        the least recently used glyphs not in protected if needed.
+        """
+        cdef unique_lock[DCGMutex] m
+        cdef list regions = []
+        cdef list added = []
+        cdef list removed = []
+        cdef int32_t codepoint, old_codepoint, index, x, y
+        cdef float dy, dx, advance
+        lock_gil_friendly(m, self.mutex)
+        for codepoint in glyph_set.images:
+            if codepoint in self.cells:
+                continue
+            image = glyph_set.images[codepoint]
+            if image.shape[0] >= self.cell or image.shape[1] >= self.cell:
+                # Too large for the cells
+                self.unavailable.add(codepoint)
+                continue
+            if len(self.free_cells) == 0:
+                old_codepoint = next(iter(self.cells), -1)
+                if old_codepoint < 0 or old_codepoint in protected:
+                    # The texture is full of glyphs in use.
+                    # The remaining glyphs will be requested again.
+                    break
+                self.free_cells.append(self.cells.pop(old_codepoint))
+                removed.append(old_codepoint)
+            index = self.free_cells.pop()
+            self.cells[codepoint] = index
+            x = self.x0 + (index % self.columns) * self.cell
+            y = self.y0 + (index // self.columns) * self.cell
+            regions.append((x, y, self.make_cell(image)))
+            (dy, dx, advance) = glyph_set.positioning[codepoint]
+            # Use the baseline of the dynamic font
+            dy = dy - glyph_set.origin_y + self.origin_y
+            added.append((codepoint, x, y, image.shape[1], image.shape[0], dy, dx, advance))
+        m.unlock()
+        if len(regions) == 0:
+            return
+
+        # Remove the replaced glyphs before overwriting their cells
+        if len(removed) > 0:
+            self.update_font(texture, removed, [])
+        texture._texture._readonly = False
+        try:
+            texture._texture.update_regions(regions)
+        finally:
+            texture._texture._readonly = True
+        self.update_font(texture, removed, added)
+
+    cdef void update_font(self, FontTexture texture, list removed, list added):
+        """Update the glyph table of the ImFont"""
+        cdef Font font_object = texture._fonts[0]
+        cdef imgui.ImFont *font = <imgui.ImFont*>font_object._font
+        # The glyph table is read during rendering
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, texture.context.viewport.mutex)
+        cdef set to_remove = set(removed)
+        # BuildLookupTable appends a tab glyph, that we remove
+        # to not accumulate them.
+        to_remove.add(9)
+        cdef int32_t i = 0
+        while i < font.Glyphs.Size:
+            if <int32_t>font.Glyphs.Data[i].Codepoint in to_remove:
+                font.Glyphs.erase_unsorted(&font.Glyphs.Data[i])
+            else:
+                i += 1
+        cdef int32_t codepoint, x, y, w, h
+        cdef float dy, dx, advance
+        cdef float u_scale = 1. / self.tex_width
+        cdef float v_scale = 1. / self.tex_height
+        for (codepoint, x, y, w, h, dy, dx, advance) in added:
+            font.AddGlyph(NULL, codepoint,
+                          dx, dy, dx + w, dy + h,
+                          x * u_scale, y * v_scale,
+                          (x + w) * u_scale, (y + h) * v_scale,
+                          advance)
+        font.BuildLookupTable()
+        # The advances of the replaced glyphs changed
+        invalidate_text_layouts()
+
+
 cdef class GlyphSet:
     """Container for font glyph data with convenient access methods"""
 
@@ -1347,21 +1868,100 @@ cdef class GlyphSet:
                 new_glyphset.add_glyph(key, image, dy, dx, advance)
         return new_glyphset
 
+    def save(self, str path) -> None:
+        """
+        Write the GlyphSet to a file, in a format
+        that can be memory mapped by GlyphSet.load.
+
+        Images shared by several characters (see remap)
+        are stored only once.
+        """
+        cdef list images = []
+        cdef dict image_indices = {}
+        cdef list glyph_entries = []
+        for key in self.images:
+            image = self.images[key]
+            index = image_indices.get(id(image))
+            if index is None:
+                index = len(images)
+                image_indices[id(image)] = index
+                images.append(memoryview(image))
+            (dy, dx, advance) = self.positioning[key]
+            glyph_entries.append(_pack(_GLYPH_ENTRY_FORMAT, key, index, dy, dx, advance))
+
+        cdef list image_entries = []
+        cdef list image_data = []
+        offset = _calcsize(_GLYPHSET_HEADER_FORMAT) + \
+            len(images) * _calcsize(_IMAGE_ENTRY_FORMAT) + \
+            len(glyph_entries) * _calcsize(_GLYPH_ENTRY_FORMAT)
+        for image in images:
+            if image.ndim > 3 or image.format != 'B':
+                raise ValueError("Glyph images must be uint8 arrays of shape (h, w[, c])")
+            shape = tuple(image.shape) + (1,) * (3 - image.ndim)
+            data = image.tobytes()
+            image_entries.append(_pack(_IMAGE_ENTRY_FORMAT, offset,
+                                       shape[0], shape[1], shape[2]))
+            image_data.append(data)
+            offset += len(data)
+
+        with open(path, 'wb') as fp:
+            fp.write(_pack(_GLYPHSET_HEADER_FORMAT, _GLYPHSET_MAGIC,
+                           _GLYPHSET_FORMAT_VERSION, self.height,
+                           self.origin_y, len(images), len(glyph_entries)))
+            fp.write(b"".join(image_entries))
+            fp.write(b"".join(glyph_entries))
+            fp.write(b"".join(image_data))
+
+    @classmethod
+    def load(cls, str path):
+        """
+        Read a GlyphSet written by GlyphSet.save.
 
-cdef freetype.FT_Library FT
-if freetype.FT_Init_FreeType(&FT):
-    raise RuntimeError("Failed to initialize FreeType library")
+        The file is memory mapped: the glyph images
+        are views into the mapping, and are only
+        read from disk when accessed.
+        """
+        with open(path, 'rb') as fp:
+            mapping = _mmap(fp.fileno(), 0, access=_ACCESS_COPY)
+        cdef memoryview buffer = memoryview(mapping)
+        (magic, version, height, origin_y, num_images, num_glyphs) = \
+            _unpack_from(_GLYPHSET_HEADER_FORMAT, buffer, 0)
+        if magic != _GLYPHSET_MAGIC or version != _GLYPHSET_FORMAT_VERSION:
+            raise ValueError(f"{path} is not a supported GlyphSet file")
+        cdef GlyphSet glyph_set = cls(height, origin_y)
+        cdef int64_t position = _calcsize(_GLYPHSET_HEADER_FORMAT)
+        cdef int64_t image_entry_size = _calcsize(_IMAGE_ENTRY_FORMAT)
+        cdef int64_t glyph_entry_size = _calcsize(_GLYPH_ENTRY_FORMAT)
+        cdef list images = []
+        for _ in range(num_images):
+            (offset, h, w, c) = _unpack_from(_IMAGE_ENTRY_FORMAT, buffer, position)
+            position += image_entry_size
+            if offset + h * w * c > len(buffer):
+                raise ValueError(f"{path} is truncated")
+            if h * w * c == 0:
+                # Empty glyph. Use a single empty pixel
+                c = max(c, 1)
+                images.append(memoryview(bytearray(c)).cast('B', (1, 1, c)))
+                continue
+            images.append(buffer[offset:offset + h * w * c].cast('B', (h, w, c)))
+        for _ in range(num_glyphs):
+            (key, index, dy, dx, advance) = \
+                _unpack_from(_GLYPH_ENTRY_FORMAT, buffer, position)
+            position += glyph_entry_size
+            glyph_set.add_glyph(key, images[index], dy, dx, advance)
+        return glyph_set
 
-def _cleanup_freetype():
-    """Cleanup FreeType library"""
-    global FT
-    if FT is not NULL:
-        freetype.FT_Done_FreeType(FT)
-        FT = NULL
 
-_atexit_register(_cleanup_freetype)
+# GlyphSet file format (see GlyphSet.save)
+_GLYPHSET_MAGIC = b"DCGGLYPH"
+_GLYPHSET_FORMAT_VERSION = 1
+# magic, version, height, origin_y, number of images, number of glyphs
+_GLYPHSET_HEADER_FORMAT = "<8sIiiII"
+# offset of the data, height, width, channels
+_IMAGE_ENTRY_FORMAT = "<QIII"
+# unicode key, image index, dy, dx, advance
+_GLYPH_ENTRY_FORMAT = "<iIfff"
 
-cdef DCGMutex freetype_mutex
 
 cdef inline int32_t get_freetype_load_flags(str hinter, bint allow_color):
     """Prepare FreeType loading flags"""
@@ -1413,8 +2013,15 @@ cdef inline int32_t get_freetype_load_flags(str hinter, bint allow_color):
     elif hinter == "monochrome":
         load_flags |= freetype.FT_LOAD_TARGET_MONO
         load_flags |= freetype.FT_LOAD_MONOCHROME
+    elif hinter == "sdf":
+        # Distance fields are computed from the unhinted outlines
+        load_flags |= freetype.FT_LOAD_TARGET_NORMAL
+        load_flags |= freetype.FT_LOAD_NO_HINTING
+        load_flags |= freetype.FT_LOAD_NO_AUTOHINT
+        load_flags |= freetype.FT_LOAD_NO_BITMAP
+        return load_flags
     else:
-        raise ValueError("Invalid hinter. Must be none, font, light, strong or monochrome")
+        raise ValueError("Invalid hinter. Must be none, font, light, strong, monochrome or sdf")
 
     if allow_color:
         load_flags |= freetype.FT_LOAD_COLOR
@@ -1423,13 +2030,25 @@ cdef inline int32_t get_freetype_load_flags(str hinter, bint allow_color):
 
 
 cdef class _Face:
-    """Internal wrapper for FT_Face"""
+    """
+    Internal wrapper for FT_Face.
+
+    Each face has its own FT_Library, as FreeType
+    requires a library and its faces to be used by a
+    single thread at a time. Different faces can thus
+    be used in parallel.
+    """
+    cdef DCGMutex mutex
+    cdef freetype.FT_Library _library
     cdef freetype.FT_Face _face
     cdef object _file_data  # Keep reference to prevent GC
+    cdef int32_t _pixel_height
     
     def __cinit__(self):
+        self._library = NULL
         self._face = NULL
         self._file_data = None
+        self._pixel_height = 0
         
     def __init__(self, path):
         if not _path_exists(path):
@@ -1442,19 +2061,24 @@ cdef class _Face:
         # Create the face
         cdef const unsigned char[::1] data_view = self._file_data
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
-        if freetype.FT_New_Memory_Face(FT, 
+        lock_gil_friendly(m, self.mutex)
+        if freetype.FT_Init_FreeType(&self._library):
+            self._library = NULL
+            raise RuntimeError("Failed to initialize FreeType library")
+        if freetype.FT_New_Memory_Face(self._library, 
                                      <const freetype.FT_Byte*>&data_view[0],
                                      <freetype.FT_Long>len(self._file_data),
                                      0, &self._face):
+            self._face = NULL
             raise ValueError(f"Failed to load font from {path}")
             
     def __dealloc__(self):
-        cdef unique_lock[DCGMutex] m
         if self._face != NULL:
-            lock_gil_friendly(m, freetype_mutex)
             freetype.FT_Done_Face(self._face)
             self._face = NULL
+        if self._library != NULL:
+            freetype.FT_Done_FreeType(self._library)
+            self._library = NULL
             
     cdef list get_chars(self):
         """Get all available character codes in a face as a Python list"""
@@ -1466,7 +2090,7 @@ cdef class _Face:
         cdef uint32_t glyph_index
         cdef unique_lock[DCGMutex] m
         
-        lock_gil_friendly(m, freetype_mutex)
+        lock_gil_friendly(m, self.mutex)
         
         # Get first character
         charcode = freetype.FT_Get_First_Char(self._face, &glyph_index)
@@ -1483,9 +2107,10 @@ cdef class _Face:
             raise ValueError("Font face not loaded")
             
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
+        lock_gil_friendly(m, self.mutex)
         if freetype.FT_Set_Pixel_Sizes(self._face, width, height):
             raise ValueError(f"Failed to set font size to {height}")
+        self._pixel_height = height
         return 0
     
     cdef int load_glyph(self, uint32_t glyph_index, int32_t load_flags):
@@ -1493,8 +2118,11 @@ cdef class _Face:
             raise ValueError("Font face not loaded")
             
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
-        if freetype.FT_Load_Glyph(self._face, glyph_index, load_flags):
+        cdef freetype.FT_Error error
+        lock_gil_friendly(m, self.mutex)
+        with nogil:
+            error = freetype.FT_Load_Glyph(self._face, glyph_index, load_flags)
+        if error:
             return -1
         return 0
     
@@ -1503,8 +2131,11 @@ cdef class _Face:
             raise ValueError("Font face not loaded")
             
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
-        if freetype.FT_Load_Char(self._face, char_code, load_flags):
+        cdef freetype.FT_Error error
+        lock_gil_friendly(m, self.mutex)
+        with nogil:
+            error = freetype.FT_Load_Char(self._face, char_code, load_flags)
+        if error:
             return -1
         return 0
     
@@ -1513,8 +2144,11 @@ cdef class _Face:
             raise ValueError("Font face not loaded")
             
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
-        if freetype.FT_Render_Glyph(self._face.glyph, render_mode):
+        cdef freetype.FT_Error error
+        lock_gil_friendly(m, self.mutex)
+        with nogil:
+            error = freetype.FT_Render_Glyph(self._face.glyph, render_mode)
+        if error:
             return -1
         return 0
     
@@ -1523,22 +2157,92 @@ cdef class _Face:
         cdef freetype.FT_Vector kerning
         cdef unique_lock[DCGMutex] m
         
-        lock_gil_friendly(m, freetype_mutex)
+        lock_gil_friendly(m, self.mutex)
         if freetype.FT_Get_Kerning(self._face, left_glyph, right_glyph, kern_mode, &kerning):
             return (0, 0)
         return (kerning.x, kerning.y)
 
 
+# Number of glyphs cached by each FontRenderer
+cdef int32_t _GLYPH_CACHE_SIZE = 4096
+_MISSING_GLYPH = object()
+
 cdef class FontRenderer:
     """
     A class that manages font loading,
-    glyph rendering and text rendering."""
+    glyph rendering and text rendering.
+
+    Each FontRenderer has its own FreeType instance,
+    thus different FontRenderers can render in parallel
+    from different threads.
+    """
     def __init__(self, path):
         if not _path_exists(path):
             raise ValueError(f"Font file {path} not found")
         self._face = _Face(path)
         if self._face is None:
             raise ValueError("Failed to open the font")
+        self._glyph_cache = _OrderedDict()
+
+    cdef object _get_cached_glyph(self,
+                                  uint32_t char_code,
+                                  int32_t load_flags,
+                                  bint render):
+        """
+        Load a character and return its metrics, and if render
+        is set, its rendered bitmap (for pixel aligned rendering).
+        The results are cached per (size, flags, character).
+        The face mutex must be held.
+
+        Returns None if the character cannot be loaded, else
+        (glyph_index, bitmap_width, bitmap_rows, bitmap_top,
+         bitmap_left, advance_x, linear_hori_advance, bitmap).
+        bitmap is None if render is not set, else
+        (data, rows, cols, pitch, pixel_mode, bitmap_top).
+        """
+        cdef _Face face = <_Face>self._face
+        key = (face._pixel_height, load_flags, char_code)
+        entry = self._glyph_cache.get(key, _MISSING_GLYPH)
+        if entry is not _MISSING_GLYPH:
+            self._glyph_cache.move_to_end(key)
+            if entry is None or not(render) or entry[7] is not None:
+                return entry
+
+        if face.load_char(char_code, load_flags) < 0:
+            self._store_cached_glyph(key, None)
+            return None
+        cdef freetype.FT_GlyphSlot glyph = face._face.glyph
+        # Metrics as seen after loading, before rendering
+        metrics = (freetype.FT_Get_Char_Index(face._face, char_code),
+                   glyph.bitmap.width,
+                   glyph.bitmap.rows,
+                   glyph.bitmap_top,
+                   glyph.bitmap_left,
+                   glyph.advance.x,
+                   glyph.linearHoriAdvance)
+        bitmap = None
+        if render:
+            if glyph.format == freetype.FT_GLYPH_FORMAT_BITMAP or \
+               face.render_glyph(freetype.FT_RENDER_MODE_NORMAL) == 0:
+                if glyph.bitmap.pitch >= 0:
+                    bitmap = (PyBytes_FromStringAndSize(<char*>glyph.bitmap.buffer,
+                                                        glyph.bitmap.pitch * glyph.bitmap.rows),
+                              glyph.bitmap.rows,
+                              glyph.bitmap.width,
+                              glyph.bitmap.pitch,
+                              glyph.bitmap.pixel_mode,
+                              glyph.bitmap_top)
+            if bitmap is None:
+                # Failed rendering. Draw nothing for this glyph
+                bitmap = (b"", 0, 0, 0, freetype.FT_PIXEL_MODE_GRAY, 0)
+        entry = metrics + (bitmap,)
+        self._store_cached_glyph(key, entry)
+        return entry
+
+    cdef void _store_cached_glyph(self, key, entry):
+        self._glyph_cache[key] = entry
+        while len(self._glyph_cache) > _GLYPH_CACHE_SIZE:
+            self._glyph_cache.popitem(last=False)
 
     def render_text_to_array(self, str text not None,
                              int target_size,
@@ -1549,7 +2253,7 @@ cdef class FontRenderer:
         """Render text string to an array and return the array and bitmap_top"""
         cdef _Face face = <_Face>self._face
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
+        lock_gil_friendly(m, face.mutex)
 
         face.set_pixel_sizes(0, <int>round(target_size))
 
@@ -1585,42 +2289,53 @@ cdef class FontRenderer:
         cdef uint32_t glyph_index = 0
         cdef int kerning_mode = freetype.FT_KERNING_DEFAULT if align_to_pixels else freetype.FT_KERNING_UNFITTED
         cdef tuple kerning_values
-        cdef freetype.FT_GlyphSlot glyph
-        cdef freetype.FT_Bitmap bitmap
+        cdef int32_t bitmap_width, bitmap_rows, bitmap_top, bitmap_left
+        cdef int64_t advance_x, linear_advance
+        cdef bytes bitmap_data
         
         
         for char in text:
             char_code = ord(char)
             
-            # Load glyph
-            if face.load_char(char_code, load_flags) < 0:
+            # Load glyph (the rendering is cached for pixel aligned text)
+            entry = self._get_cached_glyph(char_code, load_flags, align_to_pixels)
+            if entry is None:
                 continue
-                
-            glyph_index = freetype.FT_Get_Char_Index(face._face, char_code)
+            (glyph_index, bitmap_width, bitmap_rows, bitmap_top,
+             bitmap_left, advance_x, linear_advance, bitmap) = entry
 
             # Apply kerning if enabled
             if enable_kerning and previous_index != 0 and (face._face.face_flags & freetype.FT_FACE_FLAG_KERNING):
                 kerning_values = face.get_kerning(previous_index, glyph_index, kerning_mode)
                 x_offset += kerning_values[0] / 64.0
 
-            # Get glyph metrics
-            glyph = face._face.glyph
-
             # Update bounds
             min_x = min(min_x, x_offset)
-            max_x = max(max_x, x_offset + glyph.bitmap.width)
-            min_y = min(min_y, y_offset + glyph.bitmap.rows - glyph.bitmap_top)
-            max_y = max(max_y, y_offset + glyph.bitmap.rows)
-            max_top = max(max_top, glyph.bitmap_top)
+            max_x = max(max_x, x_offset + bitmap_width)
+            min_y = min(min_y, y_offset + bitmap_rows - bitmap_top)
+            max_y = max(max_y, y_offset + bitmap_rows)
+            max_top = max(max_top, bitmap_top)
 
             # Render the glyph
-            self._render_glyph_to_image(<void*>glyph, image_view, x_offset + glyph.bitmap_left, y_offset, align_to_pixels)
+            if bitmap is not None:
+                bitmap_data = bitmap[0]
+                self._copy_bitmap_to_image(<unsigned char*><char*>bitmap_data,
+                                           bitmap[1], bitmap[2], bitmap[3],
+                                           bitmap[4], bitmap[5],
+                                           image_view,
+                                           x_offset + bitmap_left,
+                                           y_offset)
+            else:
+                # The subpixel offset changes the rendering: no caching
+                if face.load_char(char_code, load_flags) < 0:
+                    continue
+                self._render_glyph_to_image(<void*>face._face.glyph, image_view, x_offset + face._face.glyph.bitmap_left, y_offset, align_to_pixels)
 
             # Advance position
             if align_to_pixels:
-                x_offset += round(glyph.advance.x / 64.0)
+                x_offset += round(advance_x / 64.0)
             else:
-                x_offset += glyph.linearHoriAdvance / 65536.0
+                x_offset += linear_advance / 65536.0
                 
             previous_index = glyph_index
             previous_char = char_code
@@ -1640,9 +2355,9 @@ cdef class FontRenderer:
 
     def estimate_text_dimensions(self, text: str, load_flags : int, align_to_pixels: bool, enable_kerning: bool):
         """Calculate the dimensions needed for the text"""
-        cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
         cdef _Face face = self._face
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, face.mutex)
         cdef double width = 0
         cdef int max_top = 0
         cdef int max_bottom = 0
@@ -1651,34 +2366,33 @@ cdef class FontRenderer:
         cdef uint32_t glyph_index = 0
         cdef int kerning_mode = freetype.FT_KERNING_DEFAULT if align_to_pixels else freetype.FT_KERNING_UNFITTED
         cdef tuple kerning_values
-
-        cdef freetype.FT_GlyphSlot glyph
+        cdef int32_t bitmap_width, bitmap_rows, bitmap_top, bitmap_left
+        cdef int64_t advance_x, linear_advance
         
         for char in text:
             char_code = ord(char)
             
-            # Load character
-            if face.load_char(char_code, load_flags) < 0:
+            # Load character. When pixel aligned, render it
+            # as well, as render_text_to_array will need it.
+            entry = self._get_cached_glyph(char_code, load_flags, align_to_pixels)
+            if entry is None:
                 continue
-                
-            glyph_index = freetype.FT_Get_Char_Index(face._face, char_code)
+            (glyph_index, bitmap_width, bitmap_rows, bitmap_top,
+             bitmap_left, advance_x, linear_advance, _) = entry
             
             # Apply kerning if enabled
             if enable_kerning and previous_index != 0 and (face._face.face_flags & freetype.FT_FACE_FLAG_KERNING):
                 kerning_values = face.get_kerning(previous_index, glyph_index, kerning_mode)
                 width += kerning_values[0] / 64.0
-            
-            # Get glyph metrics
-            glyph = face._face.glyph
 
-            max_top = max(max_top, <int>glyph.bitmap_top)
-            max_bottom = max(max_bottom, <int>glyph.bitmap.rows - <int>glyph.bitmap_top)
+            max_top = max(max_top, bitmap_top)
+            max_bottom = max(max_bottom, bitmap_rows - bitmap_top)
 
             # Update width
             if align_to_pixels:
-                width += glyph.advance.x / 64.0
+                width += advance_x / 64.0
             else:
-                width += glyph.linearHoriAdvance / 65536.0
+                width += linear_advance / 65536.0
                 
             previous_index = glyph_index
             previous_char = char_code
@@ -1700,7 +2414,7 @@ cdef class FontRenderer:
 
 
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
+        lock_gil_friendly(m, face.mutex)
 
         if glyph.format == freetype.FT_GLYPH_FORMAT_BITMAP:
             self._copy_bitmap_to_image(
@@ -1815,7 +2529,7 @@ cdef class FontRenderer:
         target_size: if set, scale the characters to match the
             font 'size' by scaling the pixel size at the 'nominal'
             value (default size of the font).
-        hinter: "font", "none", "light", "strong" or "monochrome".
+        hinter: "font", "none", "light", "strong", "monochrome" or "sdf".
             The hinter is the rendering algorithm that
             impacts a lot the aspect of the characters,
             especially at low scales, to make them
@@ -1829,6 +2543,11 @@ cdef class FontRenderer:
             even if the shape may be altered.
             "monochrome" will render extremely sharp characters,
             using only black and white pixels.
+            "sdf" renders signed distance fields (the alpha
+            value 128 is on the outline, and the alpha values 0
+            and 255 are SDF_SPREAD pixels outside and inside),
+            to be loaded with FontTexture.add_custom_font(..., sdf=True).
+            Such fonts remain sharp at any scale. Color is not supported.
         restrict_to: set of ints that contains the unicode characters
             that should be loaded. If None, load all the characters
             available.
@@ -1842,7 +2561,7 @@ cdef class FontRenderer:
         """
         cdef _Face face = <_Face>self._face
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, freetype_mutex)
+        lock_gil_friendly(m, face.mutex)
 
         # Indicate the target scale
         if target_pixel_height is not None:
@@ -1881,15 +2600,22 @@ cdef class FontRenderer:
             # Apply appropriate rendering mode
             if hinter == "monochrome":
                 render_mode = freetype.FT_RENDER_MODE_MONO
+            elif hinter == "sdf":
+                render_mode = freetype.FT_RENDER_MODE_SDF
             elif hinter == "light":
                 render_mode = freetype.FT_RENDER_MODE_LIGHT
             else:
                 render_mode = freetype.FT_RENDER_MODE_NORMAL
-                
-            if face.render_glyph(render_mode) < 0:
-                continue
-            
+
             glyph = face._face.glyph
+            if render_mode == freetype.FT_RENDER_MODE_SDF and \
+               glyph.outline.n_points == 0:
+                # Empty glyph (space). The SDF renderer rejects them,
+                # and the empty bitmap is handled below.
+                pass
+            elif face.render_glyph(render_mode) < 0:
+                continue
+
             rows = glyph.bitmap.rows
             cols = glyph.bitmap.width
             pitch = glyph.bitmap.pitch
@@ -2178,6 +2904,15 @@ def make_extended_latin_font(size: int,
             return key + _zero_int - _zero_mono
         return key - _basic_pua
 
+    cache_key = _glyph_cache_key("extended_latin", size,
+                                 [main_font_path, italic_font_path,
+                                  bold_font_path, bold_italic_path,
+                                  mono_font_path],
+                                 kwargs)
+    cached = _glyph_cache_load(cache_key)
+    if cached is not None:
+        return cached
+
     restricted_latin = [ord(c) for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"]
     restricted_latin_ext = restricted_latin + [ord(c) for c in "0123456789"]
     restricted_latin_ext2 = restricted_latin_ext + [ord(c) for c in _mono_symbols]
@@ -2209,29 +2944,47 @@ def make_extended_latin_font(size: int,
 
         del kwargs["restrict_to"]
 
-    glyphs = []
+    # Each variant uses its own FontRenderer,
+    # and thus can be rendered in parallel.
+    executor = _get_glyph_rendering_executor()
+    def render(path, restrict):
+        return FontRenderer(path).render_glyph_set(target_size=size, restrict_to=restrict, **kwargs)
 
+    main_job = bold_job = bold_italic_job = italic_job = mono_job = None
     if main_restrict is None or len(main_restrict) > 0:
-        main = FontRenderer(main_font_path).render_glyph_set(target_size=size, restrict_to=main_restrict, **kwargs)
+        main_job = executor.submit(render, main_font_path, main_restrict)
+    if len(bold_restrict) > 0:
+        bold_job = executor.submit(render, bold_font_path, bold_restrict)
+    if len(bold_italic_restrict) > 0:
+        bold_italic_job = executor.submit(render, bold_italic_path, bold_italic_restrict)
+    if len(italic_restrict) > 0:
+        italic_job = executor.submit(render, italic_font_path, italic_restrict)
+    if len(mono_restrict) > 0:
+        mono_job = executor.submit(render, mono_font_path, mono_restrict)
+
+    glyphs = []
+
+    if main_job is not None:
+        main = main_job.result()
         glyphs.append(main)
 
-    if len(bold_restrict) > 0:
-        bold = FontRenderer(bold_font_path).render_glyph_set(target_size=size, restrict_to=bold_restrict, **kwargs)
+    if bold_job is not None:
+        bold = bold_job.result()
         bold.remap(bold_restrict, [make_bold_map(c) for c in bold_restrict])
         glyphs.append(bold)
 
-    if len(bold_italic_restrict) > 0:
-        bold_italic = FontRenderer(bold_italic_path).render_glyph_set(target_size=size, restrict_to=bold_italic_restrict, **kwargs)
+    if bold_italic_job is not None:
+        bold_italic = bold_italic_job.result()
         bold_italic.remap(bold_italic_restrict, [make_bold_italic_map(c) for c in bold_italic_restrict])
         glyphs.append(bold_italic)
 
-    if len(italic_restrict) > 0:
-        italic = FontRenderer(italic_font_path).render_glyph_set(target_size=size, restrict_to=italic_restrict, **kwargs)
+    if italic_job is not None:
+        italic = italic_job.result()
         italic.remap(italic_restrict, [make_italic_map(c) for c in italic_restrict])
         glyphs.append(italic)
 
-    if len(mono_restrict) > 0:
-        mono = FontRenderer(mono_font_path).render_glyph_set(target_size=size, restrict_to=mono_restrict, **kwargs)
+    if mono_job is not None:
+        mono = mono_job.result()
         mono.remap(mono_restrict, [make_mono_map(c) for c in mono_restrict])
         glyphs.append(mono)
 
@@ -2242,7 +2995,172 @@ def make_extended_latin_font(size: int,
         merged.center_on_glyph("B")
     elif ord("8") in main_restrict:
         merged.center_on_glyph("8")
+    _glyph_cache_store(cache_key, merged)
     return merged
 
 
 
+
+
+"""
+On-disk cache of rendered GlyphSets.
+
+Rendering the glyphs with FreeType is the main cost
+of creating a font. The GlyphSets produced by
+make_extended_latin_font are thus saved in a cache
+directory, indexed by a hash of everything that
+impacts the rendering (content of the font files,
+size, rendering arguments, library versions), and
+memory mapped on the next runs.
+"""
+
+def _default_glyph_cache_directory():
+    if "DEARCYGUI_GLYPH_CACHE" in _environ:
+        return _environ["DEARCYGUI_GLYPH_CACHE"] or None
+    if _platform == "win32":
+        root = _environ.get("LOCALAPPDATA") or _expanduser("~")
+    elif _platform == "darwin":
+        root = _path_join(_expanduser("~"), "Library", "Caches")
+    else:
+        root = _environ.get("XDG_CACHE_HOME") or _path_join(_expanduser("~"), ".cache")
+    return _path_join(root, "dearcygui", "glyph_cache")
+
+_glyph_cache_directory = _default_glyph_cache_directory()
+_glyph_cache_max_size = 64 * 1024 * 1024
+# (path, mtime, size) -> hash of the content
+_font_file_hashes = dict()
+
+def set_glyph_cache(directory: str | None, max_size: int = 64 * 1024 * 1024) -> None:
+    """
+    Configure the on-disk cache of rendered glyphs.
+
+    make_extended_latin_font (used by AutoFont) stores the
+    glyphs it renders in this directory, and reuses them
+    on the next runs instead of rendering them again.
+
+    By default the cache is in the user cache directory,
+    or in the directory set by the DEARCYGUI_GLYPH_CACHE
+    environment variable (an empty value disables the cache).
+
+    Inputs:
+    -------
+    directory: cache directory. None disables the cache.
+    max_size: maximum size in bytes of the cache. When exceeded,
+        the least recently used entries are removed.
+    """
+    global _glyph_cache_directory, _glyph_cache_max_size
+    if max_size < 0:
+        raise ValueError("max_size must be positive")
+    _glyph_cache_directory = None if directory is None else str(directory)
+    _glyph_cache_max_size = max_size
+
+def get_glyph_cache() -> tuple[str | None, int]:
+    """
+    Returns the (directory, max_size) of the
+    on-disk cache of rendered glyphs.
+
+    See set_glyph_cache.
+    """
+    return (_glyph_cache_directory, _glyph_cache_max_size)
+
+cdef str _hash_font_file(str path):
+    """Hash of the content of a font file, cached by modification time"""
+    info = _stat(path)
+    key = (path, info.st_mtime_ns, info.st_size)
+    result = _font_file_hashes.get(key, None)
+    if result is None:
+        with open(path, 'rb') as fp:
+            result = _sha256(fp.read()).hexdigest()
+        _font_file_hashes[key] = result
+    return result
+
+cdef object _glyph_cache_key(str kind, size, list paths, dict kwargs):
+    """
+    Returns the cache key of a rendered GlyphSet,
+    or None if the cache is disabled.
+    """
+    if _glyph_cache_directory is None or _glyph_cache_max_size == 0:
+        return None
+    from dearcygui import __version__ as dcg_version
+    try:
+        arguments = []
+        for (name, value) in sorted(kwargs.items()):
+            if isinstance(value, (set, frozenset)):
+                value = sorted(value)
+            arguments.append((name, value))
+        description = repr((_GLYPHSET_FORMAT_VERSION,
+                            dcg_version,
+                            (freetype.FREETYPE_MAJOR,
+                             freetype.FREETYPE_MINOR,
+                             freetype.FREETYPE_PATCH),
+                            kind,
+                            size,
+                            [_hash_font_file(path) for path in paths],
+                            arguments))
+    except Exception:
+        return None
+    return _sha256(description.encode()).hexdigest()
+
+cdef object _glyph_cache_load(key):
+    """Returns the cached GlyphSet for key, or None"""
+    if key is None or _glyph_cache_directory is None:
+        return None
+    path = _path_join(_glyph_cache_directory, key + ".glyphs")
+    if not(_path_exists(path)):
+        return None
+    try:
+        glyph_set = GlyphSet.load(path)
+    except Exception:
+        # Corrupted entry
+        try:
+            _remove(path)
+        except OSError:
+            pass
+        return None
+    try:
+        # Mark as recently used
+        _utime(path, None)
+    except OSError:
+        pass
+    return glyph_set
+
+cdef void _glyph_cache_store(key, GlyphSet glyph_set):
+    """Save glyph_set in the cache, and trim the cache to max_size"""
+    directory = _glyph_cache_directory
+    if key is None or directory is None:
+        return
+    cdef int64_t max_size = _glyph_cache_max_size
+    try:
+        _makedirs(directory, exist_ok=True)
+        # Write to a temporary file first, such that concurrent
+        # readers never see a partially written entry.
+        (fd, tmp_path) = _mkstemp(dir=directory, suffix=".tmp")
+        _close(fd)
+        try:
+            glyph_set.save(tmp_path)
+            _replace(tmp_path, _path_join(directory, key + ".glyphs"))
+        except Exception:
+            _remove(tmp_path)
+            raise
+    except Exception:
+        return
+
+    # Remove the least recently used entries above max_size
+    try:
+        entries = []
+        for entry in _scandir(directory):
+            if entry.name.endswith(".glyphs"):
+                info = entry.stat()
+                entries.append((info.st_mtime, info.st_size, entry.path))
+        total_size = sum(size for (_, size, _) in entries)
+        entries.sort()
+        for (_, size, path) in entries:
+            if total_size <= max_size:
+                break
+            try:
+                _remove(path)
+                total_size -= size
+            except OSError:
+                pass
+    except OSError:
+        pass
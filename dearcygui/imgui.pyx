@@ -20,9 +20,9 @@ from libcpp.algorithm cimport swap
 from libcpp.cmath cimport sin, cos, sqrt, atan2, pow, fmod, fabs, fmin, fmax
 
 from .core cimport Context
-from .c_types cimport DCGVector
+from .c_types cimport DCGMutex, DCGVector, unique_lock
 from .draw_helpers cimport generate_elliptical_arc_points
-from .imgui_types cimport ImGuiStyleIndex, ImVec2Vec2
+from .imgui_types cimport ImGuiStyleIndex, ImVec2Vec2, Vec2ImVec2
 from .texture cimport Pattern, get_pattern_u
 from .wrapper cimport imgui
 
@@ -1034,6 +1034,11 @@ cdef void _t_draw_polygon_outline_pattern(Context context,
     cdef int max_vtx_count = points_count * 20
     cdef int max_idx_count = points_count * 60
 
+    if pattern._texture is None:
+        return
+    cdef unique_lock[DCGMutex] texture_m = unique_lock[DCGMutex](pattern._texture.mutex)
+    if not(pattern._texture.c_mark_used()):
+        return
     draw_list.PushTextureID(<imgui.ImTextureID>pattern._texture.allocated_texture)
 
     draw_list.PrimReserve(max_idx_count, max_vtx_count)
@@ -3811,10 +3816,8 @@ cdef void t_draw_text(Context context, void* drawlist,
         imgui.PushFont(<imgui.ImFont*>font)
         
     # Draw text
-    if size == 0:
-        (<imgui.ImDrawList*>drawlist).AddText(ipos, color, text, NULL)
-    else:
-        (<imgui.ImDrawList*>drawlist).AddText(NULL, fabs(size), ipos, color, text, NULL)
+    context.viewport.text_layouts.add_text(drawlist, NULL, fabs(size), ipos.x, ipos.y,
+                                           color, text, NULL)
 
     # Pop font if it was pushed
     if font != NULL:
@@ -4272,13 +4275,11 @@ cdef Vec2 calc_text_size(Context context, const char* text, void* font, float si
     cdef imgui.ImVec2 text_size
     cdef imgui.ImFont* cur_font
     cdef float scale
-    if size == 0:
-        text_size = imgui.CalcTextSize(text, NULL, False, wrap_width)
-    else:
+    text_size = Vec2ImVec2(context.viewport.text_layouts.calc_text_size(text, NULL, wrap_width))
+    if size != 0:
         # Get current font and scale it
         cur_font = imgui.GetFont()
         scale = fabs(size) / cur_font.FontSize
-        text_size = imgui.CalcTextSize(text, NULL, False, wrap_width)
         text_size.x *= scale
         text_size.y *= scale
     
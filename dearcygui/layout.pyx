@@ -234,6 +234,7 @@ cdef class HorizontalLayout(Layout):
     def alignment_mode(self, Alignment value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if <int>value < 0 or value > Alignment.MANUAL:
             raise ValueError("Invalid alignment value")
         if value == self._alignment_mode:
@@ -258,6 +259,7 @@ cdef class HorizontalLayout(Layout):
     def no_wrap(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value == self._no_wrap:
             return
         self._force_update = True
@@ -281,6 +283,7 @@ cdef class HorizontalLayout(Layout):
     def wrap_x(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._wrap_x = value
         if value != 0.0:
             _warn("wrap_x is deprecated, it will be replaced by a new interface", DeprecationWarning)
@@ -313,6 +316,7 @@ cdef class HorizontalLayout(Layout):
     def positions(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if len(value) > 0:
             self._alignment_mode = Alignment.MANUAL
         # TODO: checks
@@ -585,6 +589,7 @@ cdef class VerticalLayout(Layout):
     def alignment_mode(self, Alignment value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if <int>value < 0 or value > Alignment.MANUAL:
             raise ValueError("Invalid alignment value")
         if value == self._alignment_mode:
@@ -609,6 +614,7 @@ cdef class VerticalLayout(Layout):
     def wrap(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(value) == self._no_wrap:
             return
         self._force_update = True
@@ -632,6 +638,7 @@ cdef class VerticalLayout(Layout):
     def wrap_y(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._wrap_y = value
         if value != 0.0:
             _warn("wrap_y is deprecated, it will be replaced by a new interface", DeprecationWarning)
@@ -664,6 +671,7 @@ cdef class VerticalLayout(Layout):
     def positions(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if len(value) > 0:
             self._alignment_mode = Alignment.MANUAL
         # TODO: checks
@@ -936,6 +944,7 @@ cdef class WindowLayout(uiItem):
     def clip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._clip = value
 
     # final enables inlining
@@ -19,13 +19,14 @@ cimport cython
 from cython.operator cimport dereference
 from cpython.ref cimport PyObject
 
-from libc.stdint cimport uint8_t, int32_t, uint32_t, uint64_t
+from libc.stdint cimport uint8_t, int32_t, int64_t, uint32_t, uint64_t
 from libc.stdlib cimport malloc, free
 from libc.string cimport memcpy, strlen, memset
 from libcpp.cmath cimport floor, fmax, fmin
 from libcpp.vector cimport vector
 from libcpp.string cimport string, to_string
 from libcpp.unordered_map cimport unordered_map
+from libcpp.utility cimport move
 
 from .core cimport uiItem, Context, lock_gil_friendly, Viewport, baseFont, baseItem
 from .c_types cimport DCGMutex, unique_lock, Vec2, Vec4, make_Vec2
@@ -34,6 +35,10 @@ from .wrapper cimport imgui
 from .layout cimport Layout
 
 from .imgui cimport t_draw_line, t_draw_circle, t_draw_star, t_draw_rect
+cimport dearcygui.backends.time as ctime
+
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from warnings import warn as _warn
 
 __all__ = ["MarkDownText"]
 
@@ -827,6 +832,134 @@ cdef int handle_text(MD_TEXTTYPE type, const char* text, MD_SIZE size, void* use
     return 0
 
 
+cdef void reset_parser(MDParser* parser) noexcept nogil:
+    """Reset the parser state and the parsed content"""
+    parser.cur.block_stack.clear()
+    parser.cur.text_type = MDTextType.MD_TEXT_NORMAL
+    parser.cur.current_heading_level = 0
+    parser.cur.heading_stack.clear()
+    parser.cur.words.clear()
+    parser.cur.last_had_break = True
+    parser.content.type = MD_BLOCKTYPE_EXT.MD_BLOCK_DOC
+    parser.content.attr1.clear()
+    parser.content.attr2.clear()
+    parser.content.children.clear()
+    parser.content.words.clear()
+
+cdef int parse_markdown(MDParser* parser, const char* text, size_t size) noexcept nogil:
+    """
+    Parse text into parser.content.
+
+    Returns 0 on success. On failure, the parser is reset.
+    """
+    reset_parser(parser)
+    cdef MD_PARSER md_parser
+    md_parser.abi_version = 0
+    # not yet supported:
+    # MD_FLAG_TASKLISTS | MD_FLAG_WIKILINKS | MD_FLAG_TABLES | MD_FLAG_LATEXMATHSPANS
+    md_parser.flags = (MD_FLAG_COLLAPSEWHITESPACE | MD_FLAG_PERMISSIVEATXHEADERS |
+                       MD_FLAG_PERMISSIVEURLAUTOLINKS | MD_FLAG_PERMISSIVEEMAILAUTOLINKS |
+                       MD_FLAG_NOHTMLBLOCKS | MD_FLAG_NOHTMLSPANS |
+                       MD_FLAG_STRIKETHROUGH |
+                       MD_FLAG_PERMISSIVEWWWAUTOLINKS |
+                       MD_FLAG_UNDERLINE)
+    md_parser.enter_block = &enter_block
+    md_parser.leave_block = &leave_block
+    md_parser.enter_span = &enter_span
+    md_parser.leave_span = &leave_span
+    md_parser.text = &handle_text
+    md_parser.debug_log = NULL  # No debug logging
+    md_parser.syntax = NULL
+    if md_parse(text, size, &md_parser, <void*>parser) != 0:
+        reset_parser(parser)
+        return -1
+    # Free temporary parser state
+    parser.cur.block_stack.clear()
+    parser.cur.heading_stack.clear()
+    parser.cur.words.clear()
+    return 0
+
+cdef void append_document(MDParsedBlock* doc, MDParser* parser) noexcept nogil:
+    """Move the top-level blocks parsed by parser at the end of doc"""
+    if parser.content.children.empty():
+        return
+    # md4c wraps everything into a MD_BLOCK_DOC block
+    cdef MDParsedBlock* src = &parser.content.children[0]
+    cdef int32_t i
+    for i in range(<int>src.children.size()):
+        doc.children.push_back(move(src.children[i]))
+
+cdef inline bint starts_list_item(const char* text, size_t size) noexcept nogil:
+    """Check if a line might start a list item (or a thematic break)"""
+    if size == 0:
+        return False
+    if text[0] == '-' or text[0] == '+' or text[0] == '*':
+        return True
+    cdef size_t i = 0
+    while i < size and i < 9 and text[i] >= '0' and text[i] <= '9':
+        i += 1
+    return i > 0 and i < size and (text[i] == '.' or text[i] == ')')
+
+cdef size_t find_stable_boundary(const char* text, size_t start, size_t end) noexcept nogil:
+    """
+    Find the last offset in [start, end) at which the text can
+    be split into two documents parsed independently.
+
+    Candidates are the starts of complete, non-indented lines
+    that follow a blank line, are outside fenced code, and
+    cannot continue a list. start must be such an offset (or 0).
+    Returns start if there is no later candidate.
+    """
+    cdef size_t boundary = start
+    cdef size_t line_start = start
+    cdef size_t line_end, pos, run, rest
+    cdef bint prev_blank = False
+    cdef char fence_char = 0
+    cdef size_t fence_len = 0
+    cdef char c
+
+    while line_start < end:
+        line_end = line_start
+        while line_end < end and text[line_end] != '\n':
+            line_end += 1
+        if line_end == end:
+            break # The last line may still change
+
+        pos = line_start
+        while pos < line_end and (text[pos] == ' ' or text[pos] == '\t' or text[pos] == '\r'):
+            pos += 1
+        if pos == line_end:
+            prev_blank = True
+            line_start = line_end + 1
+            continue
+
+        # Fenced code delimiters
+        c = text[pos]
+        run = 0
+        if pos - line_start <= 3 and (c == '`' or c == '~'):
+            while pos + run < line_end and text[pos + run] == c:
+                run += 1
+
+        if fence_char != 0:
+            # Only a closing delimiter without info string ends the fence
+            if c == fence_char and run >= fence_len:
+                rest = pos + run
+                while rest < line_end and (text[rest] == ' ' or text[rest] == '\t' or text[rest] == '\r'):
+                    rest += 1
+                if rest == line_end:
+                    fence_char = 0
+        else:
+            if prev_blank and pos == line_start and \
+               not starts_list_item(text + pos, line_end - pos):
+                boundary = line_start
+            if run >= 3:
+                fence_char = c
+                fence_len = run
+        prev_blank = False
+        line_start = line_end + 1
+    return boundary
+
+
 # Layout and rendering.
 # ---------------------
 # After the parsing is done, we have a tree of blocks, with
@@ -942,6 +1075,33 @@ cdef struct MDProcessedBlockDetail:
     string attr1
     string attr2
 
+# Layout state before a top-level block, to resume the layout from it
+cdef struct MDLayoutCheckpoint:
+    size_t num_lines           # Number of lines, including the current one
+    MDProcessedLine last_line  # Copy of the current line
+    size_t num_blocks
+    size_t num_block_details
+    bint last_is_soft_break
+    float max_x                # Width of the lines before the current one
+    float max_block_y          # Bottom of the blocks
+
+# Texts at least this long (in bytes) are parsed in a worker thread
+cdef size_t _BACKGROUND_PARSE_SIZE = 1 << 18
+# Time spent at most each frame on the layout, once the visible area is done
+cdef int64_t _LAYOUT_BUDGET_NS = 4000000
+
+cdef object _markdown_executor = None
+
+cdef object _get_markdown_executor():
+    global _markdown_executor
+    if _markdown_executor is None:
+        _markdown_executor = _ThreadPoolExecutor(max_workers=1,
+                                                 thread_name_prefix="dcg_markdown")
+    return _markdown_executor
+
+def _parse_in_background(MarkDownText item, uint64_t generation, bytes text):
+    item._parse_background(generation, text)
+
 cdef const uint32_t codepoint_A = ord('A')
 cdef const uint32_t codepoint_Z = ord('Z')
 cdef const uint32_t codepoint_a = ord('a')
@@ -1031,11 +1191,26 @@ cdef class MarkDownText(uiItem):
     cdef float _last_global_scale
     cdef Vec2 _rect_size
     cdef vector[MDProcessedLine] _lines  # Processed lines for rendering, in order of increasing y position
-    cdef vector[MDProcessedBlock] _blocks  # Processed blocks for rendering, in a topological order
+    cdef vector[MDProcessedBlock] _blocks  # Processed blocks for rendering, children before their parents
     cdef vector[MDProcessedBlockDetail] _block_details # Details for selected blocks needed for rendering
+    cdef vector[MDLayoutCheckpoint] _checkpoints # Layout state before each top-level block
+    cdef int32_t _laid_out_blocks # Number of top-level blocks with an up to date layout
+    cdef bint _layout_complete
+    # Previous complete layout, drawn while the layout for a new width is in progress
+    cdef bint _stale_valid
+    cdef Vec2 _stale_rect_size
+    cdef vector[MDProcessedLine] _stale_lines
+    cdef vector[MDProcessedBlock] _stale_blocks
+    cdef vector[MDProcessedBlockDetail] _stale_block_details
     cdef PyObject *_applicable_font # font used for layout, baseFont
     cdef bint _last_is_soft_break # temporary data
 
+    # Incremental parsing
+    cdef size_t _stable_offset # Text before this offset is not parsed again by append()
+    cdef int32_t _stable_blocks # Number of top-level blocks before _stable_offset
+    cdef uint64_t _parse_generation # Incremented when the value is set
+    cdef bint _parse_pending # A worker thread is parsing the value
+
     # Style configuration
     cdef float[7] _heading_scales  # Scale factors for h1-h6, h0 used for normal text
 
@@ -1053,6 +1228,7 @@ cdef class MarkDownText(uiItem):
         self._heading_scales = [1.0, 2.0, 1.75, 1.5, 1.375, 1.25, 1.125]
         self._color_table = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
         self._last_width = -1.0  # Initial width, will be set on first layout
+        self._layout_complete = True
     
     # Properties
     @property
@@ -1071,6 +1247,7 @@ cdef class MarkDownText(uiItem):
         for i in range(min(6, len(scales))):
             self._heading_scales[1+i] = float(scales[i])
         self._last_width = -1.0
+        self.mark_dirty()
 
     @property
     def color_headings(self):
@@ -1099,6 +1276,7 @@ cdef class MarkDownText(uiItem):
     def color_headings(self, colors):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         cdef uint32_t new_colors[6]
         cdef int32_t i
         for i in range(6):
@@ -1134,6 +1312,7 @@ cdef class MarkDownText(uiItem):
     def color_emph(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._color_table[<int32_t>TextColorIndex.EMPH] = 1  # default color
             return
@@ -1155,6 +1334,7 @@ cdef class MarkDownText(uiItem):
     def color_strong(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._color_table[<int32_t>TextColorIndex.STRONG] = 1  # default color
             return
@@ -1176,6 +1356,7 @@ cdef class MarkDownText(uiItem):
     def color_code(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._color_table[<int32_t>TextColorIndex.CODE] = 1  # default code
             return
@@ -1197,6 +1378,7 @@ cdef class MarkDownText(uiItem):
     def color_code_bg(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._color_table[<int32_t>TextColorIndex.CODE_BACKGROUND] = 1  # default code
             return
@@ -1217,6 +1399,7 @@ cdef class MarkDownText(uiItem):
     def color_strikethrough(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._color_table[<int32_t>TextColorIndex.STRIKETHROUGH] = 1  # default code
             return
@@ -1237,6 +1420,7 @@ cdef class MarkDownText(uiItem):
     def color_underline(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._color_table[<int32_t>TextColorIndex.UNDERLINE] = 1  # default code
             return
@@ -1250,63 +1434,160 @@ cdef class MarkDownText(uiItem):
     @value.setter
     def value(self, text): # TODO: SharedStr
         """Set markdown text and mark for reparsing"""
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
         if not isinstance(text, str):
             raise TypeError("value must be a string")
         new_value = text.encode('utf8')
         if <int32_t>self._text.size() == <int32_t>len(new_value) and bytes(self._text) == new_value:
             return  # No change, no need to reparse
+        self.mark_dirty()
         self._text = new_value
-        # Reset parser state
-        self._parser.cur.block_stack.clear()
-        self._parser.cur.text_type = MDTextType.MD_TEXT_NORMAL
-        self._parser.cur.current_heading_level = 0
-        self._parser.cur.heading_stack.clear()
-        self._parser.cur.words.clear()
-        self._parser.cur.last_had_break = True
-        self._parser.content.type = MD_BLOCKTYPE_EXT.MD_BLOCK_DOC
-        self._parser.content.attr1.clear()
-        self._parser.content.attr2.clear()
-        self._parser.content.children.clear()
-        self._parser.content.words.clear()
-        # Reset layout state
-        self._last_width = -1.0
-        # Start parsing
-        cdef MD_PARSER parser
-        parser.abi_version = 0
-        # not yet supported:
-        # MD_FLAG_TASKLISTS | MD_FLAG_WIKILINKS | MD_FLAG_TABLES | MD_FLAG_LATEXMATHSPANS
-        parser.flags = (MD_FLAG_COLLAPSEWHITESPACE | MD_FLAG_PERMISSIVEATXHEADERS |
-                        MD_FLAG_PERMISSIVEURLAUTOLINKS | MD_FLAG_PERMISSIVEEMAILAUTOLINKS |
-                        MD_FLAG_NOHTMLBLOCKS | MD_FLAG_NOHTMLSPANS |
-                        MD_FLAG_STRIKETHROUGH |
-                        MD_FLAG_PERMISSIVEWWWAUTOLINKS |
-                        MD_FLAG_UNDERLINE)
-        parser.enter_block = &enter_block
-        parser.leave_block = &leave_block
-        parser.enter_span = &enter_span
-        parser.leave_span = &leave_span
-        parser.text = &handle_text
-        parser.debug_log = NULL  # No debug logging
-        parser.syntax = NULL
-        if md_parse(self._text.c_str(), self._text.size(), &parser, <void*>&self._parser) != 0:
-            # Reset parser state
-            self._parser.cur.block_stack.clear()
-            self._parser.cur.text_type = MDTextType.MD_TEXT_NORMAL
-            self._parser.cur.current_heading_level = 0
-            self._parser.cur.heading_stack.clear()
-            self._parser.cur.words.clear()
-            self._parser.content.type = MD_BLOCKTYPE_EXT.MD_BLOCK_DOC
-            self._parser.content.attr1.clear()
-            self._parser.content.attr2.clear()
-            self._parser.content.children.clear()
-            self._parser.content.words.clear()
+        self._parse_generation += 1
+        if self._text.size() >= _BACKGROUND_PARSE_SIZE:
+            # The previous content is displayed until parsing is done
+            self._parse_pending = True
+            _get_markdown_executor().submit(_parse_in_background, self,
+                                            self._parse_generation, new_value)
+            return
+        self._parse_pending = False
+        self._reset_layout()
+        if parse_markdown(&self._parser, self._text.c_str(), self._text.size()) != 0:
             raise RuntimeError("Failed to parse markdown text")
-        # Free temporary parser state
-        self._parser.cur.block_stack.clear()
-        self._parser.cur.heading_stack.clear()
-        self._parser.cur.words.clear()
         #self.debug_parser()
 
+    cdef void _parse_background(self, uint64_t generation, bytes text):
+        """Parse text (the value for generation) and replace the content with it"""
+        cdef unique_lock[DCGMutex] m
+        cdef MDParser head, tail
+        cdef const char* data = text
+        cdef size_t size = len(text)
+        cdef size_t boundary
+        cdef int32_t stable_blocks = 0
+        cdef int result = 0
+        with nogil:
+            # Split as append() would, such that text appended
+            # later only requires to parse the tail again.
+            boundary = find_stable_boundary(data, 0, size)
+            if boundary > 0:
+                result = parse_markdown(&head, data, boundary)
+            if result == 0:
+                result = parse_markdown(&tail, data + boundary, size - boundary)
+            if result == 0:
+                if head.content.children.empty():
+                    head.content.children.resize(1)
+                    head.content.children[0].type = MD_BLOCKTYPE_EXT.MD_BLOCK_DOC
+                stable_blocks = head.content.children[0].children.size()
+                append_document(&head.content.children[0], &tail)
+        lock_gil_friendly(m, self.mutex)
+        if generation != self._parse_generation:
+            return # The value has changed since
+        self.mark_dirty()
+        self._parse_pending = False
+        self._reset_layout()
+        # The previous tree is freed with head
+        self._parser.content.children.swap(head.content.children)
+        if result != 0:
+            self._parser.content.children.clear()
+            _warn("Failed to parse markdown text")
+        else:
+            self._stable_offset = boundary
+            self._stable_blocks = stable_blocks
+            if self._text.size() > size:
+                # Text appended during parsing
+                if self._reparse_tail() != 0:
+                    _warn("Failed to parse markdown text")
+        m.unlock()
+        self.context.viewport.wake()
+
+    @cython.final
+    cdef void _reset_layout(self) noexcept nogil:
+        """Mark the content as replaced"""
+        self._last_width = -1.0
+        self._laid_out_blocks = 0
+        self._stable_offset = 0
+        self._stable_blocks = 0
+        # The previous layout is for another content
+        self._lines.clear()
+        self._blocks.clear()
+        self._block_details.clear()
+        self._checkpoints.clear()
+        self._stale_valid = False
+        self._stale_lines.clear()
+        self._stale_blocks.clear()
+        self._stale_block_details.clear()
+
+    @property
+    def processing(self):
+        """
+        Whether parsing or layout is still in progress.
+
+        Long texts are parsed in a worker thread, and their
+        layout is spread on several frames. In the meantime,
+        the previous content or layout is displayed.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._parse_pending or not self._layout_complete
+
+    def append(self, text):
+        """
+        Append markdown text at the end of the current value.
+
+        Equivalent to `value += text`, except only the end of
+        the document is parsed and laid out again. Use it to
+        stream text into the item.
+
+        The text is parsed in parts, split at blank lines that
+        start a new top-level block. Link reference definitions
+        only apply to the part that contains them.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if not isinstance(text, str):
+            raise TypeError("text must be a string")
+        cdef bytes new_text = text.encode('utf8')
+        if len(new_text) == 0:
+            return
+        self.mark_dirty()
+        cdef size_t prev_size = self._text.size()
+        self._text.append(<const char*>new_text, len(new_text))
+        if self._parse_pending:
+            return # The text is parsed once the worker is done
+        if self._reparse_tail() != 0:
+            self._text.resize(prev_size)
+            raise RuntimeError("Failed to parse markdown text")
+
+    @cython.final
+    cdef int _reparse_tail(self) noexcept nogil:
+        """Parse again the text after the last stable block boundary"""
+        cdef MDParser head, tail
+        cdef const char* text = self._text.c_str()
+        cdef size_t end = self._text.size()
+        cdef size_t boundary = find_stable_boundary(text, self._stable_offset, end)
+
+        # Parse first, to leave the content untouched on failure
+        if boundary > self._stable_offset:
+            if parse_markdown(&head, text + self._stable_offset, boundary - self._stable_offset) != 0:
+                return -1
+        if parse_markdown(&tail, text + boundary, end - boundary) != 0:
+            return -1
+
+        if self._parser.content.children.empty():
+            self._parser.content.children.resize(1)
+            self._parser.content.children[0].type = MD_BLOCKTYPE_EXT.MD_BLOCK_DOC
+        cdef MDParsedBlock* doc = &self._parser.content.children[0]
+
+        # Replace the blocks after the previous boundary
+        doc.children.resize(self._stable_blocks)
+        self._laid_out_blocks = min(self._laid_out_blocks, self._stable_blocks)
+        if boundary > self._stable_offset:
+            append_document(doc, &head)
+            self._stable_blocks = doc.children.size()
+            self._stable_offset = boundary
+        append_document(doc, &tail)
+        return 0
+
     cdef void debug_parser(self):
         """Print the complete status of the MDParser including the whole parse tree."""
         print("=== MDParser Debug Output ===")
@@ -1992,57 +2273,153 @@ cdef class MarkDownText(uiItem):
     cdef void _process(self, float available_width) noexcept nogil:
         """Process the whole document tree to compute layout"""
         cdef PyObject *applicable_font = self._get_applicable_font()
-
-        # Skip if width or font hasn't changed TODO: also on global scale change
+        cdef MDParsedBlock *doc = NULL
+        cdef int32_t num_blocks = 0
+        if not self._parser.content.children.empty():
+            # md4c wraps the document into a MD_BLOCK_DOC block
+            doc = &self._parser.content.children[0]
+            num_blocks = doc.children.size()
+
+        # TODO: also on global scale change
         if self._last_width == available_width\
            and self._applicable_font == applicable_font\
            and self._last_global_scale == self.context.viewport.global_scale:
-            self.state.cur.rect_size = self._rect_size
-            return
-
-        # Reset layout state
-        self._lines.clear()
-        self._blocks.clear()
-        self._block_details.clear()
-        self._applicable_font = applicable_font
-        self._last_width = available_width
-        self._last_global_scale = self.context.viewport.global_scale
+            if self._laid_out_blocks == num_blocks:
+                # Nothing changed
+                self.state.cur.rect_size = self._rect_size
+                return
+            # Else only process the blocks changed by append()
+        else:
+            if self._layout_complete and not self._lines.empty():
+                # Keep drawing the current layout until the new one is ready
+                self._stale_lines.swap(self._lines)
+                self._stale_blocks.swap(self._blocks)
+                self._stale_block_details.swap(self._block_details)
+                self._stale_rect_size = self._rect_size
+                self._stale_valid = True
+            self._laid_out_blocks = 0
+            self._applicable_font = applicable_font
+            self._last_width = available_width
+            self._last_global_scale = self.context.viewport.global_scale
 
         # Apply the font to make sure scaling is taken into account
         if <object>applicable_font is not None:
             (<baseFont>applicable_font).push()
 
-        # Process the document tree recursively
-        self._process_block(&self._parser.content, 0, False)
+        self._process_top_blocks(doc, num_blocks)
 
-        cdef int i
-        # We build blocks in a reverse order, we need
-        # to reverse them to have a topological order (will not be top to bottom)
-        cdef MDProcessedBlock tmp_p_block
-        for i in range(<int>self._blocks.size() // 2):
-            tmp_p_block = self._blocks[i]
-            self._blocks[i] = self._blocks[self._blocks.size() - 1 - i]
-            self._blocks[self._blocks.size() - 1 - i] = tmp_p_block
+        # Pop the font after processing
+        if <object>applicable_font is not None:
+            (<baseFont>applicable_font).pop()
+
+    @cython.final
+    cdef void _save_checkpoint(self,
+                               size_t *scanned_lines,
+                               size_t *scanned_blocks,
+                               float *max_x,
+                               float *max_block_y) noexcept nogil:
+        """
+        Save the layout state before the next top-level block.
+
+        max_x and max_block_y accumulate the extent of the
+        lines and blocks that were not scanned yet.
+        """
+        # All lines but the current one are final
+        while scanned_lines[0] + 1 < self._lines.size():
+            if not self._lines[scanned_lines[0]].items.empty():
+                max_x[0] = fmax(max_x[0], self._lines[scanned_lines[0]].items.back().x + self._lines[scanned_lines[0]].items.back().width)
+            scanned_lines[0] += 1
+        while scanned_blocks[0] < self._blocks.size():
+            max_block_y[0] = fmax(max_block_y[0], self._blocks[scanned_blocks[0]].ymax)
+            scanned_blocks[0] += 1
+
+        self._checkpoints.resize(self._checkpoints.size() + 1)
+        cdef MDLayoutCheckpoint *checkpoint = &self._checkpoints.back()
+        checkpoint.num_lines = self._lines.size()
+        if not self._lines.empty():
+            checkpoint.last_line = self._lines.back()
+        checkpoint.num_blocks = self._blocks.size()
+        checkpoint.num_block_details = self._block_details.size()
+        checkpoint.last_is_soft_break = self._last_is_soft_break
+        checkpoint.max_x = max_x[0]
+        checkpoint.max_block_y = max_block_y[0]
+
+    @cython.final
+    cdef void _process_top_blocks(self, MDParsedBlock *doc, int32_t num_blocks) noexcept nogil:
+        """
+        Layout the top-level blocks, starting from the first outdated one.
+
+        The visible area is always laid out. Past it, processing
+        stops after a time budget and resumes on the next frames.
+        """
+        cdef int32_t start = min(self._laid_out_blocks, num_blocks)
+        cdef MDLayoutCheckpoint *checkpoint
+        cdef size_t scanned_lines = 0, scanned_blocks = 0
+        cdef float max_x = 0., max_block_y = 0.
+        cdef int32_t i, end = num_blocks
+        cdef int64_t deadline = ctime.monotonic_ns() + _LAYOUT_BUDGET_NS
+        # Bottom of the visible area, relative to the item
+        cdef float visible_bottom = imgui.GetWindowDrawList().GetClipRectMax().y - imgui.GetCursorScreenPos().y
+
+        # Restore the state before the first block to process
+        if start == 0:
+            self._lines.clear()
+            self._blocks.clear()
+            self._block_details.clear()
+            self._checkpoints.clear()
+        else:
+            checkpoint = &self._checkpoints[start]
+            self._lines.resize(checkpoint.num_lines)
+            if checkpoint.num_lines > 0:
+                self._lines[checkpoint.num_lines - 1] = checkpoint.last_line
+                scanned_lines = checkpoint.num_lines - 1
+            self._blocks.resize(checkpoint.num_blocks)
+            self._block_details.resize(checkpoint.num_block_details)
+            self._last_is_soft_break = checkpoint.last_is_soft_break
+            max_x = checkpoint.max_x
+            max_block_y = checkpoint.max_block_y
+            scanned_blocks = checkpoint.num_blocks
+            self._checkpoints.resize(start)
+
+        for i in range(start, num_blocks):
+            self._save_checkpoint(&scanned_lines, &scanned_blocks, &max_x, &max_block_y)
+            self._process_block(&doc.children[i], 0, False)
+            if i + 1 < num_blocks and ctime.monotonic_ns() > deadline and \
+               (self._stale_valid or self._lines.back().y > visible_bottom):
+                end = i + 1
+                break
+
+        self._laid_out_blocks = end
+        self._layout_complete = end == num_blocks
+        if not self._layout_complete:
+            self.context.viewport.request_redraw(0.)
+
+        # State to resume from, on the next frame or after append()
+        self._save_checkpoint(&scanned_lines, &scanned_blocks, &max_x, &max_block_y)
 
         # Compute the size
-        self.state.cur.rect_size.x = 0
-        self.state.cur.rect_size.y = 0
+        if not self._lines.empty() and not self._lines.back().items.empty():
+            max_x = fmax(max_x, self._lines.back().items.back().x + self._lines.back().items.back().width)
 
-        for i in range(<int>self._lines.size()):
-            if self._lines[i].items.empty():
-                continue  # Skip empty lines
-            self.state.cur.rect_size.x = fmax(self.state.cur.rect_size.x, self._lines[i].items.back().x + self._lines[i].items.back().width)
+        self.state.cur.rect_size.x = max_x
+        self.state.cur.rect_size.y = 0
         if self._lines.size() > 0:
             self.state.cur.rect_size.y = self._lines.back().y + self._lines.back().height
-        for i in range(<int>self._blocks.size()):
-            self.state.cur.rect_size.y = fmax(self.state.cur.rect_size.y, self._blocks[i].ymax)
+        self.state.cur.rect_size.y = fmax(self.state.cur.rect_size.y, max_block_y)
+
+        if self._layout_complete:
+            self._stale_valid = False
+            self._stale_lines.clear()
+            self._stale_blocks.clear()
+            self._stale_block_details.clear()
+        elif self._stale_valid:
+            # Do not shrink the scrolling area until done
+            self.state.cur.rect_size.x = fmax(self.state.cur.rect_size.x,
+                                              fmin(self._stale_rect_size.x, self._last_width))
+            self.state.cur.rect_size.y = fmax(self.state.cur.rect_size.y, self._stale_rect_size.y)
 
         self._rect_size = self.state.cur.rect_size
 
-        # Pop the font after processing
-        if <object>applicable_font is not None:
-            (<baseFont>applicable_font).pop()
-
     # Rendering
     cdef bint draw_item(self) noexcept nogil:
         """Draw the markdown content"""
@@ -2140,45 +2517,74 @@ cdef class MarkDownText(uiItem):
         cdef uint32_t border_color = imgui.GetColorU32(imgui.GetStyleColorVec4(imgui.ImGuiCol_Border))
         cdef float border_size = imgui.GetStyle().ChildBorderSize
 
-        # Before rendering the text (lines), render the background
-        for i in range(<int>self._blocks.size()):
-            item_pos.x = initial_pos_backup.x + self._blocks[i].x
-            item_pos.y = initial_pos_backup.y + self._blocks[i].ymin
+        cdef float clip_min_y = draw_list.GetClipRectMin().y - initial_pos_backup.y
+        cdef float clip_max_y = draw_list.GetClipRectMax().y - initial_pos_backup.y
+
+        # While the layout is in progress, draw the previous
+        # one if the new one does not reach the visible area yet.
+        cdef vector[MDProcessedLine] *lines = &self._lines
+        cdef vector[MDProcessedBlock] *blocks = &self._blocks
+        cdef vector[MDProcessedBlockDetail] *block_details = &self._block_details
+        cdef bint use_stale = not self._layout_complete and self._stale_valid and \
+            (self._lines.empty() or self._lines.back().y < clip_max_y)
+        if use_stale:
+            lines = &self._stale_lines
+            blocks = &self._stale_blocks
+            block_details = &self._stale_block_details
+            # It was made for another width
+            imgui.PushClipRect(initial_pos_backup,
+                               imgui.ImVec2(initial_pos_backup.x + self.state.cur.rect_size.x,
+                                            initial_pos_backup.y + self.state.cur.rect_size.y),
+                               True)
+
+        # Before rendering the text (lines), render the background.
+        # Parents are drawn before their children.
+        for i in range(<int>blocks[0].size() - 1, -1, -1):
+            item_pos.x = initial_pos_backup.x + blocks[0][i].x
+            item_pos.y = initial_pos_backup.y + blocks[0][i].ymin
             if not imgui.IsRectVisible(item_pos,
                                        imgui.ImVec2(max_available_x,
-                                                    initial_pos_backup.y + self._blocks[i].ymax)):
+                                                    initial_pos_backup.y + blocks[0][i].ymax)):
                 continue  # Skip invisible blocks
-            if self._blocks[i].type == MD_BLOCKTYPE_EXT.MD_BLOCK_CODE:
+            if blocks[0][i].type == MD_BLOCKTYPE_EXT.MD_BLOCK_CODE:
                 # Draw code block background
                 t_draw_rect(self.context, draw_list,
                             item_pos.x + 0.5 * border_size, item_pos.y + 0.5 * border_size,
-                            max_available_x - 0.5 * border_size, initial_pos_backup.y + self._blocks[i].ymax - 0.5 * border_size,
+                            max_available_x - 0.5 * border_size, initial_pos_backup.y + blocks[0][i].ymax - 0.5 * border_size,
                             None, border_color,
                             color_table[<int32_t>TextColorIndex.CODE_BACKGROUND],
                             border_size, 0)
-            elif self._blocks[i].type == MD_BLOCKTYPE_EXT.MD_BLOCK_QUOTE:
+            elif blocks[0][i].type == MD_BLOCKTYPE_EXT.MD_BLOCK_QUOTE:
                 # Draw quote block background
                 t_draw_line(self.context, draw_list,
                             item_pos.x + 0.5 * global_scale_backup * imgui.GetStyle().SeparatorTextBorderSize,
                             item_pos.y + 0.5 * global_scale_backup * imgui.GetStyle().SeparatorTextBorderSize,
                             item_pos.x + 0.5 * global_scale_backup * imgui.GetStyle().SeparatorTextBorderSize,
-                            initial_pos_backup.y + self._blocks[i].ymax - 0.5 * global_scale_backup * imgui.GetStyle().SeparatorTextBorderSize,
+                            initial_pos_backup.y + blocks[0][i].ymax - 0.5 * global_scale_backup * imgui.GetStyle().SeparatorTextBorderSize,
                             None, border_color,
                             global_scale_backup * imgui.GetStyle().SeparatorTextBorderSize)
 
 
-        for i in range(<int>self._lines.size()):
-            line = &self._lines[i]
+        # Lines are sorted by y and do not overlap:
+        # bisect for the first visible line.
+        cdef int32_t first_line = 0, last_line = lines[0].size(), mid_line
+        while first_line < last_line:
+            mid_line = (first_line + last_line) // 2
+            if lines[0][mid_line].y + lines[0][mid_line].height < clip_min_y:
+                first_line = mid_line + 1
+            else:
+                last_line = mid_line
+
+        for i in range(first_line, <int>lines[0].size()):
+            line = &lines[0][i]
+            if line.y > clip_max_y:
+                break # All next lines are invisible
             if line.items.empty():
                 continue  # Skip empty lines
-            
+
             item_pos.y = initial_pos_backup.y + line.y
             item_pos.x = initial_pos_backup.x + line.items[0].x
 
-            # Skip invisible lines
-            if not imgui.IsRectVisible(item_pos, imgui.ImVec2(item_pos.x + self.state.cur.rect_size.x, item_pos.y + line.height)):
-                continue
-
             last_strikethrough = False
             last_underline = False
             last_x = item_pos.x
@@ -2213,7 +2619,7 @@ cdef class MarkDownText(uiItem):
                     if <int32_t>item.text_type & <int32_t>MDTextType.MD_TEXT_LINK:
                         # Use imgui link feature. Assumes the size is the same as AddText.
                         imgui.SetCursorScreenPos(item_pos)
-                        imgui.TextLinkOpenURL(item.text.c_str(), <const char*> NULL if item.uuid == 0 or self._block_details[item.uuid - 1].attr1.size() == 0 else self._block_details[item.uuid - 1].attr1.c_str())
+                        imgui.TextLinkOpenURL(item.text.c_str(), <const char*> NULL if item.uuid == 0 or block_details[0][item.uuid - 1].attr1.size() == 0 else block_details[0][item.uuid - 1].attr1.c_str())
                         last_x = item_pos.x + item_size.x
                         continue
                     # Draw the text with the appropriate font and color
@@ -2285,6 +2691,9 @@ cdef class MarkDownText(uiItem):
 
                 last_x = item_pos.x + item_size.x
 
+        if use_stale:
+            imgui.PopClipRect()
+
         self.context.viewport.global_scale = global_scale_backup
 
         if font_to_pop != NULL:
@@ -240,6 +240,7 @@ cdef class PlotAxisConfig(baseItem):
     def enabled(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._enabled = value
 
     @property
@@ -261,6 +262,7 @@ cdef class PlotAxisConfig(baseItem):
     def scale(self, AxisScale value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value == AxisScale.LINEAR or \
            value == AxisScale.TIME or \
            value == AxisScale.LOG10 or\
@@ -286,6 +288,7 @@ cdef class PlotAxisConfig(baseItem):
     def min(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._min = value
         self._dirty_minmax = True
 
@@ -306,6 +309,7 @@ cdef class PlotAxisConfig(baseItem):
     def max(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._max = value
         self._dirty_minmax = True
 
@@ -326,6 +330,7 @@ cdef class PlotAxisConfig(baseItem):
     def constraint_min(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._constraint_min = value
 
     @property
@@ -345,6 +350,7 @@ cdef class PlotAxisConfig(baseItem):
     def constraint_max(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._constraint_max = value
 
     @property
@@ -364,6 +370,7 @@ cdef class PlotAxisConfig(baseItem):
     def zoom_min(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._zoom_min = value
 
     @property
@@ -383,6 +390,7 @@ cdef class PlotAxisConfig(baseItem):
     def zoom_max(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._zoom_max = value
 
     @property
@@ -401,6 +409,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_label(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoLabel
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoLabel
@@ -421,6 +430,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_gridlines(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoGridLines
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoGridLines
@@ -441,6 +451,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_tick_marks(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoTickMarks
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoTickMarks
@@ -462,6 +473,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_tick_labels(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoTickLabels
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoTickLabels
@@ -483,6 +495,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_initial_fit(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         # NOTE: NoInitialFit is ignored since we use linked axes
         # _to_fit does all the job.
         self._flags &= ~implot.ImPlotAxisFlags_NoInitialFit
@@ -506,6 +519,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_menus(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoMenus
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoMenus
@@ -526,6 +540,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_side_switch(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoSideSwitch
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoSideSwitch
@@ -547,6 +562,7 @@ cdef class PlotAxisConfig(baseItem):
     def no_highlight(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_NoHighlight
         if value:
             self._flags |= implot.ImPlotAxisFlags_NoHighlight
@@ -568,6 +584,7 @@ cdef class PlotAxisConfig(baseItem):
     def opposite(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_Opposite
         if value:
             self._flags |= implot.ImPlotAxisFlags_Opposite
@@ -589,6 +606,7 @@ cdef class PlotAxisConfig(baseItem):
     def foreground_grid(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_Foreground
         if value:
             self._flags |= implot.ImPlotAxisFlags_Foreground
@@ -611,6 +629,7 @@ cdef class PlotAxisConfig(baseItem):
     def invert(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_Invert
         if value:
             self._flags |= implot.ImPlotAxisFlags_Invert
@@ -632,6 +651,7 @@ cdef class PlotAxisConfig(baseItem):
     def auto_fit(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_AutoFit
         if value:
             self._flags |= implot.ImPlotAxisFlags_AutoFit
@@ -653,6 +673,7 @@ cdef class PlotAxisConfig(baseItem):
     def restrict_fit_to_range(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_RangeFit
         if value:
             self._flags |= implot.ImPlotAxisFlags_RangeFit
@@ -674,6 +695,7 @@ cdef class PlotAxisConfig(baseItem):
     def pan_stretch(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_PanStretch
         if value:
             self._flags |= implot.ImPlotAxisFlags_PanStretch
@@ -694,6 +716,7 @@ cdef class PlotAxisConfig(baseItem):
     def lock_min(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_LockMin
         if value:
             self._flags |= implot.ImPlotAxisFlags_LockMin
@@ -714,6 +737,7 @@ cdef class PlotAxisConfig(baseItem):
     def lock_max(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotAxisFlags_LockMax
         if value:
             self._flags |= implot.ImPlotAxisFlags_LockMax
@@ -810,6 +834,7 @@ cdef class PlotAxisConfig(baseItem):
     def label(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._label = string_from_str(value)
 
     @property
@@ -829,6 +854,7 @@ cdef class PlotAxisConfig(baseItem):
     def tick_format(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._format = string_from_str(value)
 
     @property
@@ -853,6 +879,7 @@ cdef class PlotAxisConfig(baseItem):
         cdef unique_lock[DCGMutex] m
         cdef int32_t i
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._labels.clear()
         self._labels_cstr.clear()
         if value is None:
@@ -886,6 +913,7 @@ cdef class PlotAxisConfig(baseItem):
     def labels_coord(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._labels_coord.clear()
         if value is None:
             return
@@ -923,6 +951,7 @@ cdef class PlotAxisConfig(baseItem):
     def labels_major(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._labels_major.clear()
         if value is None:
             return
@@ -949,6 +978,7 @@ cdef class PlotAxisConfig(baseItem):
     def keep_default_ticks(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._keep_default_ticks = value
 
     @property
@@ -975,6 +1005,7 @@ cdef class PlotAxisConfig(baseItem):
     def linked_axis(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is not None and \
            not(isinstance(value, PlotAxisConfig)):
             raise TypeError(f"Invalid type {type(value)} passed as linked_axis. Expected PlotAxisConfig")
@@ -1200,6 +1231,7 @@ cdef class PlotLegendConfig(baseItem):
     def show(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(value) and self._show:
             self.set_hidden_and_propagate_to_siblings_no_handlers()
         self._show = value
@@ -1223,6 +1255,7 @@ cdef class PlotLegendConfig(baseItem):
     def location(self, LegendLocation value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value == LegendLocation.CENTER or \
            value == LegendLocation.NORTH or \
            value == LegendLocation.SOUTH or \
@@ -1253,6 +1286,7 @@ cdef class PlotLegendConfig(baseItem):
     def no_buttons(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_NoButtons
         if value:
             self._flags |= implot.ImPlotLegendFlags_NoButtons
@@ -1274,6 +1308,7 @@ cdef class PlotLegendConfig(baseItem):
     def no_highlight_item(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_NoHighlightItem
         if value:
             self._flags |= implot.ImPlotLegendFlags_NoHighlightItem
@@ -1294,6 +1329,7 @@ cdef class PlotLegendConfig(baseItem):
     def no_highlight_axis(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_NoHighlightAxis
         if value:
             self._flags |= implot.ImPlotLegendFlags_NoHighlightAxis
@@ -1315,6 +1351,7 @@ cdef class PlotLegendConfig(baseItem):
     def no_menus(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_NoMenus
         if value:
             self._flags |= implot.ImPlotLegendFlags_NoMenus
@@ -1336,6 +1373,7 @@ cdef class PlotLegendConfig(baseItem):
     def outside(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_Outside
         if value:
             self._flags |= implot.ImPlotLegendFlags_Outside
@@ -1357,6 +1395,7 @@ cdef class PlotLegendConfig(baseItem):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotLegendFlags_Horizontal
@@ -1378,6 +1417,7 @@ cdef class PlotLegendConfig(baseItem):
     def sorted(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLegendFlags_Sort
         if value:
             self._flags |= implot.ImPlotLegendFlags_Sort
@@ -1462,6 +1502,7 @@ cdef class Plot(uiItem):
     def X1(self, PlotAxisConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._X1 = value
 
     @property
@@ -1481,6 +1522,7 @@ cdef class Plot(uiItem):
     def X2(self, PlotAxisConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._X2 = value
 
     @property
@@ -1500,6 +1542,7 @@ cdef class Plot(uiItem):
     def X3(self, PlotAxisConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._X3 = value
 
     @property
@@ -1519,6 +1562,7 @@ cdef class Plot(uiItem):
     def Y1(self, PlotAxisConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._Y1 = value
 
     @property
@@ -1538,6 +1582,7 @@ cdef class Plot(uiItem):
     def Y2(self, PlotAxisConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._Y2 = value
 
     @property
@@ -1557,6 +1602,7 @@ cdef class Plot(uiItem):
     def Y3(self, PlotAxisConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._Y3 = value
 
     @property
@@ -1590,6 +1636,7 @@ cdef class Plot(uiItem):
     def legend_config(self, PlotLegendConfig value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._legend = value
 
     @property
@@ -1609,6 +1656,7 @@ cdef class Plot(uiItem):
     def pan_button(self, button):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_MouseButton(button)):
             raise ValueError(f"pan_button must be a MouseButton, not {button}")
         if <int>button < 0 or <int>button >= imgui.ImGuiMouseButton_COUNT:
@@ -1632,6 +1680,7 @@ cdef class Plot(uiItem):
     def pan_mod(self, modifier):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_KeyMod(modifier)):
             raise ValueError(f"pan_mod must be a combinaison of modifiers (KeyMod), not {modifier}")
         self._pan_modifier = <int>make_KeyMod(modifier)
@@ -1653,6 +1702,7 @@ cdef class Plot(uiItem):
     def fit_button(self, button):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_MouseButton(button)):
             raise ValueError(f"fit_button must be a MouseButton, not {button}")
         if <int>button < 0 or <int>button >= imgui.ImGuiMouseButton_COUNT:
@@ -1676,6 +1726,7 @@ cdef class Plot(uiItem):
     def menu_button(self, button):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_MouseButton(button)):
             raise ValueError(f"menu_button must be a MouseButton, not {button}")
         if <int>button < 0 or <int>button >= imgui.ImGuiMouseButton_COUNT:
@@ -1704,6 +1755,7 @@ cdef class Plot(uiItem):
     def has_box_select(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value:
             self._flags &= ~implot.ImPlotFlags_NoBoxSelect
         else:
@@ -1725,6 +1777,7 @@ cdef class Plot(uiItem):
     def select_button(self, button):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_MouseButton(button)):
             raise ValueError(f"select_button must be a MouseButton, not {button}")
         if <int>button < 0 or <int>button >= imgui.ImGuiMouseButton_COUNT:
@@ -1748,6 +1801,7 @@ cdef class Plot(uiItem):
     def select_cancel_button(self, button):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_MouseButton(button)):
             raise ValueError(f"select_cancel_button must be a MouseButton, not {button}")
         if <int>button < 0 or <int>button >= imgui.ImGuiMouseButton_COUNT:
@@ -1771,6 +1825,7 @@ cdef class Plot(uiItem):
     def select_mod(self, modifier):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_KeyMod(modifier)):
             raise ValueError(f"select_mod must be a combination of modifiers (KeyMod), not {modifier}")
         self._select_mod = <int>make_KeyMod(modifier)
@@ -1791,6 +1846,7 @@ cdef class Plot(uiItem):
     def select_hmod(self, modifier):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_KeyMod(modifier)):
             raise ValueError(f"select_hmod must be a combination of modifiers (KeyMod), not {modifier}")
         self._select_hmod = <int>make_KeyMod(modifier)
@@ -1811,6 +1867,7 @@ cdef class Plot(uiItem):
     def select_vmod(self, modifier):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_KeyMod(modifier)):
             raise ValueError(f"select_vmod must be a combination of modifiers (KeyMod), not {modifier}")
         self._select_vmod = <int>make_KeyMod(modifier)
@@ -1832,6 +1889,7 @@ cdef class Plot(uiItem):
     def zoom_mod(self, modifier):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_KeyMod(modifier)):
             raise ValueError(f"zoom_mod must be a combinaison of modifiers (KeyMod), not {modifier}")
         self._zoom_mod = <int>make_KeyMod(modifier)
@@ -1853,6 +1911,7 @@ cdef class Plot(uiItem):
     def zoom_rate(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._zoom_rate = value
 
     @property
@@ -1870,6 +1929,7 @@ cdef class Plot(uiItem):
     def use_local_time(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._use_local_time = value
 
     @property
@@ -1887,6 +1947,7 @@ cdef class Plot(uiItem):
     def use_ISO8601(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._use_ISO8601 = value
 
     @property
@@ -1904,6 +1965,7 @@ cdef class Plot(uiItem):
     def use_24hour_clock(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._use_24hour_clock = value
 
     @property
@@ -1923,6 +1985,7 @@ cdef class Plot(uiItem):
     def no_title(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_NoTitle
         if value:
             self._flags |= implot.ImPlotFlags_NoTitle
@@ -1944,6 +2007,7 @@ cdef class Plot(uiItem):
     def no_menus(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_NoMenus
         if value:
             self._flags |= implot.ImPlotFlags_NoMenus
@@ -1965,6 +2029,7 @@ cdef class Plot(uiItem):
     def no_mouse_pos(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_NoMouseText
         if value:
             self._flags |= implot.ImPlotFlags_NoMouseText
@@ -1986,6 +2051,7 @@ cdef class Plot(uiItem):
     def crosshairs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_Crosshairs
         if value:
             self._flags |= implot.ImPlotFlags_Crosshairs
@@ -2007,6 +2073,7 @@ cdef class Plot(uiItem):
     def equal_aspects(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_Equal
         if value:
             self._flags |= implot.ImPlotFlags_Equal
@@ -2028,6 +2095,7 @@ cdef class Plot(uiItem):
     def no_inputs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_NoInputs
         if value:
             self._flags |= implot.ImPlotFlags_NoInputs
@@ -2049,6 +2117,7 @@ cdef class Plot(uiItem):
     def no_frame(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_NoFrame
         if value:
             self._flags |= implot.ImPlotFlags_NoFrame
@@ -2070,6 +2139,7 @@ cdef class Plot(uiItem):
     def no_legend(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotFlags_NoLegend
         if value:
             self._flags |= implot.ImPlotFlags_NoLegend
@@ -2091,6 +2161,7 @@ cdef class Plot(uiItem):
     def mouse_location(self, LegendLocation value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value == LegendLocation.CENTER or \
            value == LegendLocation.NORTH or \
            value == LegendLocation.SOUTH or \
@@ -2259,6 +2330,7 @@ cdef class plotElementWithLegend(plotElement):
     def no_legend(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._legend = not(value)
         # unsure if needed
         self._flags &= ~implot.ImPlotItemFlags_NoLegend
@@ -2282,6 +2354,7 @@ cdef class plotElementWithLegend(plotElement):
     def ignore_fit(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotItemFlags_NoFit
         if value:
             self._flags |= implot.ImPlotItemFlags_NoFit
@@ -2304,6 +2377,7 @@ cdef class plotElementWithLegend(plotElement):
     def enabled(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value != self._enabled:
             self._enabled_dirty = True
         self._enabled = value
@@ -2325,6 +2399,7 @@ cdef class plotElementWithLegend(plotElement):
     def font(self, baseFont value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._font = value
 
     @property
@@ -2343,6 +2418,7 @@ cdef class plotElementWithLegend(plotElement):
     def legend_button(self, button):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(is_MouseButton(button)):
             raise ValueError(f"legend_button must be a MouseButton, not {button}")
         if <int>button < 0 or <int>button >= imgui.ImGuiMouseButton_COUNT:
@@ -2488,6 +2564,7 @@ cdef class plotElementXY(plotElementWithLegend):
     def X(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._X.reset()
         else:
@@ -2510,6 +2587,7 @@ cdef class plotElementXY(plotElementWithLegend):
     def Y(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._Y.reset()
         else:
@@ -2552,6 +2630,7 @@ cdef class PlotLine(plotElementXY):
     def segments(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLineFlags_Segments
         if value:
             self._flags |= implot.ImPlotLineFlags_Segments
@@ -2573,6 +2652,7 @@ cdef class PlotLine(plotElementXY):
     def loop(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLineFlags_Loop
         if value:
             self._flags |= implot.ImPlotLineFlags_Loop
@@ -2594,6 +2674,7 @@ cdef class PlotLine(plotElementXY):
     def skip_nan(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLineFlags_SkipNaN
         if value:
             self._flags |= implot.ImPlotLineFlags_SkipNaN
@@ -2615,6 +2696,7 @@ cdef class PlotLine(plotElementXY):
     def no_clip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLineFlags_NoClip
         if value:
             self._flags |= implot.ImPlotLineFlags_NoClip
@@ -2636,6 +2718,7 @@ cdef class PlotLine(plotElementXY):
     def shaded(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotLineFlags_Shaded
         if value:
             self._flags |= implot.ImPlotLineFlags_Shaded
@@ -2703,6 +2786,7 @@ cdef class plotElementXYY(plotElementWithLegend):
     def X(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._X.reset()
         else:
@@ -2725,6 +2809,7 @@ cdef class plotElementXYY(plotElementWithLegend):
     def Y1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._Y1.reset()
         else:
@@ -2747,6 +2832,7 @@ cdef class plotElementXYY(plotElementWithLegend):
     def Y2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._Y2.reset()
         else:
@@ -2838,6 +2924,7 @@ cdef class PlotStems(plotElementXY):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotStemsFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotStemsFlags_Horizontal
@@ -2915,6 +3002,7 @@ cdef class PlotBars(plotElementXY):
     def weight(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._weight = value
 
     @property
@@ -2934,6 +3022,7 @@ cdef class PlotBars(plotElementXY):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotBarsFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotBarsFlags_Horizontal
@@ -3008,6 +3097,7 @@ cdef class PlotStairs(plotElementXY):
     def pre_step(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotStairsFlags_PreStep
         if value:
             self._flags |= implot.ImPlotStairsFlags_PreStep
@@ -3030,6 +3120,7 @@ cdef class PlotStairs(plotElementXY):
     def shaded(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotStairsFlags_Shaded
         if value:
             self._flags |= implot.ImPlotStairsFlags_Shaded
@@ -3095,6 +3186,7 @@ cdef class plotElementX(plotElementWithLegend):
     def X(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._X.reset()
         else:
@@ -3130,6 +3222,7 @@ cdef class PlotInfLines(plotElementX):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotInfLinesFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotInfLinesFlags_Horizontal
@@ -3197,6 +3290,7 @@ cdef class PlotScatter(plotElementXY):
     def no_clip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotScatterFlags_NoClip
         if value:
             self._flags |= implot.ImPlotScatterFlags_NoClip
@@ -3277,6 +3371,7 @@ cdef class DrawInPlot(plotElementWithLegend):
     def ignore_fit(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._ignore_fit = value
 
     cdef void draw(self) noexcept nogil:
@@ -3397,6 +3492,7 @@ cdef class Subplots(uiItem):
     def rows(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 1:
             raise ValueError("Rows must be > 0")
         self._rows = value
@@ -3418,6 +3514,7 @@ cdef class Subplots(uiItem):
     def cols(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 1:
             raise ValueError("Columns must be > 0")
         self._cols = value
@@ -3443,6 +3540,7 @@ cdef class Subplots(uiItem):
     def row_ratios(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._row_ratios.clear()
         cdef float v
         if PySequence_Check(value) > 0:
@@ -3474,6 +3572,7 @@ cdef class Subplots(uiItem):
     def col_ratios(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._col_ratios.clear()
         cdef float v
         if PySequence_Check(value) > 0:
@@ -3514,6 +3613,7 @@ cdef class Subplots(uiItem):
     def no_title(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_NoTitle
         if value:
             self._flags |= implot.ImPlotSubplotFlags_NoTitle
@@ -3535,7 +3635,8 @@ cdef class Subplots(uiItem):
     @no_menus.setter
     def no_menus(self, bint value):
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self.mutex) 
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_NoMenus
         if value:
             self._flags |= implot.ImPlotSubplotFlags_NoMenus
@@ -3558,6 +3659,7 @@ cdef class Subplots(uiItem):
     def no_resize(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_NoResize
         if value:
             self._flags |= implot.ImPlotSubplotFlags_NoResize
@@ -3580,6 +3682,7 @@ cdef class Subplots(uiItem):
     def no_align(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_NoAlign
         if value:
             self._flags |= implot.ImPlotSubplotFlags_NoAlign
@@ -3602,6 +3705,7 @@ cdef class Subplots(uiItem):
     def col_major(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_ColMajor
         if value:
             self._flags |= implot.ImPlotSubplotFlags_ColMajor
@@ -3624,6 +3728,7 @@ cdef class Subplots(uiItem):
     def share_legends(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_ShareItems
         if value:
             self._flags |= implot.ImPlotSubplotFlags_ShareItems
@@ -3647,6 +3752,7 @@ cdef class Subplots(uiItem):
     def share_x_all(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_LinkAllX
         if value:
             self._flags |= implot.ImPlotSubplotFlags_LinkAllX
@@ -3669,6 +3775,7 @@ cdef class Subplots(uiItem):
     def share_rows(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_LinkRows
         if value:
             self._flags |= implot.ImPlotSubplotFlags_LinkRows
@@ -3691,6 +3798,7 @@ cdef class Subplots(uiItem):
     def share_cols(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_LinkCols
         if value:
             self._flags |= implot.ImPlotSubplotFlags_LinkCols
@@ -3713,6 +3821,7 @@ cdef class Subplots(uiItem):
     def share_y_all(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotSubplotFlags_LinkAllY
         if value:
             self._flags |= implot.ImPlotSubplotFlags_LinkAllY
@@ -3919,6 +4028,7 @@ cdef class PlotBarGroups(plotElementWithLegend):
     def values(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._values.reset()
         else:
@@ -3949,6 +4059,7 @@ cdef class PlotBarGroups(plotElementWithLegend):
     def labels(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         cdef int32_t i, k
         self._labels.clear()
         if value is None:
@@ -3981,6 +4092,7 @@ cdef class PlotBarGroups(plotElementWithLegend):
     def group_size(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._group_size = value
 
     @property
@@ -4001,6 +4113,7 @@ cdef class PlotBarGroups(plotElementWithLegend):
     def shift(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._shift = value
 
     @property
@@ -4022,6 +4135,7 @@ cdef class PlotBarGroups(plotElementWithLegend):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotBarGroupsFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotBarGroupsFlags_Horizontal
@@ -4044,6 +4158,7 @@ cdef class PlotBarGroups(plotElementWithLegend):
     def stacked(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotBarGroupsFlags_Stacked
         if value:
             self._flags |= implot.ImPlotBarGroupsFlags_Stacked
@@ -4129,6 +4244,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def values(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._values.reset()
         else:
@@ -4159,6 +4275,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def labels(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._labels.clear()
         cdef int32_t k
         if value is None:
@@ -4187,6 +4304,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def x(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._x = value
 
     @property
@@ -4205,6 +4323,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def y(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._y = value
 
     @property
@@ -4223,6 +4342,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def radius(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._radius = value
 
     @property
@@ -4242,6 +4362,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def angle(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._angle = value
 
     @property
@@ -4262,6 +4383,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def normalize(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotPieChartFlags_Normalize
         if value:
             self._flags |= implot.ImPlotPieChartFlags_Normalize
@@ -4283,6 +4405,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def ignore_hidden(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotPieChartFlags_IgnoreHidden
         if value:
             self._flags |= implot.ImPlotPieChartFlags_IgnoreHidden
@@ -4304,6 +4427,7 @@ cdef class PlotPieChart(plotElementWithLegend):
     def label_format(self, str value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._label_format = string_from_str(value)
 
     cdef void draw_element(self) noexcept nogil:
@@ -4441,6 +4565,7 @@ cdef class PlotErrorBars(plotElementXY):
     def positives(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._pos.reset()
         else:
@@ -4464,6 +4589,7 @@ cdef class PlotErrorBars(plotElementXY):
     def negatives(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._neg.reset()
         else: 
@@ -4487,6 +4613,7 @@ cdef class PlotErrorBars(plotElementXY):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotErrorBarsFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotErrorBarsFlags_Horizontal
@@ -4579,6 +4706,7 @@ cdef class PlotAnnotation(plotElement):
     def x(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._x = value
 
     @property
@@ -4598,6 +4726,7 @@ cdef class PlotAnnotation(plotElement):
     def y(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._y = value
 
     @property
@@ -4617,6 +4746,7 @@ cdef class PlotAnnotation(plotElement):
     def text(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._text = string_from_str(value)
 
     @property
@@ -4639,6 +4769,7 @@ cdef class PlotAnnotation(plotElement):
     def bg_color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._bg_color = parse_color(value)
 
     @property
@@ -4659,6 +4790,7 @@ cdef class PlotAnnotation(plotElement):
     def offset(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if PySequence_Check(value) == 0 or len(value) != 2:
             raise ValueError("Offset must be a 2-tuple")
         self._offset = make_Vec2(value[0], value[1])
@@ -4681,6 +4813,7 @@ cdef class PlotAnnotation(plotElement):
     def clamp(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._clamp = value
 
     cdef void draw_element(self) noexcept nogil:
@@ -4730,6 +4863,7 @@ cdef class PlotHistogram(plotElementX):
     def bins(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < -4:
             raise ValueError("Invalid bins value")
         self._bins = value
@@ -4751,6 +4885,7 @@ cdef class PlotHistogram(plotElementX):
     def bar_scale(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._bar_scale = value
 
     @property 
@@ -4773,6 +4908,7 @@ cdef class PlotHistogram(plotElementX):
     def range(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._has_range = False
             return
@@ -4800,6 +4936,7 @@ cdef class PlotHistogram(plotElementX):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHistogramFlags_Horizontal
         if value:
             self._flags |= implot.ImPlotHistogramFlags_Horizontal
@@ -4822,6 +4959,7 @@ cdef class PlotHistogram(plotElementX):
     def cumulative(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHistogramFlags_Cumulative
         if value:
             self._flags |= implot.ImPlotHistogramFlags_Cumulative
@@ -4844,6 +4982,7 @@ cdef class PlotHistogram(plotElementX):
     def density(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHistogramFlags_Density
         if value:
             self._flags |= implot.ImPlotHistogramFlags_Density
@@ -4866,6 +5005,7 @@ cdef class PlotHistogram(plotElementX):
     def no_outliers(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHistogramFlags_NoOutliers
         if value:
             self._flags |= implot.ImPlotHistogramFlags_NoOutliers
@@ -4959,6 +5099,7 @@ cdef class PlotHistogram2D(plotElementXY):
     def x_bins(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < -4:
             raise ValueError("Invalid x_bins value")
         self._x_bins = value
@@ -4983,6 +5124,7 @@ cdef class PlotHistogram2D(plotElementXY):
     def y_bins(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < -4:
             raise ValueError("Invalid y_bins value")
         self._y_bins = value
@@ -5007,6 +5149,7 @@ cdef class PlotHistogram2D(plotElementXY):
     def range_x(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._has_range_x = False
             return
@@ -5036,6 +5179,7 @@ cdef class PlotHistogram2D(plotElementXY):
     def range_y(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._has_range_y = False
             return
@@ -5063,6 +5207,7 @@ cdef class PlotHistogram2D(plotElementXY):
     def density(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHistogramFlags_Density
         if value:
             self._flags |= implot.ImPlotHistogramFlags_Density
@@ -5085,6 +5230,7 @@ cdef class PlotHistogram2D(plotElementXY):
     def no_outliers(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHistogramFlags_NoOutliers
         if value:
             self._flags |= implot.ImPlotHistogramFlags_NoOutliers
@@ -5198,6 +5344,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def values(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._values.reset()
             self._rows = self._cols = 0
@@ -5228,6 +5375,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def scale_min(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scale_min = value
         self._auto_scale = (value == 0 and self._scale_max == 0)
 
@@ -5249,6 +5397,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def scale_max(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scale_max = value
         self._auto_scale = (value == 0 and self._scale_min == 0)
 
@@ -5269,6 +5418,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def label_format(self, str value not None):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._label_format = string_from_str(value)
 
     @property
@@ -5288,6 +5438,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def bounds_min(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if PySequence_Check(value) == 0 or len(value) != 2:
             raise ValueError("bounds_min must be a 2-tuple")
         self._bounds_min[0] = value[0]
@@ -5310,6 +5461,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def bounds_max(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if PySequence_Check(value) == 0 or len(value) != 2:
             raise ValueError("bounds_max must be a 2-tuple")
         self._bounds_max[0] = value[0]
@@ -5333,6 +5485,7 @@ cdef class PlotHeatmap(plotElementWithLegend):
     def col_major(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~implot.ImPlotHeatmapFlags_ColMajor
         if value:
             self._flags |= implot.ImPlotHeatmapFlags_ColMajor
@@ -16,17 +16,19 @@
 #distutils: language=c++
 
 from libc.stdint cimport int32_t
+from cpython.object cimport PyObject
 from libcpp.cmath cimport fabs, pow, fmod
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
-from .core cimport uiItem, lock_gil_friendly
+from .core cimport uiItem, lock_gil_friendly, record_sizing_read
 from .c_types cimport unique_lock, DCGMutex
 from .imgui cimport get_theme_style_float, get_theme_style_vec2
 from .types cimport Vec2
 
 from .imgui_types import ImGuiStyleIndex as _ImGuiStyleIndex
 
+from collections import OrderedDict as _OrderedDict
 from inspect import currentframe as _currentframe
 
 cdef class baseSizing:
@@ -73,20 +75,16 @@ cdef class baseSizing:
         """
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
 
-        # Avoid recomputing multiple times in the same frame.
-        # Only the previous frame affects computation.
         if self._frozen:
             return self._current_value
 
-        cdef float current_value = self._current_value
-
+        # Changes do not require to redraw: the sizings reading
+        # item states record the read (record_sizing_read), and
+        # only values read before the item is done rendering
+        # (and which then change) need another rendering pass.
         if self._update_value != baseSizing._update_value:
             self._current_value = self._update_value(target)
 
-        if current_value != self._current_value:
-            # Possibility of cascading updates
-            target.context.viewport.redraw_needed = True
-
         return self._current_value
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
@@ -105,7 +103,7 @@ cdef class baseSizing:
         elif isinstance(value, (int, float)):
             return FixedSize(value)
         elif isinstance(value, str):
-            return parse_size(value)
+            return compile_size(value)
         raise TypeError(f"Cannot convert {value!r} to baseSizing")
 
     # Operator overloading for composition
@@ -534,6 +532,7 @@ cdef class ParentHeight(baseSizing):
             return target.context.viewport.get_size().y
         if target.parent is None or target.parent.p_state is NULL:
             return 0. # Shouldn't happen, but just in case
+        record_sizing_read(target.parent, target)
         return target.parent.p_state.cur.rect_size.y
 
     def __repr__(self):
@@ -556,6 +555,7 @@ cdef class ParentWidth(baseSizing):
             return target.context.viewport.get_size().x
         if target.parent is None or target.parent.p_state is NULL:
             return 0. # Shouldn't happen, but just in case
+        record_sizing_read(target.parent, target)
         return target.parent.p_state.cur.rect_size.x
 
     def __repr__(self):
@@ -579,6 +579,7 @@ cdef class ParentX0(baseSizing):
         if target.parent is None or target.parent.p_state is NULL:
             return target.context.viewport.parent_pos.x
         if target.parent.p_state.cap.has_position:
+            record_sizing_read(target.parent, target)
             return target.parent.p_state.cur.pos_to_viewport.x
         # fallback to x1:
         return target.context.viewport.parent_pos.x
@@ -640,6 +641,7 @@ cdef class ParentX3(baseSizing):
         if target.parent is None or target.parent.p_state is NULL:
             return target.context.viewport.parent_pos.x + target.context.viewport.parent_size.x
         if target.parent.p_state.cap.has_position and target.parent.p_state.cap.has_rect_size:
+            record_sizing_read(target.parent, target)
             return target.parent.p_state.cur.pos_to_viewport.x + target.parent.p_state.cur.rect_size.x
         # fallback to x2:
         return target.context.viewport.parent_pos.x + target.context.viewport.parent_size.x
@@ -683,6 +685,7 @@ cdef class ParentY0(baseSizing):
         if target.parent is None or target.parent.p_state is NULL:
             return target.context.viewport.parent_pos.y
         if target.parent.p_state.cap.has_position:
+            record_sizing_read(target.parent, target)
             return target.parent.p_state.cur.pos_to_viewport.y
         # fallback to y1:
         return target.context.viewport.parent_pos.y
@@ -744,6 +747,7 @@ cdef class ParentY3(baseSizing):
         if target.parent is None or target.parent.p_state is NULL:
             return target.context.viewport.parent_pos.y + target.context.viewport.parent_size.y
         if target.parent.p_state.cap.has_position and target.parent.p_state.cap.has_rect_size:
+            record_sizing_read(target.parent, target)
             return target.parent.p_state.cur.pos_to_viewport.y + target.parent.p_state.cur.rect_size.y
         # fallback to y2:
         return target.context.viewport.parent_pos.y + target.context.viewport.parent_size.y
@@ -942,6 +946,7 @@ cdef class RefHeight(baseRefSizing):
             raise TypeError("Cannot reference item without size")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         if self._ref.state.cap.has_rect_size:
             # Use rect_size if available
             return self._ref.state.cur.rect_size.y
@@ -963,6 +968,7 @@ cdef class RefWidth(baseRefSizing):
             raise TypeError("Cannot reference item without size")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         if self._ref.state.cap.has_rect_size:
             # Use rect_size if available
             return self._ref.state.cur.rect_size.x
@@ -989,6 +995,7 @@ cdef class RefX0(baseRefSizing):
             raise TypeError("Cannot reference item without position")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         if self._ref.state.cap.has_position:
             # Use pos_to_viewport if item has position
             return self._ref.state.cur.pos_to_viewport.x
@@ -1018,6 +1025,7 @@ cdef class RefX1(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         # Use content_pos if item has content region, otherwise use pos_to_viewport
         if self._ref.state.cap.has_content_region:
             return self._ref.state.cur.content_pos.x
@@ -1042,6 +1050,7 @@ cdef class RefX2(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         # Use content_pos + content_region_size if item has content region
         if self._ref.state.cap.has_content_region:
             return self._ref.state.cur.content_pos.x + self._ref.state.cur.content_region_size.x
@@ -1070,6 +1079,7 @@ cdef class RefX3(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         if self._ref.state.cap.has_position and self._ref.state.cap.has_rect_size:
             # Use pos_to_viewport + rect_size if item has position
             return self._ref.state.cur.pos_to_viewport.x + self._ref.state.cur.rect_size.x
@@ -1096,6 +1106,7 @@ cdef class RefXC(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         # Use content_pos + content_region_size/2 if item has content region
         if self._ref.state.cap.has_content_region:
             return self._ref.state.cur.content_pos.x + (self._ref.state.cur.content_region_size.x * 0.5)
@@ -1121,6 +1132,7 @@ cdef class RefY0(baseRefSizing):
             raise TypeError("Cannot reference item without position")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         if self._ref.state.cap.has_position:
             return self._ref.state.cur.pos_to_viewport.y
         return self._ref.state.cur.content_pos.y
@@ -1144,6 +1156,7 @@ cdef class RefY1(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         # Use content_pos if item has content region, otherwise use pos_to_viewport
         if self._ref.state.cap.has_content_region:
             return self._ref.state.cur.content_pos.y
@@ -1168,6 +1181,7 @@ cdef class RefY2(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         # Use content_pos + content_region_size if item has content region
         if self._ref.state.cap.has_content_region:
             return self._ref.state.cur.content_pos.y + self._ref.state.cur.content_region_size.y
@@ -1197,6 +1211,7 @@ cdef class RefY3(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         if self._ref.state.cap.has_position and self._ref.state.cap.has_rect_size:
             return self._ref.state.cur.pos_to_viewport.y + self._ref.state.cur.rect_size.y
         if self._ref.state.cap.has_content_region:
@@ -1222,6 +1237,7 @@ cdef class RefYC(baseRefSizing):
             raise TypeError("Cannot reference item without position or content area")
 
     cdef float _update_value(self, uiItem target) noexcept nogil:
+        record_sizing_read(self._ref, target)
         # Use content_pos + content_region_size/2 if item has content region
         if self._ref.state.cap.has_content_region:
             return self._ref.state.cur.content_pos.y + (self._ref.state.cur.content_region_size.y * 0.5)
@@ -1243,6 +1259,7 @@ cdef class SelfHeight(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_rect_size:
             return target.state.cur.rect_size.y
         if target.state.cap.has_content_region:
@@ -1265,6 +1282,7 @@ cdef class SelfWidth(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_rect_size:
             return target.state.cur.rect_size.x
         if target.state.cap.has_content_region:
@@ -1287,6 +1305,7 @@ cdef class SelfX0(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_position:
             return target.state.cur.pos_to_viewport.x
         if target.state.cap.has_content_region:
@@ -1312,6 +1331,7 @@ cdef class SelfX1(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_content_region:
             return target.state.cur.content_pos.x
         if target.state.cap.has_position:
@@ -1334,6 +1354,7 @@ cdef class SelfX2(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_content_region:
             return target.state.cur.content_pos.x + target.state.cur.content_region_size.x
         if target.state.cap.has_position:
@@ -1358,6 +1379,7 @@ cdef class SelfX3(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_position and target.state.cap.has_rect_size:
             return target.state.cur.pos_to_viewport.x + target.state.cur.rect_size.x
         if target.state.cap.has_content_region:
@@ -1382,6 +1404,7 @@ cdef class SelfXC(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_content_region:
             return target.state.cur.content_pos.x + (target.state.cur.content_region_size.x * 0.5)
         if target.state.cap.has_position:
@@ -1407,6 +1430,7 @@ cdef class SelfY0(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_position:
             return target.state.cur.pos_to_viewport.y
         if target.state.cap.has_content_region:
@@ -1432,6 +1456,7 @@ cdef class SelfY1(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_content_region:
             return target.state.cur.content_pos.y
         if target.state.cap.has_position:
@@ -1457,6 +1482,7 @@ cdef class SelfY2(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_content_region:
             return target.state.cur.content_pos.y + target.state.cur.content_region_size.y
         if target.state.cap.has_position:
@@ -1482,6 +1508,7 @@ cdef class SelfY3(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_position and target.state.cap.has_rect_size:
             return target.state.cur.pos_to_viewport.y + target.state.cur.rect_size.y
         if target.state.cap.has_content_region:
@@ -1506,6 +1533,7 @@ cdef class SelfYC(baseSizing):
     cdef float _update_value(self, uiItem target) noexcept nogil:
         if target is None:
             return 0.0
+        record_sizing_read(target, target)
         if target.state.cap.has_content_region:
             return target.state.cur.content_pos.y + (target.state.cur.content_region_size.y * 0.5)
         if target.state.cap.has_position:
@@ -2077,6 +2105,7 @@ cdef class CythonParser:
     cdef vector[Token] tokens
     cdef size_t position
     cdef dict scope
+    cdef list ref_names # Names of the referenced items, in order of appearance
     
     def __cinit__(self, str expr):
         """
@@ -2118,6 +2147,7 @@ cdef class CythonParser:
             self.scope = {**caller_globals, **caller_locals}
 
         self.position = 0
+        self.ref_names = []
         
     cdef Token peek(self) noexcept nogil:
         """
@@ -2220,17 +2250,8 @@ cdef class CythonParser:
         Raises:
             ValueError: If item is not found or is not a UI item
         """
-        cdef object item = self.scope.get(name, None)
-        
-        # If still not found, raise an error
-        if item is None:
-            raise ValueError(f"Item reference '{name}' not found in current scope")
-        
-        # Check if it's actually a UI item
-        if not isinstance(item, uiItem):
-            raise ValueError(f"'{name}' is not a UI item")
-            
-        return item
+        self.ref_names.append(name)
+        return find_item_in_scope(self.scope, name)
             
     cdef baseSizing parse(self):
         """
@@ -2679,6 +2700,276 @@ cdef class CythonParser:
             token_value = self.get_token_value(token) if self.position < self.tokens.size() else ""
             raise ValueError(f"Unexpected token: '{token_value}' (type: {token.type})")
 
+cdef object find_item_in_scope(dict scope, str name):
+    """
+    Find a UI item in scope by name.
+
+    Raises:
+        ValueError: If item is not found or is not a UI item
+    """
+    cdef object item = scope.get(name, None)
+
+    # If still not found, raise an error
+    if item is None:
+        raise ValueError(f"Item reference '{name}' not found in current scope")
+
+    # Check if it's actually a UI item
+    if not isinstance(item, uiItem):
+        raise ValueError(f"'{name}' is not a UI item")
+
+    return item
+
+
+# Compiled expressions
+# --------------------
+# Strings assigned to sizes are compiled once into a template:
+# a postfix program in which constant subexpressions are folded.
+# Leaves (dpi, fillx, self.width, etc) are evaluated by the sizing
+# classes above. They are shared by all the instances of a template,
+# except item references, which are looked up in the caller scope.
+
+cdef enum SizeOpCode:
+    SIZE_OP_CONST
+    SIZE_OP_LEAF
+    SIZE_OP_ADD
+    SIZE_OP_SUBTRACT
+    SIZE_OP_MULTIPLY
+    SIZE_OP_DIVIDE
+    SIZE_OP_FLOORDIVIDE
+    SIZE_OP_MODULO
+    SIZE_OP_POWER
+    SIZE_OP_MIN
+    SIZE_OP_MAX
+    SIZE_OP_NEGATE
+    SIZE_OP_ABSOLUTE
+
+cdef struct SizeOp:
+    SizeOpCode code
+    float value    # SIZE_OP_CONST
+    int32_t leaf   # SIZE_OP_LEAF: index of the leaf
+
+cdef inline float apply_size_op(SizeOpCode code, float a, float b) noexcept nogil:
+    """Same results as the corresponding sizing classes"""
+    if code == SIZE_OP_ADD:
+        return a + b
+    if code == SIZE_OP_SUBTRACT:
+        return a - b
+    if code == SIZE_OP_MULTIPLY:
+        return a * b
+    if code == SIZE_OP_DIVIDE:
+        if b == 0:
+            return 0.0
+        return a / b
+    if code == SIZE_OP_FLOORDIVIDE:
+        if b == 0:
+            return 0.0
+        return <float>(<int>(a / b))
+    if code == SIZE_OP_MODULO:
+        if b == 0:
+            return 0.0
+        return fmod(a, b)
+    if code == SIZE_OP_POWER:
+        return pow(a, b)
+    if code == SIZE_OP_MIN:
+        return min(a, b)
+    if code == SIZE_OP_MAX:
+        return max(a, b)
+    if code == SIZE_OP_NEGATE:
+        return -a
+    if code == SIZE_OP_ABSOLUTE:
+        return fabs(a)
+    return 0.0
+
+cdef class _SizeTemplate:
+    """
+    Compiled sizing expression, shared by all
+    the CompiledSize created from the same string.
+    """
+    cdef str source
+    cdef str text # str() of the parsed expression
+    cdef vector[SizeOp] ops
+    cdef int32_t max_depth
+    cdef list leaves # None for item references
+    cdef list ref_slots # (leaf index, reference class, item name)
+
+    @staticmethod
+    cdef _SizeTemplate compile(str source, baseSizing tree, list ref_names):
+        cdef _SizeTemplate template = _SizeTemplate.__new__(_SizeTemplate)
+        template.source = source
+        template.text = str(tree)
+        template.leaves = []
+        template.ref_slots = []
+        template._emit(tree, ref_names)
+
+        cdef int32_t i, depth = 0
+        template.max_depth = 0
+        for i in range(<int>template.ops.size()):
+            if template.ops[i].code == SIZE_OP_CONST or template.ops[i].code == SIZE_OP_LEAF:
+                depth += 1
+            elif template.ops[i].code != SIZE_OP_NEGATE and template.ops[i].code != SIZE_OP_ABSOLUTE:
+                depth -= 1
+            template.max_depth = max(template.max_depth, depth)
+        return template
+
+    cdef void _emit_op(self, SizeOpCode code, bint unary):
+        """Append an operator, folding it if its operands are constants"""
+        cdef SizeOp op
+        cdef size_t n = self.ops.size()
+        if unary and self.ops[n-1].code == SIZE_OP_CONST:
+            self.ops[n-1].value = apply_size_op(code, self.ops[n-1].value, 0.)
+            return
+        # If the last two are constants, they are the operands
+        if not unary and self.ops[n-1].code == SIZE_OP_CONST and self.ops[n-2].code == SIZE_OP_CONST:
+            self.ops[n-2].value = apply_size_op(code, self.ops[n-2].value, self.ops[n-1].value)
+            self.ops.pop_back()
+            return
+        op.code = code
+        op.value = 0.
+        op.leaf = -1
+        self.ops.push_back(op)
+
+    cdef void _emit(self, baseSizing node, list ref_names):
+        """Append the postfix program of node"""
+        cdef SizeOp op
+        cdef SizeOpCode code
+        if isinstance(node, FixedSize):
+            op.code = SIZE_OP_CONST
+            op.value = node._current_value
+            op.leaf = -1
+            self.ops.push_back(op)
+        elif isinstance(node, binarySizeOp):
+            self._emit((<binarySizeOp>node)._left, ref_names)
+            self._emit((<binarySizeOp>node)._right, ref_names)
+            if isinstance(node, AddSize):
+                code = SIZE_OP_ADD
+            elif isinstance(node, SubtractSize):
+                code = SIZE_OP_SUBTRACT
+            elif isinstance(node, MultiplySize):
+                code = SIZE_OP_MULTIPLY
+            elif isinstance(node, DivideSize):
+                code = SIZE_OP_DIVIDE
+            elif isinstance(node, FloorDivideSize):
+                code = SIZE_OP_FLOORDIVIDE
+            elif isinstance(node, ModuloSize):
+                code = SIZE_OP_MODULO
+            elif isinstance(node, PowerSize):
+                code = SIZE_OP_POWER
+            elif isinstance(node, MinSize):
+                code = SIZE_OP_MIN
+            elif isinstance(node, MaxSize):
+                code = SIZE_OP_MAX
+            else:
+                raise TypeError(f"Cannot compile {type(node).__name__}")
+            self._emit_op(code, False)
+        elif isinstance(node, NegateSize):
+            self._emit((<NegateSize>node)._operand, ref_names)
+            self._emit_op(SIZE_OP_NEGATE, True)
+        elif isinstance(node, AbsoluteSize):
+            self._emit((<AbsoluteSize>node)._operand, ref_names)
+            self._emit_op(SIZE_OP_ABSOLUTE, True)
+        else:
+            op.code = SIZE_OP_LEAF
+            op.value = 0.
+            op.leaf = len(self.leaves)
+            self.ops.push_back(op)
+            if isinstance(node, baseRefSizing):
+                # References appear in the tree in the order of the source
+                self.ref_slots.append((op.leaf, type(node), ref_names[len(self.ref_slots)]))
+                self.leaves.append(None)
+            else:
+                self.leaves.append(node)
+
+    cdef baseSizing instantiate(self):
+        """Create a sizing object evaluating the template"""
+        if self.ops.size() == 1 and self.ops[0].code == SIZE_OP_CONST:
+            return FixedSize(self.ops[0].value)
+        cdef CompiledSize result = CompiledSize.__new__(CompiledSize)
+        result._template = self
+        result._leaves = list(self.leaves)
+        cdef dict scope
+        if len(self.ref_slots) > 0:
+            frame = _currentframe()
+            scope = {**frame.f_globals, **frame.f_locals}
+            for (index, ref_class, name) in self.ref_slots:
+                result._leaves[index] = ref_class(find_item_in_scope(scope, name))
+        for leaf in result._leaves:
+            result._leaf_ptrs.push_back(<PyObject*>leaf)
+        result._stack.resize(self.max_depth)
+        return result
+
+cdef class CompiledSize(baseSizing):
+    """
+    Sizing expression compiled into a flat program.
+
+    Strings assigned to sizes are converted to this class.
+    Expressions of the same string share their program.
+    """
+    cdef _SizeTemplate _template
+    cdef list _leaves
+    cdef vector[PyObject*] _leaf_ptrs
+    cdef vector[float] _stack
+
+    def __init__(self, str expression):
+        raise TypeError("Use parse_size, or assign the string to a size")
+
+    cdef float _update_value(self, uiItem target) noexcept nogil:
+        # Note: the mutex is held, thus _stack is not shared
+        cdef float *stack = self._stack.data()
+        cdef int32_t top = 0, i
+        cdef const SizeOp *op
+        for i in range(<int>self._template.ops.size()):
+            op = &self._template.ops[i]
+            if op.code == SIZE_OP_CONST:
+                stack[top] = op.value
+                top += 1
+            elif op.code == SIZE_OP_LEAF:
+                stack[top] = (<baseSizing>self._leaf_ptrs[op.leaf])._update_value(target)
+                top += 1
+            elif op.code == SIZE_OP_NEGATE or op.code == SIZE_OP_ABSOLUTE:
+                stack[top-1] = apply_size_op(op.code, stack[top-1], 0.)
+            else:
+                top -= 1
+                stack[top-1] = apply_size_op(op.code, stack[top-1], stack[top])
+        return stack[0]
+
+    def __repr__(self):
+        return f"CompiledSize({self._template.source!r})"
+
+    def __str__(self):
+        return self._template.text
+
+    def __reduce__(self):
+        return (parse_size, (self._template.source,))
+
+# Bounded cache of the compiled expressions, in LRU order
+cdef object _size_templates = _OrderedDict()
+cdef int32_t _SIZE_TEMPLATES_MAX = 1024
+
+cdef baseSizing compile_size(str size_str):
+    """
+    Convert a sizing string into a sizing object.
+
+    Equivalent to parse_size, but the result is a compiled
+    program, and the compilation is cached for later calls
+    with the same string.
+    """
+    if not size_str:
+        raise ValueError("Empty expression")
+    cdef _SizeTemplate template = _size_templates.get(size_str, None)
+    cdef CythonParser parser
+    if template is None:
+        parser = CythonParser(size_str)
+        template = _SizeTemplate.compile(size_str, parser.parse(), parser.ref_names)
+        _size_templates[size_str] = template
+        while len(_size_templates) > _SIZE_TEMPLATES_MAX:
+            _size_templates.popitem(last=False)
+    else:
+        try:
+            _size_templates.move_to_end(size_str)
+        except KeyError:
+            pass # Evicted by another thread
+    return template.instantiate()
+
 cpdef baseSizing parse_size(str size_str):
     """
     Parse a sizing string into sizing objects
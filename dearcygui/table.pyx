@@ -534,6 +534,7 @@ cdef class baseTable(uiItem):
     def num_rows_visible(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._num_rows_visible = -1
             return
@@ -563,6 +564,7 @@ cdef class baseTable(uiItem):
     def num_cols_visible(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._num_cols_visible = -1
             return
@@ -591,6 +593,7 @@ cdef class baseTable(uiItem):
     def num_rows_frozen(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 0:
             raise ValueError("num_rows_frozen must be a non-negative integer")
         if value >= 128: # imgui limit
@@ -612,6 +615,7 @@ cdef class baseTable(uiItem):
     def num_cols_frozen(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 0:
             raise ValueError("num_cols_frozen must be a non-negative integer")
         if value >= 512: # imgui limit
@@ -1436,6 +1440,7 @@ cdef class TableColConfig(baseItem):
     def show(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_Disabled
         if not(value):
             self._flags |= imgui.ImGuiTableColumnFlags_Disabled
@@ -1456,6 +1461,7 @@ cdef class TableColConfig(baseItem):
     def enabled(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.state.cur.open = value
 
     @property
@@ -1480,6 +1486,7 @@ cdef class TableColConfig(baseItem):
     def stretch(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._stretch = False
             self._fixed = False
@@ -1506,6 +1513,7 @@ cdef class TableColConfig(baseItem):
     def default_sort(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_DefaultSort
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_DefaultSort
@@ -1525,6 +1533,7 @@ cdef class TableColConfig(baseItem):
     def no_resize(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoResize
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoResize
@@ -1545,6 +1554,7 @@ cdef class TableColConfig(baseItem):
     def no_hide(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoHide
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoHide
@@ -1565,6 +1575,7 @@ cdef class TableColConfig(baseItem):
     def no_clip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoClip
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoClip
@@ -1585,6 +1596,7 @@ cdef class TableColConfig(baseItem):
     def no_sort(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoSort
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoSort
@@ -1605,6 +1617,7 @@ cdef class TableColConfig(baseItem):
     def prefer_sort_ascending(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_PreferSortAscending
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_PreferSortAscending
@@ -1625,6 +1638,7 @@ cdef class TableColConfig(baseItem):
     def prefer_sort_descending(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_PreferSortDescending
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_PreferSortDescending
@@ -1644,6 +1658,7 @@ cdef class TableColConfig(baseItem):
     def no_sort_ascending(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoSortAscending
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoSortAscending
@@ -1663,6 +1678,7 @@ cdef class TableColConfig(baseItem):
     def no_sort_descending(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoSortDescending
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoSortDescending
@@ -1683,6 +1699,7 @@ cdef class TableColConfig(baseItem):
     def no_header_label(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoHeaderLabel
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoHeaderLabel
@@ -1703,6 +1720,7 @@ cdef class TableColConfig(baseItem):
     def no_header_width(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoHeaderWidth
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoHeaderWidth
@@ -1725,6 +1743,7 @@ cdef class TableColConfig(baseItem):
     def width(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._width = value
 
     @property
@@ -1744,6 +1763,7 @@ cdef class TableColConfig(baseItem):
     def no_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._dpi_scaling = not(value)
 
     @property 
@@ -1763,6 +1783,7 @@ cdef class TableColConfig(baseItem):
     def stretch_weight(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 0:
             raise ValueError("stretch_weight must be >= 0")
         self._stretch_weight = value
@@ -1783,6 +1804,7 @@ cdef class TableColConfig(baseItem):
     def no_reorder(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTableColumnFlags_NoReorder
         if value:
             self._flags |= imgui.ImGuiTableColumnFlags_NoReorder
@@ -1803,6 +1825,7 @@ cdef class TableColConfig(baseItem):
     def label(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._label = string_from_str(value)
 
     @property
@@ -1955,6 +1978,7 @@ cdef class TableRowConfig(baseItem):
     def show(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.show = value
 
     @property
@@ -1974,7 +1998,8 @@ cdef class TableRowConfig(baseItem):
     @bg_color.setter
     def bg_color(self, value):
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self.mutex) 
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.bg_color = parse_color(value)
 
     @property
@@ -1993,7 +2018,8 @@ cdef class TableRowConfig(baseItem):
     @min_height.setter
     def min_height(self, float value):
         cdef unique_lock[DCGMutex] m
-        lock_gil_friendly(m, self.mutex) 
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.min_height = value
 
     @property
@@ -2304,6 +2330,7 @@ cdef class Table(baseTable):
             raise TypeError("flags must be a TableFlag value")
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags = <imgui.ImGuiTableFlags><uint32_t>make_TableFlag(value)
 
     @property
@@ -2326,6 +2353,7 @@ cdef class Table(baseTable):
     def inner_width(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._inner_width = value
 
     @property
@@ -2347,6 +2375,7 @@ cdef class Table(baseTable):
     def header(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._header = value
 
     cdef bint draw_item(self) noexcept nogil:
@@ -2495,7 +2524,8 @@ cdef class Table(baseTable):
                         (<uiItem>element.ui_item).draw()
                     (<uiItem>element.ui_item).mutex.unlock()
                 elif not element.str_item.empty():
-                    imgui.TextUnformatted(element.str_item.c_str())
+                    self.context.viewport.text_layouts.text_unformatted(element.str_item.c_str(),
+                                                                        element.str_item.c_str() + element.str_item.size())
 
                 # Optional tooltip
                 if element.tooltip_ui_item is not NULL:
@@ -1,7 +1,23 @@
-from libc.stdint cimport int32_t
-from .core cimport baseItem, Context
+from libc.stdint cimport int32_t, int64_t
+from .core cimport baseItem, Context, Callback
 from .c_types cimport DCGMutex
 
+cdef class TextureManager:
+    cdef DCGMutex mutex
+    cdef int64_t _budget # bytes, 0 for no limit
+    cdef int64_t _resident_bytes
+    cdef int64_t _resident_count
+    cdef int64_t _evictions
+    cdef int64_t _reloads
+    cdef object _evictable # WeakSet of the evictable textures
+    cdef bint _enforcing
+    cdef void track(self, int64_t delta_bytes, int32_t delta_count,
+                    int32_t delta_evictions, int32_t delta_reloads) noexcept nogil
+    cdef bint over_budget(self) noexcept nogil
+    cdef void enforce_budget(self, object keep)
+
+cdef TextureManager get_texture_manager(Context context)
+
 cdef class Texture(baseItem):
     ### Public read-only variables ###
     cdef void* allocated_texture
@@ -17,7 +33,23 @@ cdef class Texture(baseItem):
     cdef int32_t _repeat_mode
     cdef bint _readonly
     cdef bint _no_realloc
+    cdef object _async_pending # (value, Future) waiting for the upload worker
+    cdef bint _async_scheduled
+    cdef TextureManager _manager
+    cdef int64_t _resident_size # bytes accounted in the manager
+    cdef int64_t _last_use_frame
+    cdef bint _evictable
+    cdef bint _evicted
+    cdef bint _reload_requested
+    cdef Callback _reload_callback
     cdef void set_content(self, content)
+    cdef void _set_resident(self, bint resident) noexcept nogil
+    cdef bint _evict(self)
+    cdef bint c_mark_used(self) noexcept nogil
+    cdef void _process_async_uploads(self)
+    cdef void _update_regions(self, list regions)
+    cdef void _convert_yuv(self, int32_t width, int32_t height, unsigned yuv_format,
+                           void* data, int32_t stride, unsigned colorspace, bint full_range)
     cdef void c_gl_begin_read(self) noexcept nogil
     cdef void c_gl_end_read(self) noexcept nogil
     cdef void c_gl_begin_write(self) noexcept nogil
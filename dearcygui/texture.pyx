@@ -15,8 +15,9 @@
 #cython: freethreading_compatible=True
 #distutils: language=c++
 
-from libc.stdint cimport uint8_t, uintptr_t, int32_t
+from libc.stdint cimport uint8_t, uintptr_t, int32_t, int64_t
 from libc.string cimport memset
+from libcpp.vector cimport vector
 
 from cython.view cimport array as cython_array
 from cython.operator cimport dereference
@@ -26,11 +27,196 @@ cimport cpython
 # Thus it is the only one allowed to make calls to it
 
 from .backends.backend cimport platformViewport
-from .core cimport Context, baseItem, lock_gil_friendly
+from .core cimport Context, baseItem, Callback, lock_gil_friendly
 from .c_types cimport unique_lock, DCGMutex, defer_lock_t
 from .types cimport parse_texture
 
-from weakref import WeakKeyDictionary as _WeakKeyDictionary, WeakValueDictionary as _WeakValueDictionary
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from weakref import WeakKeyDictionary as _WeakKeyDictionary, WeakValueDictionary as _WeakValueDictionary,\
+    WeakSet as _WeakSet
+
+cdef extern from * nogil:
+    """
+    #include <cstring>
+
+    // Repacks a (row, col, chan) strided image into a packed buffer.
+    // When the channels of a pixel are contiguous, whole pixels are copied.
+    template <typename T>
+    static void repack_strided_image_t(T* dst, const unsigned char* src,
+                                       int height, int width, int num_chans,
+                                       long long row_stride, long long col_stride,
+                                       long long chan_stride)
+    {
+        const size_t pixel_bytes = (size_t)num_chans * sizeof(T);
+        for (int row = 0; row < height; row++) {
+            const unsigned char* src_row = src + row * row_stride;
+            if (chan_stride == (long long)sizeof(T)) {
+                for (int col = 0; col < width; col++) {
+                    std::memcpy(dst, src_row + col * col_stride, pixel_bytes);
+                    dst += num_chans;
+                }
+            } else {
+                for (int col = 0; col < width; col++) {
+                    const unsigned char* src_pixel = src_row + col * col_stride;
+                    for (int chan = 0; chan < num_chans; chan++)
+                        std::memcpy(&dst[chan], src_pixel + chan * chan_stride, sizeof(T));
+                    dst += num_chans;
+                }
+            }
+        }
+    }
+
+    static void repack_strided_image(void* dst, const void* src, int itemsize,
+                                     int height, int width, int num_chans,
+                                     long long row_stride, long long col_stride,
+                                     long long chan_stride)
+    {
+        if (itemsize == 1)
+            repack_strided_image_t<unsigned char>((unsigned char*)dst, (const unsigned char*)src,
+                                                  height, width, num_chans,
+                                                  row_stride, col_stride, chan_stride);
+        else if (itemsize == 2)
+            repack_strided_image_t<unsigned short>((unsigned short*)dst, (const unsigned char*)src,
+                                                   height, width, num_chans,
+                                                   row_stride, col_stride, chan_stride);
+        else
+            repack_strided_image_t<float>((float*)dst, (const unsigned char*)src,
+                                          height, width, num_chans,
+                                          row_stride, col_stride, chan_stride);
+    }
+    """
+    void repack_strided_image(void*, const void*, int, int, int, int, long long, long long, long long)
+
+# Element types of the backend textures
+cdef inline int32_t buffer_type_of(const char* format, Py_ssize_t itemsize) noexcept nogil:
+    """
+    Backend type of a buffer format:
+    0 = float32, 1 = uint8, 2 = uint16, 3 = float16, -1 = unsupported
+    """
+    if format[0] == b'B' and itemsize == 1:
+        return 1
+    if format[0] == b'f' and itemsize == 4:
+        return 0
+    if format[0] == b'H' and itemsize == 2:
+        return 2
+    if format[0] == b'e' and itemsize == 2:
+        return 3
+    return -1
+
+cdef inline int32_t buffer_type_itemsize(unsigned buffer_type) noexcept nogil:
+    if buffer_type == 1:
+        return 1
+    if buffer_type == 0:
+        return 4
+    return 2
+
+cdef inline str buffer_type_format(unsigned buffer_type):
+    return ('f', 'B', 'H', 'e')[buffer_type]
+
+cdef inline str buffer_type_name(unsigned buffer_type):
+    return ('float32', 'uint8', 'uint16', 'float16')[buffer_type]
+
+# A sub-rectangle to upload, with packed rows
+cdef struct TextureRegion:
+    void* data
+    int32_t x
+    int32_t y
+    int32_t width
+    int32_t height
+    int32_t stride
+
+# Shared by all textures. Uploads are serialized on the GL upload
+# context, but repacking can run in parallel.
+cdef object _upload_executor = None
+
+cdef object _get_upload_executor():
+    global _upload_executor
+    if _upload_executor is None:
+        _upload_executor = _ThreadPoolExecutor(max_workers=2,
+                                               thread_name_prefix="dcg_texture_upload")
+    return _upload_executor
+
+def _run_async_uploads(Texture texture):
+    texture._process_async_uploads()
+
+
+cdef class TextureManager:
+    """
+    Accounts the GPU memory of the textures of a context, and
+    evicts the least recently drawn evictable textures when
+    the budget is exceeded.
+
+    See Viewport.texture_budget and Viewport.texture_stats.
+    """
+    def __cinit__(self):
+        self._budget = 0
+        self._resident_bytes = 0
+        self._resident_count = 0
+        self._evictions = 0
+        self._reloads = 0
+        self._evictable = _WeakSet()
+        self._enforcing = False
+
+    cdef void track(self, int64_t delta_bytes, int32_t delta_count,
+                    int32_t delta_evictions, int32_t delta_reloads) noexcept nogil:
+        cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
+        self._resident_bytes += delta_bytes
+        self._resident_count += delta_count
+        self._evictions += delta_evictions
+        self._reloads += delta_reloads
+
+    cdef bint over_budget(self) noexcept nogil:
+        cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self.mutex)
+        return self._budget > 0 and self._resident_bytes > self._budget
+
+    cdef void enforce_budget(self, object keep):
+        """
+        Evict the least recently drawn evictable textures until
+        the resident memory is back under 90% of the budget, to
+        not evict again at the next allocation.
+        Textures drawn during the last frame are likely visible,
+        and are kept. keep is a texture that must not be evicted.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if self._enforcing or self._budget <= 0 or \
+           self._resident_bytes <= self._budget:
+            return
+        self._enforcing = True
+        cdef int64_t target = self._budget - self._budget // 10
+        cdef list evictable = list(self._evictable)
+        m.unlock()
+        cdef Texture texture
+        cdef bint done
+        try:
+            candidates = []
+            for texture in evictable:
+                if texture is keep or texture.allocated_texture == NULL:
+                    continue
+                if texture._last_use_frame >= 0 and \
+                   texture._last_use_frame >= texture.context.viewport.frame_count - 1:
+                    continue
+                candidates.append((texture._last_use_frame, texture.uuid, texture))
+            candidates.sort()
+            for entry in candidates:
+                lock_gil_friendly(m, self.mutex)
+                done = self._resident_bytes <= target
+                m.unlock()
+                if done:
+                    break
+                (<Texture>entry[2])._evict()
+        finally:
+            lock_gil_friendly(m, self.mutex)
+            self._enforcing = False
+
+# context -> TextureManager
+_texture_managers = _WeakKeyDictionary()
+
+cdef TextureManager get_texture_manager(Context context):
+    manager = _texture_managers.get(context, None)
+    if manager is None:
+        manager = _texture_managers.setdefault(context, TextureManager())
+    return <TextureManager>manager
 
 
 cdef class Texture(baseItem):
@@ -44,6 +230,7 @@ cdef class Texture(baseItem):
     """
 
     def __init__(self, context, *args, **kwargs):
+        self._manager = get_texture_manager(context)
         baseItem.__init__(self, context, **kwargs)
         if len(args) == 1:
             self.set_value(args[0])
@@ -62,6 +249,11 @@ cdef class Texture(baseItem):
         self._buffer_type = 0
         self._filtering_mode = 0
         self._repeat_mode = 0
+        self._resident_size = 0
+        self._last_use_frame = -1
+        self._evictable = False
+        self._evicted = False
+        self._reload_requested = False
 
     def __dealloc__(self):
         # Note: textures might be referenced during imgui rendering.
@@ -71,6 +263,7 @@ cdef class Texture(baseItem):
         # while it is still in use (there will just be an artefact),
         # plus we delay texture deletion for a few frames,
         # so it should be fine.
+        self._set_resident(False)
         if self.allocated_texture == NULL:
             return
         if self.context is None:
@@ -102,6 +295,7 @@ cdef class Texture(baseItem):
     def hint_dynamic(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self.allocated_texture != NULL and self._hint_dynamic != value:
             raise PermissionError("hint_dynamic cannot be changed after texture allocation")
         self._hint_dynamic = value
@@ -126,6 +320,7 @@ cdef class Texture(baseItem):
     def antialiased(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self.allocated_texture != NULL:
             if (((self._filtering_mode == 3) and not value) or ((self._filtering_mode == 0) and value)):
                 raise PermissionError("antialiased cannot be changed after texture allocation")
@@ -152,6 +347,7 @@ cdef class Texture(baseItem):
     def nearest_neighbor_upsampling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self.allocated_texture != NULL:
             if (((self._filtering_mode == 0) and value) or ((self._filtering_mode == 1) and not value)):
                 raise PermissionError("nearest_neighbor_upsampling cannot be changed after texture allocation")
@@ -176,6 +372,7 @@ cdef class Texture(baseItem):
     def wrap_x(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self.allocated_texture != NULL and \
            ((self._repeat_mode & 1) != 0) != value:
             raise PermissionError("wrap_x cannot be changed after texture allocation")
@@ -201,6 +398,7 @@ cdef class Texture(baseItem):
     def wrap_y(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self.allocated_texture != NULL and \
            ((self._repeat_mode & 2) != 0) != value:
             raise PermissionError("wrap_y cannot be changed after texture allocation")
@@ -248,12 +446,83 @@ cdef class Texture(baseItem):
         """
         return <uintptr_t>self.allocated_texture
 
+    @property
+    def evictable(self):
+        """
+        Whether the texture can be evicted to respect the
+        texture budget of the context.
+
+        When the textures of the context exceed the budget
+        (see Viewport.texture_budget), the least recently drawn
+        evictable textures are released. When an evicted texture
+        is drawn again, it is skipped and reload_callback is
+        called, which should set the content back (set_value or
+        set_value_async). Useful for large image galleries.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._evictable
+
+    @evictable.setter
+    def evictable(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        cdef unique_lock[DCGMutex] m2
+        lock_gil_friendly(m, self.mutex)
+        if value == self._evictable:
+            return
+        if self._readonly and value: # set for fonts
+            raise ValueError("Read-only textures cannot be evicted")
+        self._evictable = value
+        if self._manager is None:
+            return
+        lock_gil_friendly(m2, self._manager.mutex)
+        if value:
+            self._manager._evictable.add(self)
+        else:
+            self._manager._evictable.discard(self)
+        m2.unlock()
+        m.unlock()
+        if value and self._manager.over_budget():
+            self._manager.enforce_budget(None)
+
+    @property
+    def evicted(self):
+        """
+        Whether the texture content was evicted, and
+        has not been set again since.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._evicted
+
+    @property
+    def reload_callback(self):
+        """
+        Callback called when the texture is drawn while its
+        content was evicted (see evictable).
+
+        It receives the texture as sender and target, and is
+        expected to set the texture content back. It is called
+        once per eviction.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._reload_callback
+
+    @reload_callback.setter
+    def reload_callback(self, value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self._reload_callback = value if isinstance(value, Callback) or value is None else Callback(value)
+
     def allocate(self, *,
                  int32_t width,
                  int32_t height,
                  int32_t num_chans,
                  bint uint8 = False,
                  bint float32 = False,
+                 bint uint16 = False,
+                 bint float16 = False,
                  bint no_realloc = True):
         """
         Allocate the buffer backing for the texture.
@@ -269,9 +538,12 @@ cdef class Texture(baseItem):
         - num_chans: Number of channels (1, 2, 3, or 4)
         - uint8: Whether the texture format is unsigned bytes (default: False)
         - float32: Whether the texture format is float32 (default: False)
+        - uint16: Whether the texture format is unsigned 16-bit
+            integers, normalized to [0, 1] when sampled (default: False)
+        - float16: Whether the texture format is half floats (default: False)
         - no_realloc: Whether to prevent future reallocations (default: True)
         
-        Either uint8 or float32 must be set to True.
+        One of uint8, float32, uint16 or float16 must be set to True.
         """
         if self.allocated_texture != NULL and self._no_realloc:
             raise ValueError("Texture backing cannot be reallocated")
@@ -289,8 +561,12 @@ cdef class Texture(baseItem):
             buffer_type = 1
         elif float32:
             buffer_type = 0
+        elif uint16:
+            buffer_type = 2
+        elif float16:
+            buffer_type = 3
         else:
-            raise ValueError("Invalid texture format. Float32 or uint8 must be set")
+            raise ValueError("Invalid texture format. Float32, uint8, uint16 or float16 must be set")
 
         cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
         if platform == NULL:
@@ -319,9 +595,12 @@ cdef class Texture(baseItem):
                     self.num_chans = num_chans
                     self._buffer_type = buffer_type
                     self._no_realloc = no_realloc
+                self._set_resident(success)
                 self.mutex.unlock()
         if not(success):
             raise MemoryError("Failed to allocate target texture")
+        if self._manager is not None and self._manager.over_budget():
+            self._manager.enforce_budget(self)
 
 
     def set_value(self, src):
@@ -333,8 +612,8 @@ cdef class Texture(baseItem):
         content, the previous allocation will be reused if compatible.
         
         Supported formats:
-        - Data type: uint8 (0-255) or float32 (0.0-1.0)
-          (other types will be converted to float32)
+        - Data type: uint8 (0-255), uint16 (0-65535), float16 or
+          float32 (0.0-1.0) (other types will be converted to float32)
         - Channels: 1 (R), 2 (RG), 3 (RGB), or 4 (RGBA)
           
         Note that for single-channel textures, R is duplicated to G and B
@@ -345,6 +624,418 @@ cdef class Texture(baseItem):
         else:
             value = parse_texture(src)
         self.set_content(value)
+        self.mark_dirty()
+
+    def set_value_async(self, src):
+        """
+        Set the texture data from an array, in a background worker.
+
+        Accepts the same inputs as set_value, but returns right
+        away with a concurrent.futures.Future, which completes
+        once the data is uploaded (or holds the upload exception).
+
+        Uploads follow latest-wins semantics: if new data is set
+        while a previous one is still waiting for the worker, the
+        previous one is dropped and its Future is cancelled. Thus
+        frames produced faster than they can be uploaded (video)
+        do not queue up, and at most one upload per texture is
+        waiting.
+
+        The source data must not be modified until the Future
+        completes or is cancelled.
+        """
+        if cpython.PyObject_CheckBuffer(src):
+            value = src
+        else:
+            value = parse_texture(src)
+        future = _Future()
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if self._readonly: # set for fonts
+            raise ValueError("Target texture is read-only")
+        previous = self._async_pending
+        self._async_pending = (value, future)
+        cdef bint schedule = not(self._async_scheduled)
+        self._async_scheduled = True
+        m.unlock()
+        if previous is not None:
+            previous[1].cancel()
+        if schedule:
+            _get_upload_executor().submit(_run_async_uploads, self)
+        return future
+
+    cdef void _process_async_uploads(self):
+        """
+        Upload the pending data until there is none left
+        """
+        cdef unique_lock[DCGMutex] m
+        while True:
+            lock_gil_friendly(m, self.mutex)
+            pending = self._async_pending
+            self._async_pending = None
+            if pending is None:
+                self._async_scheduled = False
+                return
+            m.unlock()
+            (value, future) = pending
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self.set_content(value)
+                self.mark_dirty()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+
+    def set_value_yuv(self, src, str format, str colorspace="bt601", bint full_range=False):
+        """
+        Set the texture data from a YUV frame.
+
+        The frame is uploaded as is and converted to RGBA on the
+        GPU. This avoids a colorspace conversion pass on the CPU,
+        and transfers 1.5 (NV12, I420) or 2 (YUYV) bytes per pixel
+        rather than 4. These are the formats of most cameras and
+        video decoders.
+
+        Parameters:
+        - src: uint8 array holding the frame:
+            - "nv12": shape (height * 3 // 2, width). The luma plane,
+              followed by the interleaved UV plane at half resolution.
+            - "i420": shape (height * 3 // 2, width). The luma plane,
+              followed by the U plane, then the V plane, both at
+              half resolution.
+            - "yuyv": shape (height, width * 2) or (height, width, 2).
+              Y0 U Y1 V for each pair of pixels.
+        - format: "nv12", "i420" or "yuyv"
+        - colorspace: "bt601" (SD content, default) or "bt709" (HD content)
+        - full_range: Whether the values span [0, 255] rather
+          than the video range ([16, 235] for luma). Default False.
+
+        The width (and the height for nv12 and i420) must be even.
+        The texture holds 4 channels uint8 data of the frame size.
+        """
+        cdef unsigned yuv_format
+        if format == "nv12":
+            yuv_format = 0
+        elif format == "i420":
+            yuv_format = 1
+        elif format == "yuyv":
+            yuv_format = 2
+        else:
+            raise ValueError(f"Unknown YUV format: {format}. Expected nv12, i420 or yuyv")
+        cdef unsigned colorspace_id
+        if colorspace == "bt601":
+            colorspace_id = 0
+        elif colorspace == "bt709":
+            colorspace_id = 1
+        else:
+            raise ValueError(f"Unknown colorspace: {colorspace}. Expected bt601 or bt709")
+
+        cdef cpython.Py_buffer buf_info
+        if cpython.PyObject_GetBuffer(src, &buf_info, cpython.PyBUF_RECORDS_RO) < 0:
+            raise TypeError("Failed to retrieve buffer information")
+        cdef int32_t rows, cols, num_chans = 1
+        cdef Py_ssize_t col_stride, chan_stride
+        cdef int32_t width, height, stride
+        cdef void* data
+        cdef cython_array copy_array = None
+        cdef cython_array target
+        try:
+            if buffer_type_of(buf_info.format, buf_info.itemsize) != 1:
+                raise ValueError("YUV frames must be uint8 arrays")
+            if buf_info.ndim == 3 and yuv_format == 2 and buf_info.shape[2] == 2:
+                num_chans = 2
+            elif buf_info.ndim != 2:
+                raise ValueError("Invalid YUV frame shape")
+            rows = buf_info.shape[0]
+            cols = buf_info.shape[1]
+            if yuv_format == 2:
+                width = cols * num_chans // 2
+                height = rows
+            else:
+                width = cols
+                height = rows * 2 // 3
+                if rows % 3 != 0:
+                    raise ValueError("NV12 and I420 frames must have height * 3 // 2 rows")
+            if width == 0 or height == 0:
+                raise ValueError("Cannot set empty texture")
+            if (width % 2) != 0 or (yuv_format != 2 and (height % 2) != 0):
+                raise ValueError("YUV frame dimensions must be even")
+            data = buf_info.buf
+            stride = buf_info.strides[0]
+            col_stride = buf_info.strides[1]
+            chan_stride = buf_info.strides[2] if num_chans == 2 else 1
+            # Rows must be packed. The I420 chroma planes are
+            # expected right after the luma plane, with half its
+            # stride, thus I420 needs the whole frame packed.
+            if col_stride != num_chans or chan_stride != 1 or \
+               stride < cols * num_chans or \
+               (yuv_format == 1 and stride != cols):
+                copy_array = cython_array(shape=(rows, cols, num_chans), itemsize=1,
+                                          format='B', mode='c', allocate_buffer=True)
+                with nogil:
+                    repack_strided_image(copy_array.data, buf_info.buf, 1,
+                                         rows, cols, num_chans,
+                                         stride, col_stride, chan_stride)
+                data = copy_array.data
+                stride = cols * num_chans
+
+            if self.allocated_texture == NULL or self.width != width or \
+               self.height != height or self.num_chans != 4 or self._buffer_type != 1:
+                # (Re)allocate the RGBA target. Its initial content
+                # is overwritten right away by the conversion.
+                target = cython_array(shape=(height, width, 4), itemsize=1,
+                                      format='B', mode='c', allocate_buffer=True)
+                memset(target.data, 0, height * width * 4)
+                self.set_content(target)
+
+            self._convert_yuv(width, height, yuv_format, data, stride,
+                              colorspace_id, full_range)
+        finally:
+            cpython.PyBuffer_Release(&buf_info)
+        self.mark_dirty()
+
+    cdef void _convert_yuv(self, int32_t width, int32_t height, unsigned yuv_format,
+                           void* data, int32_t stride, unsigned colorspace, bint full_range):
+        cdef unique_lock[DCGMutex] m
+        cdef unique_lock[DCGMutex] m2
+        lock_gil_friendly(m, self._write_mutex)
+        lock_gil_friendly(m2, self.mutex)
+        if self._readonly: # set for fonts
+            raise ValueError("Target texture is read-only")
+        if self.allocated_texture == NULL:
+            raise ValueError("Cannot set the content of an unallocated texture")
+
+        cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
+        if platform == NULL:
+            raise RuntimeError("Cannot access a texture after viewport destruction")
+
+        cdef bint holds_upload_mutex = False
+        try:
+            with nogil:
+                m2.unlock()
+                platform.makeUploadContextCurrent()
+                holds_upload_mutex = True
+                m2.lock()
+                platform.updateTextureYUV(self.allocated_texture,
+                                          width,
+                                          height,
+                                          yuv_format,
+                                          data,
+                                          stride,
+                                          colorspace,
+                                          full_range)
+                platform.releaseUploadContext()
+                holds_upload_mutex = False
+        finally:
+            if holds_upload_mutex:
+                platform.releaseUploadContext()
+            self.context.viewport.release_platform()
+
+    def update_region(self, int32_t x, int32_t y, src):
+        """
+        Update a sub-rectangle of the texture.
+
+        src is an array of shape (height, width) or
+        (height, width, num_chans), which is written with its
+        top-left corner at pixel (x, y). The rest of the texture
+        is left untouched, and only the region is transferred,
+        which is much cheaper than set_value when a small part
+        of a large texture changes (tiles, incremental plots, etc).
+
+        The texture must already have content or have been
+        allocated, and src must match its number of channels and
+        its data type (uint8 or float32). The region must fit
+        inside the texture.
+        """
+        self._update_regions([(x, y, src)])
+        self.mark_dirty()
+
+    def update_regions(self, regions):
+        """
+        Update several sub-rectangles of the texture.
+
+        regions is an iterable of (x, y, src) tuples, with the
+        same meaning as for update_region. All the regions are
+        uploaded in a single upload session, which is cheaper than
+        calling update_region for each of them. Regions are
+        written in order, thus where they overlap the latest wins.
+        """
+        self._update_regions(list(regions))
+        self.mark_dirty()
+
+    cdef void _update_regions(self, list regions):
+        cdef unique_lock[DCGMutex] m
+        cdef unique_lock[DCGMutex] m2
+        lock_gil_friendly(m, self._write_mutex)
+        lock_gil_friendly(m2, self.mutex)
+        if self._readonly: # set for fonts
+            raise ValueError("Target texture is read-only")
+        if self.allocated_texture == NULL:
+            raise ValueError("Cannot update a region of an unallocated texture")
+
+        cdef int32_t itemsize = buffer_type_itemsize(self._buffer_type)
+        cdef vector[TextureRegion] rects
+        cdef TextureRegion rect
+        cdef cpython.Py_buffer buf_info
+        cdef cython_array copy_array
+        cdef int32_t num_chans
+        cdef Py_ssize_t col_stride, chan_stride
+        # memoryviews maintain the source buffers exported
+        # (and the repacked copies alive) until the upload is done
+        cdef list keep_alive = []
+        for (x, y, src) in regions:
+            if cpython.PyObject_CheckBuffer(src):
+                view = memoryview(src)
+            else:
+                view = memoryview(parse_texture(src))
+            if cpython.PyObject_GetBuffer(view, &buf_info, cpython.PyBUF_RECORDS_RO) < 0:
+                raise TypeError("Failed to retrieve buffer information")
+            try:
+                if buf_info.ndim != 2 and buf_info.ndim != 3:
+                    raise ValueError("Region data must have shape (height, width[, num_chans])")
+                if buffer_type_of(buf_info.format, buf_info.itemsize) != <int32_t>self._buffer_type:
+                    raise ValueError("Region data type must match the texture type (%s)" %
+                                     buffer_type_name(self._buffer_type))
+                rect.x = x
+                rect.y = y
+                rect.height = buf_info.shape[0]
+                rect.width = buf_info.shape[1]
+                num_chans = buf_info.shape[2] if buf_info.ndim == 3 else 1
+                if num_chans != self.num_chans:
+                    raise ValueError(f"Region has {num_chans} channels, but the texture has {self.num_chans}")
+                if rect.width == 0 or rect.height == 0:
+                    continue
+                if rect.x < 0 or rect.y < 0 or \
+                   rect.x + rect.width > self.width or \
+                   rect.y + rect.height > self.height:
+                    raise ValueError(
+                        f"Region ({rect.x}, {rect.y}, {rect.width}x{rect.height}) exceeds "
+                        f"the texture size ({self.width}x{self.height})")
+                rect.data = buf_info.buf
+                rect.stride = buf_info.strides[0]
+                col_stride = buf_info.strides[1]
+                chan_stride = buf_info.strides[2] if buf_info.ndim == 3 else itemsize
+                # rows must be packed, and with a positive stride
+                if col_stride != num_chans * itemsize or \
+                   chan_stride != itemsize or \
+                   buf_info.strides[0] < rect.width * num_chans * itemsize:
+                    copy_array = cython_array(shape=(rect.height, rect.width, num_chans),
+                                              itemsize=itemsize, format=buf_info.format,
+                                              mode='c', allocate_buffer=True)
+                    with nogil:
+                        repack_strided_image(copy_array.data, buf_info.buf, itemsize,
+                                             rect.height, rect.width, num_chans,
+                                             buf_info.strides[0], col_stride, chan_stride)
+                    rect.data = copy_array.data
+                    rect.stride = rect.width * num_chans * itemsize
+                    keep_alive.append(copy_array)
+                rects.push_back(rect)
+                keep_alive.append(view)
+            finally:
+                cpython.PyBuffer_Release(&buf_info)
+
+        if rects.empty():
+            return
+
+        cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
+        if platform == NULL:
+            raise RuntimeError("Cannot access a texture after viewport destruction")
+
+        cdef bint holds_upload_mutex = False
+        cdef int32_t i
+        try:
+            with nogil:
+                # Same lock order as set_content: upload context, then item
+                m2.unlock()
+                platform.makeUploadContextCurrent()
+                holds_upload_mutex = True
+                m2.lock()
+                # _write_mutex prevents set_content from reallocating
+                # in between, but allocate() may have
+                if self.allocated_texture != NULL:
+                    for i in range(<int32_t>rects.size()):
+                        platform.updateTextureRegion(self.allocated_texture,
+                                                     rects[i].x,
+                                                     rects[i].y,
+                                                     rects[i].width,
+                                                     rects[i].height,
+                                                     self.num_chans,
+                                                     self._buffer_type,
+                                                     rects[i].data,
+                                                     rects[i].stride)
+                platform.releaseUploadContext()
+                holds_upload_mutex = False
+        finally:
+            if holds_upload_mutex:
+                platform.releaseUploadContext()
+            self.context.viewport.release_platform()
+
+    cdef void _set_resident(self, bint resident) noexcept nogil:
+        """
+        Update the memory accounted for the texture
+        after an allocation or a release.
+        Must be called with the texture mutex held.
+        """
+        cdef int64_t size = 0
+        cdef int32_t reloaded = 0
+        if resident:
+            size = <int64_t>self.width * <int64_t>self.height * \
+                   <int64_t>self.num_chans * buffer_type_itemsize(self._buffer_type)
+            reloaded = 1 if self._evicted else 0
+            self._evicted = False
+            self._reload_requested = False
+        if self._manager is not None and (size != self._resident_size or reloaded):
+            self._manager.track(size - self._resident_size,
+                                (1 if size > 0 else 0) - (1 if self._resident_size > 0 else 0),
+                                0,
+                                reloaded)
+        self._resident_size = size
+
+    cdef bint _evict(self):
+        """
+        Release the texture memory. The reload callback is
+        called when the texture is drawn again.
+        """
+        cdef unique_lock[DCGMutex] m
+        cdef unique_lock[DCGMutex] m2
+        lock_gil_friendly(m, self._write_mutex)
+        lock_gil_friendly(m2, self.mutex)
+        if self.allocated_texture == NULL or not(self._evictable):
+            return False
+        cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
+        if platform == NULL:
+            return False
+        # Deletion is deferred by the backend for a few frames,
+        # thus a frame being rendered can still reference it.
+        # No GL context is needed.
+        try:
+            platform.freeTexture(self.allocated_texture)
+        finally:
+            self.context.viewport.release_platform()
+        self.allocated_texture = NULL
+        self._set_resident(False)
+        self._evicted = True
+        self._reload_requested = False
+        if self._manager is not None:
+            self._manager.track(0, 0, 1, 0)
+        return True
+
+    cdef bint c_mark_used(self) noexcept nogil:
+        """
+        Record the texture is drawn during the current frame, and
+        request a reload if it was evicted.
+        Returns whether the texture can be drawn.
+        Must be called during rendering, with the texture mutex held.
+        """
+        self._last_use_frame = self.context.viewport.frame_count
+        if self.allocated_texture != NULL:
+            return True
+        if self._evicted and not(self._reload_requested):
+            self._reload_requested = True
+            self.context.queue_callback_noarg(self._reload_callback, self, self)
+        return False
 
     cdef void set_content(self, content): # TODO: deadlock when held by external lock
         # The write mutex is to ensure order of processing of set_content
@@ -382,39 +1073,28 @@ cdef class Texture(baseItem):
         if width * height * num_chans == 0:
             cpython.PyBuffer_Release(&buf_info)
             raise ValueError("Cannot set empty texture")
-        if buf_info.format[0] != b'B' and buf_info.format[0] != b'f':
+        if buffer_type_of(buf_info.format, buf_info.itemsize) < 0:
             cpython.PyBuffer_Release(&buf_info)
-            raise ValueError("Invalid texture format. Must be uint8[0-255] or float32[0-1]")
+            raise ValueError("Invalid texture format. Must be uint8[0-255], uint16[0-65535], float16[0-1] or float32[0-1]")
 
         # rows must be contiguous
+        cdef void* data = buf_info.buf
         cdef cython_array copy_array
-        cdef float[:,:,::1] copy_array_float
-        cdef unsigned char[:,:,::1] copy_array_uint8
-        cdef int32_t row, col, chan
         if col_stride != (num_chans * buf_info.itemsize) or \
            chan_stride != buf_info.itemsize:
             copy_array = cython_array(shape=(height, width, num_chans), itemsize=buf_info.itemsize, format=buf_info.format, mode='c', allocate_buffer=True)
-            if buf_info.itemsize == 1:
-                copy_array_uint8 = copy_array
-                for row in range(height):
-                    for col in range(width):
-                        for chan in range(num_chans):
-                            copy_array_uint8[row, col, chan] = (<unsigned char*>buf_info.buf)[row * stride + col * col_stride + chan * chan_stride]
-                stride = width * num_chans
-            else:
-                copy_array_float = copy_array
-                for row in range(height):
-                    for col in range(width):
-                        for chan in range(num_chans):
-                            copy_array_float[row, col, chan] = \
-                                dereference(<float*>&((<unsigned char*>buf_info.buf)[row * stride + col * col_stride + chan * chan_stride]))
-                stride = width * num_chans * 4
+            data = copy_array.data
+            with nogil:
+                repack_strided_image(data, buf_info.buf, buf_info.itemsize,
+                                     height, width, num_chans,
+                                     stride, col_stride, chan_stride)
+            stride = width * num_chans * buf_info.itemsize
 
         cdef bint reuse = self.allocated_texture != NULL
         cdef bint success
-        cdef unsigned buffer_type = 1 if buf_info.itemsize == 1 else 0
+        cdef unsigned buffer_type = <unsigned>buffer_type_of(buf_info.format, buf_info.itemsize)
         reuse = reuse and not(self.width != width or self.height != height or self.num_chans != num_chans or self._buffer_type != buffer_type)
-        if not(reuse) and self._no_realloc:
+        if not(reuse) and self._no_realloc and not(self._evicted):
             cpython.PyBuffer_Release(&buf_info)
             raise ValueError("Texture cannot be reallocated and upload data is not of the same size/type as the texture")
 
@@ -483,7 +1163,7 @@ cdef class Texture(baseItem):
                                 height,
                                 num_chans,
                                 buffer_type,
-                                buf_info.buf,
+                                data,
                                 stride)
                     else:
                         success = \
@@ -493,8 +1173,9 @@ cdef class Texture(baseItem):
                                 height,
                                 num_chans,
                                 buffer_type,
-                                buf_info.buf,
+                                data,
                                 stride)
+                self._set_resident(self.allocated_texture != NULL)
                 platform.releaseUploadContext()
                 holds_upload_mutex = False
                 m.unlock()
@@ -507,6 +1188,8 @@ cdef class Texture(baseItem):
             cpython.PyBuffer_Release(&buf_info)
         if not(success):
             raise MemoryError("Failed to upload target texture")
+        if self._manager is not None and self._manager.over_budget():
+            self._manager.enforce_budget(self)
 
     def read(self, int32_t x0=0, int32_t y0=0, int32_t crop_width=0, int32_t crop_height=0):
         """
@@ -557,18 +1240,13 @@ cdef class Texture(baseItem):
         cdef bint success
 
         # allocate array
-        cdef uint8_t[:,:,:] array_view_uint8
-        cdef float[:,:,:] array_view_float
-        if buffer_type == 1:
-            array = cython_array(shape=(crop_height_, crop_width_, num_chans), itemsize=1, format='B', mode='c', allocate_buffer=True)
-            array_view_uint8 = array
-            data = <void*>&array_view_uint8[0, 0, 0]
-        else:
-            array = cython_array(shape=(crop_height_, crop_width_, num_chans), itemsize=4, format='f', mode='c', allocate_buffer=True)
-            array_view_float = array
-            data = <void*>&array_view_float[0, 0, 0]
+        cdef int32_t itemsize = buffer_type_itemsize(buffer_type)
+        array = cython_array(shape=(crop_height_, crop_width_, num_chans),
+                             itemsize=itemsize, format=buffer_type_format(buffer_type),
+                             mode='c', allocate_buffer=True)
+        data = <void*>array.data
 
-        cdef int32_t stride = crop_width_ * num_chans * (1 if buffer_type == 1 else 4)
+        cdef int32_t stride = crop_width_ * num_chans * itemsize
 
         cdef platformViewport* platform = <platformViewport*>self.context.viewport.get_platform()
         if platform == NULL:
@@ -771,6 +1449,7 @@ cdef class Pattern(baseItem):
     def texture(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(isinstance(value, Texture)) and value is not None:
             raise TypeError("texture must be a Texture object or None")
         self._texture = value
@@ -790,6 +1469,7 @@ cdef class Pattern(baseItem):
     def x_mode(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value == "points":
             self._x_mode = 0
         elif value == "length":
@@ -814,6 +1494,7 @@ cdef class Pattern(baseItem):
     def scale_factor(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value <= 0:
             raise ValueError("scale_factor must be positive")
         self._scale_factor = value
@@ -834,6 +1515,7 @@ cdef class Pattern(baseItem):
     def screen_space(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._screen_space = value
 
     # Base factory method
@@ -139,6 +139,7 @@ cdef class baseThemeColor(baseTheme):
     cdef void _common_setter(self, int32_t index, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._index_to_value.erase(index)
             return
@@ -1339,6 +1340,7 @@ cdef class baseThemeStyle(baseTheme):
     def no_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._dpi_scaling = not(value)
 
     @property
@@ -1358,6 +1360,7 @@ cdef class baseThemeStyle(baseTheme):
     def no_rounding(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._round_after_scale = not(value)
 
     @cython.annotation_typing(False)
@@ -1441,6 +1444,7 @@ cdef class baseThemeStyle(baseTheme):
     cdef void _common_setter(self, int32_t index, theme_value_types type, bint should_scale, bint should_round, py_value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if py_value is None:
             # Delete the value
             self._index_to_value.erase(index)
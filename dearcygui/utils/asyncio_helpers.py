@@ -669,27 +669,24 @@ async def run_viewport_loop(
     """
     Run the viewport's rendering loop in an asyncio-friendly manner.
 
+    Frames are rendered with viewport.render_frame_async, which
+    yields to the event loop instead of blocking. When
+    viewport.wait_for_input is set, the loop sleeps until an input,
+    a wake() or a timed refresh occurs, without consuming cpu.
+
     Args:
         viewport: The DearCyGui viewport object
-        frame_rate: Target frame rate for checking events, default is 120Hz
+        frame_rate: Maximum frame rate, default is 120Hz
     """
     frame_time = 1.0 / frame_rate
+    next_frame_time = 0.
 
     while viewport.context.running:
-        # Check if there are events waiting to be processed
-        if viewport.wait_for_input:
-            # Note: viewport.wait_for_input must be set to True
-            # for wait_events to not always return True
-            has_events = viewport.wait_events(timeout_ms=0)
-        else:
-            has_events = True
-
-        # Render a frame if there are events
-        if has_events:
-            if not viewport.render_frame():
-                # frame needs to be re-rendered
-                # we still yield to allow other tasks to run
-                await asyncio.sleep(0)
-                continue
-
-        await asyncio.sleep(frame_time)
+        # Always yield, as render_frame_async does not suspend
+        # when it has no reason to wait (for instance without
+        # vsync nor wait_for_input).
+        await asyncio.sleep(max(0., next_frame_time - time.monotonic()))
+        frame_start = time.monotonic()
+        await viewport.render_frame_async()
+        # Frames that are not presented are throttled as well
+        next_frame_time = frame_start + frame_time
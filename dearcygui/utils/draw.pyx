@@ -111,6 +111,7 @@ cdef class DrawStream(dcg.DrawingList):
     def allow_no_children(self, bint value):
         cdef unique_lock[DCGMutex] m
         dcg.lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._allow_no_children = value
 
     @property
@@ -128,6 +129,7 @@ cdef class DrawStream(dcg.DrawingList):
     def no_skip_children(self, bint value):
         cdef unique_lock[DCGMutex] m
         dcg.lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_skip_children = value
 
     @property
@@ -144,6 +146,7 @@ cdef class DrawStream(dcg.DrawingList):
     def no_wake(self, bint value):
         cdef unique_lock[DCGMutex] m
         dcg.lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_wake = value
 
     @property
@@ -161,6 +164,7 @@ cdef class DrawStream(dcg.DrawingList):
     def time_modulus(self, double value):
         cdef unique_lock[DCGMutex] m
         dcg.lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._time_modulus = value
 
     def clear(self, only_outdated=False):
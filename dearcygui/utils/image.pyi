@@ -8,11 +8,132 @@
 class DrawTiledImage(dcg.drawingItem):
     """
     This item enables to easily display a possibly huge
-    image by only loading the image times that are currently
+    image by only loading the image tiles that are currently
     visible.
 
-    The texture management is handled implicitly.
+    Tiles can either be managed manually (add_tile, remove_tile,
+    etc), or be loaded implicitly from a tile_source, which
+    serves a multi-resolution pyramid of the image:
+    the level matching the current zoom is drawn, missing
+    tiles are requested in the background (from the center
+    of the visible area outwards, with a prefetch margin),
+    coarser levels are drawn in place of tiles not loaded yet,
+    and the least recently drawn tiles are released when
+    max_tiles is exceeded.
     """
+    @property
+    def tile_source(self):
+        """
+        Multi-resolution source of the image tiles.
+
+        Any object with the following attributes:
+        - width, height: size in pixels of the full resolution image
+        - tile_size: size in pixels of the tiles (at every level)
+        - num_levels (optional): number of levels. Level l is the
+            image downsampled by 2**l. Defaults to the number of
+            levels needed to fit the image in a single tile.
+        - get_tile(level, tx, ty): returns the content of tile
+            (tx, ty) of the level, as an array of shape
+            (tile_size, tile_size[, num_chans]) (smaller for the
+            tiles on the right and bottom borders).
+
+        get_tile is called from background threads, possibly
+        concurrently. Tiles for which it raises or returns None
+        are not requested again until the source is set again.
+        """
+        ...
+
+    @tile_source.setter
+    def tile_source(self, value): # -> None:
+        ...
+
+    @property
+    def pmin(self) -> dcg.Coord:
+        """
+        Coordinate of the top left of the tile_source image.
+
+        Defaults to (0, 0).
+        """
+        ...
+
+    @pmin.setter
+    def pmin(self, value): # -> None:
+        ...
+
+    @property
+    def pmax(self) -> dcg.Coord | None:
+        """
+        Coordinate of the bottom right of the tile_source image.
+
+        Defaults to None, in which case a full resolution
+        pixel is one coordinate unit.
+        """
+        ...
+
+    @pmax.setter
+    def pmax(self, value): # -> None:
+        ...
+
+    @property
+    def prefetch_margin(self) -> int:
+        """
+        Number of tiles around the visible area that are
+        loaded in advance. Defaults to 1.
+        """
+        ...
+
+    @prefetch_margin.setter
+    def prefetch_margin(self, value: int): # -> None:
+        ...
+
+    @property
+    def max_tiles(self) -> int:
+        """
+        Maximum number of tile_source tiles kept in GPU memory.
+
+        When exceeded, the least recently drawn tiles are
+        released. Tiles drawn during the current frame are
+        never released. Defaults to 512.
+        """
+        ...
+
+    @max_tiles.setter
+    def max_tiles(self, value: int): # -> None:
+        ...
+
+    @property
+    def max_concurrent_loads(self) -> int:
+        """
+        Maximum number of get_tile calls running at the same
+        time for this item. Defaults to 4.
+        """
+        ...
+
+    @max_concurrent_loads.setter
+    def max_concurrent_loads(self, value: int): # -> None:
+        ...
+
+    @property
+    def nearest_neighbor_upsampling(self) -> bool:
+        """
+        Whether tile_source tiles use nearest neighbor upsampling
+        when zoomed beyond full resolution. Applies to the tiles
+        loaded after the change.
+        """
+        ...
+
+    @nearest_neighbor_upsampling.setter
+    def nearest_neighbor_upsampling(self, value: bool): # -> None:
+        ...
+
+    @property
+    def loaded_tiles(self) -> list[tuple[int, int, int]]:
+        """
+        List of the (level, tx, ty) tile_source tiles
+        currently in GPU memory.
+        """
+        ...
+
     def get_tile_data(self, uuid: int) -> dict:
         """
         Get tile information
@@ -6,16 +6,21 @@ from dearcygui.core cimport lock_gil_friendly
 from dearcygui.c_types cimport unique_lock, DCGMutex
 from dearcygui.imgui cimport draw_image_quad, t_draw_image_quad
 from libc.stdint cimport int32_t, int64_t
-from libcpp.cmath cimport round as cround
+from libcpp.algorithm cimport sort
+from libcpp.cmath cimport round as cround, floor, ceil, log2, fabs
 from libcpp.map cimport map, pair
 from libcpp.set cimport set
+from libcpp.unordered_map cimport unordered_map
+from libcpp.unordered_set cimport unordered_set
 from libcpp.vector cimport vector
 from cython.operator cimport dereference
 from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
 from libcpp.memory cimport unique_ptr
 
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 import pathlib
 from typing import Tuple
+from warnings import warn as _warn
 
 """
 Data structure to store the tile data.
@@ -31,13 +36,45 @@ cdef struct TileData:
     bint show
     PyObject *texture
 
+"""
+Tile of a pyramid tile source, indexed by pyramid_key
+"""
+cdef struct PyramidTile:
+    int32_t width # texture size
+    int32_t height
+    int64_t last_frame_count
+    PyObject *texture
+
+cdef inline int64_t pyramid_key(int32_t level, int64_t tx, int64_t ty) noexcept nogil:
+    return (<int64_t>level << 58) | (tx << 29) | ty
+
+cdef object _tile_executor = None
+
+cdef object _get_tile_executor():
+    global _tile_executor
+    if _tile_executor is None:
+        _tile_executor = _ThreadPoolExecutor(max_workers=4,
+                                             thread_name_prefix="dcg_tile_loader")
+    return _tile_executor
+
+def _run_tile_loader(DrawTiledImage item):
+    item._run_tile_loader()
+
 cdef class DrawTiledImage(dcg.drawingItem):
     """
     This item enables to easily display a possibly huge
-    image by only loading the image times that are currently
+    image by only loading the image tiles that are currently
     visible.
 
-    The texture management is handled implicitly.
+    Tiles can either be managed manually (add_tile, remove_tile,
+    etc), or be loaded implicitly from a tile_source, which
+    serves a multi-resolution pyramid of the image:
+    the level matching the current zoom is drawn, missing
+    tiles are requested in the background (from the center
+    of the visible area outwards, with a prefetch margin),
+    coarser levels are drawn in place of tiles not loaded yet,
+    and the least recently drawn tiles are released when
+    max_tiles is exceeded.
     """
 
     cdef double margin
@@ -45,20 +82,358 @@ cdef class DrawTiledImage(dcg.drawingItem):
     # if the map/set implementation changes.
     cdef map[int64_t, TileData] *_tiles
     cdef set[pair[int32_t, int32_t]] *_requested_tiles
+    # Pyramid tile source
+    cdef object _source
+    cdef int64_t _source_generation
+    cdef int64_t _image_width # level 0
+    cdef int64_t _image_height
+    cdef int32_t _tile_size
+    cdef int32_t _num_levels
+    cdef double[2] _pmin
+    cdef double[2] _pmax
+    cdef bint _has_pmax
+    cdef int32_t _prefetch_margin
+    cdef int32_t _max_tiles
+    cdef int32_t _max_concurrent_loads
+    cdef int32_t _active_loaders
+    cdef bint _nearest
+    cdef unordered_map[int64_t, PyramidTile] *_pyramid_tiles
+    cdef unordered_set[int64_t] *_loading
+    cdef unordered_set[int64_t] *_failed # not requested again
+    cdef vector[int64_t] *_wanted # requests, highest priority last
 
     def __cinit__(self):
         self.margin = 128
         self._tiles = new map[int64_t, TileData]()
         self._requested_tiles = new set[pair[int32_t, int32_t]]()
+        self._source_generation = 0
+        self._image_width = 0
+        self._image_height = 0
+        self._tile_size = 0
+        self._num_levels = 0
+        self._pmin = [0., 0.]
+        self._pmax = [0., 0.]
+        self._has_pmax = False
+        self._prefetch_margin = 1
+        self._max_tiles = 512
+        self._max_concurrent_loads = 4
+        self._active_loaders = 0
+        self._nearest = False
+        self._pyramid_tiles = new unordered_map[int64_t, PyramidTile]()
+        self._loading = new unordered_set[int64_t]()
+        self._failed = new unordered_set[int64_t]()
+        self._wanted = new vector[int64_t]()
 
     def __dealloc__(self):
         cdef pair[int64_t, TileData] tile_data
-        for tile_data in dereference(self._tiles):
-            Py_DECREF(<dcg.Texture>tile_data.second.texture)
         if self._tiles != NULL:
+            for tile_data in dereference(self._tiles):
+                Py_DECREF(<dcg.Texture>tile_data.second.texture)
             del self._tiles
         if self._requested_tiles != NULL:
             del self._requested_tiles
+        if self._pyramid_tiles != NULL:
+            self._clear_pyramid()
+            del self._pyramid_tiles
+        if self._loading != NULL:
+            del self._loading
+        if self._failed != NULL:
+            del self._failed
+        if self._wanted != NULL:
+            del self._wanted
+
+    @property
+    def tile_source(self):
+        """
+        Multi-resolution source of the image tiles.
+
+        Any object with the following attributes:
+        - width, height: size in pixels of the full resolution image
+        - tile_size: size in pixels of the tiles (at every level)
+        - num_levels (optional): number of levels. Level l is the
+            image downsampled by 2**l. Defaults to the number of
+            levels needed to fit the image in a single tile.
+        - get_tile(level, tx, ty): returns the content of tile
+            (tx, ty) of the level, as an array of shape
+            (tile_size, tile_size[, num_chans]) (smaller for the
+            tiles on the right and bottom borders).
+
+        get_tile is called from background threads, possibly
+        concurrently. Tiles for which it raises or returns None
+        are not requested again until the source is set again.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._source
+
+    @tile_source.setter
+    def tile_source(self, value):
+        cdef unique_lock[DCGMutex] m
+        cdef int64_t width = 0, height = 0
+        cdef int32_t tile_size = 0, num_levels = 0
+        if value is not None:
+            width = value.width
+            height = value.height
+            tile_size = value.tile_size
+            if width <= 0 or height <= 0 or tile_size <= 0:
+                raise ValueError("Invalid tile source dimensions")
+            num_levels = getattr(value, "num_levels", 0) or 0
+            if num_levels <= 0:
+                num_levels = 1
+                while (tile_size << (num_levels - 1)) < max(width, height):
+                    num_levels += 1
+            if num_levels > 29:
+                raise ValueError("Too many pyramid levels")
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        self._clear_pyramid()
+        self._source = value
+        self._source_generation += 1
+        self._image_width = width
+        self._image_height = height
+        self._tile_size = tile_size
+        self._num_levels = num_levels
+
+    @property
+    def pmin(self):
+        """
+        Coordinate of the top left of the tile_source image.
+
+        Defaults to (0, 0).
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return dcg.Coord.build(self._pmin)
+
+    @pmin.setter
+    def pmin(self, value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        dcg.read_coord(self._pmin, value)
+
+    @property
+    def pmax(self):
+        """
+        Coordinate of the bottom right of the tile_source image.
+
+        Defaults to None, in which case a full resolution
+        pixel is one coordinate unit.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if not(self._has_pmax):
+            return None
+        return dcg.Coord.build(self._pmax)
+
+    @pmax.setter
+    def pmax(self, value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if value is None:
+            self._has_pmax = False
+            return
+        dcg.read_coord(self._pmax, value)
+        self._has_pmax = True
+
+    @property
+    def prefetch_margin(self):
+        """
+        Number of tiles around the visible area that are
+        loaded in advance. Defaults to 1.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._prefetch_margin
+
+    @prefetch_margin.setter
+    def prefetch_margin(self, int32_t value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if value < 0:
+            raise ValueError("prefetch_margin must be positive")
+        self._prefetch_margin = value
+
+    @property
+    def max_tiles(self):
+        """
+        Maximum number of tile_source tiles kept in GPU memory.
+
+        When exceeded, the least recently drawn tiles are
+        released. Tiles drawn during the current frame are
+        never released. Defaults to 512.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._max_tiles
+
+    @max_tiles.setter
+    def max_tiles(self, int32_t value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if value < 1:
+            raise ValueError("max_tiles must be at least 1")
+        self._max_tiles = value
+        self._evict_pyramid_tiles()
+
+    @property
+    def max_concurrent_loads(self):
+        """
+        Maximum number of get_tile calls running at the same
+        time for this item. Defaults to 4.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._max_concurrent_loads
+
+    @max_concurrent_loads.setter
+    def max_concurrent_loads(self, int32_t value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        if value < 1:
+            raise ValueError("max_concurrent_loads must be at least 1")
+        self._max_concurrent_loads = value
+
+    @property
+    def nearest_neighbor_upsampling(self):
+        """
+        Whether tile_source tiles use nearest neighbor upsampling
+        when zoomed beyond full resolution. Applies to the tiles
+        loaded after the change.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._nearest
+
+    @nearest_neighbor_upsampling.setter
+    def nearest_neighbor_upsampling(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        self._nearest = value
+
+    @property
+    def loaded_tiles(self):
+        """
+        List of the (level, tx, ty) tile_source tiles
+        currently in GPU memory.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        cdef pair[int64_t, PyramidTile] tile
+        result = []
+        for tile in dereference(self._pyramid_tiles):
+            result.append((tile.first >> 58,
+                           (tile.first >> 29) & 0x1FFFFFFF,
+                           tile.first & 0x1FFFFFFF))
+        return result
+
+    cdef void _clear_pyramid(self):
+        """Release all the tile_source tiles. The mutex must be held."""
+        cdef pair[int64_t, PyramidTile] tile
+        for tile in dereference(self._pyramid_tiles):
+            Py_DECREF(<dcg.Texture>tile.second.texture)
+        self._pyramid_tiles.clear()
+        self._loading.clear()
+        self._failed.clear()
+        self._wanted.clear()
+
+    cdef void _evict_pyramid_tiles(self):
+        """
+        Release the least recently drawn tiles above max_tiles.
+        The mutex must be held.
+        """
+        cdef int64_t current_frame = self.context.viewport.frame_count
+        cdef unordered_map[int64_t, PyramidTile].iterator it
+        cdef unordered_map[int64_t, PyramidTile].iterator oldest
+        while <int64_t>self._pyramid_tiles.size() > self._max_tiles:
+            oldest = self._pyramid_tiles.end()
+            it = self._pyramid_tiles.begin()
+            while it != self._pyramid_tiles.end():
+                if dereference(it).second.last_frame_count < current_frame and \
+                   (oldest == self._pyramid_tiles.end() or \
+                    dereference(it).second.last_frame_count < dereference(oldest).second.last_frame_count):
+                    oldest = it
+                it += 1
+            if oldest == self._pyramid_tiles.end():
+                return
+            Py_DECREF(<dcg.Texture>dereference(oldest).second.texture)
+            self._pyramid_tiles.erase(oldest)
+
+    cdef void _run_tile_loader(self):
+        """
+        Load the requested tiles, highest priority first,
+        until there are none left. Runs in the tile executor.
+        """
+        cdef unique_lock[DCGMutex] m
+        try:
+            self._load_wanted_tiles(m)
+        finally:
+            if not(m.owns_lock()):
+                lock_gil_friendly(m, self.mutex)
+            self._active_loaders -= 1
+
+    cdef void _load_wanted_tiles(self, unique_lock[DCGMutex] &m):
+        """
+        Loop of _run_tile_loader. Returns with the mutex held.
+        """
+        cdef int64_t key, generation
+        cdef PyramidTile tile
+        cdef dcg.Texture texture
+        cdef pair[int64_t, PyramidTile] tile_data
+        while True:
+            lock_gil_friendly(m, self.mutex)
+            if self._wanted.empty() or self._source is None:
+                return
+            key = self._wanted.back()
+            self._wanted.pop_back()
+            if self._pyramid_tiles.find(key) != self._pyramid_tiles.end() or \
+               self._loading.find(key) != self._loading.end() or \
+               self._failed.find(key) != self._failed.end():
+                m.unlock()
+                continue
+            self._loading.insert(key)
+            source = self._source
+            generation = self._source_generation
+            nearest = self._nearest
+            m.unlock()
+
+            texture = None
+            try:
+                content = source.get_tile(key >> 58,
+                                          (key >> 29) & 0x1FFFFFFF,
+                                          key & 0x1FFFFFFF)
+                if content is not None:
+                    texture = dcg.Texture(self.context, content,
+                                          nearest_neighbor_upsampling=nearest)
+            except Exception as e:
+                _warn(f"Failed to load tile {(key >> 58, (key >> 29) & 0x1FFFFFFF, key & 0x1FFFFFFF)}: {e}")
+
+            lock_gil_friendly(m, self.mutex)
+            self._loading.erase(key)
+            if generation != self._source_generation:
+                # The source changed in between
+                m.unlock()
+                continue
+            if texture is None:
+                # Failed tiles do not count towards max_tiles
+                self._failed.insert(key)
+                m.unlock()
+                continue
+            tile.width = texture.width
+            tile.height = texture.height
+            tile.last_frame_count = self.context.viewport.frame_count
+            Py_INCREF(texture)
+            tile.texture = <PyObject*>texture
+            tile_data.first = key
+            tile_data.second = tile
+            self._pyramid_tiles.insert(tile_data)
+            self._evict_pyramid_tiles()
+            m.unlock()
+            self.invalidate()
 
     '''
     @property
@@ -250,9 +625,13 @@ cdef class DrawTiledImage(dcg.drawingItem):
         # Display each tile already loaded that are visible:
         cdef pair[int64_t, TileData] tile_data
         cdef TileData tile
+        cdef unique_lock[DCGMutex] m2
         for tile_data in dereference(self._tiles):
             tile = tile_data.second
             if tile.xmin < xmax and tile.xmax > xmin and tile.ymin < ymax and tile.ymax > ymin and tile.show:
+                m2 = unique_lock[DCGMutex]((<dcg.Texture>tile.texture).mutex)
+                if not((<dcg.Texture>tile.texture).c_mark_used()):
+                    continue
                 # Draw the tile
                 draw_image_quad(self.context,
                                 drawlist,
@@ -266,8 +645,204 @@ cdef class DrawTiledImage(dcg.drawingItem):
                                 1., 1.,
                                 0., 1.,
                                 4294967295)
+                m2.unlock()
                 tile.last_frame_count = self.context.viewport.frame_count
-        return
+
+        if self._source is not None:
+            self._draw_pyramid(drawlist, xmin, xmax, ymin, ymax)
+
+    cdef bint _draw_pyramid_tile(self, void* drawlist, int64_t key,
+                                 double qx0, double qy0, double qx1, double qy1,
+                                 double x0, double y0, double sx, double sy) noexcept nogil:
+        """
+        Draw the part of a loaded tile that covers the area
+        [qx0, qx1] x [qy0, qy1] (in full resolution pixels).
+        Returns False if the tile is not loaded.
+        """
+        cdef unordered_map[int64_t, PyramidTile].iterator it = self._pyramid_tiles.find(key)
+        if it == self._pyramid_tiles.end():
+            return False
+        cdef PyramidTile *tile = &dereference(it).second
+        cdef double scale = <double>(<int64_t>1 << (key >> 58))
+        # Area of the tile in full resolution pixels
+        cdef double tx0 = <double>((key >> 29) & 0x1FFFFFFF) * self._tile_size * scale
+        cdef double ty0 = <double>(key & 0x1FFFFFFF) * self._tile_size * scale
+        cdef double tw = tile.width * scale
+        cdef double th = tile.height * scale
+        qx0 = max(qx0, tx0)
+        qy0 = max(qy0, ty0)
+        qx1 = min(qx1, min(tx0 + tw, <double>self._image_width))
+        qy1 = min(qy1, min(ty0 + th, <double>self._image_height))
+        tile.last_frame_count = self.context.viewport.frame_count
+        if qx1 <= qx0 or qy1 <= qy0:
+            return True
+        cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex]((<dcg.Texture>tile.texture).mutex)
+        if not((<dcg.Texture>tile.texture).c_mark_used()):
+            return False
+        cdef float u0 = (qx0 - tx0) / tw
+        cdef float u1 = (qx1 - tx0) / tw
+        cdef float v0 = (qy0 - ty0) / th
+        cdef float v1 = (qy1 - ty0) / th
+        cdef double cx0 = x0 + qx0 * sx
+        cdef double cx1 = x0 + qx1 * sx
+        cdef double cy0 = y0 + qy0 * sy
+        cdef double cy1 = y0 + qy1 * sy
+        draw_image_quad(self.context,
+                        drawlist,
+                        (<dcg.Texture>tile.texture).allocated_texture,
+                        cx0, cy0,
+                        cx1, cy0,
+                        cx1, cy1,
+                        cx0, cy1,
+                        u0, v0,
+                        u1, v0,
+                        u1, v1,
+                        u0, v1,
+                        4294967295)
+        return True
+
+    cdef void _draw_pyramid(self, void* drawlist,
+                            double xmin, double xmax,
+                            double ymin, double ymax) noexcept nogil:
+        """
+        Draw the visible tiles of the tile_source at the level
+        matching the zoom, and request the missing ones.
+        """
+        cdef double W = <double>self._image_width
+        cdef double H = <double>self._image_height
+        # Image extent in coordinate space
+        cdef double x0 = self._pmin[0]
+        cdef double y0 = self._pmin[1]
+        cdef double x1 = self._pmax[0] if self._has_pmax else x0 + W
+        cdef double y1 = self._pmax[1] if self._has_pmax else y0 + H
+        # Coordinate units per full resolution pixel
+        cdef double sx = (x1 - x0) / W
+        cdef double sy = (y1 - y0) / H
+        if sx == 0. or sy == 0.:
+            return
+
+        # Visible area in full resolution pixels
+        cdef double px0 = (xmin - x0) / sx
+        cdef double px1 = (xmax - x0) / sx
+        cdef double py0 = (ymin - y0) / sy
+        cdef double py1 = (ymax - y0) / sy
+        if px1 < px0:
+            px0, px1 = px1, px0
+        if py1 < py0:
+            py0, py1 = py1, py0
+        px0 = max(px0, 0.)
+        py0 = max(py0, 0.)
+        px1 = min(px1, W)
+        py1 = min(py1, H)
+        if px1 <= px0 or py1 <= py0:
+            return
+
+        # Pick the level whose pixels are the closest to screen pixels
+        cdef float[2] s0, s1
+        cdef double[2] c
+        c[0] = x0
+        c[1] = y0
+        self.context.viewport.coordinate_to_screen(s0, c)
+        c[0] = x1
+        c[1] = y1
+        self.context.viewport.coordinate_to_screen(s1, c)
+        cdef double screen_per_pixel = max(fabs(s1[0] - s0[0]) / W,
+                                           fabs(s1[1] - s0[1]) / H)
+        cdef int32_t level = self._num_levels - 1
+        if screen_per_pixel > 0.:
+            level = <int32_t>min(<double>(self._num_levels - 1),
+                                 max(0., floor(log2(1. / screen_per_pixel))))
+
+        cdef int64_t current_frame = self.context.viewport.frame_count
+        cdef double T = <double>self._tile_size * <double>(<int64_t>1 << level)
+        cdef int64_t num_tx = <int64_t>ceil(W / T)
+        cdef int64_t num_ty = <int64_t>ceil(H / T)
+        cdef int64_t tx_min = <int64_t>floor(px0 / T)
+        cdef int64_t ty_min = <int64_t>floor(py0 / T)
+        cdef int64_t tx_max = min(num_tx - 1, <int64_t>ceil(px1 / T) - 1)
+        cdef int64_t ty_max = min(num_ty - 1, <int64_t>ceil(py1 / T) - 1)
+        cdef double center_x = 0.5 * (px0 + px1) / T
+        cdef double center_y = 0.5 * (py0 + py1) / T
+
+        cdef vector[pair[double, int64_t]] requests
+        cdef pair[double, int64_t] request
+        cdef int64_t tx, ty, key, parent_key
+        cdef int32_t parent_level
+        cdef bint visible
+        cdef bint missing = False
+        cdef int32_t margin = self._prefetch_margin
+        cdef double dx, dy
+        for ty in range(max(0, ty_min - margin), min(num_ty - 1, ty_max + margin) + 1):
+            for tx in range(max(0, tx_min - margin), min(num_tx - 1, tx_max + margin) + 1):
+                key = pyramid_key(level, tx, ty)
+                visible = tx >= tx_min and tx <= tx_max and ty >= ty_min and ty <= ty_max
+                if visible and \
+                   self._draw_pyramid_tile(drawlist, key,
+                                           tx * T, ty * T, (tx + 1) * T, (ty + 1) * T,
+                                           x0, y0, sx, sy):
+                    continue
+                if self._pyramid_tiles.find(key) == self._pyramid_tiles.end() and \
+                   self._loading.find(key) == self._loading.end() and \
+                   self._failed.find(key) == self._failed.end():
+                    # Center first, prefetched tiles after the visible ones
+                    dx = tx + 0.5 - center_x
+                    dy = ty + 0.5 - center_y
+                    request.first = dx * dx + dy * dy
+                    if not(visible):
+                        request.first += 1e12
+                    request.second = key
+                    requests.push_back(request)
+                if not(visible):
+                    continue
+                missing = True
+                # Draw a coarser level in place of the missing tile
+                for parent_level in range(level + 1, self._num_levels):
+                    parent_key = pyramid_key(parent_level,
+                                             tx >> (parent_level - level),
+                                             ty >> (parent_level - level))
+                    if self._draw_pyramid_tile(drawlist, parent_key,
+                                               tx * T, ty * T, (tx + 1) * T, (ty + 1) * T,
+                                               x0, y0, sx, sy):
+                        break
+
+        # The coarsest level is requested first, so that
+        # there is always something to draw in place of
+        # the missing tiles.
+        cdef int32_t top = self._num_levels - 1
+        cdef double top_T = <double>self._tile_size * <double>(<int64_t>1 << top)
+        if top != level and missing:
+            for ty in range(<int64_t>floor(py0 / top_T), <int64_t>ceil(py1 / top_T)):
+                for tx in range(<int64_t>floor(px0 / top_T), <int64_t>ceil(px1 / top_T)):
+                    key = pyramid_key(top, tx, ty)
+                    if self._pyramid_tiles.find(key) == self._pyramid_tiles.end() and \
+                       self._loading.find(key) == self._loading.end() and \
+                       self._failed.find(key) == self._failed.end():
+                        request.first = -1.
+                        request.second = key
+                        requests.push_back(request)
+
+        # Tiles loaded while older ones were still drawn
+        if <int64_t>self._pyramid_tiles.size() > self._max_tiles:
+            with gil:
+                self._evict_pyramid_tiles()
+
+        # Replace the previous requests, which
+        # might not be visible anymore.
+        sort(requests.begin(), requests.end())
+        self._wanted.clear()
+        cdef int32_t i
+        for i in range(<int32_t>requests.size() - 1, -1, -1):
+            self._wanted.push_back(requests[i].second)
+
+        cdef int32_t num_new_loaders = 0
+        if not(self._wanted.empty()) and self._active_loaders < self._max_concurrent_loads:
+            num_new_loaders = min(self._max_concurrent_loads - self._active_loaders,
+                                  <int32_t>self._wanted.size())
+            self._active_loaders += num_new_loaders
+            with gil:
+                executor = _get_tile_executor()
+                for i in range(num_new_loaders):
+                    executor.submit(_run_tile_loader, self)
 
 
 
@@ -591,6 +1166,7 @@ cdef class DrawSVG(dcg.drawingItem):
     def svg_path(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
     
         # Store path and create renderer
         self._svg_path = value
@@ -615,6 +1191,7 @@ cdef class DrawSVG(dcg.drawingItem):
     def pmin(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         dcg.read_coord(self._pmin, value)
 
     @property 
@@ -633,6 +1210,7 @@ cdef class DrawSVG(dcg.drawingItem):
     def pmax(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         dcg.read_coord(self._pmax, value)
 
     @property
@@ -652,6 +1230,7 @@ cdef class DrawSVG(dcg.drawingItem):
     def no_preserve_ratio(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._preserve_ratio = not(value)
 
     ''' Hidden as should be reworked
@@ -666,6 +1245,7 @@ cdef class DrawSVG(dcg.drawingItem):
     def no_fill_area(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_fill_area = value
     '''
 
@@ -685,6 +1265,7 @@ cdef class DrawSVG(dcg.drawingItem):
     def no_centering(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_centering = value
 
     cdef void draw(self, void* drawlist) noexcept nogil:
@@ -848,6 +1429,11 @@ cdef class DrawSVG(dcg.drawingItem):
         if flip_y:
             v0, v1 = v1, v0
 
+        cdef unique_lock[DCGMutex] m2 = unique_lock[DCGMutex](self._texture.mutex)
+        if not(self._texture.c_mark_used()):
+            # Evicted: render the SVG again on the next frame
+            self._texture_width = 0
+            return
         t_draw_image_quad(self.context,
                           drawlist,
                           self._texture.allocated_texture,
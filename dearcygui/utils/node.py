@@ -642,10 +642,10 @@ def _cleanup_motion_handler(self) -> None:
     Generic utils
     """
 
-    def delete_item(self) -> None:
+    def delete_item(self, deferred: bool = False) -> None:
         """Delete the link and remove handlers"""
         self._cleanup_motion_handler()
-        super().delete_item()
+        super().delete_item(deferred)
 
     @property
     def node_editor(self) -> BaseNodeEditor | None:
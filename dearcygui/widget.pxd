@@ -1,7 +1,7 @@
 from libc.stdint cimport uint32_t, int32_t, int64_t
 
 from .core cimport baseItem, uiItem, drawingItem, itemState, \
-    baseHandler, SharedValue
+    baseHandler, SharedValue, DrawListCache
 from .c_types cimport Vec2, Vec4, DCGVector, DCGString
 from .texture cimport Texture
 
@@ -26,6 +26,7 @@ cdef class DrawInWindow(uiItem):
     cdef bint invert_y
     cdef bint relative_scaling
     cdef bint _no_global_scale
+    cdef DrawListCache _drawlist_cache
     cdef bint draw_item(self) noexcept nogil
 
 cdef class SimplePlot(uiItem):
@@ -180,6 +181,7 @@ cdef class CollapsingHeader(uiItem):
 cdef class ChildWindow(uiItem):
     cdef int32_t _window_flags # imgui.ImGuiWindowFlags
     cdef int32_t _child_flags # imgui.ImGuiChildFlags
+    cdef DrawListCache _drawlist_cache
     cdef bint draw_item(self) noexcept nogil
 
 cdef class ColorButton(uiItem):
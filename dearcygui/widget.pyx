@@ -21,6 +21,7 @@ from libc.stdlib cimport malloc, free
 from libc.string cimport memcpy, memset
 
 from libcpp.cmath cimport trunc
+from libcpp.string cimport string
 from libc.math cimport INFINITY
 
 from cpython.object cimport PyObject
@@ -34,7 +35,7 @@ from .core cimport baseHandler, drawingItem, uiItem, \
     draw_drawing_children, draw_menubar_children, \
     draw_ui_children, button_area, \
     draw_tab_children, Callback, ItemStateView, \
-    Context, SharedValue, update_current_mouse_states
+    Context, SharedValue, update_current_mouse_states, DrawListCache
 from .c_types cimport unique_lock, DCGMutex, Vec2, Vec4, \
     DCGString, string_to_str, string_from_str, string_from_bytes,\
     swap_Vec2
@@ -129,6 +130,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def button(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._button = <int32_t>make_MouseButtonMask(value)
 
     @property
@@ -145,6 +147,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def p1(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[double](self._p1, value)
 
     @property
@@ -161,6 +164,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def p2(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_point[double](self._p2, value)
 
     @property
@@ -180,6 +184,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def min_side(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 0:
             value = 0
         self._min_side = value
@@ -201,6 +206,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def max_side(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 0:
             value = 0
         self._max_side = value
@@ -260,6 +266,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def no_input(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_input = value
 
     @property
@@ -285,6 +292,7 @@ cdef class DrawInvisibleButton(drawingItem):
     def capture_mouse(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._capture_mouse = value
 
     @property
@@ -519,6 +527,7 @@ cdef class DrawInWindow(uiItem):
     def button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.button = value
 
     @property
@@ -537,6 +546,7 @@ cdef class DrawInWindow(uiItem):
     def frame(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.has_frame = value
 
     @property
@@ -556,6 +566,7 @@ cdef class DrawInWindow(uiItem):
     def orig_x(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.orig_x = value
 
     @property
@@ -575,6 +586,7 @@ cdef class DrawInWindow(uiItem):
     def orig_y(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.orig_y = value
 
     @property
@@ -594,6 +606,7 @@ cdef class DrawInWindow(uiItem):
     def scale_x(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.scale_x = value
 
     @property
@@ -613,6 +626,7 @@ cdef class DrawInWindow(uiItem):
     def scale_y(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.scale_y = value
 
     @property
@@ -633,6 +647,7 @@ cdef class DrawInWindow(uiItem):
     def relative(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.relative_scaling = value
 
     @property
@@ -656,6 +671,7 @@ cdef class DrawInWindow(uiItem):
     def no_global_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_global_scale = value
 
     @property
@@ -676,8 +692,35 @@ cdef class DrawInWindow(uiItem):
     def invert_y(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self.invert_y = value
 
+    @property
+    def cache_drawlist(self):
+        """
+        Retain the vertices of the drawing elements between frames.
+
+        When enabled, the draw commands generated by the children are
+        kept and copied back as long as no child is modified and the
+        item position, size and transform are unchanged. This reduces
+        the cost of drawing many static elements. Mouse activity over
+        the parent window disables the cache for the frame, such that
+        interactive elements (DrawInvisibleButton) remain functional.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._drawlist_cache is not None
+
+    @cache_drawlist.setter
+    def cache_drawlist(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if not(value):
+            self._drawlist_cache = None
+        elif self._drawlist_cache is None:
+            self._drawlist_cache = DrawListCache()
+
     cdef bint draw_item(self) noexcept nogil:
         cdef bint no_frame = not(self.has_frame)
         # Remove frames
@@ -741,7 +784,11 @@ cdef class DrawInWindow(uiItem):
                                         starty + clip_height),
                            True)
 
-        draw_drawing_children(self, drawlist)
+        if self._drawlist_cache is None:
+            draw_drawing_children(self, drawlist)
+        elif not(self._drawlist_cache.try_replay(self, drawlist, False)):
+            draw_drawing_children(self, drawlist)
+            self._drawlist_cache.capture(self, drawlist)
 
         imgui.PopClipRect()
 
@@ -809,6 +856,7 @@ cdef class SimplePlot(uiItem):
     def scale_min(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scale_min = value
 
     @property
@@ -828,6 +876,7 @@ cdef class SimplePlot(uiItem):
     def scale_max(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._scale_max = value
 
     @property
@@ -846,6 +895,7 @@ cdef class SimplePlot(uiItem):
     def histogram(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._histogram = value
 
     @property
@@ -865,6 +915,7 @@ cdef class SimplePlot(uiItem):
     def autoscale(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._autoscale = value
 
     @property
@@ -883,6 +934,7 @@ cdef class SimplePlot(uiItem):
     def overlay(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._overlay = string_from_str(value)
 
     cdef bint draw_item(self) noexcept nogil:
@@ -964,6 +1016,7 @@ cdef class Button(uiItem):
     def arrow(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._direction = imgui.ImGuiDir_None
         elif not is_ButtonDirection(value):
@@ -987,6 +1040,7 @@ cdef class Button(uiItem):
     def small(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._small = value
 
     @property
@@ -1007,6 +1061,7 @@ cdef class Button(uiItem):
     def repeat(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._repeat = value
 
     cdef bint draw_item(self) noexcept nogil:
@@ -1085,6 +1140,7 @@ cdef class Combo(uiItem):
         cdef unique_lock[DCGMutex] m
         # cdef unique_lock[DCGMutex] value_m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._items.clear()
         if value is None:
             return
@@ -1129,6 +1185,7 @@ cdef class Combo(uiItem):
     def height_mode(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiComboFlags_HeightSmall |
                         imgui.ImGuiComboFlags_HeightRegular |
                         imgui.ImGuiComboFlags_HeightLarge |
@@ -1162,6 +1219,7 @@ cdef class Combo(uiItem):
     def popup_align_left(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiComboFlags_PopupAlignLeft
         if value:
             self._flags |= imgui.ImGuiComboFlags_PopupAlignLeft
@@ -1183,6 +1241,7 @@ cdef class Combo(uiItem):
     def no_arrow_button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiComboFlags_NoArrowButton
         if value:
             self._flags |= imgui.ImGuiComboFlags_NoArrowButton
@@ -1204,6 +1263,7 @@ cdef class Combo(uiItem):
     def no_preview(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiComboFlags_NoPreview
         if value:
             self._flags |= imgui.ImGuiComboFlags_NoPreview
@@ -1225,6 +1285,7 @@ cdef class Combo(uiItem):
     def fit_width(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiComboFlags_WidthFitPreview
         if value:
             self._flags |= imgui.ImGuiComboFlags_WidthFitPreview
@@ -1375,6 +1436,7 @@ cdef class Slider(uiItem):
     def keyboard_clamped(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSliderFlags_AlwaysClamp
         if value:
             self._flags |= imgui.ImGuiSliderFlags_AlwaysClamp
@@ -1397,6 +1459,7 @@ cdef class Slider(uiItem):
     def drag(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._drag = value
         if value:
             self._vertical = False
@@ -1417,6 +1480,7 @@ cdef class Slider(uiItem):
     def logarithmic(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSliderFlags_Logarithmic
         if value:
             self._flags |= imgui.ImGuiSliderFlags_Logarithmic
@@ -1437,6 +1501,7 @@ cdef class Slider(uiItem):
     def min_value(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._min = value
 
     @property
@@ -1455,6 +1520,7 @@ cdef class Slider(uiItem):
     def max_value(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._max = value
 
     @property
@@ -1474,6 +1540,7 @@ cdef class Slider(uiItem):
     def no_input(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSliderFlags_NoInput
         if value:
             self._flags |= imgui.ImGuiSliderFlags_NoInput
@@ -1498,6 +1565,7 @@ cdef class Slider(uiItem):
     def print_format(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._print_format = string_from_str(value)
 
     @property
@@ -1520,6 +1588,7 @@ cdef class Slider(uiItem):
     def no_round(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSliderFlags_NoRoundToFormat
         if value:
             self._flags |= imgui.ImGuiSliderFlags_NoRoundToFormat
@@ -1541,6 +1610,7 @@ cdef class Slider(uiItem):
     def speed(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._drag_speed = value
 
     @property
@@ -1561,6 +1631,7 @@ cdef class Slider(uiItem):
     def vertical(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._vertical = value
 
     cdef bint draw_item(self) noexcept nogil:
@@ -1668,6 +1739,7 @@ cdef class ListBox(uiItem):
         cdef unique_lock[DCGMutex] m
         # cdef unique_lock[DCGMutex] value_m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._items.clear()
         if value is None:
             return
@@ -1707,6 +1779,7 @@ cdef class ListBox(uiItem):
     def num_items_shown_when_open(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._num_items_shown_when_open = value
 
     cdef bint draw_item(self) noexcept nogil:
@@ -1802,6 +1875,7 @@ cdef class RadioButton(uiItem):
         cdef unique_lock[DCGMutex] m
         # cdef unique_lock[DCGMutex] value_m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._items.clear()
         if value is None:
             return
@@ -1836,6 +1910,7 @@ cdef class RadioButton(uiItem):
     def horizontal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._horizontal = value
 
     cdef bint draw_item(self) noexcept nogil:
@@ -1945,6 +2020,7 @@ cdef class InputText(uiItem):
     def hint(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._hint = string_from_str(value)
         if len(value) > 0:
             self.multiline = False
@@ -1966,6 +2042,7 @@ cdef class InputText(uiItem):
     def multiline(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._multiline = value
         if value:
             # reset hint
@@ -1988,6 +2065,7 @@ cdef class InputText(uiItem):
     def max_characters(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value < 1:
             raise ValueError("There must be at least space for one character")
         if value == self._max_characters:
@@ -2021,6 +2099,7 @@ cdef class InputText(uiItem):
     def decimal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsDecimal
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsDecimal
@@ -2042,6 +2121,7 @@ cdef class InputText(uiItem):
     def hexadecimal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsHexadecimal
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsHexadecimal
@@ -2063,6 +2143,7 @@ cdef class InputText(uiItem):
     def scientific(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsScientific
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsScientific
@@ -2085,6 +2166,7 @@ cdef class InputText(uiItem):
     def uppercase(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsUppercase
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsUppercase
@@ -2106,6 +2188,7 @@ cdef class InputText(uiItem):
     def no_spaces(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsNoBlank
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsNoBlank
@@ -2128,6 +2211,7 @@ cdef class InputText(uiItem):
     def tab_input(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_AllowTabInput
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_AllowTabInput
@@ -2150,6 +2234,7 @@ cdef class InputText(uiItem):
     def callback_on_enter(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_EnterReturnsTrue
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_EnterReturnsTrue
@@ -2172,6 +2257,7 @@ cdef class InputText(uiItem):
     def escape_clears_all(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_EscapeClearsAll
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_EscapeClearsAll
@@ -2193,6 +2279,7 @@ cdef class InputText(uiItem):
     def ctrl_enter_for_new_line(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CtrlEnterForNewLine
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CtrlEnterForNewLine
@@ -2215,6 +2302,7 @@ cdef class InputText(uiItem):
     def readonly(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_ReadOnly
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_ReadOnly
@@ -2237,6 +2325,7 @@ cdef class InputText(uiItem):
     def password(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_Password
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_Password
@@ -2259,6 +2348,7 @@ cdef class InputText(uiItem):
     def always_overwrite(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_AlwaysOverwrite
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_AlwaysOverwrite
@@ -2281,6 +2371,7 @@ cdef class InputText(uiItem):
     def auto_select_all(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_AutoSelectAll
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_AutoSelectAll
@@ -2302,6 +2393,7 @@ cdef class InputText(uiItem):
     def no_horizontal_scroll(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_NoHorizontalScroll
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_NoHorizontalScroll
@@ -2324,6 +2416,7 @@ cdef class InputText(uiItem):
     def no_undo_redo(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_NoUndoRedo
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_NoUndoRedo
@@ -2442,6 +2535,7 @@ cdef class InputValue(uiItem):
     def step(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._step = value
 
     @property
@@ -2460,6 +2554,7 @@ cdef class InputValue(uiItem):
     def step_fast(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._step_fast = value
 
     @property
@@ -2479,6 +2574,7 @@ cdef class InputValue(uiItem):
     def min_value(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._min = value
 
     @property
@@ -2498,6 +2594,7 @@ cdef class InputValue(uiItem):
     def max_value(self, double value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._max = value
 
     @property
@@ -2517,6 +2614,7 @@ cdef class InputValue(uiItem):
     def print_format(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._print_format = string_from_str(value)
 
     @property
@@ -2535,6 +2633,7 @@ cdef class InputValue(uiItem):
     def decimal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsDecimal
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsDecimal
@@ -2555,6 +2654,7 @@ cdef class InputValue(uiItem):
     def hexadecimal(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsHexadecimal
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsHexadecimal
@@ -2576,6 +2676,7 @@ cdef class InputValue(uiItem):
     def scientific(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_CharsScientific
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_CharsScientific
@@ -2597,6 +2698,7 @@ cdef class InputValue(uiItem):
     def callback_on_enter(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_EnterReturnsTrue
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_EnterReturnsTrue
@@ -2618,6 +2720,7 @@ cdef class InputValue(uiItem):
     def escape_clears_all(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_EscapeClearsAll
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_EscapeClearsAll
@@ -2639,6 +2742,7 @@ cdef class InputValue(uiItem):
     def readonly(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_ReadOnly
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_ReadOnly
@@ -2660,6 +2764,7 @@ cdef class InputValue(uiItem):
     def password(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_Password
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_Password
@@ -2681,6 +2786,7 @@ cdef class InputValue(uiItem):
     def always_overwrite(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_AlwaysOverwrite
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_AlwaysOverwrite
@@ -2702,6 +2808,7 @@ cdef class InputValue(uiItem):
     def auto_select_all(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_AutoSelectAll
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_AutoSelectAll
@@ -2723,6 +2830,7 @@ cdef class InputValue(uiItem):
     def empty_as_zero(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_ParseEmptyRefVal
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_ParseEmptyRefVal
@@ -2744,6 +2852,7 @@ cdef class InputValue(uiItem):
     def empty_if_zero(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_DisplayEmptyRefVal
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_DisplayEmptyRefVal
@@ -2765,6 +2874,7 @@ cdef class InputValue(uiItem):
     def no_horizontal_scroll(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_NoHorizontalScroll
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_NoHorizontalScroll
@@ -2786,6 +2896,7 @@ cdef class InputValue(uiItem):
     def no_undo_redo(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiInputTextFlags_NoUndoRedo
         if value:
             self._flags |= imgui.ImGuiInputTextFlags_NoUndoRedo
@@ -2875,6 +2986,7 @@ cdef class Text(uiItem):
     def color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color = parse_color(value)
 
     @property
@@ -2898,6 +3010,7 @@ cdef class Text(uiItem):
     def wrap(self, int32_t value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._wrap = value
 
     @property
@@ -2917,6 +3030,7 @@ cdef class Text(uiItem):
     def marker(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._marker = <int32_t>TextMarker.NONE
         elif is_TextMarker(value):
@@ -2946,7 +3060,8 @@ cdef class Text(uiItem):
         cdef DCGString current_value
         SharedStr.get(<SharedStr>self._value, current_value)
 
-        imgui.TextUnformatted(current_value.c_str(), current_value.c_str()+current_value.size())
+        self.context.viewport.text_layouts.text_unformatted(current_value.c_str(),
+                                                            current_value.c_str()+current_value.size())
 
         if self._wrap >= 0:
             imgui.PopTextWrapPos()
@@ -2965,6 +3080,32 @@ cdef class Text(uiItem):
         return False
 
 
+cdef extern from * nogil:
+    """
+    #include <cstdio>
+    #include <string>
+
+    // Formats into buf, or into storage when the
+    // result does not fit. Returns the formatted text.
+    template <typename... Args>
+    const char* FormatTextRetry(char* buf, size_t buf_size, std::string& storage,
+                                const char* fmt, Args... args)
+    {
+        int size = snprintf(buf, buf_size, fmt, args...);
+        if (size < 0) {
+            buf[0] = 0;
+            return buf;
+        }
+        if ((size_t)size < buf_size)
+            return buf;
+        storage.resize((size_t)size + 1);
+        snprintf(&storage[0], storage.size(), fmt, args...);
+        storage.resize((size_t)size);
+        return storage.c_str();
+    }
+    """
+    const char* FormatTextRetry(char*, size_t, string&, const char*, ...)
+
 cdef class TextValue(uiItem):
     """
     A widget that displays values from any type of SharedValue.
@@ -3015,6 +3156,7 @@ cdef class TextValue(uiItem):
     def shareable_value(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if self._value is value:
             return
         if not(isinstance(value, SharedBool) or
@@ -3030,9 +3172,7 @@ cdef class TextValue(uiItem):
             self._type = 4
         elif isinstance(value, SharedFloatVect):
             self._type = 8
-        self._value.dec_num_attached()
-        self._value = value
-        self._value.inc_num_attached()
+        self._set_shared_value(value)
 
     @property
     def print_format(self):
@@ -3059,6 +3199,7 @@ cdef class TextValue(uiItem):
     def print_format(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._print_format = string_from_str(value)
 
     cdef bint draw_item(self) noexcept nogil:
@@ -3070,21 +3211,35 @@ cdef class TextValue(uiItem):
         cdef double[4] value_float4
         cdef float[::1] value_vect
         cdef int32_t i
+        # Formatted here rather than by imgui.Text, in order
+        # to reuse the cached layout of unchanged values
+        # Long outputs are formatted again in a heap buffer
+        cdef char[1024] buf
+        cdef string storage
+        cdef const char *text
         if self._type == 0:
             value_bool = SharedBool.get(<SharedBool>self._value)
-            imgui.Text(self._print_format.c_str(), value_bool)
+            text = FormatTextRetry(buf, sizeof(buf), storage,
+                                   self._print_format.c_str(), <int>value_bool)
+            self.context.viewport.text_layouts.text_unformatted(text, NULL)
         elif self._type == 2:
             value_float = SharedFloat.get(<SharedFloat>self._value)
-            imgui.Text(self._print_format.c_str(), value_float)
+            text = FormatTextRetry(buf, sizeof(buf), storage,
+                                   self._print_format.c_str(), value_float)
+            self.context.viewport.text_layouts.text_unformatted(text, NULL)
         elif self._type == 4:
             value_color = SharedColor.getF4(<SharedColor>self._value)
-            imgui.Text(self._print_format.c_str(), 
-                       value_color.x, value_color.y, 
-                       value_color.z, value_color.w)
+            text = FormatTextRetry(buf, sizeof(buf), storage,
+                                   self._print_format.c_str(),
+                                   <double>value_color.x, <double>value_color.y,
+                                   <double>value_color.z, <double>value_color.w)
+            self.context.viewport.text_layouts.text_unformatted(text, NULL)
         elif self._type == 8:
             value_vect = SharedFloatVect.get(<SharedFloatVect>self._value)
             for i in range(value_vect.shape[0]):
-                imgui.Text(self._print_format.c_str(), value_vect[i])
+                text = FormatTextRetry(buf, sizeof(buf), storage,
+                                       self._print_format.c_str(), <double>value_vect[i])
+                self.context.viewport.text_layouts.text_unformatted(text, NULL)
 
         self.update_current_state()
         return False
@@ -3132,6 +3287,7 @@ cdef class Selectable(uiItem):
     def disable_popup_close(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSelectableFlags_NoAutoClosePopups
         if value:
             self._flags |= imgui.ImGuiSelectableFlags_NoAutoClosePopups
@@ -3154,6 +3310,7 @@ cdef class Selectable(uiItem):
     def span_columns(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSelectableFlags_SpanAllColumns
         if value:
             self._flags |= imgui.ImGuiSelectableFlags_SpanAllColumns
@@ -3198,6 +3355,7 @@ cdef class Selectable(uiItem):
     def highlighted(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiSelectableFlags_Highlight
         if value:
             self._flags |= imgui.ImGuiSelectableFlags_Highlight
@@ -3259,6 +3417,7 @@ cdef class MenuItem(uiItem):
     def check(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._check = value
 
     @property
@@ -3281,6 +3440,7 @@ cdef class MenuItem(uiItem):
     def shortcut(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._shortcut = string_from_str(value)
 
     cdef bint draw_item(self) noexcept nogil:
@@ -3331,6 +3491,7 @@ cdef class ProgressBar(uiItem):
     def overlay(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._overlay = string_from_str(value)
 
     cdef bint draw_item(self) noexcept nogil:
@@ -3392,6 +3553,7 @@ cdef class Image(uiItem):
     def texture(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if not(isinstance(value, Texture)):
             raise TypeError("texture must be a Texture")
         self._texture = value
@@ -3415,6 +3577,7 @@ cdef class Image(uiItem):
     def uv(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         read_vec4[float](self._uv, value)
 
     @property
@@ -3439,6 +3602,7 @@ cdef class Image(uiItem):
     def color_multiplier(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._color_multiplier = parse_color(value)
 
     @property
@@ -3465,6 +3629,7 @@ cdef class Image(uiItem):
     def background_color(self, value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._background_color = parse_color(value)
 
     @property
@@ -3485,6 +3650,7 @@ cdef class Image(uiItem):
     def button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._button = value
 
     @property
@@ -3509,6 +3675,7 @@ cdef class Image(uiItem):
     def no_global_scaling(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._no_global_scale = value
 
     cdef bint draw_item(self) noexcept nogil:
@@ -3518,7 +3685,7 @@ cdef class Image(uiItem):
                 imgui.Dummy(Vec2ImVec2(size))
             return False
         cdef unique_lock[DCGMutex] m = unique_lock[DCGMutex](self._texture.mutex)
-        if self._texture.allocated_texture == NULL:
+        if not(self._texture.c_mark_used()):
             if size.x > 0 and size.y > 0:
                 imgui.Dummy(Vec2ImVec2(size))
             return False
@@ -3584,6 +3751,7 @@ cdef class Separator(uiItem):
     def label(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         if value is None:
             self._user_label = ""
         else:
@@ -3842,6 +4010,7 @@ cdef class Tooltip(uiItem):
     def target(self, baseItem target):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._target = None
         if target is None:
             return
@@ -3901,6 +4070,7 @@ cdef class Tooltip(uiItem):
     def delay(self, float value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._delay = value
 
     @property
@@ -3924,6 +4094,7 @@ cdef class Tooltip(uiItem):
     def hide_on_activity(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._hide_on_activity = value
 
     cdef bint draw_item(self) noexcept nogil: # TODO: maybe subclass draw() instead ?
@@ -4056,6 +4227,7 @@ cdef class TabButton(uiItem):
     def no_reorder(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_NoReorder
         if value:
             self._flags |= imgui.ImGuiTabItemFlags_NoReorder
@@ -4079,6 +4251,7 @@ cdef class TabButton(uiItem):
     def leading(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_Leading
         if value:
             self._flags &= ~imgui.ImGuiTabItemFlags_Trailing
@@ -4103,6 +4276,7 @@ cdef class TabButton(uiItem):
     def trailing(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_Trailing
         if value:
             self._flags &= ~imgui.ImGuiTabItemFlags_Leading
@@ -4126,6 +4300,7 @@ cdef class TabButton(uiItem):
     def no_tooltip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_NoTooltip
         if value:
             self._flags |= imgui.ImGuiTabItemFlags_NoTooltip
@@ -4188,6 +4363,7 @@ cdef class Tab(uiItem):
     def closable(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._closable = value
 
     @property
@@ -4208,6 +4384,7 @@ cdef class Tab(uiItem):
     def no_reorder(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_NoReorder
         if value:
             self._flags |= imgui.ImGuiTabItemFlags_NoReorder
@@ -4231,6 +4408,7 @@ cdef class Tab(uiItem):
     def leading(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_Leading
         if value:
             self._flags &= ~imgui.ImGuiTabItemFlags_Trailing
@@ -4255,6 +4433,7 @@ cdef class Tab(uiItem):
     def trailing(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_Trailing
         if value:
             self._flags &= ~imgui.ImGuiTabItemFlags_Leading
@@ -4278,6 +4457,7 @@ cdef class Tab(uiItem):
     def no_tooltip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabItemFlags_NoTooltip
         if value:
             self._flags |= imgui.ImGuiTabItemFlags_NoTooltip
@@ -4364,6 +4544,7 @@ cdef class TabBar(uiItem):
     def reorderable(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_Reorderable
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_Reorderable
@@ -4386,6 +4567,7 @@ cdef class TabBar(uiItem):
     def autoselect_new_tabs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_AutoSelectNewTabs
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_AutoSelectNewTabs
@@ -4408,6 +4590,7 @@ cdef class TabBar(uiItem):
     def no_tab_list_popup_button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_TabListPopupButton
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_TabListPopupButton
@@ -4430,6 +4613,7 @@ cdef class TabBar(uiItem):
     def no_close_with_middle_mouse_button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_NoCloseWithMiddleMouseButton
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_NoCloseWithMiddleMouseButton
@@ -4452,6 +4636,7 @@ cdef class TabBar(uiItem):
     def no_scrolling_button(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_NoTabListScrollingButtons
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_NoTabListScrollingButtons
@@ -4474,6 +4659,7 @@ cdef class TabBar(uiItem):
     def no_tooltip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_NoTooltip
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_NoTooltip
@@ -4496,6 +4682,7 @@ cdef class TabBar(uiItem):
     def selected_overline(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_DrawSelectedOverline
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_DrawSelectedOverline
@@ -4518,6 +4705,7 @@ cdef class TabBar(uiItem):
     def resize_to_fit(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_FittingPolicyResizeDown
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_FittingPolicyResizeDown
@@ -4540,6 +4728,7 @@ cdef class TabBar(uiItem):
     def allow_tab_scroll(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTabBarFlags_FittingPolicyScroll
         if value:
             self._flags |= imgui.ImGuiTabBarFlags_FittingPolicyScroll
@@ -4627,6 +4816,7 @@ cdef class TreeNode(uiItem):
     def selectable(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._selectable = value
 
     @property
@@ -4649,6 +4839,7 @@ cdef class TreeNode(uiItem):
     def open_on_double_click(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_OpenOnDoubleClick
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_OpenOnDoubleClick
@@ -4673,6 +4864,7 @@ cdef class TreeNode(uiItem):
     def open_on_arrow(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_OpenOnArrow
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_OpenOnArrow
@@ -4695,6 +4887,7 @@ cdef class TreeNode(uiItem):
     def leaf(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_Leaf
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_Leaf
@@ -4719,6 +4912,7 @@ cdef class TreeNode(uiItem):
     def bullet(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_Bullet
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_Bullet
@@ -4741,6 +4935,7 @@ cdef class TreeNode(uiItem):
     def span_text_width(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_SpanLabelWidth
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_SpanLabelWidth
@@ -4763,6 +4958,7 @@ cdef class TreeNode(uiItem):
     def span_full_width(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_SpanFullWidth
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_SpanFullWidth
@@ -4859,6 +5055,7 @@ cdef class CollapsingHeader(uiItem):
     def closable(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._closable = value
 
     @property
@@ -4882,6 +5079,7 @@ cdef class CollapsingHeader(uiItem):
     def open_on_double_click(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_OpenOnDoubleClick
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_OpenOnDoubleClick
@@ -4906,6 +5104,7 @@ cdef class CollapsingHeader(uiItem):
     def open_on_arrow(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_OpenOnArrow
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_OpenOnArrow
@@ -4928,6 +5127,7 @@ cdef class CollapsingHeader(uiItem):
     def leaf(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_Leaf
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_Leaf
@@ -4952,6 +5152,7 @@ cdef class CollapsingHeader(uiItem):
     def bullet(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiTreeNodeFlags_Bullet
         if value:
             self._flags |= imgui.ImGuiTreeNodeFlags_Bullet
@@ -5038,6 +5239,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def always_show_vertical_scrollvar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_AlwaysVerticalScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_AlwaysVerticalScrollbar
@@ -5059,6 +5261,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def always_show_horizontal_scrollvar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_AlwaysHorizontalScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_AlwaysHorizontalScrollbar
@@ -5081,6 +5284,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def no_scrollbar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoScrollbar
@@ -5103,6 +5307,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def horizontal_scrollbar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_HorizontalScrollbar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_HorizontalScrollbar
@@ -5125,6 +5330,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def menubar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_MenuBar
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_MenuBar
@@ -5147,6 +5353,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def no_scroll_with_mouse(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoScrollWithMouse
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoScrollWithMouse
@@ -5169,6 +5376,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def flattened_navigation(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_NavFlattened
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_NavFlattened
@@ -5191,6 +5399,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def border(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_Borders
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_Borders
@@ -5213,6 +5422,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def always_auto_resize(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_AlwaysAutoResize
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_AlwaysAutoResize
@@ -5235,6 +5445,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def always_use_window_padding(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_AlwaysUseWindowPadding
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_AlwaysUseWindowPadding
@@ -5257,6 +5468,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def auto_resize_x(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_AutoResizeX
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_AutoResizeX
@@ -5279,6 +5491,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def auto_resize_y(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_AutoResizeY
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_AutoResizeY
@@ -5301,6 +5514,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def frame_style(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_FrameStyle
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_FrameStyle
@@ -5323,6 +5537,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def resizable_x(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_ResizeX
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_ResizeX
@@ -5345,6 +5560,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def resizable_y(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._child_flags &= ~imgui.ImGuiChildFlags_ResizeY
         if value:
             self._child_flags |= imgui.ImGuiChildFlags_ResizeY
@@ -5366,6 +5582,7 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def no_background(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoBackground
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoBackground
@@ -5388,10 +5605,37 @@ cdef class ChildWindow(uiItem): # TODO: remove label
     def no_inputs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._window_flags &= ~imgui.ImGuiWindowFlags_NoInputs
         if value:
             self._window_flags |= imgui.ImGuiWindowFlags_NoInputs
 
+    @property
+    def cache_drawlist(self):
+        """
+        Retain the draw commands of the child window content between frames.
+
+        When enabled, the vertices generated by the children are kept, and
+        copied back instead of drawing the children again as long as no
+        child is modified, the child window is not moved, resized or
+        scrolled, and it doesn't receive inputs. While the cached content
+        is used, the states and handlers of the children are not updated.
+        Nested windows (child windows, popups, tooltips) disable the cache.
+        """
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        return self._drawlist_cache is not None
+
+    @cache_drawlist.setter
+    def cache_drawlist(self, bint value):
+        cdef unique_lock[DCGMutex] m
+        lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
+        if not(value):
+            self._drawlist_cache = None
+        elif self._drawlist_cache is None:
+            self._drawlist_cache = DrawListCache()
+
     cdef bint draw_item(self) noexcept nogil:
         cdef imgui.ImGuiWindowFlags flags = self._window_flags
         if self.last_menubar_child is not None:
@@ -5423,7 +5667,11 @@ cdef class ChildWindow(uiItem): # TODO: remove label
             swap_Vec2(pos_w, self.context.viewport.window_pos)
             parent_size_backup = self.context.viewport.parent_size
             self.context.viewport.parent_size = self.state.cur.content_region_size
-            draw_ui_children(self)
+            if self._drawlist_cache is None:
+                draw_ui_children(self)
+            elif not(self._drawlist_cache.try_replay(self, imgui.GetWindowDrawList(), True)):
+                draw_ui_children(self)
+                self._drawlist_cache.capture(self, imgui.GetWindowDrawList())
             draw_menubar_children(self)
             self.context.viewport.window_pos = pos_w
             self.context.viewport.parent_pos = pos_p
@@ -5487,6 +5735,7 @@ cdef class ColorButton(uiItem):
     def no_alpha(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoAlpha
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoAlpha
@@ -5509,6 +5758,7 @@ cdef class ColorButton(uiItem):
     def no_tooltip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoTooltip
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoTooltip
@@ -5531,6 +5781,7 @@ cdef class ColorButton(uiItem):
     def no_drag_drop(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoDragDrop
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoDragDrop
@@ -5552,6 +5803,7 @@ cdef class ColorButton(uiItem):
     def no_border(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoBorder
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoBorder
@@ -5581,6 +5833,7 @@ cdef class ColorButton(uiItem):
     def alpha_preview(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_AlphaOpaque | imgui.ImGuiColorEditFlags_AlphaPreviewHalf)
         if value == "half":
             self._flags |= imgui.ImGuiColorEditFlags_AlphaPreviewHalf
@@ -5609,6 +5862,7 @@ cdef class ColorButton(uiItem):
     def data_type(self, str value):  
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_Float | imgui.ImGuiColorEditFlags_Uint8)
         if value == "uint8":
             self._flags |= imgui.ImGuiColorEditFlags_Uint8
@@ -5674,6 +5928,7 @@ cdef class ColorEdit(uiItem):
     def no_alpha(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoAlpha
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoAlpha
@@ -5696,6 +5951,7 @@ cdef class ColorEdit(uiItem):
     def no_picker(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoPicker
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoPicker
@@ -5718,6 +5974,7 @@ cdef class ColorEdit(uiItem):
     def no_options(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoOptions
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoOptions
@@ -5740,6 +5997,7 @@ cdef class ColorEdit(uiItem):
     def no_small_preview(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoSmallPreview
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoSmallPreview
@@ -5762,6 +6020,7 @@ cdef class ColorEdit(uiItem):
     def no_inputs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoInputs
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoInputs
@@ -5784,6 +6043,7 @@ cdef class ColorEdit(uiItem):
     def no_tooltip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoTooltip
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoTooltip
@@ -5806,6 +6066,7 @@ cdef class ColorEdit(uiItem):
     def no_label(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoLabel
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoLabel
@@ -5829,6 +6090,7 @@ cdef class ColorEdit(uiItem):
     def no_drag_drop(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoDragDrop
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoDragDrop
@@ -5851,6 +6113,7 @@ cdef class ColorEdit(uiItem):
     def alpha_bar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_AlphaBar
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_AlphaBar
@@ -5880,6 +6143,7 @@ cdef class ColorEdit(uiItem):
     def alpha_preview(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_AlphaOpaque | imgui.ImGuiColorEditFlags_AlphaPreviewHalf)
         if value == "half":
             self._flags |= imgui.ImGuiColorEditFlags_AlphaPreviewHalf
@@ -5915,6 +6179,7 @@ cdef class ColorEdit(uiItem):
     def display_mode(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_DisplayRGB | imgui.ImGuiColorEditFlags_DisplayHSV | imgui.ImGuiColorEditFlags_DisplayHex)
         if value == "rgb":
             self._flags |= imgui.ImGuiColorEditFlags_DisplayRGB
@@ -5946,6 +6211,7 @@ cdef class ColorEdit(uiItem):
     def input_mode(self, str value):
         cdef unique_lock[DCGMutex] m  
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_InputRGB | imgui.ImGuiColorEditFlags_InputHSV)
         if value == "rgb":
             self._flags |= imgui.ImGuiColorEditFlags_InputRGB
@@ -5974,6 +6240,7 @@ cdef class ColorEdit(uiItem):
     def data_type(self, str value):  
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_Float | imgui.ImGuiColorEditFlags_Uint8)
         if value == "uint8":
             self._flags |= imgui.ImGuiColorEditFlags_Uint8
@@ -6000,6 +6267,7 @@ cdef class ColorEdit(uiItem):
     def hdr(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_HDR
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_HDR
@@ -6064,6 +6332,7 @@ cdef class ColorPicker(uiItem):
     def no_alpha(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoAlpha
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoAlpha
@@ -6086,6 +6355,7 @@ cdef class ColorPicker(uiItem):
     def no_small_preview(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoSmallPreview
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoSmallPreview
@@ -6108,6 +6378,7 @@ cdef class ColorPicker(uiItem):
     def no_inputs(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoInputs
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoInputs
@@ -6130,6 +6401,7 @@ cdef class ColorPicker(uiItem):
     def no_tooltip(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoTooltip
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoTooltip
@@ -6152,6 +6424,7 @@ cdef class ColorPicker(uiItem):
     def no_label(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoLabel
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoLabel
@@ -6174,6 +6447,7 @@ cdef class ColorPicker(uiItem):
     def no_side_preview(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_NoSidePreview
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_NoSidePreview
@@ -6197,6 +6471,7 @@ cdef class ColorPicker(uiItem):
     def picker_mode(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_PickerHueBar | imgui.ImGuiColorEditFlags_PickerHueWheel)
         if value == "bar":
             self._flags |= imgui.ImGuiColorEditFlags_PickerHueBar
@@ -6223,6 +6498,7 @@ cdef class ColorPicker(uiItem):
     def alpha_bar(self, bint value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~imgui.ImGuiColorEditFlags_AlphaBar
         if value:
             self._flags |= imgui.ImGuiColorEditFlags_AlphaBar
@@ -6252,6 +6528,7 @@ cdef class ColorPicker(uiItem):
     def alpha_preview(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_AlphaOpaque | imgui.ImGuiColorEditFlags_AlphaPreviewHalf)
         if value == "half":
             self._flags |= imgui.ImGuiColorEditFlags_AlphaPreviewHalf
@@ -6287,6 +6564,7 @@ cdef class ColorPicker(uiItem):
     def display_mode(self, str value):
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_DisplayRGB | imgui.ImGuiColorEditFlags_DisplayHSV | imgui.ImGuiColorEditFlags_DisplayHex)
         if value == "rgb":
             self._flags |= imgui.ImGuiColorEditFlags_DisplayRGB
@@ -6318,6 +6596,7 @@ cdef class ColorPicker(uiItem):
     def input_mode(self, str value):
         cdef unique_lock[DCGMutex] m  
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_InputRGB | imgui.ImGuiColorEditFlags_InputHSV)
         if value == "rgb":
             self._flags |= imgui.ImGuiColorEditFlags_InputRGB
@@ -6346,6 +6625,7 @@ cdef class ColorPicker(uiItem):
     def data_type(self, str value):  
         cdef unique_lock[DCGMutex] m
         lock_gil_friendly(m, self.mutex)
+        self.mark_dirty()
         self._flags &= ~(imgui.ImGuiColorEditFlags_Float | imgui.ImGuiColorEditFlags_Uint8)
         if value == "uint8":
             self._flags |= imgui.ImGuiColorEditFlags_Uint8
@@ -1985,7 +1985,7 @@ cdef extern from "freetype/tttags.h":
     const int TTAG_0xA5lst
 
 
-cdef extern from "freetype/freetype.h":
+cdef extern from "freetype/freetype.h" nogil:
     struct FT_DriverRec_:
         pass
     struct FT_SubGlyphRec_:
@@ -2332,7 +2332,7 @@ cdef extern from "freetype/ftoutln.h":
     FT_Error FT_Outline_Decompose(FT_Outline* outline, const FT_Outline_Funcs* func_interface, void* user)
 
 
-cdef extern from "freetype/ftglyph.h":
+cdef extern from "freetype/ftglyph.h" nogil:
     struct FT_Glyph_Class_:
         pass
     const int FTGLYPH_H_
@@ -136,3 +136,143 @@ def __exit__(self, exc_type, exc_value, traceback): # -> Literal[False]:
 except ImportError:
     Array: TypeAlias = memoryview | bytearray | bytes | Sequence[Any] | "np.ndarray[Any, Any]"
 
+
+class ItemPool:
+    """
+    Recycling pool for items of a given type.
+
+    UIs that destroy and recreate many items per frame
+    (live tables, order books, logs) spend a significant
+    time allocating items (object, mutex, states, uuid).
+    ItemPool keeps released items detached outside the
+    rendering tree, and hands them back on acquire,
+    instead of creating new ones.
+
+    Released items are detached from their parent, their
+    children are detached, and the attributes that were
+    set through acquire (as well as the handlers, callbacks
+    and user_data) are restored to the values of a freshly
+    created item. Attributes set directly on the item
+    after acquire are not tracked and must be listed in
+    reset_attributes if they should be restored on release.
+
+    Recycled items keep their uuid, and thus their internal
+    ImGui identifier.
+
+    Example::
+
+        pool = dcg.ItemPool(C, dcg.Text, size=5000)
+        with window:
+            text = pool.acquire(value="42.0")
+        ...
+        pool.release(text)
+
+    Parameters:
+    context : Context
+        Context in which the items are created.
+    item_type : type
+        Class of the pooled items (subclass of baseItem).
+    size : int
+        Maximum number of released items kept for reuse.
+        Items released beyond this size are deleted.
+    reset_attributes : list[str], optional
+        Attributes always restored on release.
+    """
+    def __init__(self, context: Context, item_type, size: int = 1024, reset_attributes: list[str] | None = None) -> None:
+        ...
+
+    @property
+    def item_type(self) -> type[baseItem]:
+        """
+        Readonly attribute: class of the pooled items
+        """
+        ...
+
+    @property
+    def size(self) -> int:
+        """
+        Maximum number of released items kept for reuse
+        """
+        ...
+
+    @size.setter
+    def size(self, value: int) -> None:
+        ...
+
+    @property
+    def num_free(self) -> int:
+        """
+        Readonly attribute: number of items ready for reuse
+        """
+        ...
+
+    @property
+    def hits(self) -> int:
+        """
+        Readonly attribute: number of acquire calls served
+        by a recycled item
+        """
+        ...
+
+    @property
+    def misses(self) -> int:
+        """
+        Readonly attribute: number of acquire calls that
+        had to create a new item
+        """
+        ...
+
+    @property
+    def dropped(self) -> int:
+        """
+        Readonly attribute: number of released items that
+        were deleted because the pool was full
+        """
+        ...
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Readonly attribute: fraction of acquire calls served
+        by a recycled item (0 if acquire was never called)
+        """
+        ...
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hits, misses and dropped counters
+        """
+        ...
+
+    def fill(self, count: int) -> None:
+        """
+        Pre-allocate items until count items are ready
+        for reuse (bounded by size).
+        """
+        ...
+
+    def acquire(self, **kwargs) -> baseItem:
+        """
+        Retrieve an item from the pool, or create one if
+        the pool is empty.
+
+        The keyword arguments are handled as for item creation,
+        including parent, before and attach. In particular the
+        item is attached to the current parent of the 'with'
+        statement if none is specified.
+        """
+        ...
+
+    def release(self, item: baseItem) -> None:
+        """
+        Give back an item to the pool.
+
+        The item is detached, its children are detached and
+        its configuration is reset. If the pool is full, the
+        item is deleted instead. The item must not be used
+        after this call.
+
+        Raises ValueError if the item was already released.
+        """
+        ...
+
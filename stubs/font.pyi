@@ -144,6 +144,27 @@ def merge_glyph_sets(cls, glyphs: list['GlyphSet']) -> 'GlyphSet':
         """
         ...
 
+    def save(self, path: str) -> None:
+        """
+        Write the GlyphSet to a file, in a format
+        that can be memory mapped by GlyphSet.load.
+
+        Images shared by several characters (see remap)
+        are stored only once.
+        """
+        ...
+
+    @classmethod
+    def load(cls, path: str) -> 'GlyphSet':
+        """
+        Read a GlyphSet written by GlyphSet.save.
+
+        The file is memory mapped: the glyph images
+        are views into the mapping, and are only
+        read from disk when accessed.
+        """
+        ...
+
 class FontRenderer:
     """
     A class that manages font loading,
@@ -223,11 +244,15 @@ def render_glyph_set(self,
             target_size: if set, scale the characters to match the
                 font 'size' by scaling the pixel size at the 'nominal'
                 value (default size of the font).
-            hinter: "font", "none", "light", "strong" or "monochrome".
+            hinter: "font", "none", "light", "strong", "monochrome" or "sdf".
                 The hinter is the rendering algorithm that
                 impacts a lot the aspect of the characters,
                 especially at low scales, to make them
                 more readable.
+                "sdf" renders signed distance fields, to be
+                loaded with FontTexture.add_custom_font(..., sdf=True).
+                Such fonts remain sharp at any scale. Color is
+                not supported.
             restrict_to: set of ints that contains the unicode characters
                 that should be loaded. If None, load all the characters
                 available.
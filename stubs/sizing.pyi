@@ -1080,6 +1080,24 @@ def __reduce__(self): # -> tuple[Type[Self@ViewportWidth], tuple[()], dict[str,
     
 
 
+class CompiledSize(baseSizing):
+    """
+    Sizing expression compiled into a flat program.
+
+    Strings assigned to sizes are converted to this class.
+    Expressions of the same string share their program.
+    """
+    def __repr__(self) -> str: # -> str:
+        ...
+    
+    def __str__(self) -> str:
+        ...
+    
+    def __reduce__(self): # -> tuple[Callable[[str], baseSizing], tuple[str]]:
+        ...
+    
+
+
 def parse_size(size_str: str) -> baseSizing:
     """
     Parse a sizing string into sizing objects
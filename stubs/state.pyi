@@ -623,4 +623,138 @@ def frame_count(self) -> float:
         This monotonically increasing value allows tracking metrics across multiple
         frames and correlating with other frame-specific data.
         """
+        ...
+
+    @property
+    def lock_contentions(self) -> int:
+        """
+        Number of times a Python thread had to wait for an item
+        mutex held by another thread (process-wide, cumulative).
+
+        Comparing the value between two frames indicates how
+        much user threads contend with rendering.
+        """
+        ...
+
+    @property
+    def state_snapshot_reads(self) -> int:
+        """
+        Number of item state reads served from the state
+        published at the end of the last item rendering,
+        instead of waiting for the item mutex (process-wide,
+        cumulative).
+        """
+        ...
+
+    @property
+    def idle_frames_skipped(self) -> int:
+        """
+        Number of render_frame calls which skipped the
+        traversal of the item tree because nothing changed
+        since the previous traversal (cumulative).
+
+        See Viewport.skip_idle_frames.
+        """
+        ...
+
+    @property
+    def missed_deadlines(self) -> int:
+        """
+        Number of presented frames which completed after
+        the deadline set by the max_fps of the frame policy,
+        while they had started before it (cumulative).
+
+        See Viewport.frame_policy.
+        """
+        ...
+
+    @property
+    def wake_requests(self) -> int:
+        """
+        Number of redraw requests received through
+        Viewport.wake() and item.invalidate() (cumulative).
+        """
+        ...
+
+    @property
+    def wakes(self) -> int:
+        """
+        Number of wakes actually sent to the viewport (cumulative).
+
+        item.invalidate() requests are coalesced, thus comparing
+        with wake_requests and frame_count shows how many
+        redundant wakes and frames were avoided.
+        """
+        ...
+
+    @property
+    def convergence_redraws(self) -> int:
+        """
+        Number of frames which had to be rendered again,
+        without being presented, because a value read
+        during the frame changed later in the same frame
+        (cumulative).
+
+        This happens mainly when a size or position refers
+        to an item rendered after the item using it.
+        """
+        ...
+
+
+class FramePolicy:
+    """
+    Frame pacing policy of the viewport.
+
+    Controls how fast render_frame can run, and how much
+    it waits when nothing changes on screen.
+
+    Args:
+        max_fps: Maximum frame rate. render_frame sleeps to not
+            exceed it, whether the frame is presented or not.
+            0 (the default) means no limit other than vsync.
+        idle_fps: Rate at which a frame is presented when
+            nothing happens. Before the policy, this rate was
+            hardcoded to a refresh every 5 s (0.2). 0 disables
+            the periodic refresh.
+        latency: One of:
+            - "low": The max_fps sleep (and the throttling of
+                frames that are not presented, as for "balanced")
+                is done at the start of the next render_frame,
+                right before processing the events, such that
+                inputs are the most recent.
+            - "balanced" (default): With vsync or max_fps, frames
+                that are not presented are throttled to 200 fps.
+                The max_fps sleep is done at the end of render_frame.
+            - "power": Same as "balanced", but when the previous
+                frame was not presented and no item changed since,
+                render_frame waits for input events as if
+                wait_for_input was set. The wait ends on input,
+                on Viewport.wake(), on an item requesting a refresh
+                (for example a timed animation), or after 1/idle_fps.
+                Note items modified from another thread while
+                render_frame waits require a call to Viewport.wake()
+                to be displayed before 1/idle_fps.
+
+    The policy is immutable. Assign a new one to the viewport to
+    change it.
+
+    Example:
+        viewport.frame_policy = dcg.FramePolicy(max_fps=60, idle_fps=2, latency="power")
+    """
+    def __init__(self, max_fps: float = 0., idle_fps: float = 0.2, latency: Literal["low", "balanced", "power"] = "balanced") -> None:
+        ...
+
+    @property
+    def max_fps(self) -> float:
+        """Maximum frame rate (0 = no limit)"""
+        ...
+
+    @property
+    def idle_fps(self) -> float:
+        """Rate of presented frames when nothing happens (0 = none)"""
+        ...
+
+    @property
+    def latency(self) -> Literal["low", "balanced", "power"]:
+        """Latency mode: 'low', 'balanced' or 'power'"""
         ...
\ No newline at end of file
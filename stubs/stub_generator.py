@@ -765,6 +765,7 @@ def generate_docstring_for_class(object_class, instance):
                 if object_class.__name__ == "AutoFont":
                     params_str.append("base_size: float = 17.0")
                     params_str.append("font_creator: Callable[Concatenate[float, ...], 'GlyphSet'] | None = None")
+                    params_str.append("sdf: bool = False")
                 continue
             if param.name == 'kwargs':
                 if "callbacks" in additional_properties and "callback" in additional_properties:
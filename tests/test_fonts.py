@@ -0,0 +1,130 @@
+import pytest
+import numpy as np
+import dearcygui as dcg
+import os
+import time
+
+
+def test_glyphset_save_load(tmp_path):
+    """Test a GlyphSet survives a save/load round trip."""
+    glyph_set = dcg.GlyphSet(20, 15)
+    image_a = np.arange(6 * 4, dtype=np.uint8).reshape(6, 4, 1)
+    image_b = np.full((3, 5, 4), 200, dtype=np.uint8)
+    glyph_set.add_glyph(ord("a"), image_a, 2., 1., 5.)
+    glyph_set.add_glyph(ord("b"), image_b, 3., 0., 6.)
+    # Shared image
+    glyph_set.remap(["a"], ["c"])
+
+    path = str(tmp_path / "set.glyphs")
+    glyph_set.save(path)
+    loaded = dcg.GlyphSet.load(path)
+
+    assert loaded.height == 20
+    assert loaded.origin_y == 15
+    assert set(loaded.images.keys()) == {ord("a"), ord("b"), ord("c")}
+    for key in loaded.images:
+        (image, dy, dx, advance) = loaded[key]
+        (ref_image, ref_dy, ref_dx, ref_advance) = glyph_set[key]
+        assert np.array_equal(np.asarray(image), np.asarray(ref_image))
+        assert (dy, dx, advance) == (ref_dy, ref_dx, ref_advance)
+
+    with open(path, "r+b") as fp:
+        fp.write(b"NOTGLYPH")
+    with pytest.raises(ValueError):
+        dcg.GlyphSet.load(path)
+
+
+def test_glyph_cache(tmp_path):
+    """Test make_extended_latin_font reuses the on-disk cache."""
+    previous = dcg.get_glyph_cache()
+    dcg.set_glyph_cache(str(tmp_path))
+    try:
+        restrict = [ord(c) for c in "ABC8"]
+        rendered = dcg.make_extended_latin_font(15, restrict_to=restrict)
+        entries = [name for name in os.listdir(tmp_path) if name.endswith(".glyphs")]
+        assert len(entries) == 1
+
+        cached = dcg.make_extended_latin_font(15, restrict_to=restrict)
+        assert cached.height == rendered.height
+        assert cached.origin_y == rendered.origin_y
+        assert cached.positioning == rendered.positioning
+        for key in rendered.images:
+            assert np.array_equal(np.asarray(cached.images[key]),
+                                  np.asarray(rendered.images[key]))
+
+        # A different size is a different entry
+        dcg.make_extended_latin_font(16, restrict_to=restrict)
+        entries = [name for name in os.listdir(tmp_path) if name.endswith(".glyphs")]
+        assert len(entries) == 2
+
+        # The size cap evicts old entries
+        dcg.set_glyph_cache(str(tmp_path), max_size=1)
+        dcg.make_extended_latin_font(17, restrict_to=restrict)
+        entries = [name for name in os.listdir(tmp_path) if name.endswith(".glyphs")]
+        assert len(entries) == 0
+    finally:
+        dcg.set_glyph_cache(*previous)
+
+
+def test_dynamic_font():
+    """Test glyphs of dynamic fonts are rendered on request."""
+    C = dcg.Context()
+    C.viewport.initialize(visible=False)
+    path = os.path.join(os.path.dirname(dcg.__file__), "lmsans17-regular.otf")
+    texture = dcg.FontTexture(C)
+    font = texture.add_dynamic_font(path, size=16, preload="AB")
+    assert texture.built
+    with pytest.raises(ValueError):
+        texture.add_dynamic_font(path)
+
+    # Preloaded glyphs are not requested again
+    assert font.request_glyphs("ABAB") == 0
+    assert font.request_glyphs("CDC") == 2
+    # Pending glyphs are not requested twice
+    assert font.request_glyphs("CD") == 0
+
+    # Fonts from other modes ignore requests
+    static_texture = dcg.FontTexture(C)
+    static_texture.add_font_file(path, size=16)
+    static_texture.build()
+    assert static_texture[0].request_glyphs("xyz") == 0
+    assert static_texture[0].loaded_glyphs == ""
+
+
+def _render_until(viewport, condition, timeout=10.):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        viewport.render_frame()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_dynamic_font_text_items():
+    """Test texts displayed with a dynamic font load their glyphs."""
+    C = dcg.Context()
+    C.viewport.initialize(visible=False)
+    path = os.path.join(os.path.dirname(dcg.__file__), "lmsans17-regular.otf")
+    texture = dcg.FontTexture(C)
+    font = texture.add_dynamic_font(path, size=16, atlas_size=256, preload="AB")
+    assert font.loaded_glyphs == "AB"
+    with dcg.Window(C, width=400, height=400):
+        text = dcg.Text(C, value="WWWW", font=font)
+
+    # Placeholders are displayed until the glyphs are inserted
+    C.viewport.render_frame()
+    placeholder_width = text.state.rect_size[0]
+    assert _render_until(C.viewport, lambda: "W" in font.loaded_glyphs)
+    assert _render_until(C.viewport,
+                         lambda: text.state.rect_size[0] != placeholder_width)
+
+    # When the cells are full, the least recently used glyphs are replaced
+    characters = [chr(c) for c in range(0xC0, 0x180)]
+    for i in range(0, len(characters), 12):
+        chunk = set(characters[i:i+12])
+        text.value = "".join(chunk)
+        assert _render_until(C.viewport, lambda: chunk <= set(font.loaded_glyphs))
+    loaded = set(font.loaded_glyphs)
+    assert "W" not in loaded
+    assert len(loaded) < len(characters)
@@ -1,5 +1,6 @@
 import gc
 import sys
+import time
 import weakref
 import pytest
 import dearcygui as dcg
@@ -259,6 +260,60 @@ def test_tree_cleanup():
     # Verify everything was collected
     assert window_ref() is None
 
+def test_deferred_delete():
+    """Test that deferred deletion detaches immediately and frees the subtree"""
+    C = dcg.Context()
+
+    with dcg.Window(C) as window:
+        with dcg.DrawInWindow(C) as drawing:
+            for i in range(1000):
+                dcg.DrawRect(C)
+        button = dcg.Button(C)
+
+    drawing_ref = weakref.ref(drawing)
+    button_ref = weakref.ref(button)
+    del drawing
+
+    assert window.parent is C.viewport
+    window.delete_item(deferred=True)
+    # The root is detached right away
+    assert window.parent is None
+    del window
+    del button
+
+    # Teardown is performed by a background worker
+    for _ in range(100):
+        gc.collect()
+        if drawing_ref() is None and button_ref() is None:
+            break
+        time.sleep(0.01)
+    assert drawing_ref() is None
+    assert button_ref() is None
+
+def test_deferred_delete_worker_shutdown():
+    """Test that the teardown worker stops with its context"""
+    import threading
+    before = set(threading.enumerate())
+    C = dcg.Context()
+    with dcg.Window(C) as window:
+        dcg.Button(C)
+    window.delete_item(deferred=True)
+    del window
+    workers = [t for t in threading.enumerate()
+               if t not in before and t.name.startswith("dcg_teardown")]
+    assert len(workers) == 1
+
+    C_ref = weakref.ref(C)
+    del C
+    for _ in range(100):
+        gc.collect()
+        if C_ref() is None:
+            break
+        time.sleep(0.01)
+    assert C_ref() is None
+    workers[0].join(timeout=1.)
+    assert not workers[0].is_alive()
+
 def test_memory_usage():
     """Test that memory usage doesn't grow with item creation/destruction"""
     import psutil
@@ -0,0 +1,95 @@
+import pytest
+import dearcygui as dcg
+
+@pytest.fixture
+def ctx():
+    C = dcg.Context()
+    return C
+
+def test_pool_reuses_items(ctx):
+    pool = dcg.ItemPool(ctx, dcg.Text, size=10)
+    with dcg.Window(ctx) as window:
+        text = pool.acquire(value="first")
+    assert text.parent is window
+    uuid = text.uuid
+
+    pool.release(text)
+    assert text.parent is None
+    assert pool.num_free == 1
+
+    with window:
+        text2 = pool.acquire(value="second")
+    assert text2 is text
+    assert text2.uuid == uuid
+    assert text2.value == "second"
+    assert pool.hits == 1
+    assert pool.misses == 1
+    assert pool.hit_rate == 0.5
+
+def test_pool_resets_configuration(ctx):
+    pool = dcg.ItemPool(ctx, dcg.Text, size=10)
+    default_text = dcg.Text(ctx, attach=False)
+    text = pool.acquire(attach=False, value="test", show=False, user_data=5)
+    pool.release(text)
+    assert text.value == default_text.value
+    assert text.show == default_text.show
+    assert text.user_data is None
+    text = pool.acquire(attach=False)
+    assert text.value == default_text.value
+
+def test_pool_size_limit(ctx):
+    pool = dcg.ItemPool(ctx, dcg.Text, size=2)
+    items = [pool.acquire(attach=False) for _ in range(4)]
+    for item in items:
+        pool.release(item)
+    assert pool.num_free == 2
+    assert pool.dropped == 2
+    pool.fill(1)
+    assert pool.num_free == 2
+    pool.size = 1
+    assert pool.num_free == 1
+
+def test_pool_type_check(ctx):
+    pool = dcg.ItemPool(ctx, dcg.Text)
+    with pytest.raises(TypeError):
+        pool.release(dcg.Button(ctx, attach=False))
+
+def test_pool_drawing_items(ctx):
+    pool = dcg.ItemPool(ctx, dcg.DrawRect, size=10)
+    with dcg.DrawInWindow(ctx, attach=False) as drawing:
+        rect = pool.acquire(pmin=(1, 2), pmax=(3, 4), thickness=2.)
+    assert rect.parent is drawing
+    pool.release(rect)
+    assert rect.parent is None
+    default_rect = dcg.DrawRect(ctx, attach=False)
+    assert tuple(rect.pmin) == tuple(default_rect.pmin)
+    assert rect.thickness == default_rect.thickness
+    with drawing:
+        assert pool.acquire() is rect
+
+def test_pool_double_release(ctx):
+    pool = dcg.ItemPool(ctx, dcg.Text, size=10)
+    text = pool.acquire(attach=False)
+    pool.release(text)
+    with pytest.raises(ValueError):
+        pool.release(text)
+    assert pool.num_free == 1
+    first = pool.acquire(attach=False)
+    second = pool.acquire(attach=False)
+    assert first is text
+    assert second is not first
+    # Acquired again, it can be released again
+    pool.release(first)
+
+def test_pool_resets_states(ctx):
+    ctx.viewport.initialize(visible=False)
+    pool = dcg.ItemPool(ctx, dcg.Text, size=10)
+    with dcg.Window(ctx, width=200, height=200):
+        text = pool.acquire(value="text")
+    for _ in range(2):
+        ctx.viewport.render_frame()
+    assert text.state.visible
+    assert text.state.rect_size[0] > 0
+    pool.release(text)
+    assert not text.state.visible
+    assert text.state.rect_size[0] == 0
@@ -0,0 +1,60 @@
+import pytest
+import dearcygui as dcg
+
+@pytest.fixture
+def ctx():
+    C = dcg.Context()
+    return C
+
+def make_factory(ctx, created):
+    def factory(key):
+        created.append(key)
+        return dcg.Text(ctx, value=str(key), attach=False)
+    return factory
+
+def test_reconcile_creates_in_order(ctx):
+    window = dcg.Window(ctx)
+    created = []
+    children = window.reconcile([1, 2, 3], make_factory(ctx, created))
+    assert created == [1, 2, 3]
+    assert window.children == children
+    assert [c.value for c in window.children] == ["1", "2", "3"]
+
+def test_reconcile_reuses_and_moves(ctx):
+    window = dcg.Window(ctx)
+    created = []
+    updated = []
+    factory = make_factory(ctx, created)
+    first = window.reconcile([1, 2, 3, 4], factory)
+    second = window.reconcile([4, 1, 5, 3], factory,
+                              lambda key, item: updated.append(key))
+    assert created == [1, 2, 3, 4, 5]
+    assert updated == [4, 1, 3]
+    assert second[0] is first[3]
+    assert second[1] is first[0]
+    assert second[3] is first[2]
+    assert window.children == second
+    # Removed keys are deleted
+    assert first[1].parent is None
+    # Sibling links are consistent
+    for prev, next in zip(second[:-1], second[1:]):
+        assert prev.next_sibling is next
+        assert next.previous_sibling is prev
+
+def test_reconcile_keeps_other_children(ctx):
+    window = dcg.Window(ctx)
+    with window:
+        button = dcg.Button(ctx)
+    children = window.reconcile(["a", "b"], make_factory(ctx, []))
+    assert window.children == [button] + children
+    children = window.reconcile(["b", "a"], make_factory(ctx, []))
+    assert window.children == [button] + children
+    assert window.reconcile([], make_factory(ctx, [])) == []
+    assert window.children == [button]
+
+def test_reconcile_errors(ctx):
+    window = dcg.Window(ctx)
+    with pytest.raises(ValueError):
+        window.reconcile([1, 1], make_factory(ctx, []))
+    with pytest.raises(TypeError):
+        window.reconcile([1], lambda key: dcg.DrawRect(ctx, attach=False))
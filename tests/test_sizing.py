@@ -367,4 +367,73 @@ def test_sizing_edge_cases(ctx):
     btn_min = dcg.Button(ctx, label="Min", width="min(fillx, 300)", parent=window)
     viewport.render_frame()
     expected_min = min(content_w, 300)
-    assert btn_min.state.rect_size[0] == expected_min, f"min() should be exact: expected {expected_min}"
\ No newline at end of file
+    assert btn_min.state.rect_size[0] == expected_min, f"min() should be exact: expected {expected_min}"
+
+def test_compiled_string_sizes(ctx):
+    """Test strings assigned to sizes resolve like parsed trees."""
+    viewport = ctx.viewport
+    viewport.initialize(visible=False, width=800, height=600)
+    window = dcg.Window(ctx, label="Compiled", width="600", height="400")
+
+    ref = dcg.Button(ctx, label="Ref", width="100 + 2 * 25", parent=window)
+    expressions = ["0.5*fillx - 10",
+                   "max(2 * 10 + 30, fillx / (2 + 2))",
+                   "-(-fullx) // (1 + 2) % 500",
+                   "mean(ref.width, 100 * dpi, abs(-3 ** 2))"]
+    compiled = [dcg.Button(ctx, label="C", width=expr, parent=window)
+                for expr in expressions]
+    # Same strings: the compiled programs are shared
+    shared = [dcg.Button(ctx, label="S", width=expr, parent=window)
+              for expr in expressions]
+    trees = [dcg.Button(ctx, label="T", width=parse_size(expr), parent=window)
+             for expr in expressions]
+    for _ in range(4):
+        viewport.render_frame()
+
+    assert ref.state.rect_size[0] == 150
+    for (c, s, t) in zip(compiled, shared, trees):
+        assert c.state.rect_size[0] == t.state.rect_size[0]
+        assert s.state.rect_size[0] == t.state.rect_size[0]
+
+    # Item references are looked up in the caller scope on each use
+    with pytest.raises(ValueError):
+        dcg.Button(ctx, label="Missing", width="missing_item.width")
+
+
+def test_reference_resolution_passes(ctx):
+    """Test only references to items rendered later need another pass."""
+    import time
+    viewport = ctx.viewport
+    viewport.initialize(visible=False, width=800, height=600)
+    window = dcg.Window(ctx, label="Refs", width=600, height=400)
+    first = dcg.Button(ctx, label="First", width=200, parent=window)
+    second = dcg.Button(ctx, label="Second", width="first.width", parent=window)
+    third = dcg.Button(ctx, label="Third", width="second.width + fillx * 0", parent=window)
+    later = dcg.Button(ctx, label="Later", width=100, parent=window)
+    early = dcg.Button(ctx, label="Early", width="later.width", before=first)
+    for _ in range(5):
+        viewport.render_frame()
+    assert third.state.rect_size[0] == 200
+    assert early.state.rect_size[0] == 100
+
+    # References to previous items read the values of the current frame
+    redraws = viewport.metrics.convergence_redraws
+    first.width = 300
+    viewport.render_frame()
+    assert third.state.rect_size[0] == 300
+    assert viewport.metrics.convergence_redraws == redraws
+
+    # A reference to a later item needs another pass
+    later.width = 150
+    viewport.render_frame()
+    assert viewport.metrics.convergence_redraws == redraws + 1
+    viewport.render_frame()
+    assert early.state.rect_size[0] == 150
+
+    # Cycles are reported
+    first.width = "early.width + 10"
+    later.width = "first.width"
+    with pytest.warns(RuntimeWarning, match="cycle"):
+        start = time.monotonic()
+        while time.monotonic() - start < 0.5:
+            viewport.render_frame()
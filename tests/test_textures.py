@@ -541,3 +541,284 @@ def test_visual_verification_grayscale(capture_context):
         if i > 0:
             prev_x = x_positions[i-1]
             assert int(fb_data[y, x, 0]) > int(fb_data[y, prev_x, 0])
+
+def test_texture_non_contiguous_upload(ctx):
+    """Test uploading arrays whose pixels or channels are strided."""
+    data = np.random.randint(0, 255, (20, 30, 4), dtype=np.uint8)
+    # Reversed channels and every other column
+    view = data[:, ::2, ::-1]
+    tex = dcg.Texture(ctx, view)
+    assert np.array_equal(np.asarray(tex.read()), view)
+
+    data_f = np.random.rand(20, 30, 3).astype(np.float32)
+    view_f = data_f[::-1, :, 1:]
+    tex_f = dcg.Texture(ctx, view_f)
+    assert np.allclose(np.asarray(tex_f.read()), view_f)
+
+def test_texture_set_value_async(ctx):
+    """Test asynchronous uploads and their latest-wins semantics."""
+    tex = dcg.Texture(ctx)
+    tex.hint_dynamic = True
+    frames = [np.full((64, 64, 4), i, dtype=np.uint8) for i in range(20)]
+    futures = [tex.set_value_async(frame) for frame in frames]
+    futures[-1].result(timeout=10.)
+    # Intermediate frames may have been dropped, never the last one
+    assert all(f.done() for f in futures)
+    assert not futures[-1].cancelled()
+    assert np.asarray(tex.read())[0, 0, 0] == 19
+
+    # Errors are reported through the future
+    future = tex.set_value_async(np.zeros((0,), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        future.result(timeout=10.)
+
+
+def test_texture_update_region(ctx):
+    """Test sub-rectangle updates leave the rest of the texture untouched."""
+    tex = dcg.Texture(ctx)
+    base = np.zeros((32, 48, 3), dtype=np.uint8)
+    tex.set_value(base)
+
+    patch = np.full((4, 5, 3), 200, dtype=np.uint8)
+    tex.update_region(10, 6, patch)
+    expected = base.copy()
+    expected[6:10, 10:15] = 200
+    assert np.array_equal(np.asarray(tex.read()), expected)
+
+    # Several regions, including a non-contiguous one
+    strided = np.arange(8 * 8 * 3, dtype=np.uint8).reshape(8, 8, 3)[::2, ::2]
+    tex.update_regions([(0, 0, patch), (40, 28, strided)])
+    expected[0:4, 0:5] = 200
+    expected[28:32, 40:44] = strided
+    assert np.array_equal(np.asarray(tex.read()), expected)
+
+    with pytest.raises(ValueError):
+        tex.update_region(46, 0, patch)
+    with pytest.raises(ValueError):
+        tex.update_region(0, 0, np.zeros((2, 2, 4), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        tex.update_region(0, 0, np.zeros((2, 2, 3), dtype=np.float32))
+    with pytest.raises(ValueError):
+        dcg.Texture(ctx).update_region(0, 0, patch)
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float16])
+def test_texture_16bit_formats(ctx, dtype):
+    """Test 16-bit integer and half-float textures round-trip."""
+    tex = dcg.Texture(ctx)
+    if dtype == np.uint16:
+        data = np.arange(16 * 8 * 2, dtype=np.uint16).reshape(16, 8, 2) * 100
+    else:
+        data = np.linspace(0., 1., 16 * 8 * 2, dtype=np.float16).reshape(16, 8, 2)
+    tex.set_value(data)
+    result = np.asarray(tex.read())
+    assert result.dtype == dtype
+    assert np.array_equal(result, data)
+
+    tex2 = dcg.Texture(ctx)
+    tex2.allocate(width=4, height=4, num_chans=1,
+                  uint16=(dtype == np.uint16), float16=(dtype == np.float16))
+    assert np.asarray(tex2.read()).dtype == dtype
+
+
+def test_texture_set_value_yuv(ctx):
+    """Test YUV frames are converted to RGBA on upload."""
+    width, height = 8, 4
+    # Pure red in full range BT.601
+    y, u, v = 76, 85, 255
+    nv12 = np.empty((height * 3 // 2, width), dtype=np.uint8)
+    nv12[:height] = y
+    nv12[height:, 0::2] = u
+    nv12[height:, 1::2] = v
+    i420 = np.concatenate([np.full(width * height, y, dtype=np.uint8),
+                           np.full(width * height // 4, u, dtype=np.uint8),
+                           np.full(width * height // 4, v, dtype=np.uint8)])
+    i420 = i420.reshape(height * 3 // 2, width)
+    yuyv = np.tile(np.array([y, u, y, v], dtype=np.uint8), (height, width // 2))
+
+    tex = dcg.Texture(ctx)
+    for fmt, frame in (("nv12", nv12), ("i420", i420), ("yuyv", yuyv)):
+        tex.set_value_yuv(frame, fmt, full_range=True)
+        assert (tex.width, tex.height, tex.num_chans) == (width, height, 4)
+        result = np.asarray(tex.read()).astype(np.int32)
+        assert np.all(np.abs(result - [255, 0, 0, 255]) <= 3), fmt
+
+    # Video range: luma 16 is black and 235 is white
+    nv12[:height] = 16
+    nv12[height:] = 128
+    tex.set_value_yuv(nv12, "nv12", colorspace="bt709")
+    assert np.all(np.asarray(tex.read())[..., :3] <= 1)
+    nv12[:height] = 235
+    tex.set_value_yuv(nv12, "nv12", colorspace="bt709")
+    assert np.all(np.asarray(tex.read())[..., :3] >= 254)
+
+    with pytest.raises(ValueError):
+        tex.set_value_yuv(nv12, "yuv444")
+    with pytest.raises(ValueError):
+        tex.set_value_yuv(nv12[:5], "nv12")
+
+
+def test_texture_budget_eviction(capture_context):
+    """Test LRU eviction of evictable textures and their reload."""
+    ctx = capture_context
+    viewport = ctx.viewport
+    size = 64 * 64 * 4
+    baseline = viewport.texture_stats()["resident_bytes"]
+
+    reloaded = threading.Event()
+    def reload(sender, target):
+        target.set_value(np.full((64, 64, 4), 255, dtype=np.uint8))
+        reloaded.set()
+
+    textures = []
+    for i in range(8):
+        tex = dcg.Texture(ctx, np.full((64, 64, 4), i, dtype=np.uint8))
+        tex.evictable = True
+        tex.reload_callback = reload
+        textures.append(tex)
+    stats = viewport.texture_stats()
+    assert stats["resident_bytes"] == baseline + 8 * size
+    assert stats["evictable_count"] == 8
+
+    # Textures drawn during the last frame are kept
+    with dcg.ViewportDrawList(ctx, front=True):
+        dcg.DrawImage(ctx, texture=textures[7], pmin=(0, 0), pmax=(64, 64))
+    while not viewport.render_frame():
+        continue
+
+    viewport.texture_budget = baseline + 4 * size
+    stats = viewport.texture_stats()
+    assert stats["resident_bytes"] <= baseline + 4 * size
+    assert stats["evictions"] >= 4
+    assert not textures[7].evicted
+    assert textures[0].evicted
+
+    # Drawing an evicted texture requests a reload
+    with dcg.ViewportDrawList(ctx, front=True):
+        dcg.DrawImage(ctx, texture=textures[0], pmin=(0, 0), pmax=(64, 64))
+    viewport.render_frame()
+    assert reloaded.wait(timeout=10.)
+    assert not textures[0].evicted
+    assert viewport.texture_stats()["reloads"] == 1
+
+    with pytest.raises(ValueError):
+        viewport.texture_budget = -1
+    viewport.texture_budget = 0
+
+class _TileSource:
+    """Pyramid of uniform tiles, colored by level."""
+    def __init__(self, size=4096, tile_size=256, gate=None):
+        self.width = size
+        self.height = size
+        self.tile_size = tile_size
+        self.gate = gate
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get_tile(self, level, tx, ty):
+        with self.lock:
+            self.requests.append((level, tx, ty))
+        if self.gate is not None and level < 4:
+            self.gate.wait()
+        tile = np.zeros((self.tile_size, self.tile_size, 4), dtype=np.uint8)
+        tile[:, :, 3] = 255
+        tile[:, :, 0 if level == 4 else 1] = 255
+        return tile
+
+def _render_until(viewport, condition, timeout=10.):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        viewport.render_frame()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_tiled_image_level_selection(capture_context):
+    """Test tile_source levels are picked from the zoom."""
+    from dearcygui.utils.image import DrawTiledImage
+    ctx = capture_context
+    source = _TileSource()
+    with dcg.ViewportDrawList(ctx, front=True):
+        image = DrawTiledImage(ctx)
+    image.prefetch_margin = 0
+    image.tile_source = source
+    # 4096 pixels shown on 512: level 3 (tiles of 2048 pixels)
+    image.pmax = (512, 512)
+    level3 = {(3, tx, ty) for tx in range(2) for ty in range(2)}
+    assert _render_until(ctx.viewport, lambda: level3 <= set(image.loaded_tiles))
+    assert {level for (level, _, _) in source.requests} <= {3, 4}
+
+    # Full resolution: level 0
+    image.pmax = (4096, 4096)
+    level0 = {(0, tx, ty) for tx in range(2) for ty in range(2)}
+    assert _render_until(ctx.viewport, lambda: level0 <= set(image.loaded_tiles))
+    assert {(level, tx, ty) for (level, tx, ty) in source.requests
+            if level == 0} == level0
+
+def test_tiled_image_coarser_fallback(capture_context):
+    """Test a coarser loaded level is drawn while a tile loads."""
+    from dearcygui.utils.image import DrawTiledImage
+    ctx = capture_context
+    ctx.viewport.clear_color = (0, 0, 0, 255)
+    gate = threading.Event()
+    source = _TileSource(gate=gate)
+    with dcg.ViewportDrawList(ctx, front=True):
+        image = DrawTiledImage(ctx)
+    image.tile_source = source
+    image.pmax = (4096, 4096)
+
+    def pixel():
+        data = np.asarray(ctx.viewport.framebuffer.read())[::-1, :, :]
+        return data[100, 100, :3]
+    try:
+        # Only the coarsest level (red) can load
+        assert _render_until(ctx.viewport, lambda: (4, 0, 0) in image.loaded_tiles)
+        while not ctx.viewport.render_frame():
+            continue
+        color = pixel()
+        assert color[0] > 200 and color[1] < 50
+    finally:
+        gate.set()
+    # Then full resolution (green) replaces it
+    assert _render_until(ctx.viewport, lambda: (0, 0, 0) in image.loaded_tiles)
+    while not ctx.viewport.render_frame():
+        continue
+    color = pixel()
+    assert color[1] > 200 and color[0] < 50
+
+def test_tiled_image_eviction(capture_context):
+    """Test max_tiles releases the least recently drawn tiles."""
+    from dearcygui.utils.image import DrawTiledImage
+    ctx = capture_context
+    source = _TileSource()
+    with dcg.ViewportDrawList(ctx, front=True):
+        image = DrawTiledImage(ctx)
+    image.prefetch_margin = 0
+    image.max_tiles = 4
+    image.tile_source = source
+    image.pmax = (4096, 4096)
+    first = {(0, tx, ty) for tx in range(2) for ty in range(2)}
+    assert _render_until(ctx.viewport, lambda: first <= set(image.loaded_tiles))
+
+    # Pan: the tiles of the previous view are released
+    image.pmin = (-1024, 0)
+    image.pmax = (3072, 4096)
+    second = {(0, tx, ty) for tx in range(4, 6) for ty in range(2)}
+    assert _render_until(ctx.viewport,
+                         lambda: set(image.loaded_tiles) == second)
+
+    # Failed tiles are not kept, nor requested again
+    class FailingSource(_TileSource):
+        def get_tile(self, level, tx, ty):
+            with self.lock:
+                self.requests.append((level, tx, ty))
+            raise RuntimeError("unavailable")
+    failing = FailingSource()
+    image.tile_source = failing
+    assert _render_until(ctx.viewport, lambda: len(failing.requests) >= 5)
+    for _ in range(10):
+        ctx.viewport.render_frame()
+    time.sleep(0.1)
+    assert image.loaded_tiles == []
+    assert len(failing.requests) == len(set(failing.requests))
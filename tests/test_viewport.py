@@ -472,3 +472,315 @@ def frequent_wake_and_close(times, wake_delay, sleep_delay):
     assert new_timestamp - timestamp < 0.3
     assert new_timestamp - timestamp > 0.05
     assert not initialized_viewport.wait_events(0)  # no event to process
+
+
+def test_viewport_skip_idle_frames(initialized_viewport: dcg.Viewport):
+    """Test that frames without any change skip the tree traversal."""
+    ctx = initialized_viewport.context
+    win = dcg.Window(ctx, label="window")
+    text = dcg.Text(ctx, value="text", parent=win)
+    initialized_viewport.vsync = False
+    initialized_viewport.wait_for_input = False
+    # Opt-in
+    assert not initialized_viewport.skip_idle_frames
+    initialized_viewport.skip_idle_frames = True
+
+    # Let the initial activity settle
+    for _ in range(10):
+        initialized_viewport.render_frame()
+
+    skipped = initialized_viewport.metrics.idle_frames_skipped
+    frame_count = initialized_viewport.metrics.frame_count
+    for _ in range(20):
+        initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.idle_frames_skipped > skipped
+    assert initialized_viewport.metrics.frame_count < frame_count + 20
+
+    # An item change requires a new traversal
+    frame_count = initialized_viewport.metrics.frame_count
+    text.value = "other text"
+    initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.frame_count == frame_count + 1
+
+    # Same for property writes
+    frame_count = initialized_viewport.metrics.frame_count
+    win.label = "renamed window"
+    initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.frame_count == frame_count + 1
+
+    # Same for tree changes
+    frame_count = initialized_viewport.metrics.frame_count
+    dcg.Text(ctx, value="new text", parent=win)
+    initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.frame_count == frame_count + 1
+
+    # When disabled, every frame is traversed
+    initialized_viewport.skip_idle_frames = False
+    frame_count = initialized_viewport.metrics.frame_count
+    for _ in range(5):
+        initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.frame_count == frame_count + 5
+
+
+def test_window_cache_drawlist(initialized_viewport: dcg.Viewport):
+    """Test the retained draw commands produce the same frame."""
+    ctx = initialized_viewport.context
+    win = dcg.Window(ctx, label="window", width=300, height=300, cache_drawlist=True)
+    texts = [dcg.Text(ctx, value=f"text {i}", parent=win) for i in range(20)]
+    drawing = dcg.DrawInWindow(ctx, width=100, height=100, parent=win, cache_drawlist=True)
+    dcg.DrawRect(ctx, pmin=(10, 10), pmax=(90, 90), parent=drawing)
+    assert win.cache_drawlist and drawing.cache_drawlist
+    initialized_viewport.vsync = False
+    initialized_viewport.always_submit_to_gpu = True
+
+    for _ in range(5):
+        initialized_viewport.render_frame()
+    vertices = initialized_viewport.metrics.rendered_vertices
+    for _ in range(5):
+        initialized_viewport.render_frame()
+        assert initialized_viewport.metrics.rendered_vertices == vertices
+
+    # Modifying a child invalidates the cache
+    texts[0].value = "a much longer text than before"
+    initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.rendered_vertices > vertices
+
+    win.cache_drawlist = False
+    assert not win.cache_drawlist
+    initialized_viewport.render_frame()
+
+
+def test_drawing_cache(initialized_viewport: dcg.Viewport):
+    """Test the children of a DrawingCache are only rendered when needed."""
+    ctx = initialized_viewport.context
+    win = dcg.Window(ctx, label="window", width=300, height=300)
+    drawing = dcg.DrawInWindow(ctx, width=200, height=200, parent=win)
+    cache = dcg.DrawingCache(ctx, pmin=(0, 0), pmax=(200, 200),
+                             supersampling=2., parent=drawing)
+    lines = [dcg.DrawLine(ctx, p1=(i, 0), p2=(200 - i, 200), parent=cache)
+             for i in range(0, 200, 10)]
+    initialized_viewport.vsync = False
+
+    assert cache.texture is None
+    for _ in range(5):
+        initialized_viewport.render_frame()
+    assert cache.render_count == 1
+    assert cache.texture.width == cache.texture.height == 400
+
+    # Modifying a child invalidates the cache
+    lines[0].color = (255, 0, 0)
+    initialized_viewport.render_frame()
+    assert cache.render_count == 2
+
+    # Panning and small zooms reuse the texture
+    drawing.orig_x = 20.
+    drawing.scale_x = 1.2
+    initialized_viewport.render_frame()
+    assert cache.render_count == 2
+
+    # Zooming beyond the threshold renders again
+    drawing.scale_x = 2.
+    initialized_viewport.render_frame()
+    assert cache.render_count == 3
+    assert cache.texture.width == 800
+
+    with pytest.raises(ValueError):
+        cache.zoom_threshold = 0.5
+
+
+def test_frame_policy(initialized_viewport: dcg.Viewport):
+    """Test the frame pacing policy of the viewport."""
+    policy = initialized_viewport.frame_policy
+    assert policy == dcg.FramePolicy()
+    assert policy.max_fps == 0. and policy.idle_fps == 0.2
+    assert policy.latency == "balanced"
+    with pytest.raises(ValueError):
+        dcg.FramePolicy(latency="fast")
+    with pytest.raises(ValueError):
+        dcg.FramePolicy(max_fps=-1)
+
+    initialized_viewport.vsync = False
+    initialized_viewport.frame_policy = dcg.FramePolicy(max_fps=50, idle_fps=2)
+    assert initialized_viewport.frame_policy.max_fps == 50
+    initialized_viewport.render_frame()
+    start = time.monotonic()
+    for _ in range(5):
+        initialized_viewport.render_frame()
+    assert time.monotonic() - start >= 5 * 0.02 * 0.9
+
+    # Frames taking longer than 1/max_fps miss their deadline
+    class SlowHandler(dcg.CustomHandler):
+        def check_can_bind(self, item):
+            return True
+        def check_status(self, item):
+            time.sleep(0.05)
+            return False
+    initialized_viewport.always_submit_to_gpu = True
+    window = dcg.Window(initialized_viewport.context, label="slow",
+                        handlers=[SlowHandler(initialized_viewport.context)])
+    initialized_viewport.render_frame()
+    missed = initialized_viewport.metrics.missed_deadlines
+    for _ in range(3):
+        initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.missed_deadlines >= missed + 3
+    window.delete_item()
+    initialized_viewport.always_submit_to_gpu = False
+
+    # The low latency mode sleeps before processing events instead
+    initialized_viewport.frame_policy = dcg.FramePolicy(max_fps=50, latency="low")
+    initialized_viewport.render_frame()
+    start = time.monotonic()
+    for _ in range(5):
+        initialized_viewport.render_frame()
+    assert time.monotonic() - start >= 4 * 0.02 * 0.9
+
+
+def test_threaded_presentation(initialized_viewport: dcg.Viewport):
+    """Test presenting frames from the presentation thread."""
+    ctx = initialized_viewport.context
+    win = dcg.Window(ctx, label="window", width=300, height=300)
+    text = dcg.Text(ctx, value="text", parent=win)
+    assert not initialized_viewport.threaded_presentation
+    initialized_viewport.threaded_presentation = True
+    assert initialized_viewport.threaded_presentation
+    initialized_viewport.always_submit_to_gpu = True
+
+    frame_count = initialized_viewport.metrics.frame_count
+    for i in range(10):
+        text.value = f"frame {i}"
+        initialized_viewport.render_frame()
+    assert initialized_viewport.metrics.frame_count == frame_count + 10
+
+    # Frames retrieving the framebuffer are presented synchronously
+    initialized_viewport.retrieve_framebuffer = True
+    initialized_viewport.render_frame()
+    assert initialized_viewport.framebuffer is not None
+    initialized_viewport.retrieve_framebuffer = False
+
+    initialized_viewport.threaded_presentation = False
+    initialized_viewport.render_frame()
+
+
+def test_invalidate_coalesces_wakes(initialized_viewport: dcg.Viewport):
+    """Test invalidate() sends a single wake per batch of changes."""
+    ctx = initialized_viewport.context
+    win = dcg.Window(ctx, label="window", width=300, height=300)
+    text = dcg.Text(ctx, value="text", parent=win)
+    initialized_viewport.render_frame()
+
+    metrics = initialized_viewport.metrics
+    def update():
+        for i in range(100):
+            text.value = f"update {i}"
+            text.invalidate(max_latency=0.05)
+    threads = [threading.Thread(target=update) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    after = initialized_viewport.metrics
+    assert after.wake_requests - metrics.wake_requests == 400
+    assert after.wakes - metrics.wakes <= 4
+
+    # Once a frame is rendered, a new wake can be sent
+    initialized_viewport.render_frame()
+    assert text.invalidate()
+    assert not text.invalidate(max_latency=1.)
+
+
+def test_render_frame_async(initialized_viewport: dcg.Viewport):
+    """Test render_frame_async yields to the event loop while idle."""
+    viewport = initialized_viewport
+    ctx = viewport.context
+    dcg.Text(ctx, value="text", parent=dcg.Window(ctx, label="window"))
+    handle = viewport.wait_handle
+    assert handle is None or isinstance(handle, int)
+    # Let the initial activity settle
+    for _ in range(5):
+        viewport.render_frame()
+    viewport.wait_for_input = True
+
+    async def run():
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+        tick_task = asyncio.ensure_future(ticker())
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.2, viewport.wake)
+        start = time.monotonic()
+        await viewport.render_frame_async()
+        elapsed = time.monotonic() - start
+        tick_task.cancel()
+        return (ticks, elapsed)
+
+    (ticks, elapsed) = asyncio.run(run())
+    # The frame waited for the wake without blocking the loop
+    assert elapsed >= 0.15
+    assert ticks >= 5
+
+
+def test_state_snapshots_are_consistent(initialized_viewport: dcg.Viewport):
+    """Test states read during rendering are never torn."""
+    ctx = initialized_viewport.context
+    with dcg.Window(ctx, width=400, height=400, no_move=True):
+        button = dcg.Button(ctx, label="button")
+    configurations = [(10, 50), (100, 120)]
+    # (rect_size, pos_to_viewport) pairs observed outside rendering
+    reference = set()
+    observed = []
+    stop = threading.Event()
+
+    def read_states():
+        while not stop.is_set():
+            state = button.state.snapshot()
+            observed.append((tuple(state.rect_size), tuple(state.pos_to_viewport)))
+
+    reader = threading.Thread(target=read_states)
+    reader.start()
+    try:
+        for i in range(200):
+            (x, width) = configurations[i % 2]
+            button.x = x
+            button.width = width
+            initialized_viewport.render_frame()
+            state = button.state
+            reference.add((tuple(state.rect_size), tuple(state.pos_to_viewport)))
+    finally:
+        stop.set()
+        reader.join()
+
+    assert len(reference) >= 2
+    assert len(observed) > 0
+    # Snapshots taken before the first frame report empty states
+    for pair in observed:
+        assert pair in reference or pair == ((0., 0.), (0., 0.))
+
+
+def test_run_viewport_loop_yields(initialized_viewport: dcg.Viewport):
+    """Test run_viewport_loop lets other tasks run when frames are not waited for."""
+    viewport = initialized_viewport
+    ctx = viewport.context
+    dcg.Text(ctx, value="text", parent=dcg.Window(ctx, label="window"))
+    viewport.vsync = False
+    viewport.wait_for_input = False
+
+    async def run():
+        ticks = 0
+        async def ticker():
+            nonlocal ticks
+            for _ in range(20):
+                ticks += 1
+                await asyncio.sleep(0.001)
+            ctx.running = False
+        tick_task = asyncio.ensure_future(ticker())
+        await asyncio.wait_for(run_viewport_loop(viewport), timeout=5.)
+        await tick_task
+        return ticks
+
+    try:
+        assert asyncio.run(run()) == 20
+    finally:
+        ctx.running = True
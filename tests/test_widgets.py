@@ -914,3 +914,97 @@ def test_mixed_show_and_detach_effects(ctx):
     button2.parent = None
     assert not button2.state.visible, "Button2 should not be visible after detachment"
 
+
+
+def test_text_layout_cache(ctx):
+    """Test texts measured from the layout cache match fresh measurements"""
+    viewport = ctx.viewport
+    viewport.initialize(visible=False)
+
+    win = dcg.Window(ctx, label="Test Window", primary=True)
+    short = dcg.Text(ctx, value="Hello", parent=win)
+    lines = dcg.Text(ctx, value="Hello\nHello\nHello", parent=win)
+    wrapped = dcg.Text(ctx, value="word " * 40, wrap=100, parent=win)
+
+    viewport.render_frame()
+    cached_sizes = [item.state.rect_size for item in (short, lines, wrapped)]
+    assert cached_sizes[1].y > 2 * cached_sizes[0].y
+    assert cached_sizes[2].y > 3 * cached_sizes[0].y
+
+    assert viewport.text_layout_cache_size > 0
+    viewport.text_layout_cache_size = 0
+    viewport.render_frame()
+    assert [item.state.rect_size for item in (short, lines, wrapped)] == cached_sizes
+
+    with pytest.raises(ValueError):
+        viewport.text_layout_cache_size = -1
+
+
+def test_markdown_append(ctx):
+    """Test streamed markdown lays out like the same text set at once"""
+    viewport = ctx.viewport
+    viewport.initialize(visible=False)
+
+    text = ("# Title\n\nSome *text* with `code`.\n\n- item 1\n- item 2\n\n"
+            "- loose item\n\n  continued\n\n```\ncode\n\nblock\n```\n\n"
+            "> quote\n\nLast paragraph " + "word " * 30 + "\n\n---\n")
+
+    win = dcg.Window(ctx, label="Test Window", primary=True)
+    full = dcg.MarkDownText(ctx, value=text, width=300, parent=win)
+    streamed = dcg.MarkDownText(ctx, width=300, parent=win)
+    for i in range(0, len(text), 7):
+        streamed.append(text[i:i+7])
+        viewport.render_frame()
+    assert streamed.value == text
+    assert streamed.state.rect_size == full.state.rect_size
+
+    with pytest.raises(TypeError):
+        streamed.append(1)
+
+
+def test_markdown_background_processing(ctx):
+    """Test long markdown texts are parsed and laid out in the background"""
+    import time
+    viewport = ctx.viewport
+    viewport.initialize(visible=False)
+
+    text = "".join(f"## Section {i}\n\nParagraph {i} " + "word " * 50 + "\n\n"
+                   for i in range(3000))
+    win = dcg.Window(ctx, label="Test Window", primary=True)
+    items = [dcg.MarkDownText(ctx, value=text, width=300, parent=win)
+             for _ in range(2)]
+    # Appended during parsing
+    items[1].append("\n\nEnd")
+    items[0].append("\n\nEnd")
+
+    deadline = time.monotonic() + 60
+    while any(item.processing for item in items):
+        assert time.monotonic() < deadline
+        viewport.render_frame()
+    assert items[0].value == text + "\n\nEnd"
+    assert items[0].state.rect_size == items[1].state.rect_size
+    assert items[0].state.rect_size.y > 3000 * 20
+
+    # Appending after background parsing only parses the tail
+    start = time.monotonic()
+    for i in range(20):
+        items[0].append(f"\n\nMore {i}")
+    append_time = time.monotonic() - start
+    items[1].value = items[0].value
+    while any(item.processing for item in items):
+        assert time.monotonic() < deadline
+        viewport.render_frame()
+    assert items[0].state.rect_size == items[1].state.rect_size
+    assert append_time < 0.1
+
+
+def test_text_value_long_format(ctx):
+    """Test TextValue outputs longer than the stack buffer are not truncated"""
+    viewport = ctx.viewport
+    viewport.initialize(visible=False)
+
+    win = dcg.Window(ctx, label="Test Window", primary=True)
+    short = dcg.TextValue(ctx, print_format="%1000.1f", parent=win)
+    long = dcg.TextValue(ctx, print_format="%2000.1f", parent=win)
+    viewport.render_frame()
+    assert long.state.rect_size.x > 1.5 * short.state.rect_size.x